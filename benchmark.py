@@ -15,6 +15,13 @@ Usage:
     python benchmark.py --cpu              # CPU profiling only
     python benchmark.py --memory           # Memory profiling only
     python benchmark.py --queries          # Database query analysis
+    python benchmark.py --typeahead        # Typeahead index latency (100k devices)
+    python benchmark.py --removal          # Removal detection (needs DATABASE_URL)
+    python benchmark.py --entity-memory    # Bytes per device: entities vs records
+    python benchmark.py --mapping          # Mapping CPU: per row vs per page column
+    python benchmark.py --report-render    # Loop lag during Excel exports: threads vs processes
+    python benchmark.py --report-modes     # Excel report time/memory: regular vs write-only
+    python benchmark.py --e2e              # Syncers + assignments against a mock API
     python benchmark.py --all              # All profiling modes
 
     # Export results
@@ -29,9 +36,16 @@ Example:
     python benchmark.py --cpu --cpu-dump sync.prof
     # Then visualize with: snakeviz sync.prof
 
+    # End-to-end against the local mock API with 50ms latency and 429s
+    BENCHMARK_DATABASE_URL=postgresql://localhost/glp_bench \\
+        python benchmark.py --e2e --device-count 10000 \\
+        --mock-latency-ms 50 --mock-429-rate 0.01 --output e2e.json
+
 Requirements:
     - For real sync: GLP_CLIENT_ID, GLP_CLIENT_SECRET, DATABASE_URL env vars
     - For mock mode: No external dependencies
+    - For --e2e: BENCHMARK_DATABASE_URL, a scratch database with the schema
+      and migrations applied (its inventory tables are overwritten)
     - Optional: snakeviz for CPU profile visualization (pip install snakeviz)
     - Optional: memory_profiler for detailed memory (pip install memory_profiler)
 
@@ -44,9 +58,10 @@ import logging
 import os
 import sys
 import time
-from dataclasses import asdict
-from datetime import datetime
-from typing import Optional
+import uuid
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
@@ -85,16 +100,44 @@ from src.glp.profiling import (
 # ============================================
 
 class MockDataGenerator:
-    """Generate mock device and subscription data for benchmarking."""
+    """Generate mock GreenLake and Aruba Central records for benchmarking.
+
+    Records match the API shapes and the database constraints (UUID ids,
+    assigned/subscription states), so they can be served by the mock API
+    server and written by the real syncers.
+    """
+
+    # Namespaces for deterministic UUIDs
+    DEVICE_NS = 1
+    SUBSCRIPTION_NS = 2
+    WORKSPACE_NS = 3
+    APPLICATION_NS = 4
+    LOCATION_NS = 5
+    PLATFORM_NS = 6
 
     @staticmethod
-    def generate_devices(count: int = 1000) -> list[dict]:
-        """Generate mock device records."""
+    def uuid_for(namespace: int, i: int) -> str:
+        """Deterministic UUID string for the i-th record of a namespace."""
+        return str(uuid.UUID(int=(namespace << 64) | i))
+
+    @staticmethod
+    def generate_devices(count: int = 1000, subscription_count: int = 500) -> list[dict]:
+        """Generate mock device records.
+
+        Each device references two of the first subscription_count
+        subscriptions from generate_subscriptions().
+        """
+        uuid_for = MockDataGenerator.uuid_for
+        subscription_count = max(subscription_count, 1)
         devices = []
         for i in range(count):
+            sub_ids = [
+                uuid_for(MockDataGenerator.SUBSCRIPTION_NS, (i * 2) % subscription_count),
+                uuid_for(MockDataGenerator.SUBSCRIPTION_NS, (i * 2 + 1) % subscription_count),
+            ]
             devices.append({
-                "id": f"device-{i:06d}",
-                "macAddress": f"AA:BB:CC:DD:{i//256:02X}:{i%256:02X}",
+                "id": uuid_for(MockDataGenerator.DEVICE_NS, i),
+                "macAddress": f"AA:BB:CC:{i//65536 % 256:02X}:{i//256 % 256:02X}:{i%256:02X}",
                 "serialNumber": f"SN{i:08d}",
                 "partNumber": f"PN-{i % 100:04d}",
                 "deviceType": ["COMPUTE", "STORAGE", "NETWORK"][i % 3],
@@ -103,15 +146,15 @@ class MockDataGenerator:
                 "archived": False,
                 "deviceName": f"Device {i}",
                 "secondaryName": None,
-                "assignedState": ["ASSIGNED", "UNASSIGNED", "PENDING"][i % 3],
+                "assignedState": ["ASSIGNED_TO_SERVICE", "UNASSIGNED"][i % 2],
                 "type": "compute.device",
-                "tenantWorkspaceId": f"workspace-{i % 10}",
+                "tenantWorkspaceId": uuid_for(MockDataGenerator.WORKSPACE_NS, i % 10),
                 "application": {
-                    "id": f"app-{i % 5}",
+                    "id": uuid_for(MockDataGenerator.APPLICATION_NS, i % 5),
                     "resourceUri": f"/apps/app-{i % 5}",
                 },
                 "location": {
-                    "id": f"loc-{i % 20}",
+                    "id": uuid_for(MockDataGenerator.LOCATION_NS, i % 20),
                     "locationName": f"Location {i % 20}",
                     "city": ["San Jose", "Austin", "Seattle", "Denver"][i % 4],
                     "state": ["CA", "TX", "WA", "CO"][i % 4],
@@ -122,17 +165,18 @@ class MockDataGenerator:
                     "longitude": -122.0 + (i % 10) * 0.1,
                     "locationSource": "MANUAL",
                 },
-                "dedicatedPlatformWorkspace": {"id": f"dpw-{i % 3}"},
+                "dedicatedPlatformWorkspace": {"id": uuid_for(MockDataGenerator.PLATFORM_NS, i % 3)},
                 "subscription": [
-                    {"id": f"sub-{i * 2}", "resourceUri": f"/subs/sub-{i * 2}"},
-                    {"id": f"sub-{i * 2 + 1}", "resourceUri": f"/subs/sub-{i * 2 + 1}"},
+                    {"id": sub_id, "resourceUri": f"/subscriptions/v1/subscriptions/{sub_id}"}
+                    for sub_id in dict.fromkeys(sub_ids)
                 ],
                 "tags": {
                     "environment": ["prod", "dev", "staging"][i % 3],
                     "owner": f"team-{i % 10}",
                 },
-                "createdAt": "2024-01-01T00:00:00Z",
-                "updatedAt": "2024-06-15T12:00:00Z",
+                # Onboarded in daily batches; updated at distinct times
+                "createdAt": f"2024-01-{i % 28 + 1:02d}T00:00:00Z",
+                "updatedAt": f"2024-06-15T{(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d}Z",
             })
         return devices
 
@@ -143,17 +187,82 @@ class MockDataGenerator:
         for i in range(count):
             subscriptions.append({
                 "key": f"SUB-{i:06d}",
-                "id": f"subscription-{i:06d}",
-                "subscriptionType": ["HARDWARE", "SOFTWARE", "SUPPORT"][i % 3],
-                "subscriptionStatus": ["ACTIVE", "EXPIRED", "PENDING"][i % 3],
+                "id": MockDataGenerator.uuid_for(MockDataGenerator.SUBSCRIPTION_NS, i),
+                "type": "subscriptions/subscription",
+                "subscriptionType": ["CENTRAL_AP", "CENTRAL_SWITCH", "CENTRAL_GW"][i % 3],
+                "subscriptionStatus": ["STARTED", "ENDED", "SUSPENDED"][i % 3],
+                "quantity": 100,
+                "availableQuantity": 100 - i % 100,
+                "sku": f"SKU-{i % 20:03d}",
                 "productDescription": f"Product {i % 100}",
                 "startTime": "2024-01-01T00:00:00Z",
                 "endTime": "2025-12-31T23:59:59Z",
+                "tags": {"contract": f"C-{i % 25}"},
                 "createdAt": "2024-01-01T00:00:00Z",
                 "updatedAt": "2024-06-15T12:00:00Z",
             })
         return subscriptions
 
+    @staticmethod
+    def generate_central_devices(devices: list[dict], site_count: int = 50) -> list[dict]:
+        """Generate Aruba Central inventory records for GreenLake devices.
+
+        Serial numbers match the GreenLake devices so the Central sync
+        merges into existing rows.
+        """
+        central = []
+        for i, device in enumerate(devices):
+            site = i % site_count
+            central.append({
+                "id": f"central-{i:08d}",
+                "serialNumber": device["serialNumber"],
+                "macAddress": device["macAddress"],
+                "deviceName": f"ap-{i:06d}",
+                "deviceType": ["ACCESS_POINT", "SWITCH", "GATEWAY"][i % 3],
+                "model": device.get("model"),
+                "partNumber": device.get("partNumber"),
+                "status": ["ONLINE", "OFFLINE"][i % 7 == 0],
+                "softwareVersion": f"10.{i % 5}.0.{i % 3}",
+                "ipv4": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                "deployment": "Standalone",
+                "role": "default",
+                "siteId": f"site-{site:04d}",
+                "siteName": f"Site {site}",
+                "deviceGroupName": f"group-{i % 10}",
+                "isProvisioned": True,
+                "uptimeInMillis": 86_400_000 + i,
+                "lastSeenAt": "2026-01-01T00:00:00Z",
+            })
+        return central
+
+    @staticmethod
+    def generate_clients(central_devices: list[dict], clients_per_site: int = 20) -> dict[str, list[dict]]:
+        """Generate Aruba Central client records, keyed by site id."""
+        sites: dict[str, list[dict]] = {}
+        for device in central_devices:
+            sites.setdefault(device["siteId"], []).append(device["serialNumber"])
+
+        clients: dict[str, list[dict]] = {}
+        n = 0
+        for site_id, serials in sites.items():
+            site_clients = clients.setdefault(site_id, [])
+            for j in range(clients_per_site):
+                site_clients.append({
+                    "mac": f"02:00:{n // 16_777_216 % 256:02X}:{n // 65536 % 256:02X}:{n // 256 % 256:02X}:{n % 256:02X}",
+                    "name": f"client-{n}",
+                    "status": "Connected",
+                    "type": ["Wireless", "Wired"][j % 2],
+                    "ipv4": f"172.{16 + n // 65536 % 16}.{n // 256 % 256}.{n % 256}",
+                    "network": f"ssid-{j % 4}",
+                    "vlanId": str(100 + j % 4),
+                    "connectedDeviceSerial": serials[j % len(serials)],
+                    "connectedSince": "2026-01-01T00:00:00Z",
+                    "lastSeenAt": "2026-01-01T00:00:00Z",
+                    "health": "Good",
+                })
+                n += 1
+        return clients
+
 
 # ============================================
 # Benchmark Functions
@@ -318,6 +427,712 @@ async def benchmark_memory_scaling(sizes: list[int] = None) -> dict:
     return {"memory_scaling": results}
 
 
+async def benchmark_typeahead(device_count: int = 100_000, queries: int = 2000) -> dict:
+    """Benchmark the in-memory typeahead index (build time and lookup latency)."""
+    import random
+
+    from src.glp.assignment.api.typeahead import (
+        InventoryTypeahead,
+        SearchHistoryCache,
+        TypeaheadEntry,
+    )
+
+    devices = MockDataGenerator.generate_devices(device_count)
+    subscriptions = MockDataGenerator.generate_subscriptions(max(device_count // 10, 1))
+    entries = [
+        TypeaheadEntry(
+            id=d["id"],
+            kind="device",
+            label=d["serialNumber"],
+            name=d["deviceName"],
+            mac_address=d["macAddress"],
+            sub_type=d["deviceType"],
+        )
+        for d in devices
+    ]
+    entries.extend(
+        TypeaheadEntry(id=s["id"], kind="subscription", label=s["key"], sub_type=s["subscriptionType"])
+        for s in subscriptions
+    )
+
+    index = InventoryTypeahead()
+    with Timer("typeahead_build") as build_timer:
+        index.load(entries)
+
+    # Incremental refresh of 1% of entries (typical post-sync delta)
+    changed = [
+        replace(e, name=f"{e.name} (renamed)")
+        for e in random.sample(entries[:device_count], max(device_count // 100, 1))
+    ]
+    with Timer("typeahead_incremental") as incremental_timer:
+        index.apply(changed)
+
+    # Keystroke-style prefixes: serials, MACs (with and without separators), names
+    rng = random.Random(42)
+    prefixes = []
+    for _ in range(queries):
+        d = devices[rng.randrange(device_count)]
+        choice = rng.randrange(4)
+        if choice == 0:
+            prefixes.append(d["serialNumber"][: rng.randint(3, 10)])
+        elif choice == 1:
+            prefixes.append(d["macAddress"][: rng.randint(5, 17)])
+        elif choice == 2:
+            prefixes.append(d["macAddress"].replace(":", "")[: rng.randint(4, 12)].lower())
+        else:
+            prefixes.append(d["deviceName"][: rng.randint(3, 12)])
+
+    latencies_us = []
+    for prefix in prefixes:
+        t0 = time.perf_counter()
+        index.search(prefix, limit=10)
+        latencies_us.append((time.perf_counter() - t0) * 1_000_000)
+    latencies_us.sort()
+
+    # Search-history suggestions against a full (200 item) cached history
+    history = SearchHistoryCache()
+    history.put("tenant", "user", [(f"SN{i:08d}", "device") for i in range(history.max_items_per_user)])
+    history_latencies_us = []
+    for prefix in prefixes[:500]:
+        t0 = time.perf_counter()
+        SearchHistoryCache.suggest(history.get("tenant", "user"), prefix, limit=5)
+        history_latencies_us.append((time.perf_counter() - t0) * 1_000_000)
+    history_latencies_us.sort()
+
+    def percentile(values: list[float], pct: float) -> float:
+        return values[min(len(values) - 1, int(len(values) * pct))]
+
+    return {
+        "device_count": device_count,
+        "indexed_entries": len(index),
+        "build_ms": build_timer.duration_ms,
+        "incremental_update_ms": incremental_timer.duration_ms,
+        "incremental_update_count": len(changed),
+        "lookup_count": len(latencies_us),
+        "lookup_p50_us": percentile(latencies_us, 0.50),
+        "lookup_p99_us": percentile(latencies_us, 0.99),
+        "lookup_max_us": latencies_us[-1],
+        "history_suggest_p50_us": percentile(history_latencies_us, 0.50),
+        "history_suggest_p99_us": percentile(history_latencies_us, 0.99),
+    }
+
+
+async def benchmark_removal_detection(
+    db_pool,
+    device_count: int = 100_000,
+    client_count: int = 500_000,
+    site_count: int = 200,
+    removed_fraction: float = 0.01,
+) -> dict:
+    """Benchmark removal detection: seen-key arrays vs a staging anti-join.
+
+    Runs against temporary tables (dropped on commit), so no real data is
+    touched. The staging table is filled before timing, as the Central sync
+    does while merging each page; only the removal UPDATE is timed.
+    """
+    seen_devices = int(device_count * (1 - removed_fraction))
+    seen_clients = int(client_count * (1 - removed_fraction))
+
+    async with db_pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("""
+                CREATE TEMP TABLE bench_devices (
+                    serial_number TEXT PRIMARY KEY,
+                    in_central BOOLEAN
+                ) ON COMMIT DROP
+            """)
+            await conn.execute("""
+                INSERT INTO bench_devices
+                SELECT 'SN' || lpad(g::text, 9, '0'), TRUE
+                FROM generate_series(1, $1) g
+            """, device_count)
+            serials_seen = [f"SN{i:09d}" for i in range(1, seen_devices + 1)]
+            await conn.execute("ANALYZE bench_devices")
+
+            with Timer("devices_array") as array_timer:
+                await conn.execute("""
+                    UPDATE bench_devices SET in_central = FALSE
+                    WHERE in_central = TRUE AND serial_number != ALL($1::text[])
+                """, serials_seen)
+            await conn.execute("UPDATE bench_devices SET in_central = TRUE")
+
+            await conn.execute("""
+                CREATE TEMP TABLE bench_staging (serial_number TEXT) ON COMMIT DROP
+            """)
+            await conn.copy_records_to_table(
+                "bench_staging", records=[(s,) for s in serials_seen]
+            )
+            await conn.execute("ANALYZE bench_staging")
+            with Timer("devices_anti_join") as anti_join_timer:
+                removed_devices = await conn.execute("""
+                    UPDATE bench_devices d SET in_central = FALSE
+                    WHERE d.in_central = TRUE
+                      AND NOT EXISTS (
+                          SELECT 1 FROM bench_staging s WHERE s.serial_number = d.serial_number
+                      )
+                """)
+
+            await conn.execute("""
+                CREATE TEMP TABLE bench_clients (
+                    site_id TEXT,
+                    mac TEXT,
+                    status TEXT,
+                    synced_at TIMESTAMPTZ,
+                    PRIMARY KEY (site_id, mac)
+                ) ON COMMIT DROP
+            """)
+            await conn.execute("""
+                INSERT INTO bench_clients
+                SELECT 'site-' || (g % $3), 'mac-' || g, 'Connected',
+                       CASE WHEN g <= $2 THEN TIMESTAMPTZ '2026-01-02'
+                            ELSE TIMESTAMPTZ '2026-01-01' END
+                FROM generate_series(1, $1) g
+            """, client_count, seen_clients, site_count)
+            await conn.execute("CREATE INDEX ON bench_clients(site_id)")
+            await conn.execute("ANALYZE bench_clients")
+            sites = [f"site-{i}" for i in range(site_count)]
+
+            async def mark_clients(predicate: str) -> None:
+                for site_id in sites:
+                    await conn.execute(f"""
+                        UPDATE bench_clients SET status = 'REMOVED'
+                        WHERE site_id = $1 AND synced_at < $2 AND {predicate}
+                    """, site_id, datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+            with Timer("clients_site_index") as clients_before:
+                await mark_clients("(status IS NULL OR status != 'REMOVED')")
+            await conn.execute("UPDATE bench_clients SET status = 'Connected'")
+
+            await conn.execute("""
+                CREATE INDEX ON bench_clients(site_id, synced_at)
+                WHERE status IS DISTINCT FROM 'REMOVED'
+            """)
+            await conn.execute("ANALYZE bench_clients")
+            with Timer("clients_partial_index") as clients_after:
+                await mark_clients("status IS DISTINCT FROM 'REMOVED'")
+
+    array_bytes = sum(len(s) + 4 for s in serials_seen)
+    return {
+        "device_count": device_count,
+        "client_count": client_count,
+        "removed_fraction": removed_fraction,
+        "devices_removed": int(removed_devices.split()[-1]),
+        "devices_array_ms": array_timer.duration_ms,
+        "devices_anti_join_ms": anti_join_timer.duration_ms,
+        "devices_array_param_bytes": array_bytes,
+        "clients_site_index_ms": clients_before.duration_ms,
+        "clients_partial_index_ms": clients_after.duration_ms,
+    }
+
+
+async def benchmark_query_metrics(database_url: Optional[str] = None, calls: int = 200_000, round_trips: int = 2000) -> dict:
+    """Measure the per-statement cost of always-on query instrumentation.
+
+    Times QueryMetrics.record() inside a request scope over a realistic mix
+    of statement shapes. With a database URL, also compares SELECT round trips on a
+    plain asyncpg connection and an InstrumentedConnection.
+    """
+    from src.glp.api.query_metrics import QueryMetrics
+
+    statements = [
+        f"SELECT * FROM devices WHERE serial_number = $1 AND region = 'r{i}' LIMIT {i}"
+        for i in range(50)
+    ]
+    metrics = QueryMetrics(n_plus_one_threshold=calls + 1)
+    with metrics.scope("benchmark"), Timer("query_metrics_record") as record_timer:
+        for i in range(calls):
+            metrics.record(statements[i % 50], 0.0012, 1)
+
+    results = {
+        "record_calls": calls,
+        "distinct_statements": len(metrics.statements),
+        "record_ns_per_call": record_timer.duration_ms * 1_000_000 / calls,
+    }
+
+    if database_url:
+        import asyncpg
+
+        from src.glp.api.query_metrics import InstrumentedConnection
+
+        async def median_round_trip_us(connection_class) -> float:
+            conn = await asyncpg.connect(database_url, connection_class=connection_class)
+            try:
+                latencies = []
+                for i in range(round_trips):
+                    t0 = time.perf_counter()
+                    await conn.fetchval("SELECT $1::int", i)
+                    latencies.append((time.perf_counter() - t0) * 1_000_000)
+            finally:
+                await conn.close()
+            latencies.sort()
+            return latencies[len(latencies) // 2]
+
+        plain_us = await median_round_trip_us(asyncpg.Connection)
+        instrumented_us = await median_round_trip_us(InstrumentedConnection)
+        results.update({
+            "round_trips": round_trips,
+            "plain_p50_us": plain_us,
+            "instrumented_p50_us": instrumented_us,
+            "overhead_pct": (instrumented_us - plain_us) / plain_us * 100 if plain_us else 0.0,
+        })
+
+    return results
+
+
+def benchmark_entity_memory(device_count: int = 100_000) -> dict:
+    """Measure bytes held per synced device by each mapping strategy.
+
+    - dict_entities: Device/DeviceSubscription/DeviceTag as __dict__-backed
+      dataclasses (the previous layout), each Device keeping its raw dict
+    - slotted_entities: the current slotted entities, still keeping raw dicts
+    - records: DeviceFieldMapper.map_to_records() rows; raw dicts released
+
+    Each strategy maps freshly generated API dicts (round-tripped through
+    JSON so, as with a real response, no two devices share value strings),
+    then measures what is still allocated (tracemalloc) once only the
+    mapped result is kept.
+    """
+    import gc
+    import tracemalloc
+    from dataclasses import MISSING, field, fields, make_dataclass
+
+    from src.glp.sync.adapters.field_mapper import DeviceFieldMapper
+    from src.glp.sync.domain.entities import (
+        Device,
+        DeviceRecordBatch,
+        DeviceSubscription,
+        DeviceTag,
+    )
+
+    def dict_backed(cls):
+        return make_dataclass(
+            f"Dict{cls.__name__}",
+            [
+                (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+                if f.default is not MISSING or f.default_factory is not MISSING
+                else (f.name, f.type)
+                for f in fields(cls)
+            ],
+        )
+
+    dict_classes = {cls: dict_backed(cls) for cls in (Device, DeviceSubscription, DeviceTag)}
+    mapper = DeviceFieldMapper()
+
+    def to_dict_backed(entity):
+        cls = dict_classes[type(entity)]
+        return cls(**{f.name: getattr(entity, f.name) for f in fields(entity)})
+
+    def map_entities(raw_devices: list[dict], convert) -> list:
+        mapped = []
+        for raw in raw_devices:
+            device = mapper.map_to_entity(raw)
+            mapped.append(convert(device))
+            mapped.extend(convert(s) for s in mapper.extract_subscriptions(device, raw))
+            mapped.extend(convert(t) for t in mapper.extract_tags(device, raw))
+        return mapped
+
+    def map_records(raw_devices: list[dict]) -> DeviceRecordBatch:
+        batch = DeviceRecordBatch()
+        for raw in raw_devices:
+            mapper.map_to_records(raw, batch)
+        raw_devices.clear()
+        return batch
+
+    strategies = {
+        "dict_entities": lambda raw: map_entities(raw, to_dict_backed),
+        "slotted_entities": lambda raw: map_entities(raw, lambda entity: entity),
+        "records": map_records,
+    }
+
+    results = {"device_count": device_count, "strategies": {}}
+    for name, strategy in strategies.items():
+        gc.collect()
+        tracemalloc.start()
+        raw_devices = json.loads(json.dumps(
+            MockDataGenerator.generate_devices(device_count, max(device_count // 10, 1))
+        ))
+        kept = strategy(raw_devices)
+        del raw_devices
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results["strategies"][name] = {
+            "bytes_per_device": current / device_count,
+            "peak_bytes_per_device": peak / device_count,
+        }
+        del kept
+
+    results["instance_bytes"] = {
+        "dict_device": sys.getsizeof(dict_classes[Device](id=None))
+        + sys.getsizeof(dict_classes[Device](id=None).__dict__),
+        "slotted_device": sys.getsizeof(Device(id=None)),
+    }
+    return results
+
+
+def benchmark_mapping_cpu(sizes: Optional[list[int]] = None, page_size: int = 2000) -> dict:
+    """Compare CPU time of device mapping strategies on API-sized pages.
+
+    - legacy_rows: DeviceSyncer._prepare_*_records(), one dict walk per row
+    - entities: map_to_entity() + map_to_record() + extract_*()
+    - row_records: DeviceFieldMapper.map_to_records() per device
+
+    Each strategy maps the same pages of generated devices, round-tripped
+    through JSON like a real response; the best of three runs (one run
+    above 50k devices) is reported as process CPU time, also relative to
+    the entity path.
+    """
+    from src.glp.api.devices import DeviceSyncer
+    from src.glp.sync.adapters.field_mapper import DeviceFieldMapper
+    from src.glp.sync.domain.entities import DeviceRecordBatch
+
+    sizes = sizes or [10_000, 100_000]
+    mapper = DeviceFieldMapper()
+    syncer = DeviceSyncer(client=None)
+
+    def legacy_rows(page: list[dict]) -> None:
+        syncer._prepare_device_records(page)
+        syncer._prepare_subscription_records(page)
+        syncer._prepare_tag_records(page)
+
+    def entities(page: list[dict]) -> None:
+        for raw in page:
+            device = mapper.map_to_entity(raw)
+            mapper.map_to_record(device)
+            mapper.extract_subscriptions(device, raw)
+            mapper.extract_tags(device, raw)
+
+    def row_records(page: list[dict]) -> None:
+        batch = DeviceRecordBatch()
+        for raw in page:
+            mapper.map_to_records(raw, batch)
+
+    strategies = {
+        "legacy_rows": legacy_rows,
+        "entities": entities,
+        "row_records": row_records,
+    }
+
+    results = {"page_size": page_size, "sizes": {}}
+    for size in sizes:
+        raw_devices = json.loads(json.dumps(
+            MockDataGenerator.generate_devices(size, max(size // 10, 1))
+        ))
+        pages = [raw_devices[i:i + page_size] for i in range(0, size, page_size)]
+        timings = {}
+        for name, strategy in strategies.items():
+            best = float("inf")
+            for _ in range(1 if size > 50_000 else 3):
+                start = time.process_time()
+                for page in pages:
+                    strategy(page)
+                best = min(best, time.process_time() - start)
+            timings[name] = {
+                "cpu_ms": best * 1000,
+                "devices_per_sec": size / best if best else 0,
+            }
+        baseline = timings["entities"]["cpu_ms"]
+        for stats in timings.values():
+            stats["vs_entities"] = stats["cpu_ms"] / baseline if baseline else 0
+        results["sizes"][size] = timings
+
+    return results
+
+
+def _device_report_items(row_count: int) -> list[dict]:
+    """Device report rows shaped like the devices report query returns."""
+    devices = MockDataGenerator.generate_devices(row_count, max(row_count // 10, 1))
+    return [
+        {
+            "id": d["id"],
+            "serial_number": d["serialNumber"],
+            "mac_address": d["macAddress"],
+            "device_type": d["deviceType"],
+            "model": d["model"],
+            "region": d["region"],
+            "device_name": d["deviceName"],
+            "assigned_state": d["assignedState"],
+            "location_city": d["location"]["city"],
+            "location_country": d["location"]["country"],
+            "tags": d["tags"],
+            "updated_at": d["updatedAt"],
+        }
+        for d in devices
+    ]
+
+
+async def benchmark_report_render(row_count: int = 20_000, concurrent_exports: int = 2) -> dict:
+    """Measure event-loop stalls while device Excel exports render.
+
+    A probe coroutine sleeps 10ms in a loop (standing in for dashboard
+    requests served by the same process) while concurrent_exports device
+    reports render, first on threads, then in the render process pool.
+    Probe overshoot beyond 10ms is time the loop could not serve requests.
+    """
+    from src.glp.reports.devices_report import DevicesReportGenerator
+    from src.glp.reports.render_pool import ReportRenderPool
+
+    data = {"items": _device_report_items(row_count), "total": row_count}
+
+    async def probe(stop: asyncio.Event, lags: list[float]) -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append((time.perf_counter() - start - 0.01) * 1000)
+
+    results = {"row_count": row_count, "concurrent_exports": concurrent_exports, "modes": {}}
+    for mode, use_processes in (("threads", False), ("processes", True)):
+        pool = ReportRenderPool(
+            max_workers=concurrent_exports,
+            per_type_limit=concurrent_exports,
+            use_processes=use_processes,
+        )
+        if use_processes:
+            # Start the workers outside the measurement
+            await pool.render_excel(DevicesReportGenerator(), {"items": [], "total": 0})
+            pool.stats.clear()
+
+        stop = asyncio.Event()
+        lags: list[float] = []
+        probe_task = asyncio.create_task(probe(stop, lags))
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(
+                pool.render_excel(DevicesReportGenerator(), data)
+                for _ in range(concurrent_exports)
+            ))
+        finally:
+            wall_ms = (time.perf_counter() - start) * 1000
+            stop.set()
+            await probe_task
+            pool.shutdown()
+
+        lags.sort()
+        stats = pool.snapshot()["report_types"]["DevicesReportGenerator"]
+        results["modes"][mode] = {
+            "wall_ms": wall_ms,
+            "render_p50_ms": stats["render_time"]["p50_ms"],
+            "probe_ticks": len(lags),
+            "loop_lag_p50_ms": lags[len(lags) // 2] if lags else 0.0,
+            "loop_lag_p99_ms": lags[int(len(lags) * 0.99)] if lags else 0.0,
+            "loop_lag_max_ms": lags[-1] if lags else 0.0,
+        }
+
+    return results
+
+
+def benchmark_report_modes(sizes: Optional[list[int]] = None) -> dict:
+    """Compare the regular and write-only device Excel report.
+
+    Each mode renders every size twice: once timed, once under
+    tracemalloc for the peak Python heap of the render (the input rows
+    are allocated beforehand and not counted).
+    """
+    import gc
+    import tracemalloc
+
+    from src.glp.reports.devices_report import DevicesReportGenerator
+
+    generator = DevicesReportGenerator()
+    modes = {
+        # The regular sheet builders, whatever the row count
+        "regular": lambda data: generator._workbook_to_bytes(_regular_device_workbook(generator, data)),
+        "write_only": generator.generate_excel_write_only,
+    }
+
+    results: dict[str, Any] = {"sizes": {}}
+    for size in sizes or [10_000, 100_000]:
+        data = {"items": _device_report_items(size), "total": size}
+        size_results = results["sizes"][size] = {}
+        for name, render in modes.items():
+            gc.collect()
+            start = time.perf_counter()
+            content = render(data)
+            seconds = time.perf_counter() - start
+
+            gc.collect()
+            tracemalloc.start()
+            render(data)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            size_results[name] = {
+                "seconds": seconds,
+                "rows_per_sec": size / seconds,
+                "peak_mb": peak / 1024 / 1024,
+                "bytes_out": len(content),
+            }
+
+        regular, write_only = size_results["regular"], size_results["write_only"]
+        size_results["speedup"] = regular["seconds"] / write_only["seconds"]
+        size_results["memory_ratio"] = regular["peak_mb"] / max(write_only["peak_mb"], 0.001)
+
+    return results
+
+
+def _regular_device_workbook(generator, data: dict):
+    """Build the device report workbook with the regular (random-access) sheets."""
+    items = data["items"]
+    wb = generator.create_workbook()
+    ws_summary = wb.active
+    ws_summary.title = "Summary"
+    generator._create_summary_sheet(ws_summary, items, data["total"], None)
+    generator._create_device_list_sheet(wb.create_sheet("Device List"), items, None)
+    generator._create_insights_sheet(wb.create_sheet("Insights"), items)
+    return wb
+
+
+async def benchmark_end_to_end(
+    database_url: str,
+    device_count: int = 1000,
+    clients_per_site: int = 20,
+    assignment_count: int = 250,
+    mock_config=None,
+) -> dict:
+    """Run the real syncers and assignment workflow against the mock API.
+
+    Starts MockGreenLakeServer on a free local port and drives
+    SubscriptionSyncer, DeviceSyncer, ArubaCentralSyncer, ArubaClientsSyncer
+    and ApplyAssignmentsUseCase through GLPClient/ArubaCentralClient into
+    Postgres. Each stage reports wall time, throughput, API requests, 429s
+    and the SQL statements it ran.
+
+    The inventory tables of database_url are overwritten, so point it at a
+    scratch database with the schema and migrations applied.
+    """
+    from uuid import UUID
+
+    from src.glp.api import (
+        ArubaCentralClient,
+        ArubaCentralSyncer,
+        ArubaClientsSyncer,
+        ArubaTokenManager,
+        DeviceManager,
+        DeviceSyncer,
+        GLPClient,
+        SubscriptionSyncer,
+        TokenManager,
+    )
+    from src.glp.api.aruba_client import ArubaPaginationConfig
+    from src.glp.api.client import PaginationConfig
+    from src.glp.api.database import create_pool
+    from src.glp.api.query_metrics import get_query_metrics
+    from src.glp.api.resilience import AdaptiveRateLimiter
+    from src.glp.assignment.adapters.glp_device_manager import GLPDeviceManagerAdapter
+    from src.glp.assignment.domain.entities import DeviceAssignment
+    from src.glp.assignment.use_cases.apply_assignments import ApplyAssignmentsUseCase
+    from src.glp.mock_api import MockAPIConfig, MockGreenLakeServer
+
+    config = mock_config or MockAPIConfig()
+    subscription_count = max(device_count // 10, 1)
+    subscriptions = MockDataGenerator.generate_subscriptions(subscription_count)
+    devices = MockDataGenerator.generate_devices(device_count, subscription_count)
+    central_devices = MockDataGenerator.generate_central_devices(devices)
+    clients = MockDataGenerator.generate_clients(central_devices, clients_per_site)
+
+    # Without server-side limits, pace nothing so the run measures our code;
+    # with them, start from the production limits and let the limiter adapt.
+    unthrottled = {name: (1_000_000.0, 1000, 1_000_000.0) for name in AdaptiveRateLimiter.DEFAULT_LIMITS}
+    limits = None if config.rate_limits else unthrottled
+
+    results = {
+        "device_count": device_count,
+        "subscription_count": subscription_count,
+        "client_count": sum(len(c) for c in clients.values()),
+        "mock_config": asdict(config),
+        "stages": [],
+    }
+    metrics = get_query_metrics()
+    db_pool = await create_pool(database_url, min_size=2, max_size=10)
+
+    async with MockGreenLakeServer(devices, subscriptions, central_devices, clients, config) as server:
+        async def run_stage(name: str, items: int, coro_factory) -> Any:
+            before = server.stats.to_dict()
+            with metrics.scope(f"e2e:{name}") as query_scope, Timer(name) as timer:
+                outcome = await coro_factory()
+            after = server.stats.to_dict()
+            seconds = timer.duration_ms / 1000
+            stage = {
+                "stage": name,
+                "items": items,
+                "duration_ms": timer.duration_ms,
+                "items_per_second": items / seconds if seconds > 0 else 0,
+                "api_requests": after["total_requests"] - before["total_requests"],
+                "api_throttled": after["total_throttled"] - before["total_throttled"],
+                "queries": query_scope.queries,
+                "db_ms": query_scope.db_seconds * 1000,
+                "pool_wait_ms": query_scope.pool_wait_seconds * 1000,
+            }
+            results["stages"].append(stage)
+            logger.info(
+                f"  {name}: {items} items in {timer.duration_ms:.0f}ms "
+                f"({stage['items_per_second']:.0f}/sec), {stage['api_requests']} requests, "
+                f"{stage['api_throttled']} throttled, {stage['queries']} queries"
+            )
+            return outcome
+
+        glp_limiter = AdaptiveRateLimiter(limits=limits, name="e2e_glp")
+        central_limiter = AdaptiveRateLimiter(limits=limits, name="e2e_central")
+        glp_pagination = {
+            "devices": PaginationConfig(page_size=config.page_sizes["devices"], delay_between_pages=0),
+            "subscriptions": PaginationConfig(page_size=config.page_sizes["subscriptions"], delay_between_pages=0),
+        }
+        central_pagination = ArubaPaginationConfig(page_size=config.page_sizes["central"], delay_between_pages=0)
+
+        try:
+            token_manager = TokenManager("benchmark", "benchmark", server.token_url)
+            async with GLPClient(token_manager, base_url=server.base_url, rate_limiter=glp_limiter) as client:
+                await run_stage("subscriptions", len(subscriptions), SubscriptionSyncer(
+                    client, db_pool, pagination=glp_pagination["subscriptions"]
+                ).sync)
+                await run_stage("devices", len(devices), DeviceSyncer(
+                    client, db_pool, pagination=glp_pagination["devices"]
+                ).sync)
+
+                targets = devices[:min(assignment_count, len(devices))]
+                assignments = [
+                    DeviceAssignment(
+                        serial_number=device["serialNumber"],
+                        device_id=UUID(device["id"]),
+                        selected_application_id=UUID(MockDataGenerator.uuid_for(MockDataGenerator.APPLICATION_NS, 0)),
+                        selected_region="us-west",
+                        selected_subscription_id=UUID(subscriptions[0]["id"]),
+                        selected_tags={"benchmark": "e2e"},
+                    )
+                    for device in targets
+                ]
+                use_case = ApplyAssignmentsUseCase(
+                    device_manager=GLPDeviceManagerAdapter(DeviceManager(client)),
+                    rate_limiter=glp_limiter,
+                )
+                apply_result = await run_stage(
+                    "apply_assignments", len(assignments), lambda: use_case.execute(assignments)
+                )
+                results["stages"][-1]["errors"] = apply_result.errors
+
+            aruba_token_manager = ArubaTokenManager("benchmark", "benchmark", server.token_url)
+            async with ArubaCentralClient(
+                aruba_token_manager, base_url=server.base_url, rate_limiter=central_limiter
+            ) as central:
+                await run_stage("central_devices", len(central_devices), ArubaCentralSyncer(
+                    central, db_pool, pagination=central_pagination
+                ).sync)
+                await run_stage("clients", results["client_count"], ArubaClientsSyncer(
+                    central, db_pool, pagination=central_pagination
+                ).sync)
+        finally:
+            await db_pool.close()
+
+        results["api"] = server.stats.to_dict()
+        results["rate_limiters"] = {
+            "glp": glp_limiter.get_metrics(),
+            "central": central_limiter.get_metrics(),
+        }
+
+    results["total_duration_ms"] = sum(stage["duration_ms"] for stage in results["stages"])
+    return results
+
+
 async def profile_cpu_detailed(device_count: int = 1000, save_path: Optional[str] = None) -> dict:
     """Detailed CPU profiling of data processing."""
     devices = MockDataGenerator.generate_devices(device_count)
@@ -417,7 +1232,11 @@ async def run_benchmarks(args: argparse.Namespace) -> dict:
     logger.info("=" * 60)
 
     # 1. Mock data benchmarks (always run)
-    if args.mock or not (args.cpu or args.memory or args.queries):
+    if args.mock or not (
+        args.cpu or args.memory or args.queries or args.typeahead or args.removal
+        or args.query_metrics or args.e2e or args.entity_memory or args.mapping
+        or args.report_render
+    ):
         logger.info("\n--- Mock Data Operations Benchmark ---")
         mock_results = await benchmark_mock_db_operations(
             device_count=args.device_count
@@ -555,6 +1374,187 @@ async def run_benchmarks(args: argparse.Namespace) -> dict:
             logger.info(f"  Estimated {total_queries} queries for {n_devices} devices")
             logger.info(f"  Estimated overhead: {estimated_overhead_ms:.0f}ms")
 
+    # 6. Typeahead index latency
+    if args.typeahead or args.all:
+        logger.info("\n--- Typeahead Index Benchmark ---")
+        typeahead_results = await benchmark_typeahead(
+            device_count=max(args.device_count, 100_000)
+        )
+        results["benchmarks"].append({
+            "name": "typeahead",
+            "results": typeahead_results,
+        })
+
+        logger.info(
+            f"  Build {typeahead_results['indexed_entries']} entries: "
+            f"{typeahead_results['build_ms']:.0f}ms"
+        )
+        logger.info(
+            f"  Lookup p50={typeahead_results['lookup_p50_us']:.1f}us "
+            f"p99={typeahead_results['lookup_p99_us']:.1f}us"
+        )
+
+    # 7. Removal detection (requires DATABASE_URL)
+    if args.removal or (args.all and not args.mock):
+        logger.info("\n--- Removal Detection Benchmark ---")
+        db_url = os.getenv("DATABASE_URL")
+        if not db_url:
+            logger.warning("No DATABASE_URL, skipping removal detection benchmark")
+        else:
+            import asyncpg
+
+            db_pool = await asyncpg.create_pool(db_url, min_size=1, max_size=2)
+            try:
+                removal_results = await benchmark_removal_detection(
+                    db_pool,
+                    device_count=max(args.device_count, 100_000),
+                    client_count=max(args.device_count * 5, 500_000),
+                )
+            finally:
+                await db_pool.close()
+
+            results["benchmarks"].append({
+                "name": "removal_detection",
+                "results": removal_results,
+            })
+            logger.info(
+                f"  Devices ({removal_results['device_count']}): "
+                f"array {removal_results['devices_array_ms']:.0f}ms, "
+                f"anti-join {removal_results['devices_anti_join_ms']:.0f}ms"
+            )
+            logger.info(
+                f"  Clients ({removal_results['client_count']}): "
+                f"site index {removal_results['clients_site_index_ms']:.0f}ms, "
+                f"partial index {removal_results['clients_partial_index_ms']:.0f}ms"
+            )
+
+    # 8. Query instrumentation overhead (round trips need DATABASE_URL)
+    if args.query_metrics or args.all:
+        logger.info("\n--- Query Instrumentation Overhead ---")
+        db_url = None if args.mock else os.getenv("DATABASE_URL")
+        metrics_results = await benchmark_query_metrics(db_url)
+        results["benchmarks"].append({
+            "name": "query_metrics",
+            "results": metrics_results,
+        })
+        logger.info(f"  record(): {metrics_results['record_ns_per_call']:.0f}ns per statement")
+        if "overhead_pct" in metrics_results:
+            logger.info(
+                f"  SELECT round trip p50: plain {metrics_results['plain_p50_us']:.0f}us, "
+                f"instrumented {metrics_results['instrumented_p50_us']:.0f}us "
+                f"({metrics_results['overhead_pct']:+.1f}%)"
+            )
+
+    # 9. Entity memory per synced device
+    if args.entity_memory or args.all:
+        logger.info("\n--- Entity Memory Benchmark ---")
+        entity_results = benchmark_entity_memory(
+            device_count=max(args.device_count, 100_000)
+        )
+        results["benchmarks"].append({
+            "name": "entity_memory",
+            "results": entity_results,
+        })
+        for name, stats in entity_results["strategies"].items():
+            logger.info(
+                f"  {name}: {stats['bytes_per_device']:.0f} bytes/device "
+                f"(peak {stats['peak_bytes_per_device']:.0f})"
+            )
+
+    # 10. Mapping CPU per page strategy
+    if args.mapping or args.all:
+        logger.info("\n--- Mapping CPU Benchmark ---")
+        mapping_results = benchmark_mapping_cpu()
+        results["benchmarks"].append({
+            "name": "mapping_cpu",
+            "results": mapping_results,
+        })
+        for size, timings in mapping_results["sizes"].items():
+            for name, stats in timings.items():
+                logger.info(
+                    f"  {size} devices, {name}: {stats['cpu_ms']:.0f}ms "
+                    f"({stats['devices_per_sec']:.0f}/s, "
+                    f"{stats['vs_entities']:.2f}x entities)"
+                )
+
+    # 11. Event-loop lag during concurrent Excel exports
+    if args.report_render or args.all:
+        logger.info("\n--- Report Render Benchmark ---")
+        render_results = await benchmark_report_render(
+            row_count=max(args.device_count, 20_000)
+        )
+        results["benchmarks"].append({
+            "name": "report_render",
+            "results": render_results,
+        })
+        for mode, stats in render_results["modes"].items():
+            logger.info(
+                f"  {mode}: {stats['wall_ms']:.0f}ms for {render_results['concurrent_exports']} "
+                f"exports, loop lag p50={stats['loop_lag_p50_ms']:.1f}ms "
+                f"p99={stats['loop_lag_p99_ms']:.1f}ms max={stats['loop_lag_max_ms']:.0f}ms"
+            )
+
+    # 12. Regular vs write-only Excel report at 10k/100k rows
+    if args.report_modes or args.all:
+        logger.info("\n--- Report Mode Benchmark ---")
+        mode_results = benchmark_report_modes()
+        results["benchmarks"].append({
+            "name": "report_modes",
+            "results": mode_results,
+        })
+        for size, stats in mode_results["sizes"].items():
+            for mode in ("regular", "write_only"):
+                logger.info(
+                    f"  {size} rows, {mode}: {stats[mode]['seconds']:.1f}s, "
+                    f"peak {stats[mode]['peak_mb']:.1f}MB"
+                )
+            logger.info(
+                f"  {size} rows: {stats['speedup']:.1f}x faster, "
+                f"{stats['memory_ratio']:.0f}x less peak memory"
+            )
+
+    # 13. End-to-end sync against the mock API (requires BENCHMARK_DATABASE_URL)
+    if args.e2e:
+        logger.info("\n--- End-to-End Benchmark (mock API) ---")
+        db_url = os.getenv("BENCHMARK_DATABASE_URL")
+        if not db_url:
+            logger.warning(
+                "No BENCHMARK_DATABASE_URL, skipping end-to-end benchmark "
+                "(it overwrites inventory tables, so DATABASE_URL is not used)"
+            )
+        else:
+            from src.glp.mock_api import MockAPIConfig
+
+            mock_config = MockAPIConfig(
+                latency_ms=args.mock_latency_ms,
+                error_429_rate=args.mock_429_rate,
+            )
+            if args.mock_rate_limit:
+                mock_config.rate_limits = {
+                    name: args.mock_rate_limit
+                    for name in ("get", "patch", "post", "async_status", "central")
+                }
+            if args.mock_page_size:
+                mock_config.page_sizes = {
+                    name: min(size, args.mock_page_size)
+                    for name, size in mock_config.page_sizes.items()
+                }
+
+            e2e_results = await benchmark_end_to_end(
+                db_url,
+                device_count=args.device_count,
+                mock_config=mock_config,
+            )
+            results["benchmarks"].append({
+                "name": "end_to_end",
+                "results": e2e_results,
+            })
+            logger.info(
+                f"  Total: {e2e_results['total_duration_ms']:.0f}ms, "
+                f"{e2e_results['api']['total_requests']} API requests, "
+                f"{e2e_results['api']['total_throttled']} throttled"
+            )
+
     # Summary
     end_time = datetime.utcnow()
     duration = (end_time - start_time).total_seconds()
@@ -585,6 +1585,7 @@ Examples:
   python benchmark.py --cpu               # CPU profiling
   python benchmark.py --cpu-dump sync.prof  # Save CPU profile for snakeviz
   python benchmark.py --all               # All profiling modes
+  python benchmark.py --e2e --mock-latency-ms 50  # Syncers against a mock API
   python benchmark.py --output report.json  # Save results to JSON
         """
     )
@@ -616,6 +1617,47 @@ Examples:
         action="store_true",
         help="Enable query pattern analysis"
     )
+    mode_group.add_argument(
+        "--typeahead",
+        action="store_true",
+        help="Benchmark typeahead index lookups (at least 100k devices)"
+    )
+    mode_group.add_argument(
+        "--removal",
+        action="store_true",
+        help="Benchmark removal detection at 100k devices/500k clients (needs DATABASE_URL)"
+    )
+    mode_group.add_argument(
+        "--query-metrics",
+        action="store_true",
+        help="Measure query instrumentation overhead (round trips need DATABASE_URL)"
+    )
+    mode_group.add_argument(
+        "--entity-memory",
+        action="store_true",
+        help="Measure bytes per device for entity vs record mapping (at least 100k devices)"
+    )
+    mode_group.add_argument(
+        "--mapping",
+        action="store_true",
+        help="Compare device mapping CPU time per strategy at 10k and 100k devices"
+    )
+    mode_group.add_argument(
+        "--report-render",
+        action="store_true",
+        help="Event-loop lag during concurrent Excel exports, threads vs process pool"
+    )
+    mode_group.add_argument(
+        "--report-modes",
+        action="store_true",
+        help="Time and peak memory of regular vs write-only Excel reports at 10k and 100k rows"
+    )
+    mode_group.add_argument(
+        "--e2e",
+        action="store_true",
+        help="Run all syncers and assignments against a local mock API "
+             "(needs BENCHMARK_DATABASE_URL, a scratch database)"
+    )
     mode_group.add_argument(
         "--all",
         action="store_true",
@@ -630,6 +1672,32 @@ Examples:
         default=1000,
         help="Number of mock devices to generate (default: 1000)"
     )
+    config_group.add_argument(
+        "--mock-latency-ms",
+        type=float,
+        default=0.0,
+        help="Latency added to every mock API response (default: 0)"
+    )
+    config_group.add_argument(
+        "--mock-rate-limit",
+        type=float,
+        default=0.0,
+        metavar="RPM",
+        help="Mock API requests per minute per endpoint class (default: unlimited)"
+    )
+    config_group.add_argument(
+        "--mock-429-rate",
+        type=float,
+        default=0.0,
+        metavar="FRACTION",
+        help="Fraction of mock API requests answered with 429 (default: 0)"
+    )
+    config_group.add_argument(
+        "--mock-page-size",
+        type=int,
+        default=0,
+        help="Cap mock API page sizes (default: API maximums)"
+    )
 
     # Output
     output_group = parser.add_argument_group("Output")
@@ -649,7 +1717,11 @@ Examples:
     args = parser.parse_args()
 
     # Default to mock mode if no flags specified
-    if not any([args.mock, args.live, args.cpu, args.memory, args.queries, args.all]):
+    if not any([
+        args.mock, args.live, args.cpu, args.memory, args.queries, args.typeahead,
+        args.removal, args.query_metrics, args.e2e, args.entity_memory, args.mapping,
+        args.report_render, args.all,
+    ]):
         args.mock = True
 
     # Run benchmarks
@@ -0,0 +1,15 @@
+-- Migration 008: Index subscriptions.synced_at for sync-generation checks
+-- Applied: 2026-10-18
+--
+-- The assignment API caches a precomputed subscription compatibility index
+-- (device type / model series -> subscription options) per process and
+-- rebuilds it only when the subscription data changes. It detects changes
+-- with SELECT MAX(synced_at) FROM subscriptions on each options request;
+-- this index turns that into a single index lookup.
+--
+-- Performance Impact:
+-- - Options requests no longer scan and filter every subscription
+-- - Negligible write cost (subscriptions table is small)
+
+CREATE INDEX IF NOT EXISTS idx_subscriptions_synced_at
+ON subscriptions(synced_at DESC);
@@ -0,0 +1,46 @@
+-- Migration 009: Sync-generation stamping for removal detection
+-- Applied: 2026-10-18
+--
+-- Syncers used to detect removed rows by passing every key seen in the run
+-- as an array (serial_number != ALL($1::text[])), which compares each row
+-- against the whole array and ships a large parameter on every sync.
+--
+-- The firmware sync now draws a generation id from sync_generation_seq and
+-- stamps it on every device it updates. Clearing stale firmware becomes a
+-- single UPDATE ... WHERE firmware_sync_generation IS DISTINCT FROM
+-- $current, scoped by a partial index to devices that still have firmware.
+--
+-- The Central device sync needs no column: it COPYs every page into a
+-- temporary staging table and finds removed devices with an anti-join
+-- against it.
+--
+-- Clients already stamp synced_at with the run's timestamp (which works as
+-- a generation); they get a matching partial index.
+--
+-- Performance Impact:
+-- - Removal detection is O(rows in scope) instead of O(rows x seen keys)
+-- - No per-sync array parameter (previously ~1.5 MB at 100k serials)
+-- - One extra BIGINT write per touched row
+
+CREATE SEQUENCE IF NOT EXISTS sync_generation_seq;
+
+-- ============================================
+-- Aruba Central firmware
+-- ============================================
+
+ALTER TABLE devices ADD COLUMN IF NOT EXISTS firmware_sync_generation BIGINT;
+
+CREATE INDEX IF NOT EXISTS idx_devices_firmware_sync_generation
+ON devices(firmware_sync_generation)
+WHERE firmware_version IS NOT NULL;
+
+-- ============================================
+-- Aruba Central clients
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_clients_site_synced_active
+ON clients(site_id, synced_at)
+WHERE status IS DISTINCT FROM 'REMOVED';
+
+COMMENT ON COLUMN devices.firmware_sync_generation IS
+    'Generation of the last Aruba Central firmware sync that saw this device';
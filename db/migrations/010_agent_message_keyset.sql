@@ -0,0 +1,18 @@
+-- Migration 010: Keyset index for agent message windows
+-- Applied: 2026-10-18
+--
+-- Chat turns load the last N messages of a conversation and history
+-- views page backwards with a (created_at, id) cursor instead of loading
+-- every message. Both read agent_messages in (created_at, id) order
+-- within one conversation; with id in the index the ORDER BY ... LIMIT
+-- and the row comparison are served by a backward index scan that stops
+-- after N rows.
+--
+-- Performance Impact:
+-- - Per-turn message load is bounded by the window, not the conversation length
+-- - Replaces idx_agent_messages_conversation, whose columns are a prefix of the new index
+
+CREATE INDEX IF NOT EXISTS idx_agent_messages_conversation_keyset
+    ON agent_messages(conversation_id, created_at, id);
+
+DROP INDEX IF EXISTS idx_agent_messages_conversation;
@@ -43,6 +43,7 @@ export function ChatWidget({
     isLoading,
     error,
     pendingConfirmation,
+    queuePosition,
     connect,
     disconnect,
     sendMessage,
@@ -204,6 +205,13 @@ export function ChatWidget({
         )}
       </div>
 
+      {/* Queue position while waiting for a free slot */}
+      {queuePosition !== null && (
+        <div className="px-4 py-2 border-t border-slate-700/50 text-slate-400 text-sm">
+          Assistant is busy. Your message is number {queuePosition} in line.
+        </div>
+      )}
+
       {/* Error message */}
       {error && (
         <div className="px-4 py-2 bg-red-500/10 border-t border-red-500/20 flex items-center gap-2 text-red-400 text-sm">
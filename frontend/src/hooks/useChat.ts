@@ -4,6 +4,7 @@
  * Features:
  * - JWT authentication for ticket requests
  * - Automatic reconnection with exponential backoff
+ * - Resumes an in-flight answer after reconnecting
  * - Heartbeat ping to keep connection alive
  * - Proper error handling and state management
  */
@@ -26,6 +27,9 @@ export interface ToolCall {
   name: string
   arguments: Record<string, unknown>
   result?: unknown
+  // Rows of a large result, streamed ahead of its summary
+  rows?: unknown[]
+  totalRows?: number
 }
 
 export interface PendingConfirmation {
@@ -42,6 +46,8 @@ export interface ChatState {
   error: string | null
   conversationId: string | null
   pendingConfirmation: PendingConfirmation | null
+  // Place in the chat queue while waiting for a free slot
+  queuePosition: number | null
 }
 
 interface WebSocketEvent {
@@ -53,6 +59,7 @@ interface WebSocketEvent {
   tool_arguments?: Record<string, unknown>
   error_type?: string
   metadata?: Record<string, unknown>
+  stream_id?: string
 }
 
 const INITIAL_STATE: ChatState = {
@@ -63,6 +70,7 @@ const INITIAL_STATE: ChatState = {
   error: null,
   conversationId: null,
   pendingConfirmation: null,
+  queuePosition: null,
 }
 
 // Reconnection settings
@@ -109,6 +117,9 @@ export function useChat(options: UseChatOptions = {}) {
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null)
   const heartbeatIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null)
   const manualDisconnectRef = useRef(false)
+  // In-flight answer, resumed from lastSequence after a reconnect
+  const streamRef = useRef<{ id: string; lastSequence: number } | null>(null)
+  const queuedRef = useRef(false)
 
   // Clear reconnect timeout
   const clearReconnectTimeout = useCallback(() => {
@@ -148,7 +159,34 @@ export function useChat(options: UseChatOptions = {}) {
 
   // Handle WebSocket events
   const handleWebSocketEvent = useCallback((event: WebSocketEvent) => {
+    if (streamRef.current && typeof event.sequence === 'number') {
+      streamRef.current.lastSequence = event.sequence
+    }
+
+    if (event.type !== 'queued' && queuedRef.current) {
+      queuedRef.current = false
+      setState(prev => ({ ...prev, queuePosition: null }))
+    }
+
     switch (event.type) {
+      case 'queued':
+        queuedRef.current = true
+        setState(prev => ({
+          ...prev,
+          queuePosition: (event.metadata?.position as number) ?? null,
+        }))
+        break
+
+      case 'stream_started':
+        streamRef.current = event.stream_id ? { id: event.stream_id, lastSequence: 0 } : null
+        break
+
+      case 'cancel':
+      case 'cancelled':
+        streamRef.current = null
+        setState(prev => ({ ...prev, isLoading: false }))
+        break
+
       case 'text_delta':
         currentMessageRef.current += event.content || ''
         setState(prev => {
@@ -217,11 +255,17 @@ export function useChat(options: UseChatOptions = {}) {
           const messages = [...prev.messages]
           const lastMsg = messages[messages.length - 1]
           if (lastMsg?.role === 'assistant' && lastMsg.toolCalls) {
-            const toolCalls = lastMsg.toolCalls.map(tc =>
-              tc.id === event.tool_call_id
-                ? { ...tc, result: event.content }
-                : tc
-            )
+            const toolCalls = lastMsg.toolCalls.map(tc => {
+              if (tc.id !== event.tool_call_id) return tc
+              if (event.metadata?.partial) {
+                return {
+                  ...tc,
+                  rows: [...(tc.rows || []), ...(event.metadata.rows as unknown[] || [])],
+                  totalRows: event.metadata.total_rows as number,
+                }
+              }
+              return { ...tc, result: event.content }
+            })
             messages[messages.length - 1] = { ...lastMsg, toolCalls }
           }
           return { ...prev, messages }
@@ -255,9 +299,11 @@ export function useChat(options: UseChatOptions = {}) {
         })
         currentMessageRef.current = ''
         currentThinkingRef.current = ''
+        streamRef.current = null
         break
 
       case 'error':
+        streamRef.current = null
         setState(prev => ({
           ...prev,
           isLoading: false,
@@ -324,6 +370,16 @@ export function useChat(options: UseChatOptions = {}) {
         reconnectAttemptsRef.current = 0
         setState(prev => ({ ...prev, isConnected: true, isConnecting: false, error: null }))
         startHeartbeat()
+
+        // Pick up the answer that was streaming when the connection dropped
+        if (streamRef.current) {
+          ws.send(JSON.stringify({
+            type: 'resume',
+            stream_id: streamRef.current.id,
+            after_sequence: streamRef.current.lastSequence,
+          }))
+          setState(prev => ({ ...prev, isLoading: true }))
+        }
       }
 
       ws.onclose = (event) => {
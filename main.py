@@ -39,10 +39,12 @@ load_dotenv()
 
 # Local imports
 from src.glp.api import (
+    DEFAULT_POOL_CONFIGS,
     DeviceSyncer,
     GLPClient,
     SubscriptionSyncer,
     TokenManager,
+    create_named_pool,
 )
 
 
@@ -58,21 +60,14 @@ async def setup_database():
         return None
 
     try:
-        import asyncpg
-
-        pool = await asyncpg.create_pool(
+        pool = await create_named_pool(
             database_url,
-            min_size=2,
-            max_size=10,
-            command_timeout=60,
+            DEFAULT_POOL_CONFIGS["bulk_sync"].with_env_overrides(),
         )
 
         print("[Main] Connected to PostgreSQL")
         return pool
 
-    except ImportError:
-        print("[Main] asyncpg not installed. Run: pip install asyncpg")
-        return None
     except Exception as e:
         print(f"[Main] Database connection failed: {e}")
         return None
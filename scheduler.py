@@ -6,19 +6,36 @@ devices and/or subscriptions at configurable intervals. Designed to run
 as the main process in a Docker container.
 
 Architecture:
-    - Simple asyncio loop with sleep (no external dependencies)
+    - Each source (subscriptions, devices, Central devices, Central clients,
+      firmware) is a separate job with its own interval and jitter (see
+      src/glp/api/job_scheduler.py); devices wait for subscriptions, clients
+      for Central devices
+    - PostgreSQL advisory locks keep replicas from running the same job at once
+    - SYNC_MODE=cycle restores the single-interval sync cycle
     - Graceful shutdown on SIGTERM/SIGINT
     - Configurable via environment variables
     - Health check endpoint via optional HTTP server
     - Supports both GreenLake and Aruba Central as data sources
 
 Environment Variables:
-    SYNC_INTERVAL_MINUTES: Minutes between sync runs (default: 60)
+    SYNC_MODE: "jobs" (independent jobs, default) or "cycle" (one sync cycle
+        every SYNC_INTERVAL_MINUTES)
+    SYNC_INTERVAL_MINUTES: Minutes between sync cycles, and the default
+        device job interval (default: 60)
     SYNC_DEVICES: Enable GreenLake device sync (default: true)
     SYNC_SUBSCRIPTIONS: Enable subscription sync (default: true)
     SYNC_CENTRAL: Enable Aruba Central device sync (default: true)
+    SYNC_CLIENTS: Enable Aruba Central client sync, jobs mode (default: SYNC_CENTRAL)
+    SYNC_FIRMWARE: Enable Aruba Central firmware sync, jobs mode (default: SYNC_CENTRAL)
+    SYNC_<JOB>_INTERVAL_MINUTES: Per-job interval in jobs mode; defaults:
+        SUBSCRIPTIONS 360, DEVICES SYNC_INTERVAL_MINUTES, CENTRAL 30,
+        CLIENTS 15, FIRMWARE 1440
+    SYNC_JOB_JITTER: Fraction of each interval randomly added or removed (default: 0.1)
+    SYNC_MAX_CONCURRENT_JOBS: Jobs running at the same time (default: 2)
     SYNC_ON_STARTUP: Run sync immediately on startup (default: true)
-    HEALTH_CHECK_PORT: Port for health check endpoint (default: 8080, 0 to disable)
+    HEALTH_CHECK_PORT: Port for health check endpoint (default: 8080, 0 to disable);
+        GET /health/queries returns per-statement query metrics,
+        GET /health/jobs per-job status
 
     GreenLake credentials:
         GLP_CLIENT_ID, GLP_CLIENT_SECRET, GLP_TOKEN_URL, GLP_BASE_URL
@@ -30,8 +47,11 @@ Environment Variables:
         DATABASE_URL
 
 Example:
-    # Run every 30 minutes, sync both platforms
-    SYNC_INTERVAL_MINUTES=30 python scheduler.py
+    # Default jobs; refresh Central device status every 10 minutes
+    SYNC_CENTRAL_INTERVAL_MINUTES=10 python scheduler.py
+
+    # One sync cycle every 30 minutes, both platforms
+    SYNC_MODE=cycle SYNC_INTERVAL_MINUTES=30 python scheduler.py
 
     # Run every 6 hours, GreenLake devices only
     SYNC_INTERVAL_MINUTES=360 SYNC_SUBSCRIPTIONS=false SYNC_CENTRAL=false python scheduler.py
@@ -45,12 +65,14 @@ Docker Usage:
 Author: HPE GreenLake Team
 """
 import asyncio
+import json
 import logging
 import os
 import signal
 import sys
 import traceback
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -59,13 +81,22 @@ load_dotenv()
 
 # Local imports
 from src.glp.api import (
+    DEFAULT_POOL_CONFIGS,
+    AdvisoryLocks,
     ArubaCentralClient,
     ArubaCentralSyncer,
+    ArubaClientsSyncer,
+    ArubaFirmwareSyncer,
     ArubaTokenManager,
     DeviceSyncer,
     GLPClient,
+    JobScheduler,
+    JobState,
     SubscriptionSyncer,
+    SyncJob,
     TokenManager,
+    create_named_pool,
+    get_query_metrics,
 )
 
 # Initialize logger
@@ -88,7 +119,39 @@ class SchedulerConfig:
         self.max_retries = int(os.getenv("SYNC_MAX_RETRIES", "3"))
         self.retry_delay_minutes = int(os.getenv("SYNC_RETRY_DELAY_MINUTES", "5"))
 
+        # Jobs mode: one job per source, each on its own interval
+        self.mode = os.getenv("SYNC_MODE", "jobs").lower()
+        central = "true" if self.sync_central else "false"
+        self.sync_clients = os.getenv("SYNC_CLIENTS", central).lower() == "true"
+        self.sync_firmware = os.getenv("SYNC_FIRMWARE", central).lower() == "true"
+        self.job_intervals_minutes = {
+            "subscriptions": int(os.getenv("SYNC_SUBSCRIPTIONS_INTERVAL_MINUTES", "360")),
+            "devices": int(os.getenv("SYNC_DEVICES_INTERVAL_MINUTES", str(self.interval_minutes))),
+            "central": int(os.getenv("SYNC_CENTRAL_INTERVAL_MINUTES", "30")),
+            "clients": int(os.getenv("SYNC_CLIENTS_INTERVAL_MINUTES", "15")),
+            "firmware": int(os.getenv("SYNC_FIRMWARE_INTERVAL_MINUTES", "1440")),
+        }
+        self.job_jitter = float(os.getenv("SYNC_JOB_JITTER", "0.1"))
+        self.max_concurrent_jobs = int(os.getenv("SYNC_MAX_CONCURRENT_JOBS", "2"))
+
     def __repr__(self):
+        if self.mode == "jobs":
+            enabled = {
+                "subscriptions": self.sync_subscriptions,
+                "devices": self.sync_devices,
+                "central": self.sync_central,
+                "clients": self.sync_clients,
+                "firmware": self.sync_firmware,
+            }
+            jobs = ", ".join(
+                f"{name}={self.job_intervals_minutes[name]}m"
+                for name, on in enabled.items() if on
+            )
+            return (
+                f"SchedulerConfig(mode=jobs, {jobs}, "
+                f"startup={self.sync_on_startup}, "
+                f"health_port={self.health_check_port})"
+            )
         return (
             f"SchedulerConfig("
             f"interval={self.interval_minutes}m, "
@@ -105,7 +168,7 @@ class SchedulerConfig:
 # ============================================
 
 async def create_db_pool():
-    """Create database connection pool.
+    """Create the bulk-sync database connection pool.
 
     Returns:
         asyncpg.Pool or None if database not configured
@@ -117,21 +180,16 @@ async def create_db_pool():
         return None
 
     try:
-        import asyncpg
-
-        pool = await asyncpg.create_pool(
+        # Bulk-sync pool settings (long command timeout, small pool);
+        # tune with DB_POOL_BULK_SYNC_* env vars
+        pool = await create_named_pool(
             database_url,
-            min_size=2,
-            max_size=10,
-            command_timeout=60,
+            DEFAULT_POOL_CONFIGS["bulk_sync"].with_env_overrides(),
         )
 
         print("[Scheduler] Connected to PostgreSQL")
         return pool
 
-    except ImportError:
-        print("[Scheduler] ERROR: asyncpg not installed")
-        return None
     except Exception as e:
         print(f"[Scheduler] ERROR: Database connection failed: {e}")
         return None
@@ -377,7 +435,14 @@ async def run_sync_with_retry(
     last_error = None
 
     for attempt in range(config.max_retries):
-        results = await run_sync(config, token_manager, db_pool, aruba_token_manager)
+        with get_query_metrics().scope("scheduler:sync_cycle") as query_scope:
+            results = await run_sync(config, token_manager, db_pool, aruba_token_manager)
+        results["queries"] = {
+            "count": query_scope.queries,
+            "db_seconds": round(query_scope.db_seconds, 3),
+            "pool_wait_seconds": round(query_scope.pool_wait_seconds, 3),
+        }
+        log_top_statements()
 
         if results["success"]:
             if attempt > 0:
@@ -395,6 +460,136 @@ async def run_sync_with_retry(
     return results
 
 
+def log_top_statements(limit: int = 5) -> None:
+    """Log the statements with the most cumulative time so far."""
+    for row in get_query_metrics().top_statements(limit):
+        logger.info(
+            f"Query {row['total_ms']:.0f}ms total, {row['calls']} calls, "
+            f"p99 {row['p99_ms']:.0f}ms: {row['statement'][:120]}"
+        )
+
+
+# ============================================
+# Sync Jobs
+# ============================================
+
+async def sync_subscriptions_job(token_manager: TokenManager, db_pool) -> dict:
+    """Sync (or, without a database, fetch) GreenLake subscriptions."""
+    async with GLPClient(token_manager) as client:
+        syncer = SubscriptionSyncer(client=client, db_pool=db_pool)
+        if db_pool:
+            return await syncer.sync()
+        subs = await syncer.fetch_all_subscriptions()
+        return {"fetched": len(subs), "mode": "fetch-only"}
+
+
+async def sync_devices_job(token_manager: TokenManager, db_pool) -> dict:
+    """Sync (or, without a database, fetch) GreenLake devices."""
+    async with GLPClient(token_manager) as client:
+        syncer = DeviceSyncer(client=client, db_pool=db_pool)
+        if db_pool:
+            return await syncer.sync()
+        devices = await syncer.fetch_all_devices()
+        return {"fetched": len(devices), "mode": "fetch-only"}
+
+
+async def sync_central_job(aruba_token_manager: ArubaTokenManager, db_pool) -> dict:
+    """Sync (or, without a database, fetch) Aruba Central devices."""
+    async with ArubaCentralClient(aruba_token_manager) as client:
+        syncer = ArubaCentralSyncer(client=client, db_pool=db_pool)
+        if db_pool:
+            return await syncer.sync()
+        central_devices = await syncer.fetch_all_devices()
+        return {"fetched": len(central_devices), "mode": "fetch-only"}
+
+
+async def sync_clients_job(aruba_token_manager: ArubaTokenManager, db_pool) -> dict:
+    """Sync Aruba Central clients for the sites found by the Central device sync."""
+    async with ArubaCentralClient(aruba_token_manager) as client:
+        return await ArubaClientsSyncer(client=client, db_pool=db_pool).sync()
+
+
+async def sync_firmware_job(aruba_token_manager: ArubaTokenManager, db_pool) -> dict:
+    """Sync (or, without a database, fetch) Aruba Central firmware details."""
+    async with ArubaCentralClient(aruba_token_manager) as client:
+        syncer = ArubaFirmwareSyncer(client=client, db_pool=db_pool)
+        if db_pool:
+            return await syncer.sync()
+        firmware = await syncer.fetch_all_firmware()
+        return {"fetched": len(firmware), "mode": "fetch-only"}
+
+
+async def run_with_query_metrics(name: str, sync) -> dict:
+    """Run one job's sync in its own query metrics scope."""
+    with get_query_metrics().scope(f"scheduler:{name}") as query_scope:
+        result = await sync()
+    if isinstance(result, dict):
+        result["queries"] = {
+            "count": query_scope.queries,
+            "db_seconds": round(query_scope.db_seconds, 3),
+            "pool_wait_seconds": round(query_scope.pool_wait_seconds, 3),
+        }
+    return result
+
+
+def build_sync_jobs(
+    config: SchedulerConfig,
+    token_manager: Optional[TokenManager],
+    db_pool,
+    aruba_token_manager: Optional[ArubaTokenManager] = None,
+) -> list[SyncJob]:
+    """Create the enabled sync jobs.
+
+    Devices depend on subscriptions when writing to the database
+    (device_subscriptions foreign key); clients depend on Central devices,
+    which provide the sites clients are fetched for.
+
+    Args:
+        config: Scheduler configuration
+        token_manager: TokenManager for GreenLake (None skips GreenLake jobs)
+        db_pool: Database connection pool (can be None)
+        aruba_token_manager: ArubaTokenManager for Aruba Central (optional)
+
+    Returns:
+        Jobs to pass to JobScheduler
+    """
+    candidates = []
+    if token_manager:
+        candidates += [
+            ("subscriptions", config.sync_subscriptions, sync_subscriptions_job, token_manager, ()),
+            (
+                "devices", config.sync_devices, sync_devices_job, token_manager,
+                ("subscriptions",) if db_pool else (),
+            ),
+        ]
+    if aruba_token_manager:
+        candidates += [
+            ("central", config.sync_central, sync_central_job, aruba_token_manager, ()),
+            # Clients are fetched per site, and sites come from the database
+            (
+                "clients", config.sync_clients and db_pool is not None, sync_clients_job,
+                aruba_token_manager, ("central",),
+            ),
+            ("firmware", config.sync_firmware, sync_firmware_job, aruba_token_manager, ()),
+        ]
+    elif config.sync_central:
+        print("[Scheduler] WARNING: SYNC_CENTRAL enabled but Aruba credentials not configured")
+
+    jobs = []
+    for name, enabled, sync, credentials, depends_on in candidates:
+        if not enabled:
+            continue
+        jobs.append(SyncJob(
+            name=name,
+            run=partial(run_with_query_metrics, name, partial(sync, credentials, db_pool)),
+            interval_seconds=config.job_intervals_minutes[name] * 60,
+            jitter=config.job_jitter,
+            depends_on=depends_on,
+            retry_delay_seconds=config.retry_delay_minutes * 60,
+        ))
+    return jobs
+
+
 # ============================================
 # Health Check Server
 # ============================================
@@ -408,30 +603,68 @@ class HealthState:
         self.total_syncs: int = 0
         self.failed_syncs: int = 0
         self.started_at: datetime = datetime.now(UTC)
+        # Set in jobs mode; per-job health replaces last_sync_success
+        self.job_scheduler: Optional[JobScheduler] = None
+
+    def record_job(self, state: JobState) -> None:
+        """Count a finished job run (JobScheduler on_finished callback)."""
+        if state.last_outcome == "locked":
+            return
+        self.total_syncs += 1
+        self.last_sync_at = state.last_finished_at
+        self.last_sync_success = state.last_outcome == "success"
+        if not self.last_sync_success:
+            self.failed_syncs += 1
+
+    @property
+    def healthy(self) -> bool:
+        if self.job_scheduler is not None:
+            return self.job_scheduler.healthy
+        return self.last_sync_success or self.total_syncs == 0
 
 
 async def health_check_handler(reader, writer, state: HealthState):
     """Handle HTTP health check requests."""
-    # Read request (we don't care about the content)
-    await reader.read(1024)
+    # Only the request path matters (GET /health/queries vs. anything else)
+    request = await reader.read(1024)
+    request_line = request.split(b"\r\n", 1)[0].split()
+    path = request_line[1].decode(errors="replace") if len(request_line) > 1 else "/"
 
     # Build response
     uptime = (datetime.now(UTC) - state.started_at).total_seconds()
-    status = "healthy" if state.last_sync_success or state.total_syncs == 0 else "unhealthy"
-
-    body = (
-        f'{{"status": "{status}", '
-        f'"uptime_seconds": {uptime:.0f}, '
-        f'"total_syncs": {state.total_syncs}, '
-        f'"failed_syncs": {state.failed_syncs}, '
-        f'"last_sync_at": "{state.last_sync_at.isoformat() if state.last_sync_at else "never"}"}}'
-    )
+    status = "healthy" if state.healthy else "unhealthy"
+
+    if path.startswith("/health/queries"):
+        status = "healthy"
+        body = json.dumps(get_query_metrics().snapshot())
+    elif path.startswith("/health/jobs"):
+        jobs = state.job_scheduler.snapshot() if state.job_scheduler else {}
+        body = json.dumps({"status": status, "jobs": jobs})
+    else:
+        payload = {
+            "status": status,
+            "uptime_seconds": round(uptime),
+            "total_syncs": state.total_syncs,
+            "failed_syncs": state.failed_syncs,
+            "last_sync_at": state.last_sync_at.isoformat() if state.last_sync_at else "never",
+        }
+        if state.job_scheduler is not None:
+            payload["jobs"] = {
+                name: {
+                    "healthy": job["healthy"],
+                    "last_outcome": job["last_outcome"],
+                    "last_success_at": job["last_success_at"],
+                    "next_run_at": job["next_run_at"],
+                }
+                for name, job in state.job_scheduler.snapshot().items()
+            }
+        body = json.dumps(payload)
 
     http_status = 200 if status == "healthy" else 503
     response = (
         f"HTTP/1.1 {http_status} {'OK' if http_status == 200 else 'Service Unavailable'}\r\n"
         f"Content-Type: application/json\r\n"
-        f"Content-Length: {len(body)}\r\n"
+        f"Content-Length: {len(body.encode())}\r\n"
         f"Connection: close\r\n"
         f"\r\n"
         f"{body}"
@@ -529,6 +762,46 @@ async def scheduler_loop(
     print("[Scheduler] Shutdown requested, exiting loop")
 
 
+async def job_scheduler_loop(
+    config: SchedulerConfig,
+    token_manager: Optional[TokenManager],
+    db_pool,
+    health_state: HealthState,
+    shutdown_event: asyncio.Event,
+    aruba_token_manager: Optional[ArubaTokenManager] = None,
+):
+    """Run every source as an independent job until shutdown.
+
+    Args:
+        config: Scheduler configuration
+        token_manager: TokenManager instance for GreenLake (optional)
+        db_pool: Database connection pool (None runs fetch-only, unlocked)
+        health_state: Shared health state
+        shutdown_event: Event to signal shutdown
+        aruba_token_manager: ArubaTokenManager instance for Aruba Central (optional)
+    """
+    jobs = build_sync_jobs(config, token_manager, db_pool, aruba_token_manager)
+    if not jobs:
+        print("[Scheduler] ERROR: No sync jobs could be scheduled")
+        return
+
+    scheduler = JobScheduler(
+        jobs,
+        locks=AdvisoryLocks(db_pool) if db_pool else None,
+        max_concurrent=config.max_concurrent_jobs,
+        run_on_startup=config.sync_on_startup,
+        on_finished=health_state.record_job,
+    )
+    health_state.job_scheduler = scheduler
+
+    for job in jobs:
+        after = f" after {', '.join(job.depends_on)}" if job.depends_on else ""
+        print(f"[Scheduler] Job {job.name}: every {job.interval_seconds / 60:g} minutes{after}")
+
+    await scheduler.run(shutdown_event)
+    print("[Scheduler] Shutdown requested, jobs stopped")
+
+
 # ============================================
 # Main Entry Point
 # ============================================
@@ -551,7 +824,10 @@ async def main():
     print(f"[Scheduler] Config: {config}")
 
     # Validate we have something to sync
-    if not config.sync_devices and not config.sync_subscriptions and not config.sync_central:
+    aruba_jobs = config.sync_central or (
+        config.mode == "jobs" and (config.sync_clients or config.sync_firmware)
+    )
+    if not config.sync_devices and not config.sync_subscriptions and not aruba_jobs:
         print("[Scheduler] ERROR: Nothing to sync (SYNC_DEVICES, SYNC_SUBSCRIPTIONS, and SYNC_CENTRAL are all false)")
         sys.exit(1)
 
@@ -577,13 +853,13 @@ async def main():
             print("[Scheduler] GreenLake TokenManager initialized")
         except ValueError as e:
             print(f"[Scheduler] ERROR: GreenLake credentials missing: {e}")
-            if not config.sync_central:
+            if not aruba_jobs:
                 sys.exit(1)
             print("[Scheduler] Continuing with Aruba Central only...")
 
     # Initialize Aruba Central token manager (optional)
     aruba_token_manager = None
-    if config.sync_central:
+    if aruba_jobs:
         try:
             aruba_token_manager = ArubaTokenManager()
             print("[Scheduler] ArubaTokenManager initialized")
@@ -614,8 +890,9 @@ async def main():
     health_server = await start_health_server(config.health_check_port, health_state)
 
     try:
-        # Run the scheduler loop
-        await scheduler_loop(
+        # Run independent jobs, or the single-interval sync cycle
+        loop = job_scheduler_loop if config.mode == "jobs" else scheduler_loop
+        await loop(
             config=config,
             token_manager=token_manager,
             db_pool=db_pool,
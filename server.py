@@ -18,9 +18,13 @@ Environment Variables Required for Write Operations:
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import hashlib
+import json
 import logging
 import os
 import re
+import secrets
 from contextlib import asynccontextmanager
 from typing import Any
 from uuid import UUID
@@ -29,7 +33,15 @@ import asyncpg
 from dotenv import load_dotenv
 from fastmcp import Context, FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+
+from src.glp.api.database import DEFAULT_POOL_CONFIGS, PoolRegistry
+from src.glp.api.query_metrics import get_query_metrics
+
+try:
+    from fastmcp.server.middleware import Middleware
+except ImportError:  # fastmcp < 2.9 has no middleware hooks
+    Middleware = None
 
 load_dotenv()
 
@@ -189,9 +201,12 @@ except ImportError as e:
 # Database Connection Pool (Lifespan)
 # =============================================================================
 
-# Global pool reference for REST API access
+# Global pool reference for REST API access (interactive pool)
 _DB_POOL: asyncpg.Pool | None = None
 
+# Named pools: interactive (tool queries) and bulk_sync (post-write resyncs)
+_DB_POOLS: PoolRegistry | None = None
+
 # Global GLP client and dependencies for write operations
 _GLP_CLIENT = None
 _TOKEN_MANAGER = None
@@ -218,7 +233,7 @@ _PENDING_OPERATIONS: dict[str, dict[str, Any]] = {}
 @asynccontextmanager
 async def lifespan(server: FastMCP):
     """Initialize and cleanup database connection pool, GLP client, and use cases."""
-    global _DB_POOL, _GLP_CLIENT, _TOKEN_MANAGER, _DEVICE_MANAGER
+    global _DB_POOL, _DB_POOLS, _GLP_CLIENT, _TOKEN_MANAGER, _DEVICE_MANAGER
     global _DEVICE_SYNCER, _SUBSCRIPTION_SYNCER
     global _DEVICE_REPO, _SUBSCRIPTION_REPO
     global _DEVICE_MANAGER_ADAPTER, _DEVICE_SYNCER_ADAPTER
@@ -229,15 +244,20 @@ async def lifespan(server: FastMCP):
     if not database_url:
         raise RuntimeError("DATABASE_URL environment variable is required")
 
-    # Pool configuration optimized for MCP server workloads
-    pool = await asyncpg.create_pool(
-        database_url,
+    # Tool queries and syncs get separate pools so a resync after a write
+    # can't starve read tools. DB_POOL_MIN/MAX still size the interactive
+    # pool; DB_POOL_<NAME>_* env vars override individual settings.
+    configs = dict(DEFAULT_POOL_CONFIGS)
+    configs["interactive"] = dataclasses.replace(
+        configs["interactive"],
         min_size=int(os.environ.get("DB_POOL_MIN", "2")),
         max_size=int(os.environ.get("DB_POOL_MAX", "10")),
         command_timeout=60,
-        # Connection health and timeout settings
         max_inactive_connection_lifetime=300,  # Close idle connections after 5 min
     )
+    _DB_POOLS = await PoolRegistry(database_url, configs).start(["interactive", "bulk_sync"])
+    pool = _DB_POOLS.get("interactive")
+    sync_pool = _DB_POOLS.get("bulk_sync")
     _DB_POOL = pool  # Store globally for REST API access
 
     # Initialize GLP client for write operations (if assignment module is available)
@@ -247,8 +267,8 @@ async def lifespan(server: FastMCP):
             _GLP_CLIENT = GLPClient(_TOKEN_MANAGER)
             await _GLP_CLIENT.__aenter__()
             _DEVICE_MANAGER = DeviceManager(_GLP_CLIENT)
-            _DEVICE_SYNCER = DeviceSyncer(_GLP_CLIENT, pool)
-            _SUBSCRIPTION_SYNCER = SubscriptionSyncer(_GLP_CLIENT, pool)
+            _DEVICE_SYNCER = DeviceSyncer(_GLP_CLIENT, sync_pool)
+            _SUBSCRIPTION_SYNCER = SubscriptionSyncer(_GLP_CLIENT, sync_pool)
 
             logger.info("GLP client initialized successfully")
 
@@ -275,10 +295,15 @@ async def lifespan(server: FastMCP):
             logger.info("Use cases initialized successfully")
 
             # Initialize rate limiters for write operations
-            # PATCH operations: 3.5s interval (for 20/min limits, yields ~17 req/min)
-            # POST operations: 2.6s interval (for 25/min limits, yields ~23 req/min)
-            _PATCH_RATE_LIMITER = SequentialRateLimiter(operation_type="patch")
-            _POST_RATE_LIMITER = SequentialRateLimiter(operation_type="post")
+            # Both draw from the GLPClient's adaptive limiter (learns from 429s);
+            # without one they fall back to fixed intervals
+            # (PATCH 3.5s for 20/min limits, POST 2.6s for 25/min limits)
+            _PATCH_RATE_LIMITER = SequentialRateLimiter(
+                operation_type="patch", limiter=_GLP_CLIENT.rate_limiter
+            )
+            _POST_RATE_LIMITER = SequentialRateLimiter(
+                operation_type="post", limiter=_GLP_CLIENT.rate_limiter
+            )
             logger.info("Rate limiters initialized successfully")
 
         except Exception as e:
@@ -308,7 +333,8 @@ async def lifespan(server: FastMCP):
         _DEVICE_MANAGER = None
         _DEVICE_SYNCER = None
         _SUBSCRIPTION_SYNCER = None
-        await pool.close()
+        await _DB_POOLS.close()
+        _DB_POOLS = None
 
 
 # =============================================================================
@@ -328,6 +354,18 @@ mcp = FastMCP(
 )
 
 
+if Middleware is not None:
+
+    class QueryScopeMiddleware(Middleware):
+        """Attribute database statements to the MCP tool that ran them."""
+
+        async def on_call_tool(self, context, call_next):
+            with get_query_metrics().scope(f"tool:{context.message.name}"):
+                return await call_next(context)
+
+    mcp.add_middleware(QueryScopeMiddleware())
+
+
 # =============================================================================
 # Health Check Endpoint (for HTTP transport)
 # =============================================================================
@@ -343,6 +381,48 @@ async def health_check(request: Request) -> JSONResponse:
     })
 
 
+def _diagnostics_denied(request: Request) -> JSONResponse | None:
+    """Gate the diagnostics routes, which expose SQL text and query load.
+
+    They are off unless DIAGNOSTICS_ENABLED=true. When API_KEY is set the
+    request must also carry it in the X-API-Key header.
+
+    Returns:
+        Error response, or None if the request may proceed
+    """
+    if os.environ.get("DIAGNOSTICS_ENABLED", "false").lower() != "true":
+        return JSONResponse({"error": "Not found"}, status_code=404)
+    expected_key = os.environ.get("API_KEY", "")
+    if expected_key and not secrets.compare_digest(
+        request.headers.get("x-api-key", ""), expected_key
+    ):
+        return JSONResponse({"error": "Invalid or missing API key"}, status_code=401)
+    return None
+
+
+@mcp.custom_route("/health/pools", methods=["GET"])
+async def pool_health(request: Request) -> JSONResponse:
+    """Per-pool size, acquire latency and wait-queue metrics."""
+    if denied := _diagnostics_denied(request):
+        return denied
+    return JSONResponse({"pools": _DB_POOLS.get_metrics() if _DB_POOLS else {}})
+
+
+@mcp.custom_route("/health/queries", methods=["GET"])
+async def query_health(request: Request) -> JSONResponse:
+    """Per-statement latency histograms, per-tool query load and N+1 events."""
+    if denied := _diagnostics_denied(request):
+        return denied
+    try:
+        limit = int(request.query_params.get("limit", "50"))
+    except ValueError:
+        return JSONResponse({"error": "limit must be an integer"}, status_code=400)
+    if not 1 <= limit <= 1000:
+        return JSONResponse({"error": "limit must be between 1 and 1000"}, status_code=400)
+    order_by = request.query_params.get("order_by", "total_ms")
+    return JSONResponse(get_query_metrics().snapshot(limit=limit, order_by=order_by))
+
+
 # =============================================================================
 # REST API Endpoints for Agent Chatbot
 # =============================================================================
@@ -352,10 +432,14 @@ async def health_check(request: Request) -> JSONResponse:
 _TOOL_REGISTRY: dict[str, dict] = {}
 _TOOLS_INITIALIZED = False
 
+# Serialized tool list and its ETag, built once with the registry
+_TOOL_CATALOGUE: dict[str, Any] = {"tools": []}
+_TOOL_CATALOGUE_ETAG = ""
+
 
 def _init_tool_registry():
     """Initialize tool registry from FastMCP tools."""
-    global _TOOLS_INITIALIZED
+    global _TOOLS_INITIALIZED, _TOOL_CATALOGUE, _TOOL_CATALOGUE_ETAG
     if _TOOLS_INITIALIZED:
         return
 
@@ -378,13 +462,9 @@ def _init_tool_registry():
                 "inputSchema": tool.parameters if hasattr(tool, "parameters") else {},
                 "annotations": annotations,
             }
-    _TOOLS_INITIALIZED = True
-
 
-@mcp.custom_route("/mcp/v1/tools/list", methods=["POST"])
-async def rest_list_tools(request: Request) -> JSONResponse:
-    """REST endpoint to list all available tools."""
-    _init_tool_registry()
+    # The catalogue only changes when the tool definitions do, so clients
+    # revalidate with If-None-Match instead of downloading it again
     tools = [
         {
             "name": t["name"],
@@ -394,7 +474,26 @@ async def rest_list_tools(request: Request) -> JSONResponse:
         }
         for t in _TOOL_REGISTRY.values()
     ]
-    return JSONResponse({"tools": tools})
+    digest = hashlib.sha256(
+        json.dumps(tools, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+    _TOOL_CATALOGUE_ETAG = f'"{digest}"'
+    _TOOL_CATALOGUE = {"tools": tools, "version": _TOOL_CATALOGUE_ETAG}
+    _TOOLS_INITIALIZED = True
+
+
+@mcp.custom_route("/mcp/v1/tools/list", methods=["GET", "POST"])
+async def rest_list_tools(request: Request) -> Response:
+    """REST endpoint to list all available tools.
+
+    Sends the catalogue version as an ETag and answers 304 when the
+    client's If-None-Match already matches it.
+    """
+    _init_tool_registry()
+    headers = {"ETag": _TOOL_CATALOGUE_ETAG}
+    if request.headers.get("if-none-match") == _TOOL_CATALOGUE_ETAG:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(_TOOL_CATALOGUE, headers=headers)
 
 
 @mcp.custom_route("/mcp/v1/tools/call", methods=["POST"])
@@ -427,13 +526,13 @@ async def rest_call_tool(request: Request) -> JSONResponse:
         ctx = MockContext(pool) if pool else None
 
         # Call the tool function
-        if "ctx" in func.__code__.co_varnames[:func.__code__.co_argcount]:
-            result = await func(ctx=ctx, **arguments)
-        else:
-            result = await func(**arguments)
+        with get_query_metrics().scope(f"tool:{tool_name}"):
+            if "ctx" in func.__code__.co_varnames[:func.__code__.co_argcount]:
+                result = await func(ctx=ctx, **arguments)
+            else:
+                result = await func(**arguments)
 
         # Format result as MCP content
-        import json
         if isinstance(result, (dict, list)):
             text = json.dumps(result)
         else:
@@ -2267,7 +2366,7 @@ async def apply_device_assignments(
         sync_service = DeviceSyncerAdapter(
             _DEVICE_SYNCER,
             _SUBSCRIPTION_SYNCER,
-            db_pool=_DB_POOL,
+            db_pool=_DB_POOLS.get("bulk_sync") if _DB_POOLS else _DB_POOL,
         )
 
         # Execute the use case
@@ -2275,6 +2374,7 @@ async def apply_device_assignments(
             device_manager=device_manager,
             device_repository=device_repo,
             sync_service=sync_service,
+            rate_limiter=_GLP_CLIENT.rate_limiter if _GLP_CLIENT else None,
         )
 
         result = await use_case.execute(
@@ -2635,13 +2735,14 @@ async def archive_devices(
         sync_service = DeviceSyncerAdapter(
             _DEVICE_SYNCER,
             _SUBSCRIPTION_SYNCER,
-            db_pool=_DB_POOL,
+            db_pool=_DB_POOLS.get("bulk_sync") if _DB_POOLS else _DB_POOL,
         ) if sync_after else None
 
         # Execute the use case
         use_case = DeviceActionsUseCase(
             device_manager=device_manager,
             sync_service=sync_service,
+            rate_limiter=_GLP_CLIENT.rate_limiter if _GLP_CLIENT else None,
         )
 
         result = await use_case.execute(
@@ -2825,13 +2926,14 @@ async def unarchive_devices(
         sync_service = DeviceSyncerAdapter(
             _DEVICE_SYNCER,
             _SUBSCRIPTION_SYNCER,
-            db_pool=_DB_POOL,
+            db_pool=_DB_POOLS.get("bulk_sync") if _DB_POOLS else _DB_POOL,
         ) if sync_after else None
 
         # Execute the use case
         use_case = DeviceActionsUseCase(
             device_manager=device_manager,
             sync_service=sync_service,
+            rate_limiter=_GLP_CLIENT.rate_limiter if _GLP_CLIENT else None,
         )
 
         result = await use_case.execute(
@@ -0,0 +1,412 @@
+"""
+Fair scheduling for agent chats.
+
+A chat turn holds an LLM connection, database pool connections and MCP
+server capacity for its whole run, often across several tool rounds.
+Without a limit, one tenant running many long chats takes all of them
+and every other tenant waits behind it. Chats are therefore admitted
+through a ChatScheduler:
+
+    - Global limit: at most CHAT_MAX_CONCURRENT chats run in this process
+    - Per tenant limit: at most CHAT_MAX_CONCURRENT_PER_TENANT of them
+      belong to one tenant
+    - Weighted fair queuing: when a slot frees up, the waiting tenant that
+      has had the least service relative to its weight goes next
+      (CHAT_TENANT_WEIGHTS, e.g. "acme=2,globex=0.5"; default weight 1).
+      A tenant's own chats run in arrival order.
+    - Bounded queue: a tenant with CHAT_MAX_QUEUED_PER_TENANT chats
+      waiting gets a rate_limit error instead of another place in line,
+      and a chat waiting longer than CHAT_QUEUE_TIMEOUT_SECONDS gets a
+      timeout error
+    - Queue position: a chat that has to wait streams "queued" events
+      with its position, sent again whenever the position changes
+    - Metrics: totals and queue wait histograms, overall and for tenants
+      with running or queued chats, served at /health/chats (API key
+      required). A tenant's state is dropped once it has no chats left.
+
+TenantRateLimiter limits how many chats a tenant can start per window;
+this limits how many run at once. Limits apply per worker process.
+
+Example:
+    events = get_chat_scheduler().schedule(orchestrator.chat(message, context), context)
+    async for event in events:
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
+
+from ..domain.entities import ChatEvent, ChatEventType, ErrorType, UserContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT = int(os.getenv("CHAT_MAX_CONCURRENT", "16"))
+DEFAULT_PER_TENANT_LIMIT = int(os.getenv("CHAT_MAX_CONCURRENT_PER_TENANT", "4"))
+DEFAULT_MAX_QUEUED_PER_TENANT = int(os.getenv("CHAT_MAX_QUEUED_PER_TENANT", "20"))
+DEFAULT_QUEUE_TIMEOUT_SECONDS = float(os.getenv("CHAT_QUEUE_TIMEOUT_SECONDS", "120"))
+
+# Upper bounds (ms) of the queue wait histogram buckets
+WAIT_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+def parse_tenant_weights(value: str) -> dict[str, float]:
+    """Parse "tenant=weight,..." into a dict, skipping malformed entries."""
+    weights = {}
+    for item in value.split(","):
+        tenant_id, _, weight = item.strip().partition("=")
+        try:
+            if tenant_id and float(weight) > 0:
+                weights[tenant_id] = float(weight)
+        except ValueError:
+            logger.warning(f"Ignoring invalid chat tenant weight: {item!r}")
+    return weights
+
+
+# ============================================
+# Metrics
+# ============================================
+
+@dataclass
+class WaitStats:
+    """Count, total, max and histogram of queue wait times."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(WAIT_BUCKETS_MS) + 1))
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.histogram[bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def percentile_ms(self, pct: float) -> float:
+        """Approximate percentile (bucket upper bound)."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return float(WAIT_BUCKETS_MS[i]) if i < len(WAIT_BUCKETS_MS) else self.max_seconds * 1000
+        return self.max_seconds * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"le_{b}ms" for b in WAIT_BUCKETS_MS] + [f"gt_{WAIT_BUCKETS_MS[-1]}ms"]
+        return {
+            "avg_ms": (self.total_seconds / self.count * 1000) if self.count else 0.0,
+            "p50_ms": self.percentile_ms(0.50),
+            "p95_ms": self.percentile_ms(0.95),
+            "max_ms": self.max_seconds * 1000,
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """One chat waiting for a slot."""
+
+    seq: int
+    admitted: bool = False
+    position: int = 0
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+@dataclass(eq=False)
+class _TenantState:
+    """Scheduling state and counters for one tenant."""
+
+    tenant_id: str
+    weight: float = 1.0
+    running: int = 0
+    # Service received so far, in chats divided by weight
+    virtual_time: float = 0.0
+    waiters: deque[_Waiter] = field(default_factory=deque)
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    queue_wait: WaitStats = field(default_factory=WaitStats)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "weight": self.weight,
+            "running": self.running,
+            "queued": len(self.waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "queue_wait": self.queue_wait.to_dict(),
+        }
+
+
+# ============================================
+# Scheduler
+# ============================================
+
+class ChatScheduler:
+    """Admits chats through global and per tenant concurrency limits.
+
+    Args:
+        max_concurrent: Chats running at once (default CHAT_MAX_CONCURRENT)
+        per_tenant_limit: Chats running at once per tenant
+            (default CHAT_MAX_CONCURRENT_PER_TENANT)
+        max_queued_per_tenant: Chats waiting per tenant before new ones are
+            rejected (default CHAT_MAX_QUEUED_PER_TENANT)
+        queue_timeout_seconds: Longest a chat waits for a slot
+            (default CHAT_QUEUE_TIMEOUT_SECONDS)
+        tenant_weights: Share of slots per tenant relative to the default
+            weight of 1 (default CHAT_TENANT_WEIGHTS)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        per_tenant_limit: Optional[int] = None,
+        max_queued_per_tenant: Optional[int] = None,
+        queue_timeout_seconds: Optional[float] = None,
+        tenant_weights: Optional[dict[str, float]] = None,
+    ):
+        self.max_concurrent = max(1, max_concurrent or DEFAULT_MAX_CONCURRENT)
+        self.per_tenant_limit = max(1, per_tenant_limit or DEFAULT_PER_TENANT_LIMIT)
+        self.max_queued_per_tenant = max(0, (
+            DEFAULT_MAX_QUEUED_PER_TENANT if max_queued_per_tenant is None else max_queued_per_tenant
+        ))
+        self.queue_timeout_seconds = queue_timeout_seconds or DEFAULT_QUEUE_TIMEOUT_SECONDS
+        self.tenant_weights = (
+            parse_tenant_weights(os.getenv("CHAT_TENANT_WEIGHTS", ""))
+            if tenant_weights is None else tenant_weights
+        )
+        self.running = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.queue_wait = WaitStats()
+        # Tenants with running or waiting chats
+        self._tenants: dict[str, _TenantState] = {}
+        # Tenants with waiting chats, in the order they started waiting
+        self._backlogged: dict[str, _TenantState] = {}
+        # Virtual start time of the most recently admitted chat
+        self._virtual_clock = 0.0
+        self._next_seq = 0
+
+    def _tenant(self, tenant_id: str) -> _TenantState:
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            state = _TenantState(tenant_id, weight=self.tenant_weights.get(tenant_id, 1.0))
+            self._tenants[tenant_id] = state
+        return state
+
+    def _forget_if_idle(self, state: _TenantState) -> None:
+        # An idle tenant starts at the current clock anyway, and its
+        # counters are already in the scheduler totals
+        if not state.running and not state.waiters and self._tenants.get(state.tenant_id) is state:
+            del self._tenants[state.tenant_id]
+
+    def _start_time(self, state: _TenantState) -> float:
+        # A tenant that was idle starts at the current clock, not with credit
+        return max(state.virtual_time, self._virtual_clock)
+
+    def _admit(self, state: _TenantState) -> None:
+        start = self._start_time(state)
+        self._virtual_clock = start
+        state.virtual_time = start + 1.0 / state.weight
+        state.running += 1
+        state.admitted += 1
+        self.running += 1
+        self.admitted += 1
+
+    def _dispatch(self) -> None:
+        """Admit waiting chats while there are free slots, then renumber the queue."""
+        while self.running < self.max_concurrent:
+            best: Optional[_TenantState] = None
+            best_key: tuple[float, int] = (0.0, 0)
+            for state in self._backlogged.values():
+                if state.running >= self.per_tenant_limit:
+                    continue
+                key = (self._start_time(state), state.waiters[0].seq)
+                if best is None or key < best_key:
+                    best, best_key = state, key
+            if best is None:
+                break
+
+            waiter = best.waiters.popleft()
+            if not best.waiters:
+                del self._backlogged[best.tenant_id]
+            self._admit(best)
+            waiter.admitted = True
+            waiter.changed.set()
+
+        self._update_positions()
+
+    def _update_positions(self) -> None:
+        """Set each waiter's 1-based place in the admission order.
+
+        Orders waiters by the virtual time at which fair queuing would
+        start them, ignoring per tenant limits.
+        """
+        order: list[tuple[float, int, _Waiter]] = []
+        for state in self._backlogged.values():
+            start = self._start_time(state)
+            for i, waiter in enumerate(state.waiters):
+                order.append((start + i / state.weight, waiter.seq, waiter))
+        order.sort(key=lambda item: item[:2])
+
+        for position, (_, _, waiter) in enumerate(order, 1):
+            if waiter.position != position:
+                waiter.position = position
+                waiter.changed.set()
+
+    def _release(self, state: _TenantState) -> None:
+        state.running -= 1
+        self.running -= 1
+        self._dispatch()
+
+    def _withdraw(self, state: _TenantState, waiter: _Waiter) -> None:
+        try:
+            state.waiters.remove(waiter)
+        except ValueError:
+            return
+        if not state.waiters:
+            self._backlogged.pop(state.tenant_id, None)
+        self._dispatch()
+
+    async def schedule(
+        self,
+        events: AsyncIterator[ChatEvent],
+        context: UserContext,
+    ) -> AsyncIterator[ChatEvent]:
+        """Run a chat event stream once a slot is free.
+
+        The stream is not started until the chat is admitted. While it
+        waits, QUEUED events carry its position; the chat's own sequence
+        numbers are shifted past them.
+
+        Args:
+            events: Event stream from AgentOrchestrator.chat()
+            context: User the chat belongs to
+
+        Yields:
+            QUEUED events, then the chat's events. A chat that cannot be
+            queued or waits too long ends with a single ERROR event.
+        """
+        state = self._tenant(context.tenant_id)
+        self._next_seq += 1
+        waiter = _Waiter(seq=self._next_seq)
+        queued_at = time.monotonic()
+        offset = 0
+
+        try:
+            if (
+                not state.waiters
+                and state.running < self.per_tenant_limit
+                and self.running < self.max_concurrent
+            ):
+                self._admit(state)
+                waiter.admitted = True
+
+            elif len(state.waiters) >= self.max_queued_per_tenant:
+                state.rejected += 1
+                self.rejected += 1
+                logger.warning(f"Chat queue full for tenant {context.tenant_id}")
+                yield ChatEvent(
+                    type=ChatEventType.ERROR,
+                    sequence=1,
+                    content="Too many chats are waiting for your organization. Please try again shortly.",
+                    error_type=ErrorType.RATE_LIMIT,
+                )
+                return
+
+            else:
+                state.waiters.append(waiter)
+                self._backlogged.setdefault(state.tenant_id, state)
+                self._update_positions()
+
+                deadline = queued_at + self.queue_timeout_seconds
+                reported = 0
+                while not waiter.admitted:
+                    if waiter.position != reported:
+                        reported = waiter.position
+                        offset += 1
+                        yield ChatEvent(
+                            type=ChatEventType.QUEUED,
+                            sequence=offset,
+                            content=f"Waiting for a free slot (position {reported})",
+                            metadata={"position": reported},
+                        )
+                        continue
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        state.timed_out += 1
+                        self.timed_out += 1
+                        logger.warning(f"Chat for tenant {context.tenant_id} timed out in queue")
+                        yield ChatEvent(
+                            type=ChatEventType.ERROR,
+                            sequence=offset + 1,
+                            content="The assistant is busy. Please try again shortly.",
+                            error_type=ErrorType.TIMEOUT,
+                        )
+                        return
+
+                    waiter.changed.clear()
+                    try:
+                        await asyncio.wait_for(waiter.changed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+
+            wait_seconds = time.monotonic() - queued_at
+            state.queue_wait.record(wait_seconds)
+            self.queue_wait.record(wait_seconds)
+
+            async for event in events:
+                event.sequence += offset
+                yield event
+
+        finally:
+            if waiter.admitted:
+                self._release(state)
+            else:
+                self._withdraw(state, waiter)
+            self._forget_if_idle(state)
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Limits, current load, totals and metrics of active tenants."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "per_tenant_limit": self.per_tenant_limit,
+            "max_queued_per_tenant": self.max_queued_per_tenant,
+            "running": self.running,
+            "queued": sum(len(state.waiters) for state in self._backlogged.values()),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "queue_wait": self.queue_wait.to_dict(),
+            "tenants": {
+                tenant_id: state.to_dict() for tenant_id, state in sorted(self._tenants.items())
+            },
+        }
+
+
+_chat_scheduler: Optional[ChatScheduler] = None
+
+
+def get_chat_scheduler() -> ChatScheduler:
+    """The process-wide ChatScheduler."""
+    global _chat_scheduler
+    if _chat_scheduler is None:
+        _chat_scheduler = ChatScheduler()
+    return _chat_scheduler
@@ -0,0 +1,253 @@
+"""
+WebSocket transport for chat event streams.
+
+AgentOrchestrator.chat() yields one TEXT_DELTA or THINKING_DELTA event
+per model token. ChatEventSender turns that into fewer, larger frames:
+
+- Consecutive deltas of the same type are merged into one frame within a
+  short window (WS_COALESCE_MS) or up to WS_MAX_FRAME_CHARS characters.
+  Clients append delta content, so a merged delta reads the same as the
+  deltas it replaces. It keeps the first event's id and the last event's
+  sequence number.
+- Frames are written by a single writer task behind a bounded queue
+  (WS_MAX_PENDING_EVENTS). A slow client makes send() wait instead of
+  buffering without limit, which in turn pauses the model stream. A
+  frame that cannot be written within WS_SEND_TIMEOUT_SECONDS ends the
+  stream.
+- Clients may ask for MessagePack binary frames with ``?encoding=msgpack``
+  when the msgpack package is installed; otherwise frames are compact
+  JSON text. Compression is permessage-deflate, negotiated by uvicorn
+  (--ws-per-message-deflate).
+
+Frame count, bytes and send latency per stream are kept in StreamStats
+and logged when the stream ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..domain.entities import ChatEvent, ChatEventType
+
+logger = logging.getLogger(__name__)
+
+# Optional binary encoding
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+COALESCE_SECONDS = int(os.getenv("WS_COALESCE_MS", "20")) / 1000
+MAX_FRAME_CHARS = int(os.getenv("WS_MAX_FRAME_CHARS", "8192"))
+MAX_PENDING_EVENTS = int(os.getenv("WS_MAX_PENDING_EVENTS", "256"))
+SEND_TIMEOUT_SECONDS = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "10"))
+
+DELTA_TYPES = frozenset({ChatEventType.TEXT_DELTA, ChatEventType.THINKING_DELTA})
+
+# Queue marker for the end of the stream
+_CLOSE = object()
+
+
+def resolve_encoding(requested: Any) -> str:
+    """Return the frame encoding to use for a client's request."""
+    if requested == ENCODING_MSGPACK:
+        if MSGPACK_AVAILABLE:
+            return ENCODING_MSGPACK
+        logger.info("msgpack not installed, streaming JSON frames")
+    return ENCODING_JSON
+
+
+@dataclass
+class StreamStats:
+    """Transport counters for one chat event stream.
+
+    Attributes:
+        encoding: Frame encoding (json or msgpack)
+        conversation_id: Conversation, once the DONE event names it
+        events: Chat events received from the orchestrator
+        frames: WebSocket frames written
+        bytes_sent: Encoded payload bytes, before permessage-deflate
+        send_seconds: Total time spent writing frames
+        max_send_seconds: Slowest single frame write
+        backpressure_waits: send() calls that found the queue full
+    """
+
+    encoding: str = ENCODING_JSON
+    conversation_id: Optional[str] = None
+    events: int = 0
+    frames: int = 0
+    bytes_sent: int = 0
+    send_seconds: float = 0.0
+    max_send_seconds: float = 0.0
+    backpressure_waits: int = 0
+
+    def record_frame(self, size: int, seconds: float) -> None:
+        self.frames += 1
+        self.bytes_sent += size
+        self.send_seconds += seconds
+        if seconds > self.max_send_seconds:
+            self.max_send_seconds = seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "encoding": self.encoding,
+            "conversation_id": self.conversation_id,
+            "events": self.events,
+            "frames": self.frames,
+            "bytes_sent": self.bytes_sent,
+            "avg_send_ms": (self.send_seconds / self.frames * 1000) if self.frames else 0.0,
+            "max_send_ms": self.max_send_seconds * 1000,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+
+class ChatEventSender:
+    """Coalescing, bounded sender of chat events to one WebSocket.
+
+    Usage:
+        async with ChatEventSender(websocket, encoding) as sender:
+            async for event in orchestrator.chat(message, context):
+                await sender.send(event)
+    """
+
+    def __init__(
+        self,
+        websocket: Any,
+        encoding: str = ENCODING_JSON,
+        coalesce_seconds: float = COALESCE_SECONDS,
+        max_frame_chars: int = MAX_FRAME_CHARS,
+        max_pending_events: int = MAX_PENDING_EVENTS,
+        send_timeout_seconds: float = SEND_TIMEOUT_SECONDS,
+    ):
+        """Initialize the sender.
+
+        Args:
+            websocket: Accepted WebSocket connection
+            encoding: Frame encoding from resolve_encoding()
+            coalesce_seconds: How long a delta waits for more deltas
+            max_frame_chars: Delta content per frame before it is sent
+            max_pending_events: Events queued before send() waits
+            send_timeout_seconds: Longest a single frame write may take
+        """
+        self.websocket = websocket
+        self.encoding = encoding
+        self.coalesce_seconds = coalesce_seconds
+        self.max_frame_chars = max_frame_chars
+        self.send_timeout_seconds = send_timeout_seconds
+        self.stats = StreamStats(encoding=encoding)
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending_events)
+        self._writer: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    async def __aenter__(self) -> ChatEventSender:
+        self._writer = asyncio.create_task(self._write_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            # Flush everything queued before returning
+            await self._queue.put(_CLOSE)
+            await self._writer
+        else:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+        logger.info(f"Chat stream transport: {self.stats.to_dict()}")
+
+    async def send(self, event: ChatEvent) -> None:
+        """Queue an event, waiting while the client is behind.
+
+        Raises:
+            Exception: The error that stopped the writer, e.g. a
+                disconnect or a send timeout
+        """
+        if self._error is not None:
+            raise self._error
+
+        self.stats.events += 1
+        if event.type == ChatEventType.DONE and event.metadata:
+            self.stats.conversation_id = event.metadata.get("conversation_id")
+        if self._queue.full():
+            self.stats.backpressure_waits += 1
+        await self._queue.put(event)
+
+    async def _write_loop(self) -> None:
+        try:
+            await self._write_frames()
+        except Exception as e:
+            logger.warning(f"Chat stream stopped: {type(e).__name__}: {e}")
+            self._error = e
+            # Keep draining so a producer blocked on a full queue wakes up
+            while await self._queue.get() is not _CLOSE:
+                pass
+
+    async def _write_frames(self) -> None:
+        loop = asyncio.get_running_loop()
+        carry = None
+
+        while True:
+            event, carry = carry or await self._queue.get(), None
+            if event is _CLOSE:
+                return
+
+            if event.type not in DELTA_TYPES:
+                await self._send_frame(event.to_dict())
+                continue
+
+            parts = [event.content or ""]
+            size = len(parts[0])
+            last = event
+            deadline = loop.time() + self.coalesce_seconds
+
+            while size < self.max_frame_chars:
+                try:
+                    following = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        following = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                if following is _CLOSE or following.type != event.type:
+                    carry = following
+                    break
+                parts.append(following.content or "")
+                size += len(parts[-1])
+                last = following
+
+            payload = event.to_dict()
+            payload["content"] = "".join(parts)
+            payload["sequence"] = last.sequence
+            await self._send_frame(payload)
+
+    async def _send_frame(self, payload: dict[str, Any]) -> None:
+        if self.encoding == ENCODING_MSGPACK:
+            data = msgpack.packb(payload, use_bin_type=True)
+            size = len(data)
+            send = self.websocket.send_bytes(data)
+        else:
+            text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+            size = len(text.encode("utf-8"))
+            send = self.websocket.send_text(text)
+
+        started = time.monotonic()
+        await asyncio.wait_for(send, self.send_timeout_seconds)
+        self.stats.record_frame(size, time.monotonic() - started)
@@ -28,6 +28,13 @@ from ..domain.entities import UserContext
 from ..orchestrator import AgentOrchestrator
 from ..security import TicketAuth
 from .auth import get_user_context_jwt
+from .chat_scheduler import ChatScheduler, get_chat_scheduler
+from .event_stream import ChatEventSender, resolve_encoding
+from .stream_replay import (
+    ChatStreamManager,
+    InMemoryReplayBuffer,
+    ResumeUnavailableError,
+)
 from .schemas import (
     ChatRequest,
     ChatResponse,
@@ -65,6 +72,8 @@ class AgentDependencies:
 
     orchestrator: Optional[AgentOrchestrator] = None
     ticket_auth: Optional[TicketAuth] = None
+    stream_manager: Optional[ChatStreamManager] = None
+    chat_scheduler: Optional[ChatScheduler] = None
 
 
 _deps = AgentDependencies()
@@ -73,6 +82,8 @@ _deps = AgentDependencies()
 def create_agent_dependencies(
     orchestrator: AgentOrchestrator,
     ticket_auth: Optional[TicketAuth] = None,
+    stream_manager: Optional[ChatStreamManager] = None,
+    chat_scheduler: Optional[ChatScheduler] = None,
 ) -> None:
     """Initialize agent dependencies.
 
@@ -81,9 +92,13 @@ def create_agent_dependencies(
     Args:
         orchestrator: The agent orchestrator
         ticket_auth: Optional ticket auth for WebSocket
+        stream_manager: Resumable chat streams (default: in-process buffer)
+        chat_scheduler: Chat admission limits (default: process-wide scheduler)
     """
     _deps.orchestrator = orchestrator
     _deps.ticket_auth = ticket_auth
+    _deps.stream_manager = stream_manager or ChatStreamManager(InMemoryReplayBuffer())
+    _deps.chat_scheduler = chat_scheduler or get_chat_scheduler()
 
 
 def get_orchestrator() -> AgentOrchestrator:
@@ -175,9 +190,13 @@ async def _process_chat_async(
     Events are delivered via WebSocket.
     Note: This is used by the REST endpoint - errors are logged since
     the client should be connected via WebSocket to receive events.
+    The chat waits for a slot in the chat scheduler like WebSocket chats.
     """
+    scheduler = _deps.chat_scheduler or get_chat_scheduler()
     try:
-        async for event in orchestrator.chat(message, context, conversation_id):
+        async for event in scheduler.schedule(
+            orchestrator.chat(message, context, conversation_id), context
+        ):
             # Events are streamed via WebSocket
             pass
     except asyncio.CancelledError:
@@ -221,12 +240,17 @@ async def list_conversations(
 @router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
 async def get_conversation(
     conversation_id: UUID,
+    limit: int = Query(default=50, ge=1, le=200),
+    before: Optional[UUID] = Query(default=None, description="Return messages before this message ID"),
     context: UserContext = Depends(get_user_context),
     orchestrator: AgentOrchestrator = Depends(get_orchestrator),
 ) -> ConversationResponse:
-    """Get a conversation with messages."""
+    """Get a conversation with its newest messages.
+
+    For older messages, pass the response's next_before as ``before``.
+    """
     conversation = await orchestrator.get_conversation_history(
-        conversation_id, context
+        conversation_id, context, limit, before
     )
 
     if not conversation:
@@ -258,6 +282,7 @@ async def get_conversation(
         summary=conversation.summary,
         message_count=conversation.message_count,
         messages=messages,
+        next_before=messages[0].id if len(messages) == limit else None,
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
     )
@@ -363,6 +388,7 @@ async def get_memory_stats(
 async def websocket_endpoint(
     websocket: WebSocket,
     ticket: str = Query(..., description="One-time authentication ticket from /api/agent/ticket"),
+    encoding: str = Query("json", description="Chat event frames: json (text) or msgpack (binary)"),
 ):
     """WebSocket endpoint for streaming chat.
 
@@ -380,15 +406,33 @@ async def websocket_endpoint(
     Message formats:
     - Client -> Server:
         {"type": "chat", "message": "...", "conversation_id": "..."}
+        {"type": "resume", "stream_id": "...", "after_sequence": 41}
         {"type": "confirm", "operation_id": "...", "confirmed": true/false}
         {"type": "cancel"}
 
     - Server -> Client:
+        {"type": "stream_started", "stream_id": "..."}
+        {"type": "queued", "metadata": {"position": 3}, ...}
         {"type": "text_delta", "content": "...", ...}
         {"type": "tool_call_start", "tool_name": "...", ...}
         {"type": "confirmation_required", "message": "...", ...}
         {"type": "done", ...}
         {"type": "error", "content": "...", ...}
+
+    Chat events are streamed through ChatEventSender: consecutive deltas
+    are merged into one frame, and with ?encoding=msgpack (if msgpack is
+    installed) frames are binary MessagePack. Control replies such as
+    pong and validation errors are always JSON text.
+
+    Chat generations run detached from the connection (see
+    stream_replay): a disconnect leaves the answer running for a grace
+    period, and a new connection can send "resume" with the stream_id
+    and the last sequence number it received to get the rest. A new
+    chat message or "cancel" stops the current generation.
+
+    Chats are admitted through the ChatScheduler's global and per tenant
+    concurrency limits. A chat that has to wait gets "queued" events with
+    its position before its first answer event.
     """
     # Ticket authentication is REQUIRED - no fallback
     if not _deps.ticket_auth:
@@ -413,6 +457,7 @@ async def websocket_endpoint(
     # Accept connection
     await websocket.accept()
     logger.info(f"WebSocket connected: user={context.user_id}")
+    encoding = resolve_encoding(encoding)
 
     orchestrator = _deps.orchestrator
     if not orchestrator:
@@ -423,7 +468,10 @@ async def websocket_endpoint(
         await websocket.close()
         return
 
+    stream_manager = _deps.stream_manager or ChatStreamManager(InMemoryReplayBuffer())
+    scheduler = _deps.chat_scheduler or get_chat_scheduler()
     current_task: Optional[asyncio.Task] = None
+    current_stream_id: Optional[str] = None
 
     try:
         while True:
@@ -459,10 +507,6 @@ async def websocket_endpoint(
             msg_type = data.get("type", "chat")
 
             if msg_type == "chat":
-                # Cancel any existing task
-                if current_task and not current_task.done():
-                    current_task.cancel()
-
                 # Start new chat
                 message = data.get("message", "")
 
@@ -491,14 +535,57 @@ async def websocket_endpoint(
                     except ValueError:
                         conversation_id = None
 
+                # Stop any running generation before starting a new one
+                if current_task and not current_task.done():
+                    current_task.cancel()
+                if current_stream_id:
+                    await stream_manager.cancel(current_stream_id)
+
+                current_stream_id = await stream_manager.start(
+                    scheduler.schedule(
+                        orchestrator.chat(message, context, conversation_id),
+                        context,
+                    ),
+                    context,
+                )
+                await websocket.send_json({
+                    "type": "stream_started",
+                    "stream_id": current_stream_id,
+                })
+
                 # Stream response
                 current_task = asyncio.create_task(
                     _stream_chat(
                         websocket,
-                        orchestrator,
-                        message,
+                        stream_manager,
+                        current_stream_id,
                         context,
-                        conversation_id,
+                        encoding=encoding,
+                    )
+                )
+
+            elif msg_type == "resume":
+                stream_id = data.get("stream_id")
+                after_sequence = data.get("after_sequence", 0)
+                if not isinstance(stream_id, str) or not isinstance(after_sequence, int):
+                    await websocket.send_json({
+                        "type": "error",
+                        "content": "resume needs a stream_id and an integer after_sequence",
+                        "error_type": "validation_error",
+                    })
+                    continue
+
+                if current_task and not current_task.done():
+                    current_task.cancel()
+                current_stream_id = stream_id
+                current_task = asyncio.create_task(
+                    _stream_chat(
+                        websocket,
+                        stream_manager,
+                        stream_id,
+                        context,
+                        after_sequence,
+                        encoding,
                     )
                 )
 
@@ -511,10 +598,11 @@ async def websocket_endpoint(
                 found = False
                 for conv_id, ops in orchestrator._pending_confirmations.items():
                     if str(operation_id) in ops:
-                        async for event in orchestrator.confirm_operation(
-                            conv_id, confirmed, context, str(operation_id)
-                        ):
-                            await websocket.send_json(event.to_dict())
+                        async with ChatEventSender(websocket, encoding) as sender:
+                            async for event in orchestrator.confirm_operation(
+                                conv_id, confirmed, context, str(operation_id)
+                            ):
+                                await sender.send(event)
                         found = True
                         break
 
@@ -528,6 +616,8 @@ async def websocket_endpoint(
                 # Cancel current operation
                 if current_task and not current_task.done():
                     current_task.cancel()
+                    if current_stream_id:
+                        await stream_manager.cancel(current_stream_id)
                     await websocket.send_json({
                         "type": "cancelled",
                         "content": "Operation cancelled",
@@ -551,33 +641,45 @@ async def websocket_endpoint(
         except Exception:
             pass
     finally:
+        # Detach only; the generation keeps running for the grace period
         if current_task and not current_task.done():
             current_task.cancel()
 
 
 async def _stream_chat(
     websocket: WebSocket,
-    orchestrator: AgentOrchestrator,
-    message: str,
+    stream_manager: ChatStreamManager,
+    stream_id: str,
     context: UserContext,
-    conversation_id: Optional[UUID],
+    after_sequence: int = 0,
+    encoding: str = "json",
 ) -> None:
-    """Stream chat events to WebSocket.
+    """Stream a chat's events from its replay buffer to WebSocket.
 
     Args:
         websocket: WebSocket connection
-        orchestrator: Agent orchestrator
-        message: User message
+        stream_manager: Manager running the chat generation
+        stream_id: Stream from ChatStreamManager.start()
         context: User context
-        conversation_id: Optional conversation ID
+        after_sequence: Last sequence number the client already has
+        encoding: Frame encoding from resolve_encoding()
     """
     try:
-        async for event in orchestrator.chat(message, context, conversation_id):
-            await websocket.send_json(event.to_dict())
+        async with ChatEventSender(websocket, encoding) as sender:
+            async for event in stream_manager.subscribe(stream_id, context, after_sequence):
+                await sender.send(event)
 
     except asyncio.CancelledError:
         logger.info("Chat streaming cancelled")
         raise
+    except ResumeUnavailableError as e:
+        logger.info(f"Chat stream resume failed: {e}")
+        await websocket.send_json({
+            "type": "error",
+            "content": "This response can no longer be resumed",
+            "error_type": "resume_unavailable",
+            "stream_id": stream_id,
+        })
     except Exception as e:
         logger.exception(f"Chat streaming error: {e}")
         # Sanitize error message before sending to client
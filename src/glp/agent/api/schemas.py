@@ -85,6 +85,7 @@ class ConversationResponse(BaseModel):
     summary: Optional[str] = None
     message_count: int
     messages: list[MessageResponse] = []
+    next_before: Optional[UUID] = None  # Cursor for the previous page
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,535 @@
+"""
+Resumable chat streams.
+
+A chat generation runs in its own task and writes every event to a
+bounded per-stream replay buffer instead of straight to the WebSocket.
+Connections subscribe to the buffer, so when a connection drops the
+generation keeps running and a reconnecting client can ask for the
+events after the last sequence number it saw:
+
+    Server -> Client: {"type": "stream_started", "stream_id": "..."}
+    Client -> Server: {"type": "resume", "stream_id": "...", "after_sequence": 41}
+
+- A generation with no subscriber for CHAT_STREAM_GRACE_SECONDS is
+  stopped at its next event, so abandoned answers do not run (and call
+  tools) indefinitely.
+- Each stream keeps its last CHAT_STREAM_MAX_EVENTS events. A client that
+  is further behind than that gets ResumeUnavailableError and has to
+  reload the conversation.
+- Finished streams stay resumable for CHAT_STREAM_RETENTION_SECONDS.
+- CHAT_STREAM_BACKEND=redis keeps buffers in Redis Streams so a client
+  can resume on another worker; the default keeps them in process.
+
+Sequence numbers come from the orchestrator's EventStreamer, one counter
+per chat() call, starting at 1. ChatScheduler's queue events come first
+and shift the chat's numbers past them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional, Protocol
+
+from ...api.error_sanitizer import sanitize_error_message
+from ..domain.entities import ChatEvent, ChatEventType, ErrorType, UserContext
+
+logger = logging.getLogger(__name__)
+
+STREAM_BACKEND = os.getenv("CHAT_STREAM_BACKEND", "memory").lower()
+GRACE_SECONDS = float(os.getenv("CHAT_STREAM_GRACE_SECONDS", "60"))
+MAX_EVENTS = int(os.getenv("CHAT_STREAM_MAX_EVENTS", "5000"))
+RETENTION_SECONDS = float(os.getenv("CHAT_STREAM_RETENTION_SECONDS", "300"))
+
+
+class ResumeUnavailableError(Exception):
+    """The stream is unknown, expired, not the caller's, or no longer
+    holds the events after the requested sequence number."""
+
+
+def _stream_owner(context: UserContext) -> str:
+    return f"{context.tenant_id}:{context.user_id}"
+
+
+class IReplayBuffer(Protocol):
+    """Storage for the events of running and recently finished streams."""
+
+    grace_seconds: float
+
+    async def create(self, stream_id: str, owner: str) -> None:
+        """Register a new stream, attached for one grace period."""
+        ...
+
+    async def append(self, stream_id: str, event: ChatEvent) -> None:
+        """Add an event, evicting the oldest past the buffer size."""
+        ...
+
+    async def close(self, stream_id: str) -> None:
+        """Mark the stream finished; it expires after the retention period."""
+        ...
+
+    async def read(
+        self, stream_id: str, after_sequence: int, timeout: float
+    ) -> tuple[list[ChatEvent], bool]:
+        """Return the events after a sequence number and whether the stream
+        is finished, waiting up to ``timeout`` seconds for new events.
+
+        Raises:
+            ResumeUnavailableError: Unknown stream, or events were evicted
+        """
+        ...
+
+    async def owner(self, stream_id: str) -> Optional[str]:
+        """Return the stream owner, or None if the stream is unknown."""
+        ...
+
+    async def touch(self, stream_id: str) -> None:
+        """Mark the stream attached for another grace period."""
+        ...
+
+    async def release(self, stream_id: str) -> None:
+        """Mark the stream detached immediately."""
+        ...
+
+    async def attached(self, stream_id: str) -> bool:
+        """Whether a subscriber touched the stream within the grace period."""
+        ...
+
+
+# =============================================================================
+# In-process buffer
+# =============================================================================
+
+
+@dataclass
+class _BufferedStream:
+    owner: str
+    events: deque
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    first_sequence: Optional[int] = None
+    done: bool = False
+    attached_until: float = 0.0
+    expires_at: float = math.inf
+
+
+class InMemoryReplayBuffer:
+    """Replay buffer for a single worker process."""
+
+    def __init__(
+        self,
+        max_events: int = MAX_EVENTS,
+        grace_seconds: float = GRACE_SECONDS,
+        retention_seconds: float = RETENTION_SECONDS,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            max_events: Events kept per stream
+            grace_seconds: How long a stream stays attached after a touch
+            retention_seconds: How long finished streams stay resumable
+        """
+        self.max_events = max_events
+        self.grace_seconds = grace_seconds
+        self.retention_seconds = retention_seconds
+        self._streams: dict[str, _BufferedStream] = {}
+
+    def _live(self, stream_id: str) -> Optional[_BufferedStream]:
+        stream = self._streams.get(stream_id)
+        if stream is not None and stream.expires_at <= time.monotonic():
+            del self._streams[stream_id]
+            return None
+        return stream
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for stream_id in [s for s, stream in self._streams.items() if stream.expires_at <= now]:
+            del self._streams[stream_id]
+
+    async def create(self, stream_id: str, owner: str) -> None:
+        self._prune()
+        self._streams[stream_id] = _BufferedStream(
+            owner=owner,
+            events=deque(maxlen=self.max_events),
+            attached_until=time.monotonic() + self.grace_seconds,
+        )
+
+    async def append(self, stream_id: str, event: ChatEvent) -> None:
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            return
+        if stream.first_sequence is None:
+            stream.first_sequence = event.sequence
+        stream.events.append(event)
+        async with stream.changed:
+            stream.changed.notify_all()
+
+    async def close(self, stream_id: str) -> None:
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            return
+        stream.done = True
+        stream.expires_at = time.monotonic() + self.retention_seconds
+        async with stream.changed:
+            stream.changed.notify_all()
+
+    async def read(
+        self, stream_id: str, after_sequence: int, timeout: float
+    ) -> tuple[list[ChatEvent], bool]:
+        stream = self._live(stream_id)
+        if stream is None:
+            raise ResumeUnavailableError(f"Chat stream {stream_id} not found")
+
+        async with stream.changed:
+            if not stream.done and not self._has_after(stream, after_sequence):
+                try:
+                    await asyncio.wait_for(stream.changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+        oldest = stream.events[0].sequence if stream.events else None
+        if oldest is not None and oldest != stream.first_sequence and oldest > after_sequence + 1:
+            raise ResumeUnavailableError(
+                f"Chat stream {stream_id} no longer holds events after {after_sequence}"
+            )
+
+        # Newest first, stopping at what the reader already has
+        events = []
+        for event in reversed(stream.events):
+            if event.sequence <= after_sequence:
+                break
+            events.append(event)
+        events.reverse()
+        return events, stream.done
+
+    @staticmethod
+    def _has_after(stream: _BufferedStream, after_sequence: int) -> bool:
+        return bool(stream.events) and stream.events[-1].sequence > after_sequence
+
+    async def owner(self, stream_id: str) -> Optional[str]:
+        stream = self._live(stream_id)
+        return stream.owner if stream else None
+
+    async def touch(self, stream_id: str) -> None:
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            stream.attached_until = time.monotonic() + self.grace_seconds
+
+    async def release(self, stream_id: str) -> None:
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            stream.attached_until = 0.0
+
+    async def attached(self, stream_id: str) -> bool:
+        stream = self._streams.get(stream_id)
+        return stream is not None and stream.attached_until > time.monotonic()
+
+
+# =============================================================================
+# Redis buffer
+# =============================================================================
+
+
+class RedisReplayBuffer:
+    """Replay buffer in Redis Streams, shared by all workers.
+
+    Each chat stream is a Redis stream whose entry IDs are ``0-<sequence>``,
+    so a resume is an XREAD from the client's last sequence number. The
+    owner and first sequence live in a hash, attachment in a key that
+    expires after the grace period. A final entry with a ``done`` field
+    marks the end of the stream.
+
+    Expects a redis.asyncio client created with ``decode_responses=True``.
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        max_events: int = MAX_EVENTS,
+        grace_seconds: float = GRACE_SECONDS,
+        retention_seconds: float = RETENTION_SECONDS,
+        key_prefix: str = "chat_stream:",
+    ):
+        """Initialize the buffer.
+
+        Args:
+            redis: redis.asyncio client
+            max_events: Approximate events kept per stream (XADD MAXLEN ~)
+            grace_seconds: How long a stream stays attached after a touch
+            retention_seconds: Key TTL, refreshed on every event
+            key_prefix: Prefix for all keys of this buffer
+        """
+        self.redis = redis
+        self.max_events = max_events
+        self.grace_seconds = grace_seconds
+        self.retention_seconds = retention_seconds
+        self.key_prefix = key_prefix
+
+    def _keys(self, stream_id: str) -> tuple[str, str, str]:
+        key = f"{self.key_prefix}{stream_id}"
+        return key, f"{key}:meta", f"{key}:attached"
+
+    async def create(self, stream_id: str, owner: str) -> None:
+        _, meta_key, attached_key = self._keys(stream_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(meta_key, mapping={"owner": owner})
+        pipe.expire(meta_key, int(self.retention_seconds))
+        pipe.set(attached_key, "1", ex=math.ceil(self.grace_seconds))
+        await pipe.execute()
+
+    async def append(self, stream_id: str, event: ChatEvent) -> None:
+        await self._add(
+            stream_id,
+            {"event": json.dumps(event.to_dict(), separators=(",", ":"))},
+            entry_id=f"0-{event.sequence}",
+            first_sequence=event.sequence,
+        )
+
+    async def close(self, stream_id: str) -> None:
+        await self._add(stream_id, {"done": "1"})
+
+    async def _add(
+        self,
+        stream_id: str,
+        fields: dict[str, str],
+        entry_id: str = "*",
+        first_sequence: Optional[int] = None,
+    ) -> None:
+        key, meta_key, _ = self._keys(stream_id)
+        ttl = int(self.retention_seconds)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.xadd(key, fields, id=entry_id, maxlen=self.max_events, approximate=True)
+        if first_sequence is not None:
+            pipe.hsetnx(meta_key, "first", first_sequence)
+        pipe.expire(key, ttl)
+        pipe.expire(meta_key, ttl)
+        await pipe.execute()
+
+    async def read(
+        self, stream_id: str, after_sequence: int, timeout: float
+    ) -> tuple[list[ChatEvent], bool]:
+        key, meta_key, _ = self._keys(stream_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hget(meta_key, "first")
+        pipe.exists(meta_key)
+        pipe.xrange(key, count=1)
+        pipe.xrange(key, min=f"(0-{after_sequence}")
+        first, exists, oldest, entries = await pipe.execute()
+
+        if not exists:
+            raise ResumeUnavailableError(f"Chat stream {stream_id} not found")
+        if oldest and "event" in oldest[0][1]:
+            oldest_sequence = int(oldest[0][0].split("-")[1])
+            if (
+                first is not None
+                and oldest_sequence != int(first)
+                and oldest_sequence > after_sequence + 1
+            ):
+                raise ResumeUnavailableError(
+                    f"Chat stream {stream_id} no longer holds events after {after_sequence}"
+                )
+
+        if not entries:
+            reply = await self.redis.xread(
+                {key: f"0-{after_sequence}"}, block=max(1, int(timeout * 1000))
+            )
+            entries = reply[0][1] if reply else []
+
+        events, done = [], False
+        for _, fields in entries:
+            if "done" in fields:
+                done = True
+            else:
+                events.append(ChatEvent.from_dict(json.loads(fields["event"])))
+        return events, done
+
+    async def owner(self, stream_id: str) -> Optional[str]:
+        _, meta_key, _ = self._keys(stream_id)
+        return await self.redis.hget(meta_key, "owner")
+
+    async def touch(self, stream_id: str) -> None:
+        _, _, attached_key = self._keys(stream_id)
+        await self.redis.set(attached_key, "1", ex=math.ceil(self.grace_seconds))
+
+    async def release(self, stream_id: str) -> None:
+        _, _, attached_key = self._keys(stream_id)
+        await self.redis.delete(attached_key)
+
+    async def attached(self, stream_id: str) -> bool:
+        _, _, attached_key = self._keys(stream_id)
+        return bool(await self.redis.exists(attached_key))
+
+
+# =============================================================================
+# Stream manager
+# =============================================================================
+
+
+class ChatStreamManager:
+    """Runs chat generations detached from the connections that read them.
+
+    Usage:
+        stream_id = await manager.start(orchestrator.chat(message, context), context)
+        async for event in manager.subscribe(stream_id, context, after_sequence=0):
+            await sender.send(event)
+    """
+
+    def __init__(
+        self,
+        buffer: IReplayBuffer,
+        read_timeout_seconds: float = 1.0,
+        liveness_check_seconds: float = 1.0,
+    ):
+        """Initialize the manager.
+
+        Args:
+            buffer: Replay buffer for stream events
+            read_timeout_seconds: Longest a subscriber waits per buffer read
+            liveness_check_seconds: Minimum time between the generation's
+                checks for a subscriber
+        """
+        self.buffer = buffer
+        self.read_timeout_seconds = read_timeout_seconds
+        self.liveness_check_seconds = liveness_check_seconds
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def start(self, events: AsyncIterator[ChatEvent], context: UserContext) -> str:
+        """Start consuming a chat event stream into the replay buffer.
+
+        Args:
+            events: Event stream from AgentOrchestrator.chat()
+            context: User the stream belongs to
+
+        Returns:
+            Stream ID for subscribe() and cancel()
+        """
+        stream_id = uuid.uuid4().hex
+        await self.buffer.create(stream_id, _stream_owner(context))
+
+        task = asyncio.create_task(self._pump(stream_id, events), name=f"chat-stream-{stream_id}")
+        self._tasks[stream_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(stream_id, None))
+        return stream_id
+
+    async def _pump(self, stream_id: str, events: AsyncIterator[ChatEvent]) -> None:
+        loop = asyncio.get_running_loop()
+        last_sequence = 0
+        next_check = loop.time() + self.liveness_check_seconds
+        final_event: Optional[ChatEvent] = None
+
+        try:
+            async for event in events:
+                last_sequence = event.sequence
+                await self.buffer.append(stream_id, event)
+
+                if loop.time() >= next_check:
+                    next_check = loop.time() + self.liveness_check_seconds
+                    if not await self.buffer.attached(stream_id):
+                        logger.info(f"Chat stream {stream_id} has no subscriber, stopping generation")
+                        final_event = ChatEvent(
+                            type=ChatEventType.CANCEL,
+                            sequence=last_sequence + 1,
+                            content="Stopped after the client disconnected",
+                        )
+                        break
+
+        except asyncio.CancelledError:
+            logger.info(f"Chat stream {stream_id} cancelled")
+            final_event = ChatEvent(
+                type=ChatEventType.CANCEL,
+                sequence=last_sequence + 1,
+                content="Operation cancelled",
+            )
+            raise
+        except Exception as e:
+            logger.exception(f"Chat streaming error: {e}")
+            final_event = ChatEvent(
+                type=ChatEventType.ERROR,
+                sequence=last_sequence + 1,
+                content=sanitize_error_message(str(e), "Chat error"),
+                error_type=ErrorType.FATAL,
+            )
+        finally:
+            aclose = getattr(events, "aclose", None)
+            try:
+                if aclose is not None:
+                    await aclose()
+                if final_event is not None:
+                    await self.buffer.append(stream_id, final_event)
+                await self.buffer.close(stream_id)
+            except Exception as e:
+                logger.warning(f"Failed to close chat stream {stream_id}: {e}")
+
+    async def subscribe(
+        self,
+        stream_id: str,
+        context: UserContext,
+        after_sequence: int = 0,
+    ) -> AsyncIterator[ChatEvent]:
+        """Yield the stream's events after a sequence number until it ends.
+
+        Keeps the stream attached while iterating.
+
+        Raises:
+            ResumeUnavailableError: The stream is unknown, belongs to another
+                user, or no longer holds the requested events
+        """
+        if await self.buffer.owner(stream_id) != _stream_owner(context):
+            raise ResumeUnavailableError(f"Chat stream {stream_id} not found")
+
+        loop = asyncio.get_running_loop()
+        touch_interval = self.buffer.grace_seconds / 4
+        touched_at: Optional[float] = None
+
+        while True:
+            now = loop.time()
+            if touched_at is None or now - touched_at >= touch_interval:
+                await self.buffer.touch(stream_id)
+                touched_at = now
+
+            events, done = await self.buffer.read(
+                stream_id, after_sequence, self.read_timeout_seconds
+            )
+            for event in events:
+                after_sequence = event.sequence
+                yield event
+            if done:
+                return
+
+    async def cancel(self, stream_id: str) -> None:
+        """Stop a generation, here or (via the buffer) on another worker."""
+        await self.buffer.release(stream_id)
+        task = self._tasks.get(stream_id)
+        if task is not None:
+            task.cancel()
+
+    async def close(self) -> None:
+        """Cancel all generations running in this process."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def create_stream_manager(redis_client: Any = None) -> ChatStreamManager:
+    """Create the stream manager for CHAT_STREAM_BACKEND.
+
+    Args:
+        redis_client: redis.asyncio client, required for the redis backend
+
+    Returns:
+        ChatStreamManager with a Redis or in-process replay buffer
+    """
+    if STREAM_BACKEND == "redis":
+        if redis_client is not None:
+            logger.info("Chat stream replay buffer: redis")
+            return ChatStreamManager(RedisReplayBuffer(redis_client))
+        logger.warning("CHAT_STREAM_BACKEND=redis but Redis is unavailable, using in-process buffer")
+    return ChatStreamManager(InMemoryReplayBuffer())
@@ -9,6 +9,7 @@ from .entities import (
     MemoryType,
     Message,
     MessageRole,
+    SystemPrompt,
     ToolCall,
     ToolDefinition,
     ToolResult,
@@ -33,6 +34,7 @@ __all__ = [
     "MemoryType",
     "Message",
     "MessageRole",
+    "SystemPrompt",
     "ToolCall",
     "ToolDefinition",
     "ToolResult",
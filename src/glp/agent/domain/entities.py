@@ -144,6 +144,52 @@ class Conversation:
         self.message_count += 1
         self.updated_at = datetime.utcnow()
 
+    def keep_recent_messages(self, limit: int) -> None:
+        """Drop all but the last ``limit`` loaded messages.
+
+        The kept window starts at a user message, so tool results are
+        never separated from the assistant message that called the tool.
+        message_count still counts the whole conversation.
+        """
+        recent = self.messages[max(len(self.messages) - limit, 0):] if limit > 0 else []
+        start = next(
+            (i for i, m in enumerate(recent) if m.role == MessageRole.USER), len(recent)
+        )
+        self.messages = recent[start:]
+
+
+class SystemPrompt(str):
+    """A system prompt split into a stable prefix and a volatile suffix.
+
+    Behaves as the full prompt string, so providers without prompt
+    caching use it unchanged. Providers that cache prompt prefixes
+    (Anthropic) cache the stable part, which stays identical across
+    turns and conversations, and send the volatile part (per-request
+    memories and patterns) after the cache breakpoint.
+
+    Attributes:
+        stable: Base prompt, identical for every request
+        volatile: Per-request context appended after the stable part
+    """
+
+    stable_length: int
+
+    def __new__(cls, stable: str, volatile: str = "") -> SystemPrompt:
+        prompt = super().__new__(cls, stable + volatile)
+        prompt.stable_length = len(stable)
+        return prompt
+
+    def __reduce__(self):
+        return (SystemPrompt, (self.stable, self.volatile))
+
+    @property
+    def stable(self) -> str:
+        return str(self[: self.stable_length])
+
+    @property
+    def volatile(self) -> str:
+        return str(self[self.stable_length :])
+
 
 # ============================================
 # Memory Types
@@ -320,6 +366,7 @@ class ToolResult:
 class ChatEventType(str, Enum):
     """Types of streaming chat events."""
 
+    QUEUED = "queued"  # Waiting for a chat slot (metadata: position)
     TEXT_DELTA = "text_delta"  # Partial text token
     THINKING_DELTA = "thinking_delta"  # CoT content (redacted)
     TOOL_CALL_START = "tool_call_start"  # Tool invocation begins
@@ -406,6 +453,25 @@ class ChatEvent:
             result["data"] = self.data
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ChatEvent:
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            type=ChatEventType(data["type"]),
+            sequence=data["sequence"],
+            content=data.get("content"),
+            tool_call_id=data.get("tool_call_id"),
+            tool_name=data.get("tool_name"),
+            tool_arguments=data.get("tool_arguments"),
+            confirmation_id=data.get("confirmation_id"),
+            error=data.get("error"),
+            error_type=ErrorType(data["error_type"]) if data.get("error_type") else None,
+            metadata=data.get("metadata"),
+            correlation_id=data.get("correlation_id"),
+            data=data.get("data"),
+            event_id=data.get("event_id") or str(uuid.uuid4()),
+        )
+
     @classmethod
     def text_delta(cls, text: str, sequence: int) -> ChatEvent:
         """Create a text delta event."""
@@ -70,13 +70,15 @@ class ILLMProvider(ABC):
         Args:
             messages: Conversation history
             tools: Available tools for the model to use
-            system_prompt: System prompt to prepend
+            system_prompt: System prompt to prepend; a SystemPrompt marks
+                the stable prefix that providers may cache
             stream: Whether to stream the response
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
 
         Yields:
-            ChatEvent objects representing the streaming response
+            ChatEvent objects representing the streaming response. The DONE
+            event may carry token usage in ``metadata["usage"]``.
         """
         pass
 
@@ -92,6 +94,32 @@ class ILLMProvider(ABC):
         """
         pass
 
+    async def embed_batch(
+        self, texts: list[str]
+    ) -> list[tuple[list[float], str, int]]:
+        """Generate embeddings for several texts.
+
+        Providers with a batch endpoint override this; the default
+        embeds each text in turn.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of (embedding_vector, model_name, dimension) tuples, in
+            the order of ``texts``
+        """
+        return [await self.embed(text) for text in texts]
+
+    def prepare_tools(self, tools: list[ToolDefinition]) -> Any:
+        """Precompute the provider's API payload for a tool catalogue.
+
+        Called at startup so the first chat does not pay for formatting.
+        Providers that cache formatted tools override this; the default
+        does nothing.
+        """
+        return None
+
     async def complete(
         self,
         prompt: str,
@@ -183,9 +211,16 @@ class IConversationStore(ABC):
 
     @abstractmethod
     async def get(
-        self, conversation_id: UUID, context: UserContext
+        self,
+        conversation_id: UUID,
+        context: UserContext,
+        message_limit: Optional[int] = None,
     ) -> Optional[Conversation]:
-        """Get a conversation by ID (with tenant isolation)."""
+        """Get a conversation by ID (with tenant isolation).
+
+        With ``message_limit``, only that many recent messages are loaded
+        (0 loads just the conversation row).
+        """
         pass
 
     @abstractmethod
@@ -213,7 +248,7 @@ class IConversationStore(ABC):
         limit: int = 50,
         before: Optional[UUID] = None,
     ) -> list[Message]:
-        """Get messages from a conversation."""
+        """Get the newest messages before a message ID, oldest first."""
         pass
 
     @abstractmethod
@@ -242,6 +277,14 @@ class IMemoryStore(ABC):
         """Store a new memory (handles deduplication via content_hash)."""
         pass
 
+    async def store_many(self, memories: list[Memory]) -> list[Memory]:
+        """Store several memories.
+
+        Stores that can write in bulk override this; the default stores
+        each memory in turn.
+        """
+        return [await self.store(memory) for memory in memories]
+
     @abstractmethod
     async def search(
         self,
@@ -3,6 +3,11 @@ Conversation Store Implementation.
 
 Handles conversation and message persistence with tenant isolation.
 Uses PostgreSQL with RLS for security.
+
+Chat turns load a window of recent messages (get() with message_limit)
+rather than the whole conversation, and history views page backwards
+with a (created_at, id) keyset cursor (get_messages() with before), so
+neither gets slower as a conversation grows.
 """
 
 from __future__ import annotations
@@ -23,6 +28,9 @@ from ..domain.ports import IConversationStore
 
 logger = logging.getLogger(__name__)
 
+MESSAGE_COLUMNS = """id, role, content, thinking_summary, tool_calls,
+                     model_used, tokens_used, latency_ms, created_at"""
+
 
 class IAsyncDBPool(Protocol):
     """Protocol for async database pool."""
@@ -113,13 +121,20 @@ class ConversationStore(IConversationStore):
         return conversation
 
     async def get(
-        self, conversation_id: UUID, context: UserContext
+        self,
+        conversation_id: UUID,
+        context: UserContext,
+        message_limit: Optional[int] = None,
     ) -> Optional[Conversation]:
         """Get a conversation by ID with messages.
 
         Args:
             conversation_id: Conversation ID
             context: User context for tenant isolation
+            message_limit: Load only the most recent messages, trimmed to
+                start at a user message (see
+                Conversation.keep_recent_messages). 0 loads no messages;
+                None loads all of them.
 
         Returns:
             Conversation with messages, or None if not found
@@ -155,47 +170,71 @@ class ConversationStore(IConversationStore):
                     updated_at=row["updated_at"],
                 )
 
-                # Get messages
-                message_rows = await conn.fetch(
-                    """
-                    SELECT id, role, content, thinking_summary, tool_calls,
-                           model_used, tokens_used, latency_ms, created_at
-                    FROM agent_messages
-                    WHERE conversation_id = $1
-                    ORDER BY created_at ASC
-                    """,
-                    conversation_id,
-                )
+                if message_limit == 0:
+                    return conversation
 
-                for msg_row in message_rows:
-                    tool_calls = None
-                    if msg_row["tool_calls"]:
-                        tool_calls = [
-                            ToolCall(
-                                id=tc.get("id", ""),
-                                name=tc.get("name", ""),
-                                arguments=tc.get("arguments", {}),
-                                result=tc.get("result"),
-                            )
-                            for tc in msg_row["tool_calls"]
-                        ]
-
-                    message = Message(
-                        id=msg_row["id"],
-                        conversation_id=conversation_id,
-                        role=MessageRole(msg_row["role"]),
-                        content=msg_row["content"],
-                        thinking_summary=msg_row["thinking_summary"],
-                        tool_calls=tool_calls,
-                        model_used=msg_row["model_used"],
-                        tokens_used=msg_row["tokens_used"],
-                        latency_ms=msg_row["latency_ms"],
-                        created_at=msg_row["created_at"],
+                # Get messages
+                if message_limit is None:
+                    message_rows = await conn.fetch(
+                        f"""
+                        SELECT {MESSAGE_COLUMNS}
+                        FROM agent_messages
+                        WHERE conversation_id = $1
+                        ORDER BY created_at ASC, id ASC
+                        """,
+                        conversation_id,
+                    )
+                else:
+                    message_rows = await conn.fetch(
+                        f"""
+                        SELECT {MESSAGE_COLUMNS}
+                        FROM agent_messages
+                        WHERE conversation_id = $1
+                        ORDER BY created_at DESC, id DESC
+                        LIMIT $2
+                        """,
+                        conversation_id,
+                        message_limit,
                     )
-                    conversation.messages.append(message)
+                    message_rows = list(reversed(message_rows))
 
+                conversation.messages = [
+                    self._row_to_message(msg_row, conversation_id)
+                    for msg_row in message_rows
+                ]
+
+        if message_limit is not None:
+            conversation.keep_recent_messages(message_limit)
         return conversation
 
+    @staticmethod
+    def _row_to_message(row: Any, conversation_id: UUID) -> Message:
+        """Build a Message from an agent_messages row."""
+        tool_calls = None
+        if row["tool_calls"]:
+            tool_calls = [
+                ToolCall(
+                    id=tc.get("id", ""),
+                    name=tc.get("name", ""),
+                    arguments=tc.get("arguments", {}),
+                    result=tc.get("result"),
+                )
+                for tc in row["tool_calls"]
+            ]
+
+        return Message(
+            id=row["id"],
+            conversation_id=conversation_id,
+            role=MessageRole(row["role"]),
+            content=row["content"],
+            thinking_summary=row["thinking_summary"],
+            tool_calls=tool_calls,
+            model_used=row["model_used"],
+            tokens_used=row["tokens_used"],
+            latency_ms=row["latency_ms"],
+            created_at=row["created_at"],
+        )
+
     async def list(
         self,
         context: UserContext,
@@ -334,7 +373,12 @@ class ConversationStore(IConversationStore):
         limit: int = 50,
         before: Optional[UUID] = None,
     ) -> list[Message]:
-        """Get messages from a conversation.
+        """Get a page of messages from a conversation.
+
+        Pages run backwards from the newest message: pass the first
+        (oldest) message ID of a page as ``before`` to get the page
+        preceding it. The cursor compares (created_at, id), so messages
+        with the same timestamp are neither skipped nor repeated.
 
         Args:
             conversation_id: Conversation ID
@@ -343,7 +387,7 @@ class ConversationStore(IConversationStore):
             before: Get messages before this message ID (for pagination)
 
         Returns:
-            List of messages ordered by creation time
+            The newest ``limit`` messages before the cursor, oldest first
         """
         async with self.db.acquire() as conn:
             async with conn.transaction():
@@ -366,61 +410,39 @@ class ConversationStore(IConversationStore):
 
                 if before:
                     rows = await conn.fetch(
-                        """
-                        SELECT id, role, content, thinking_summary, tool_calls,
-                               model_used, tokens_used, latency_ms, created_at
+                        f"""
+                        SELECT {MESSAGE_COLUMNS}
                         FROM agent_messages
                         WHERE conversation_id = $1
-                          AND created_at < (SELECT created_at FROM agent_messages WHERE id = $2)
-                        ORDER BY created_at DESC
+                          AND (created_at, id) < (
+                              SELECT created_at, id FROM agent_messages
+                              WHERE id = $2 AND conversation_id = $1
+                          )
+                        ORDER BY created_at DESC, id DESC
                         LIMIT $3
                         """,
                         conversation_id,
                         before,
                         limit,
                     )
-                    # Reverse to get chronological order
-                    rows = list(reversed(rows))
                 else:
                     rows = await conn.fetch(
-                        """
-                        SELECT id, role, content, thinking_summary, tool_calls,
-                               model_used, tokens_used, latency_ms, created_at
+                        f"""
+                        SELECT {MESSAGE_COLUMNS}
                         FROM agent_messages
                         WHERE conversation_id = $1
-                        ORDER BY created_at ASC
+                        ORDER BY created_at DESC, id DESC
                         LIMIT $2
                         """,
                         conversation_id,
                         limit,
                     )
 
-                messages = []
-                for row in rows:
-                    tool_calls = None
-                    if row["tool_calls"]:
-                        tool_calls = [
-                            ToolCall(
-                                id=tc.get("id", ""),
-                                name=tc.get("name", ""),
-                                arguments=tc.get("arguments", {}),
-                                result=tc.get("result"),
-                            )
-                            for tc in row["tool_calls"]
-                        ]
-
-                    messages.append(Message(
-                        id=row["id"],
-                        conversation_id=conversation_id,
-                        role=MessageRole(row["role"]),
-                        content=row["content"],
-                        thinking_summary=row["thinking_summary"],
-                        tool_calls=tool_calls,
-                        model_used=row["model_used"],
-                        tokens_used=row["tokens_used"],
-                        latency_ms=row["latency_ms"],
-                        created_at=row["created_at"],
-                    ))
+                # Reverse to get chronological order
+                messages = [
+                    self._row_to_message(row, conversation_id)
+                    for row in reversed(rows)
+                ]
 
         return messages
 
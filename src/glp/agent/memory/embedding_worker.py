@@ -276,7 +276,7 @@ class EmbeddingWorker:
             async with conn.transaction():
                 # Set tenant context for RLS
                 await conn.execute(
-                    "SET LOCAL app.tenant_id = $1",
+                    "SELECT set_config('app.tenant_id', $1, true)",
                     job.tenant_id,
                 )
 
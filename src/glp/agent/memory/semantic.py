@@ -10,6 +10,8 @@ from __future__ import annotations
 import hashlib
 import logging
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Optional, Protocol
 from uuid import UUID
 
@@ -18,6 +20,38 @@ from ..domain.ports import IMemoryStore
 
 logger = logging.getLogger(__name__)
 
+# Columns written by store() and store_many(), in bind parameter order
+MEMORY_INSERT_COLUMNS = (
+    "id", "tenant_id", "user_id", "memory_type", "content", "content_hash",
+    "embedding", "embedding_model", "embedding_dimension",
+    "source_conversation_id", "source_message_id",
+    "valid_from", "valid_until", "confidence", "metadata",
+)
+
+# Keeps a multi-row upsert well under PostgreSQL's 32767 bind parameters
+MAX_ROWS_PER_UPSERT = 1000
+
+
+@lru_cache(maxsize=32)
+def _bulk_upsert_sql(row_count: int) -> str:
+    """Build the multi-row memory upsert for ``row_count`` rows."""
+    width = len(MEMORY_INSERT_COLUMNS)
+    values = ",\n".join(
+        "(" + ", ".join(f"${row * width + col + 1}" for col in range(width)) + ")"
+        for row in range(row_count)
+    )
+    return f"""
+        INSERT INTO agent_memory ({", ".join(MEMORY_INSERT_COLUMNS)})
+        VALUES {values}
+        ON CONFLICT (tenant_id, user_id, content_hash)
+        DO UPDATE SET
+            confidence = GREATEST(agent_memory.confidence, EXCLUDED.confidence),
+            access_count = agent_memory.access_count + 1,
+            last_accessed_at = NOW(),
+            updated_at = NOW()
+        RETURNING id, user_id, content_hash, created_at, updated_at
+    """
+
 
 class IAsyncDBPool(Protocol):
     """Protocol for async database pool."""
@@ -33,6 +67,9 @@ class IEmbeddingProvider(Protocol):
     """Protocol for embedding generation."""
 
     async def embed(self, text: str) -> tuple[list[float], str, int]: ...
+    async def embed_batch(
+        self, texts: list[str]
+    ) -> list[tuple[list[float], str, int]]: ...
 
 
 class SemanticMemoryStore(IMemoryStore):
@@ -48,6 +85,9 @@ class SemanticMemoryStore(IMemoryStore):
     Usage:
         store = SemanticMemoryStore(db_pool, embedding_provider)
 
+        # Store memories (one embedding call, one upsert)
+        memories = await store.store_many(extracted_memories)
+
         # Store a memory
         memory = await store.store(Memory(
             tenant_id="tenant-123",
@@ -82,8 +122,10 @@ class SemanticMemoryStore(IMemoryStore):
 
     async def _set_tenant_context(self, conn, tenant_id: str) -> None:
         """Set the tenant context for RLS policies."""
+        # SET LOCAL takes no bind parameters; set_config(..., true) is the
+        # transaction-scoped equivalent
         await conn.execute(
-            "SET LOCAL app.tenant_id = $1",
+            "SELECT set_config('app.tenant_id', $1, true)",
             tenant_id,
         )
 
@@ -141,21 +183,7 @@ class SemanticMemoryStore(IMemoryStore):
                         updated_at = NOW()
                     RETURNING id, created_at, updated_at
                     """,
-                    memory.id,
-                    memory.tenant_id,
-                    memory.user_id,
-                    memory.memory_type.value,
-                    memory.content,
-                    content_hash,
-                    memory.embedding,
-                    memory.embedding_model,
-                    memory.embedding_dimension,
-                    memory.source_conversation_id,
-                    memory.source_message_id,
-                    memory.valid_from,
-                    memory.valid_until,
-                    memory.confidence,
-                    memory.metadata,
+                    *self._insert_values(memory),
                 )
 
                 memory.id = row["id"]
@@ -165,6 +193,102 @@ class SemanticMemoryStore(IMemoryStore):
         logger.debug(f"Stored memory {memory.id}: {memory.content[:50]}...")
         return memory
 
+    async def store_many(self, memories: list[Memory]) -> list[Memory]:
+        """Store several memories with one embedding call and one upsert.
+
+        Memories without an embedding are embedded with a single
+        ``embed_batch`` call. Each tenant's memories are then upserted by
+        one multi-row statement inside one tenant-scoped transaction.
+        Duplicates within the batch collapse into one row that keeps the
+        highest confidence.
+
+        Args:
+            memories: Memories to store
+
+        Returns:
+            The stored memories in input order; duplicates share one id
+        """
+        if not memories:
+            return []
+
+        for memory in memories:
+            memory.content_hash = self._compute_content_hash(memory.content)
+        await self._embed_many([memory for memory in memories if not memory.embedding])
+
+        # ON CONFLICT cannot update the same row twice in one statement
+        unique_by_tenant: dict[str, dict[tuple[str, str], Memory]] = {}
+        for memory in memories:
+            unique = unique_by_tenant.setdefault(memory.tenant_id, {})
+            key = (memory.user_id, memory.content_hash)
+            if key not in unique or memory.confidence > unique[key].confidence:
+                unique[key] = memory
+
+        stored: dict[tuple[str, str, str], Any] = {}
+        async with self.db.acquire() as conn:
+            for tenant_id, unique in unique_by_tenant.items():
+                rows = list(unique.values())
+                async with conn.transaction():
+                    await self._set_tenant_context(conn, tenant_id)
+                    for start in range(0, len(rows), MAX_ROWS_PER_UPSERT):
+                        chunk = rows[start:start + MAX_ROWS_PER_UPSERT]
+                        for row in await conn.fetch(
+                            _bulk_upsert_sql(len(chunk)),
+                            *chain.from_iterable(map(self._insert_values, chunk)),
+                        ):
+                            stored[(tenant_id, row["user_id"], row["content_hash"])] = row
+
+        for memory in memories:
+            row = stored[(memory.tenant_id, memory.user_id, memory.content_hash)]
+            memory.id = row["id"]
+            memory.created_at = row["created_at"]
+            memory.updated_at = row["updated_at"]
+
+        logger.debug(f"Stored {len(memories)} memories in {len(unique_by_tenant)} upserts")
+        return memories
+
+    async def _embed_many(self, memories: list[Memory]) -> None:
+        """Embed memories in place with one batch call.
+
+        On failure the memories are stored without embeddings, as in
+        store(); the embedding worker fills them in later.
+        """
+        if not self.embedding_provider or not memories:
+            return
+
+        try:
+            results = await self.embedding_provider.embed_batch(
+                [memory.content for memory in memories]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to generate {len(memories)} embeddings: {e}")
+            return
+
+        for memory, (embedding, model, dimension) in zip(memories, results):
+            memory.embedding = embedding
+            memory.embedding_model = model
+            memory.embedding_dimension = dimension
+
+    @staticmethod
+    def _insert_values(memory: Memory) -> tuple:
+        """Bind parameters for one memory, in MEMORY_INSERT_COLUMNS order."""
+        return (
+            memory.id,
+            memory.tenant_id,
+            memory.user_id,
+            memory.memory_type.value,
+            memory.content,
+            memory.content_hash,
+            memory.embedding,
+            memory.embedding_model,
+            memory.embedding_dimension,
+            memory.source_conversation_id,
+            memory.source_message_id,
+            memory.valid_from,
+            memory.valid_until,
+            memory.confidence,
+            memory.metadata,
+        )
+
     async def search(
         self,
         query: str,
@@ -14,7 +14,9 @@ Main orchestration logic for the agent chatbot. Coordinates:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Optional
 from uuid import UUID
@@ -37,12 +39,14 @@ from ..domain.ports import (
     IMemoryStore,
 )
 from ..memory.long_term import ConversationSummarizer, FactExtractor
+from .event_streamer import EventStreamer
 from ..memory.agentdb import (
     AgentDBAdapter,
     PatternType,
 )
 from ..security.cot_redactor import get_redactor
 from ..tools.registry import ToolRegistry
+from ..tools.result_shaper import ResultShaper, serialize_result
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +71,15 @@ class AgentConfig:
         max_tokens: Maximum tokens per response
         enable_thinking: Whether to enable extended thinking mode
         thinking_budget: Token budget for extended thinking
+        history_window_messages: Recent messages sent to the LLM each turn;
+            older ones are represented by the conversation summary
+        conversation_cache_size: Active conversations cached in process
+        tool_result_token_budget: Maximum tokens of a tool result kept in
+            the conversation; larger row sets are summarized behind a
+            paging handle (0 disables shaping)
+        tool_result_page_size: Rows per page of a summarized result
+        tool_result_stream_rows: Rows of a summarized result streamed to
+            the client
     """
 
     system_prompt: str = """You are a specialized AI assistant for the HPE GreenLake Device Inventory System.
@@ -119,6 +132,11 @@ For modifications (POST, PATCH, DELETE):
     max_tokens: Optional[int] = None
     enable_thinking: bool = False
     thinking_budget: Optional[int] = None
+    history_window_messages: int = 40
+    conversation_cache_size: int = 256
+    tool_result_token_budget: int = 2000
+    tool_result_page_size: int = 50
+    tool_result_stream_rows: int = 500
 
 
 class AgentOrchestrator:
@@ -188,13 +206,14 @@ class AgentOrchestrator:
         from .memory_manager import MemoryManager
         from .pattern_manager import PatternManager
         from .tool_executor import ToolExecutor
-        from .event_streamer import EventStreamer
         from .confirmation_manager import ConfirmationManager
         from .prompt_builder import PromptBuilder
 
         # Conversation lifecycle management
         self.conversation_manager = ConversationManager(
             conversation_store=conversation_store,
+            history_window=self.config.history_window_messages,
+            cache_size=self.config.conversation_cache_size,
         )
 
         # Semantic memory and fact extraction
@@ -216,14 +235,13 @@ class AgentOrchestrator:
             enable_matching=self.config.enable_pattern_matching,
         )
 
-        # Tool execution with error handling
+        # Tool execution with error handling and result shaping
         self.tool_executor = ToolExecutor(
             tool_registry=tool_registry,
-        )
-
-        # Event streaming with sequence tracking
-        self.event_streamer = EventStreamer(
-            correlation_id=None,  # Set per chat() call
+            result_shaper=ResultShaper(
+                token_budget=self.config.tool_result_token_budget,
+                page_size=self.config.tool_result_page_size,
+            ) if self.config.tool_result_token_budget > 0 else None,
         )
 
         # Operation confirmation management
@@ -237,6 +255,21 @@ class AgentOrchestrator:
             pattern_similarity_threshold=self.config.pattern_min_confidence,
         )
 
+    async def warm_up(self) -> None:
+        """Prepare tools before the first chat.
+
+        Loads the tool catalogue (opening the MCP connection) and has the
+        LLM provider format its tool payload, so the first turn after
+        startup skips both. Failures are logged; everything is retried
+        lazily on first use.
+        """
+        try:
+            tools = await self.tools.warm_up()
+            self.llm.prepare_tools(tools)
+            logger.info(f"Agent warmed up with {len(tools)} tools")
+        except Exception as e:
+            logger.warning(f"Agent warm-up failed: {e}")
+
 
     async def chat(
         self,
@@ -258,15 +291,21 @@ class AgentOrchestrator:
         """
         turn = 0
 
-        # Initialize event streamer for this conversation turn
-        self.event_streamer.set_correlation_id(context.session_id)
-        self.event_streamer.reset()
+        # Each call numbers its own events, so concurrent chats (and
+        # resumed streams) see a gapless sequence starting at 1
+        event_streamer = EventStreamer(correlation_id=context.session_id)
 
         try:
             # Get or create conversation
             conversation = await self.conversation_manager.get_or_create(
                 conversation_id, context
             )
+            # Older messages are outside the loaded window
+            earlier_summary = (
+                conversation.summary
+                if conversation.message_count > len(conversation.messages)
+                else None
+            )
 
             # Store user message
             user_msg = Message(
@@ -299,11 +338,17 @@ class AgentOrchestrator:
                 base_prompt=self.config.system_prompt,
                 memories=memories,
                 patterns=patterns,
+                conversation_summary=earlier_summary,
             )
 
+            # Token usage summed over all LLM calls for this message
+            usage_totals: dict[str, int] = {}
+
             # Main conversation loop
             while turn < self.config.max_turns:
                 turn += 1
+                turn_started = time.monotonic()
+                turn_usage: dict[str, Any] = {}
 
                 # Accumulate response
                 response_text = ""
@@ -322,7 +367,7 @@ class AgentOrchestrator:
                     # Forward events to client
                     if event.type == ChatEventType.TEXT_DELTA:
                         response_text += event.content or ""
-                        yield self.event_streamer.create_event(
+                        yield event_streamer.create_event(
                             ChatEventType.TEXT_DELTA,
                             content=event.content,
                         )
@@ -331,7 +376,7 @@ class AgentOrchestrator:
                         thinking_text += event.content or ""
                         # Redact sensitive data before streaming to client
                         redacted_chunk = get_redactor().redact(event.content or "").summary
-                        yield self.event_streamer.create_event(
+                        yield event_streamer.create_event(
                             ChatEventType.THINKING_DELTA,
                             content=redacted_chunk,
                         )
@@ -342,7 +387,7 @@ class AgentOrchestrator:
                             "name": event.tool_name,
                             "arguments": {},
                         }
-                        yield self.event_streamer.create_event(
+                        yield event_streamer.create_event(
                             ChatEventType.TOOL_CALL_START,
                             tool_call_id=event.tool_call_id,
                             tool_name=event.tool_name,
@@ -358,7 +403,7 @@ class AgentOrchestrator:
                                     arguments=current_tool_call["arguments"],
                                 )
                             )
-                            yield self.event_streamer.create_event(
+                            yield event_streamer.create_event(
                                 ChatEventType.TOOL_CALL_END,
                                 tool_call_id=event.tool_call_id,
                                 tool_arguments=event.tool_arguments,
@@ -366,7 +411,7 @@ class AgentOrchestrator:
                             current_tool_call = None
 
                     elif event.type == ChatEventType.ERROR:
-                        yield self.event_streamer.create_event(
+                        yield event_streamer.create_event(
                             ChatEventType.ERROR,
                             content=event.content,
                             error_type=event.error_type,
@@ -374,6 +419,7 @@ class AgentOrchestrator:
                         return
 
                     elif event.type == ChatEventType.DONE:
+                        turn_usage = (event.metadata or {}).get("usage") or {}
                         break
 
                 # Redact thinking BEFORE truncation to prevent sensitive data leak
@@ -399,6 +445,8 @@ class AgentOrchestrator:
                     thinking_summary=redacted_thinking,
                     tool_calls=tool_calls if tool_calls else None,
                     conversation_id=conversation.id,
+                    tokens_used=self._record_usage(turn, turn_usage, usage_totals),
+                    latency_ms=int((time.monotonic() - turn_started) * 1000),
                 )
 
                 # Store assistant message
@@ -437,7 +485,7 @@ class AgentOrchestrator:
                             confirmation_data=confirmation_data,
                         )
 
-                        yield self.event_streamer.create_event(
+                        yield event_streamer.create_event(
                             ChatEventType.CONFIRMATION_REQUIRED,
                             tool_call_id=tc.id,
                             content=result.result.get("message"),
@@ -449,11 +497,36 @@ class AgentOrchestrator:
                         # Don't continue loop - wait for confirmation
                         return
 
+                    # Large results enter the context as a summary
+                    shaped = self.tool_executor.shape_result(result, context)
+
+                    # Stream the rows of a summarized result in pages
+                    # before the final result event
+                    streamed = shaped.rows[:self.config.tool_result_stream_rows]
+                    for offset in range(0, len(streamed), self.config.tool_result_page_size):
+                        yield event_streamer.create_event(
+                            ChatEventType.TOOL_RESULT,
+                            tool_call_id=tc.id,
+                            metadata={
+                                "partial": True,
+                                "offset": offset,
+                                "total_rows": shaped.total_rows,
+                                "rows": json.loads(serialize_result(
+                                    streamed[offset:offset + self.config.tool_result_page_size]
+                                )),
+                            },
+                        )
+
                     # Send tool result
-                    yield self.event_streamer.create_event(
+                    yield event_streamer.create_event(
                         ChatEventType.TOOL_RESULT,
                         tool_call_id=tc.id,
-                        content=str(result.result)[:1000],  # Truncate for event
+                        content=shaped.content[:1000],  # Truncate for event
+                        metadata={
+                            "truncated": True,
+                            "handle": shaped.handle,
+                            "total_rows": shaped.total_rows,
+                        } if shaped.truncated else None,
                     )
 
                     # Learn from successful tool execution (via background worker)
@@ -469,14 +542,14 @@ class AgentOrchestrator:
                             trigger=user_message,
                             tool_name=tc.name,
                             arguments=tc.arguments,
-                            result_preview=str(result.result)[:100],
+                            result_preview=shaped.content[:100],
                             name=f"learn_pattern:{tc.name}",
                         )
 
                     # Add tool result as message
                     tool_msg = Message(
                         role=MessageRole.TOOL,
-                        content=str(result.result),
+                        content=shaped.content,
                         tool_calls=[result],
                         conversation_id=conversation.id,
                     )
@@ -499,22 +572,53 @@ class AgentOrchestrator:
                 )
 
             # Done
-            yield self.event_streamer.create_event(
+            yield event_streamer.create_event(
                 ChatEventType.DONE,
                 metadata={
                     "conversation_id": str(conversation.id),
                     "turns": turn,
+                    "usage": usage_totals,
                 },
             )
 
         except Exception as e:
             logger.exception(f"Chat error: {e}")
-            yield self.event_streamer.create_event(
+            yield event_streamer.create_event(
                 ChatEventType.ERROR,
                 content=f"An error occurred: {str(e)}",
                 error_type=ErrorType.FATAL,
             )
 
+    @staticmethod
+    def _record_usage(
+        turn: int, usage: dict[str, Any], totals: dict[str, int]
+    ) -> Optional[int]:
+        """Log one LLM call's token usage and add it to the running totals.
+
+        Args:
+            turn: Turn number within the current message
+            usage: Usage reported by the provider's DONE event
+            totals: Running totals, updated in place
+
+        Returns:
+            Total tokens for the call, or None if the provider reported none
+        """
+        counts = {k: v for k, v in usage.items() if k.endswith("_tokens")}
+        if not counts:
+            return None
+
+        for name, value in counts.items():
+            totals[name] = totals.get(name, 0) + value
+
+        logger.info(
+            f"LLM turn {turn} usage: input={counts.get('input_tokens', 0)}, "
+            f"cache_read={counts.get('cache_read_input_tokens', 0)}, "
+            f"cache_write={counts.get('cache_creation_input_tokens', 0)}, "
+            f"output={counts.get('output_tokens', 0)}, "
+            f"ttft_ms={usage.get('time_to_first_token_ms')}"
+        )
+        return sum(counts.values())
+
     async def confirm_operation(
         self,
         conversation_id: UUID,
@@ -534,8 +638,7 @@ class AgentOrchestrator:
             ChatEvent objects
         """
         # Initialize event streamer for this confirmation
-        self.event_streamer.set_correlation_id(context.session_id)
-        self.event_streamer.reset()
+        event_streamer = EventStreamer(correlation_id=context.session_id)
 
         # Use ConfirmationManager to get and delete confirmation
         pending = await self.confirmation_manager.get_and_delete(
@@ -549,24 +652,24 @@ class AgentOrchestrator:
             operation_id = pending.get("operation_id")
 
         if not pending:
-            yield self.event_streamer.create_event(
+            yield event_streamer.create_event(
                 ChatEventType.ERROR,
                 content="No pending operation to confirm",
                 error_type=ErrorType.RECOVERABLE,
             )
             return
 
-        yield self.event_streamer.create_event(
+        yield event_streamer.create_event(
             ChatEventType.CONFIRMATION_RESPONSE,
             metadata={"confirmed": confirmed, "operation_id": operation_id},
         )
 
         if not confirmed:
-            yield self.event_streamer.create_event(
+            yield event_streamer.create_event(
                 ChatEventType.TEXT_DELTA,
                 content="Operation cancelled.",
             )
-            yield self.event_streamer.create_event(ChatEventType.DONE)
+            yield event_streamer.create_event(ChatEventType.DONE)
             return
 
         # Execute the confirmed operation
@@ -591,7 +694,7 @@ class AgentOrchestrator:
                 )
 
                 if operation.error:
-                    yield self.event_streamer.create_event(
+                    yield event_streamer.create_event(
                         ChatEventType.ERROR,
                         content=f"Operation failed: {operation.error}",
                         error_type=ErrorType.RECOVERABLE,
@@ -608,12 +711,12 @@ class AgentOrchestrator:
                             name=f"learn_failure:{tool_call.name}",
                         )
                 else:
-                    yield self.event_streamer.create_event(
+                    yield event_streamer.create_event(
                         ChatEventType.TOOL_RESULT,
                         tool_call_id=tool_call.id if tool_call else "unknown",
                         content=f"Operation completed successfully: {operation.result}",
                     )
-                    yield self.event_streamer.create_event(
+                    yield event_streamer.create_event(
                         ChatEventType.TEXT_DELTA,
                         content="Done! The operation completed successfully.",
                     )
@@ -631,13 +734,13 @@ class AgentOrchestrator:
 
             except Exception as e:
                 logger.exception(f"Confirmation execution failed: {e}")
-                yield self.event_streamer.create_event(
+                yield event_streamer.create_event(
                     ChatEventType.ERROR,
                     content=f"Failed to execute operation: {e}",
                     error_type=ErrorType.RECOVERABLE,
                 )
 
-        yield self.event_streamer.create_event(ChatEventType.DONE)
+        yield event_streamer.create_event(ChatEventType.DONE)
 
     async def cancel_chat(
         self,
@@ -663,6 +766,7 @@ class AgentOrchestrator:
         conversation_id: UUID,
         context: UserContext,
         limit: int = 50,
+        before: Optional[UUID] = None,
     ) -> Optional[Conversation]:
         """Get conversation history.
 
@@ -670,12 +774,13 @@ class AgentOrchestrator:
             conversation_id: Conversation ID
             context: User context
             limit: Max messages to return
+            before: Return messages before this message ID
 
         Returns:
             Conversation with messages
         """
         return await self.conversation_manager.get_history(
-            conversation_id, context, limit
+            conversation_id, context, limit, before
         )
 
     async def list_conversations(
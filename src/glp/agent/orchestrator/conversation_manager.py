@@ -6,11 +6,17 @@ retrieval, history management, and message storage.
 
 This module extracts conversation-related responsibilities from
 the AgentOrchestrator to improve modularity and testability.
+
+Chat turns work on a window of the most recent messages. The active
+conversation of each session is cached in process and appended to as
+the turn adds messages; the next turn only re-reads the conversation row
+to check that no other worker or session added messages meanwhile.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from typing import Optional
 from uuid import UUID
 
@@ -55,14 +61,57 @@ class ConversationManager:
         )
     """
 
-    def __init__(self, conversation_store: Optional[IConversationStore] = None):
+    def __init__(
+        self,
+        conversation_store: Optional[IConversationStore] = None,
+        history_window: int = 40,
+        cache_size: int = 256,
+    ):
         """Initialize the conversation manager.
 
         Args:
             conversation_store: Store for conversation persistence.
                                If None, operations will work in-memory only.
+            history_window: Recent messages loaded for a chat turn
+            cache_size: Active conversations cached (one per session)
         """
         self.store = conversation_store
+        self.history_window = history_window
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, Conversation] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(conversation_id: UUID, context: UserContext) -> tuple:
+        return (context.tenant_id, context.user_id, context.session_id, conversation_id)
+
+    def _cache_put(self, conversation: Conversation, context: UserContext) -> None:
+        key = self._cache_key(conversation.id, context)
+        self._cache[key] = conversation
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _get_cached(
+        self, conversation_id: UUID, context: UserContext
+    ) -> Optional[Conversation]:
+        """Return the session's cached conversation if it is still current."""
+        key = self._cache_key(conversation_id, context)
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+
+        # Cheap check against the conversation row only
+        current = await self.store.get(conversation_id, context, message_limit=0)
+        if current is None or current.message_count != cached.message_count:
+            del self._cache[key]
+            return None
+
+        cached.title = current.title
+        cached.summary = current.summary
+        cached.updated_at = current.updated_at
+        cached.keep_recent_messages(self.history_window)
+        self._cache.move_to_end(key)
+        return cached
 
     async def get_or_create(
         self,
@@ -71,24 +120,34 @@ class ConversationManager:
     ) -> Conversation:
         """Get existing or create new conversation.
 
-        If conversation_id is provided and exists, retrieves it.
-        Otherwise, creates a new conversation.
+        If conversation_id is provided and exists, retrieves it with the
+        last ``history_window`` messages, from the session cache when it
+        is current. Otherwise, creates a new conversation.
 
         Args:
             conversation_id: Existing conversation ID or None
             context: User context for tenant isolation
 
         Returns:
-            Conversation object (existing or newly created)
+            Conversation object (existing or newly created). Messages
+            appended to it are kept for the session's next turn.
         """
         # Try to get existing conversation
         if conversation_id and self.store:
-            conversation = await self.store.get(conversation_id, context)
+            conversation = await self._get_cached(conversation_id, context)
+            if conversation:
+                logger.debug(f"Using cached conversation {conversation_id}")
+                return conversation
+
+            conversation = await self.store.get(
+                conversation_id, context, message_limit=self.history_window
+            )
             if conversation:
                 logger.debug(
                     f"Retrieved existing conversation {conversation_id} "
                     f"for user {context.user_id}"
                 )
+                self._cache_put(conversation, context)
                 return conversation
 
         # Create new conversation
@@ -99,6 +158,7 @@ class ConversationManager:
 
         if self.store:
             conversation = await self.store.create(conversation)
+            self._cache_put(conversation, context)
             logger.info(
                 f"Created new conversation {conversation.id} "
                 f"for user {context.user_id}"
@@ -139,6 +199,11 @@ class ConversationManager:
             conversation_id, message, context
         )
 
+        # Keep the cached count in step with the database
+        cached = self._cache.get(self._cache_key(conversation_id, context))
+        if cached is not None:
+            cached.message_count += 1
+
         logger.debug(
             f"Added {message.role} message to conversation {conversation_id}"
         )
@@ -150,15 +215,18 @@ class ConversationManager:
         conversation_id: UUID,
         context: UserContext,
         limit: int = 50,
+        before: Optional[UUID] = None,
     ) -> Optional[Conversation]:
-        """Get conversation history with messages.
+        """Get conversation history with a page of messages.
 
-        Retrieves the conversation along with its messages.
+        Retrieves the conversation along with its newest messages, or
+        with the messages before ``before`` for older pages.
 
         Args:
             conversation_id: ID of the conversation
             context: User context for tenant isolation
             limit: Maximum number of messages to return
+            before: Message ID the page ends before (keyset cursor)
 
         Returns:
             Conversation with messages, or None if not found
@@ -167,7 +235,11 @@ class ConversationManager:
             logger.warning("No conversation store available - cannot retrieve history")
             return None
 
-        conversation = await self.store.get(conversation_id, context)
+        conversation = await self.store.get(conversation_id, context, message_limit=0)
+        if conversation:
+            conversation.messages = await self.store.get_messages(
+                conversation_id, context, limit=limit, before=before
+            )
 
         if conversation:
             logger.debug(
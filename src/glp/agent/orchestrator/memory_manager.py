@@ -130,6 +130,10 @@ class MemoryManager:
     ) -> int:
         """Extract facts from content and store in memory.
 
+        All facts are stored with one store_many() call: one embedding
+        batch and one upsert. The orchestrator runs this on the background
+        worker, so the response never waits for memory writes.
+
         Args:
             content: Text to extract facts from
             conversation_id: Source conversation ID
@@ -147,17 +151,19 @@ class MemoryManager:
             # Extract facts using LLM
             facts = await self.fact_extractor.extract(content)
 
-            # Convert to memories and store
-            stored_count = 0
-            for fact in facts:
-                memory = fact.to_memory(
+            # Convert to memories and store them in one batch
+            memories = [
+                fact.to_memory(
                     tenant_id=context.tenant_id,
                     user_id=context.user_id,
                     source_conversation_id=conversation_id,
                     source_message_id=message_id,
                 )
-                await self.memory_store.store(memory)
-                stored_count += 1
+                for fact in facts
+            ]
+            if memories:
+                await self.memory_store.store_many(memories)
+            stored_count = len(memories)
 
             if stored_count > 0:
                 logger.info(f"Extracted and stored {stored_count} facts")
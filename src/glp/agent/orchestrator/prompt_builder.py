@@ -6,6 +6,7 @@ Encapsulates system prompt construction:
 - Adding memory context to prompts
 - Adding pattern context to prompts
 - Formatting context sections
+- Keeping the base prompt as a stable, cacheable prefix
 
 Extracted from AgentOrchestrator to improve modularity and testability.
 """
@@ -15,7 +16,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional
 
-from ..domain.entities import Memory
+from ..domain.entities import Memory, SystemPrompt
 
 logger = logging.getLogger(__name__)
 
@@ -58,30 +59,38 @@ class PromptBuilder:
         base_prompt: str,
         memories: Optional[list[Memory]] = None,
         patterns: Optional[list[tuple[Any, float]]] = None,
-    ) -> str:
+        conversation_summary: Optional[str] = None,
+    ) -> SystemPrompt:
         """Build system prompt with memory and pattern context.
 
         Constructs a complete system prompt by:
         1. Starting with the base prompt from config
         2. Appending relevant memory context if available
         3. Appending learned pattern context if available
+        4. Appending the summary of earlier messages that are not in the
+           loaded message window
+
+        The base prompt is the stable part of the result and the context
+        sections are the volatile part, so providers with prompt caching
+        can reuse the cached base prompt even when the context changes.
 
         Args:
             base_prompt: Base system prompt template
             memories: Relevant memories to include as context
             patterns: Relevant learned patterns to include (pattern, similarity score)
+            conversation_summary: Summary of messages before the history window
 
         Returns:
             Complete system prompt with all context sections
         """
-        prompt = base_prompt
+        context = ""
 
         # Add memory context if available
         if memories:
             memory_context = "\n\nRelevant context from previous conversations:\n"
             for mem in memories:
                 memory_context += f"- [{mem.memory_type.value}] {mem.content}\n"
-            prompt += memory_context
+            context += memory_context
 
         # Add pattern context if available
         if patterns:
@@ -93,6 +102,10 @@ class PromptBuilder:
 
             # Only append if we actually added patterns
             if pattern_context != "\n\nSuccessful patterns from previous interactions:\n":
-                prompt += pattern_context
+                context += pattern_context
+
+        # Add summary of messages outside the history window
+        if conversation_summary:
+            context += f"\n\nSummary of earlier messages in this conversation:\n{conversation_summary}\n"
 
-        return prompt
+        return SystemPrompt(base_prompt, context)
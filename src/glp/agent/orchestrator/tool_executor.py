@@ -2,7 +2,8 @@
 Tool Executor.
 
 Handles execution of tool calls with error handling and result processing.
-Coordinates with ToolRegistry to route tool calls to appropriate executors.
+Coordinates with ToolRegistry to route tool calls to appropriate executors
+and with ResultShaper to keep large results out of the LLM context.
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ from uuid import UUID
 
 from ..domain.entities import ToolCall, UserContext
 from ..tools.registry import ToolRegistry
+from ..tools.result_shaper import ResultShaper, ShapedResult, serialize_result
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +41,25 @@ class ToolExecutor:
         - Catches all exceptions and converts to recoverable errors
         - Logs execution start, success, and failures
         - Ensures ToolCall always has a result (success or error)
+        - Shapes results to the token budget when a ResultShaper is set,
+          registering its paging tool with the registry
     """
 
-    def __init__(self, tool_registry: ToolRegistry):
+    def __init__(
+        self,
+        tool_registry: ToolRegistry,
+        result_shaper: Optional[ResultShaper] = None,
+    ):
         """Initialize the tool executor.
 
         Args:
             tool_registry: Registry for tool discovery and execution
+            result_shaper: Shaper for large results (None passes results through)
         """
         self.tools = tool_registry
+        self.result_shaper = result_shaper
+        if result_shaper:
+            tool_registry.register_tool(result_shaper.page_tool, result_shaper.page)
 
     async def execute_tool_call(
         self,
@@ -84,6 +96,29 @@ class ToolExecutor:
             }
             return tool_call
 
+    def shape_result(self, tool_call: ToolCall, context: UserContext) -> ShapedResult:
+        """Prepare an executed tool call's result for the LLM context.
+
+        Over-budget results are replaced on the ToolCall by their summary,
+        so the conversation (and the stored tool message) only keeps the
+        summary; the full rows stay reachable through the handle.
+
+        Args:
+            tool_call: Executed tool call
+            context: User context
+
+        Returns:
+            Shaped result with the content for the tool message
+        """
+        if not self.result_shaper:
+            return ShapedResult(
+                result=tool_call.result, content=serialize_result(tool_call.result)
+            )
+
+        shaped = self.result_shaper.shape(tool_call.name, tool_call.result, context)
+        tool_call.result = shaped.result
+        return shaped
+
     async def execute_tool_calls(
         self,
         tool_calls: list[ToolCall],
@@ -2,6 +2,7 @@
 
 from .base import BaseLLMProvider, LLMProviderError, LLMProviderConfig
 from .anthropic import AnthropicProvider
+from .batching import BatchingStats, MicroBatchEmbedder
 from .openai import OpenAIProvider
 from .voyageai import VoyageAIProvider
 
@@ -10,6 +11,8 @@ __all__ = [
     "LLMProviderError",
     "LLMProviderConfig",
     "AnthropicProvider",
+    "BatchingStats",
+    "MicroBatchEmbedder",
     "OpenAIProvider",
     "VoyageAIProvider",
 ]
@@ -2,13 +2,14 @@
 Anthropic Claude LLM Provider.
 
 Implements the ILLMProvider interface for Anthropic's Claude models.
-Supports streaming, tool calling, and extended thinking (CoT).
+Supports streaming, tool calling, extended thinking (CoT) and prompt caching.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import time
 from typing import Any, AsyncIterator, Optional
 
 from ..domain.entities import (
@@ -17,6 +18,7 @@ from ..domain.entities import (
     ErrorType,
     Message,
     MessageRole,
+    SystemPrompt,
     ToolDefinition,
 )
 from ..security.cot_redactor import redact_cot
@@ -35,6 +37,18 @@ except ImportError:
     anthropic = None
     AsyncAnthropic = None
 
+# Prompt cache breakpoint; everything up to and including the marked block
+# is cached for five minutes and billed at the cache-read rate on reuse.
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Usage fields reported by message_start and message_delta events
+USAGE_FIELDS = (
+    "input_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "output_tokens",
+)
+
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude provider implementation.
@@ -45,6 +59,8 @@ class AnthropicProvider(BaseLLMProvider):
     - Streaming responses
     - Tool/function calling
     - Extended thinking (CoT)
+    - Prompt caching of the tool catalogue, the stable system prompt and
+      the conversation up to the latest tool result
 
     Usage:
         config = LLMProviderConfig(
@@ -108,6 +124,7 @@ class AnthropicProvider(BaseLLMProvider):
         """Convert messages to Anthropic format.
 
         Anthropic uses a separate system parameter, not in messages.
+        System messages join the stable part of a SystemPrompt.
 
         Returns:
             Tuple of (system_prompt, messages_list)
@@ -118,7 +135,11 @@ class AnthropicProvider(BaseLLMProvider):
         for msg in messages:
             if msg.role == MessageRole.SYSTEM:
                 # Prepend to system prompt
-                if system:
+                if isinstance(system, SystemPrompt) and system:
+                    system = SystemPrompt(
+                        f"{msg.content}\n\n{system.stable}", system.volatile
+                    )
+                elif system:
                     system = f"{msg.content}\n\n{system}"
                 else:
                     system = msg.content
@@ -169,8 +190,62 @@ class AnthropicProvider(BaseLLMProvider):
     def _format_tools_for_api(
         self, tools: list[ToolDefinition]
     ) -> list[dict[str, Any]]:
-        """Convert tools to Anthropic format."""
-        return [tool.to_anthropic_format() for tool in tools]
+        """Convert tools to Anthropic format.
+
+        With prompt caching the last tool carries the cache breakpoint, so
+        the whole catalogue is cached as long as its order is stable.
+        """
+        api_tools = [tool.to_anthropic_format() for tool in tools]
+        if self.config.enable_prompt_cache and api_tools:
+            api_tools[-1] = {**api_tools[-1], "cache_control": CACHE_CONTROL}
+        return api_tools
+
+    def _format_system_for_api(self, system: str) -> str | list[dict[str, Any]]:
+        """Convert the system prompt to Anthropic format.
+
+        With prompt caching the stable part of a SystemPrompt becomes a
+        cached text block and the volatile part (memories, patterns)
+        follows it uncached, so changing context does not invalidate the
+        cached prefix. A plain string is cached as a whole.
+        """
+        if not self.config.enable_prompt_cache:
+            return str(system)
+
+        if isinstance(system, SystemPrompt):
+            stable, volatile = system.stable, system.volatile
+        else:
+            stable, volatile = system, ""
+
+        blocks: list[dict[str, Any]] = []
+        if stable:
+            blocks.append({"type": "text", "text": stable, "cache_control": CACHE_CONTROL})
+        if volatile:
+            blocks.append({"type": "text", "text": volatile})
+        return blocks
+
+    @staticmethod
+    def _mark_conversation_cache(api_messages: list[dict[str, Any]]) -> None:
+        """Put a cache breakpoint on the latest structured message.
+
+        In a tool loop that is the newest tool result, so each turn reads
+        the previous turns from the cache and only writes the new ones.
+        Plain-text messages are left as strings.
+        """
+        for message in reversed(api_messages):
+            content = message["content"]
+            if isinstance(content, list) and content:
+                content[-1] = {**content[-1], "cache_control": CACHE_CONTROL}
+                return
+
+    @staticmethod
+    def _usage_counts(usage: Any) -> dict[str, int]:
+        """Read token counts from an API usage object."""
+        counts = {}
+        for name in USAGE_FIELDS:
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                counts[name] = value
+        return counts
 
     async def chat(
         self,
@@ -186,18 +261,22 @@ class AnthropicProvider(BaseLLMProvider):
         Args:
             messages: Conversation history
             tools: Available tools
-            system_prompt: System prompt
+            system_prompt: System prompt; a SystemPrompt caches its stable part
             stream: Whether to stream (always True for this implementation)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
 
         Yields:
-            ChatEvent objects
+            ChatEvent objects. The DONE event carries token usage, including
+            cache reads and writes, and time to first token in
+            ``metadata["usage"]``.
         """
         self._reset_sequence()
 
         # Format messages
         system, api_messages = self._format_messages_for_api(messages, system_prompt)
+        if self.config.enable_prompt_cache:
+            self._mark_conversation_cache(api_messages)
 
         # Build request kwargs
         kwargs: dict[str, Any] = {
@@ -217,10 +296,13 @@ class AnthropicProvider(BaseLLMProvider):
             kwargs["max_tokens"] = max_tokens or self.config.max_tokens
 
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = self._format_system_for_api(system)
 
         if tools:
-            kwargs["tools"] = self._format_tools_for_api(tools)
+            kwargs["tools"] = self.prepare_tools(tools)
+
+        usage: dict[str, Any] = {}
+        started = time.monotonic()
 
         try:
             async with self.client.messages.stream(**kwargs) as stream_response:
@@ -232,7 +314,19 @@ class AnthropicProvider(BaseLLMProvider):
                 async for event in stream_response:
                     # Handle different event types
                     if hasattr(event, "type"):
-                        if event.type == "content_block_start":
+                        if event.type in ("content_block_start", "content_block_delta"):
+                            usage.setdefault(
+                                "time_to_first_token_ms",
+                                int((time.monotonic() - started) * 1000),
+                            )
+
+                        if event.type == "message_start":
+                            usage.update(self._usage_counts(getattr(event.message, "usage", None)))
+
+                        elif event.type == "message_delta":
+                            usage.update(self._usage_counts(getattr(event, "usage", None)))
+
+                        elif event.type == "content_block_start":
                             block = event.content_block
                             if hasattr(block, "type"):
                                 if block.type == "tool_use":
@@ -273,7 +367,9 @@ class AnthropicProvider(BaseLLMProvider):
                                 current_tool_call_id = None
                                 current_tool_name = None
 
-                yield self._create_done()
+                if usage:
+                    logger.debug(f"Anthropic usage: {usage}")
+                yield self._create_done(metadata={"usage": usage})
 
         except anthropic.RateLimitError as e:
             logger.warning(f"Rate limited by Anthropic: {e}")
@@ -52,6 +52,8 @@ class LLMProviderConfig:
         max_tokens: Default max tokens
         enable_thinking: Enable extended thinking mode
         thinking_budget: Maximum tokens for thinking (when enabled)
+        enable_prompt_cache: Cache the tool catalogue, stable system prompt
+            and conversation prefix (providers with prompt caching only)
     """
 
     api_key: str
@@ -64,6 +66,7 @@ class LLMProviderConfig:
     max_tokens: int = 4096
     enable_thinking: bool = False
     thinking_budget: int = 10000
+    enable_prompt_cache: bool = True
     extra: dict[str, Any] = field(default_factory=dict)
 
 
@@ -82,6 +85,7 @@ class BaseLLMProvider(ILLMProvider, ABC):
         """
         self.config = config
         self._sequence_counter = 0
+        self._prepared_tools: Optional[tuple[list[ToolDefinition], list[dict[str, Any]]]] = None
 
     @property
     def model_name(self) -> str:
@@ -151,11 +155,16 @@ class BaseLLMProvider(ILLMProvider, ABC):
             error_type=error_type,
         )
 
-    def _create_done(self) -> ChatEvent:
-        """Create a done event."""
+    def _create_done(self, metadata: Optional[dict[str, Any]] = None) -> ChatEvent:
+        """Create a done event.
+
+        Args:
+            metadata: Optional metadata, e.g. token usage for the request
+        """
         return ChatEvent(
             type=ChatEventType.DONE,
             sequence=self._next_sequence(),
+            metadata=metadata,
         )
 
     def _format_messages_for_api(
@@ -183,6 +192,21 @@ class BaseLLMProvider(ILLMProvider, ABC):
         """
         raise NotImplementedError("Subclass must implement _format_tools_for_api")
 
+    def prepare_tools(self, tools: list[ToolDefinition]) -> list[dict[str, Any]]:
+        """Return the API payload for a tool catalogue, formatting it once.
+
+        The payload of the last catalogue is reused while the same list
+        object is passed in. ToolRegistry returns one list per catalogue
+        version, so only the first turn after a change pays for formatting.
+        """
+        prepared = self._prepared_tools
+        if prepared is not None and prepared[0] is tools:
+            return prepared[1]
+
+        payload = self._format_tools_for_api(tools)
+        self._prepared_tools = (tools, payload)
+        return payload
+
     @abstractmethod
     async def chat(
         self,
@@ -0,0 +1,160 @@
+"""
+Micro-batching Embedding Adapter.
+
+Coalesces concurrent single embed() calls into embed_batch() requests.
+Memory search, memory writes and the embedding worker each embed one
+text at a time from their own coroutines; against a provider with a
+batch endpoint (Ollama, OpenAI, Voyage AI) one request for many texts
+costs about the same as one request for a single text.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchingStats:
+    """Counters for a MicroBatchEmbedder.
+
+    Attributes:
+        requests: embed() calls received
+        batches: embed_batch() requests sent to the provider
+        failed_batches: Batches whose provider call raised
+        max_batch_size: Largest batch sent so far
+    """
+
+    requests: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class MicroBatchEmbedder:
+    """Embedding provider wrapper that batches concurrent embed() calls.
+
+    The first embed() call opens a batch and flushes it after
+    ``linger_seconds``, or as soon as ``max_batch_size`` texts are
+    waiting. Every caller gets its own result, or the provider's
+    exception if the batch fails. Anything other than embed() and
+    embed_batch() is forwarded to the wrapped provider, so the wrapper
+    can stand in for an ILLMProvider.
+
+    Usage:
+        embedder = MicroBatchEmbedder(OllamaProvider(config), linger_seconds=0.005)
+        store = SemanticMemoryStore(db_pool, embedder)
+
+        # Concurrent calls share one /api/embed request
+        results = await asyncio.gather(*(embedder.embed(t) for t in texts))
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        max_batch_size: int = 64,
+        linger_seconds: float = 0.005,
+        max_concurrent_batches: int = 2,
+    ):
+        """Initialize the adapter.
+
+        Args:
+            provider: Provider implementing embed_batch()
+            max_batch_size: Texts per provider request
+            linger_seconds: How long the first call in a batch waits for others
+            max_concurrent_batches: Provider requests in flight at once
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.linger_seconds = linger_seconds
+        self.stats = BatchingStats()
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_slots = asyncio.Semaphore(max_concurrent_batches)
+        self._tasks: set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the adapter itself
+        return getattr(self.provider, name)
+
+    async def embed(self, text: str) -> tuple[list[float], str, int]:
+        """Embed one text as part of the next micro-batch.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Tuple of (embedding_vector, model_name, dimension)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self.stats.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.linger_seconds, self._flush)
+
+        return await future
+
+    async def embed_batch(self, texts: list[str]) -> list[tuple[list[float], str, int]]:
+        """Embed texts that are already batched, bypassing the queue."""
+        return await self.provider.embed_batch(texts)
+
+    def _flush(self) -> None:
+        """Send the waiting texts as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Call the provider and hand each caller its result."""
+        self.stats.batches += 1
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(batch))
+
+        try:
+            async with self._batch_slots:
+                results = await self.provider.embed_batch([text for text, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"embed_batch returned {len(results)} results for {len(batch)} texts"
+                )
+        except Exception as e:
+            self.stats.failed_batches += 1
+            logger.warning(f"Embedding batch of {len(batch)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            # A caller may have been cancelled while the batch ran
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Flush waiting texts and wait for batches in flight."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -40,7 +40,7 @@ class OllamaProvider(BaseLLMProvider):
     - Locally-hosted models (qwen, llama, mistral, etc.)
     - Streaming responses
     - Tool/function calling (if model supports it)
-    - Embeddings
+    - Embeddings, including batches through /api/embed
 
     Usage:
         config = LLMProviderConfig(
@@ -59,6 +59,9 @@ class OllamaProvider(BaseLLMProvider):
     DEFAULT_BASE_URL = "http://localhost:11434"
     DEFAULT_EMBEDDING_MODEL = "nomic-embed-text"
 
+    # Texts per /api/embed request
+    EMBED_BATCH_SIZE = 64
+
     def __init__(self, config: LLMProviderConfig):
         """Initialize the Ollama provider.
 
@@ -191,7 +194,7 @@ class OllamaProvider(BaseLLMProvider):
 
         # Only include tools if provided and model might support them
         if tools:
-            payload["tools"] = self._format_tools_for_api(tools)
+            payload["tools"] = self.prepare_tools(tools)
 
         try:
             # Make streaming request to Ollama API
@@ -334,6 +337,72 @@ class OllamaProvider(BaseLLMProvider):
                 original_error=e,
             )
 
+    async def embed_batch(self, texts: list[str]) -> list[tuple[list[float], str, int]]:
+        """Generate embeddings for multiple texts with Ollama's batch endpoint.
+
+        /api/embed takes a list of inputs and runs them through the model
+        together, so a batch costs about as much as a single embedding.
+        Its vectors are L2-normalized; /api/embeddings (used by embed())
+        returns them unnormalized, which cosine distance search ignores.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of (embedding_vector, model_name, dimension) tuples
+
+        Raises:
+            LLMProviderError: If embedding generation fails
+        """
+        results = []
+        for start in range(0, len(texts), self.EMBED_BATCH_SIZE):
+            chunk = texts[start:start + self.EMBED_BATCH_SIZE]
+            embeddings = await self._embed_chunk(chunk)
+            if len(embeddings) != len(chunk) or not all(embeddings):
+                raise LLMProviderError(
+                    f"Ollama returned {len(embeddings)} embeddings for {len(chunk)} texts",
+                    error_type=ErrorType.RECOVERABLE,
+                )
+            results.extend(
+                (embedding, self.embedding_model, len(embedding))
+                for embedding in embeddings
+            )
+        return results
+
+    async def _embed_chunk(self, texts: list[str]) -> list[list[float]]:
+        """Call /api/embed for one chunk of texts."""
+        try:
+            response = await self.client.post(
+                "/api/embed",
+                json={
+                    "model": self.embedding_model,
+                    "input": texts,
+                },
+            )
+            response.raise_for_status()
+            return response.json().get("embeddings", [])
+
+        except httpx.HTTPStatusError as e:
+            raise LLMProviderError(
+                f"Ollama embedding API error: {e.response.status_code} - {e.response.text}",
+                error_type=ErrorType.RECOVERABLE,
+                original_error=e,
+            )
+
+        except httpx.TimeoutException as e:
+            raise LLMProviderError(
+                f"Ollama embedding timeout: {str(e)}",
+                error_type=ErrorType.TIMEOUT,
+                original_error=e,
+            )
+
+        except httpx.RequestError as e:
+            raise LLMProviderError(
+                f"Ollama connection error: {str(e)}",
+                error_type=ErrorType.FATAL,
+                original_error=e,
+            )
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -197,7 +197,7 @@ class OpenAIProvider(BaseLLMProvider):
             kwargs["max_tokens"] = max_tokens
 
         if tools:
-            kwargs["tools"] = self._format_tools_for_api(tools)
+            kwargs["tools"] = self.prepare_tools(tools)
             kwargs["tool_choice"] = "auto"
 
         try:
@@ -6,9 +6,11 @@ Uses Redis for distributed rate limiting across multiple API server instances.
 
 Features:
 - Configurable limits per tenant
-- Sliding window rate limiting
+- Sliding window rate limiting (current bucket plus weighted previous
+  bucket), with the same semantics in Redis (one Lua script) and in memory
 - Redis-backed for distributed deployments
 - Fail-closed behavior: Falls back to in-memory rate limiting when Redis unavailable
+  (sharded, O(1) per check, incremental expiry)
 - Configurable fail-open mode for high-availability scenarios
 
 Environment Variables:
@@ -33,13 +35,13 @@ Example:
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import math
 import os
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Optional, Protocol
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Protocol
 
 from fastapi import HTTPException, status
 
@@ -110,23 +112,131 @@ class RateLimitConfig:
     key_prefix: str = "rate_limit:tenant"
 
 
-@dataclass
-class _BucketCounter:
-    """Internal counter for a time bucket.
+# Lua script for atomic sliding window rate limiting, one hash per tenant
+# ARGV: window seconds, limit, now (seconds, float), cost (0 = peek)
+# Returns: (allowed: 0/1, requests in the last window, retry_after seconds)
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4] or '1')
+
+-- Roll the buckets; the previous bucket's count is kept for weighting
+local bucket = math.floor(now / window)
+local state = redis.call('HMGET', key, 'bucket', 'current', 'previous')
+local stored = tonumber(state[1])
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if stored == nil or bucket > stored + 1 then
+    current = 0
+    previous = 0
+elseif bucket == stored + 1 then
+    previous = current
+    current = 0
+else
+    bucket = stored
+end
+
+-- Requests in the last window: all of this bucket plus the share of the
+-- previous bucket that still overlaps it
+local elapsed = math.max(0, (now - bucket * window) / window)
+local used = previous * (1 - elapsed) + current
+
+if used + cost > limit then
+    local room = limit - cost
+    local wait
+    if room < 0 then
+        wait = window
+    elseif current <= room then
+        wait = (1 - (room - current) / previous - elapsed) * window
+    else
+        wait = (2 - elapsed - room / current) * window
+    end
+    return {0, math.ceil(used), math.max(1, math.ceil(wait))}
+end
+
+if cost > 0 then
+    redis.call('HSET', key, 'bucket', bucket, 'current', current + cost, 'previous', previous)
+    redis.call('PEXPIRE', key, math.ceil(window * 2000))
+end
+return {1, math.ceil(used + cost), 0}
+"""
+
+
+@dataclass(slots=True)
+class _WindowState:
+    """Sliding window counters for one tenant.
 
     Attributes:
-        count: Number of requests in this bucket
-        expires_at: When this bucket expires (Unix timestamp)
+        bucket: Index of the current bucket (now // window), None if unused
+        current: Requests in the current bucket
+        previous: Requests in the bucket before it
     """
 
-    count: int = 0
-    expires_at: float = field(default_factory=time.time)
+    bucket: Optional[int] = None
+    current: int = 0
+    previous: int = 0
+
+
+def _check_window(
+    state: _WindowState,
+    now: float,
+    window: float,
+    limit: int,
+    cost: int,
+) -> tuple[bool, int, int]:
+    """Python twin of SLIDING_WINDOW_SCRIPT.
+
+    Updates state the way the script's HSET does: only when the request
+    is allowed and cost is not 0.
+
+    Returns:
+        (allowed, requests in the last window, retry_after seconds)
+    """
+    bucket = math.floor(now / window)
+    current, previous = state.current, state.previous
+    if state.bucket is None or bucket > state.bucket + 1:
+        current = previous = 0
+    elif bucket == state.bucket + 1:
+        previous, current = current, 0
+    else:
+        bucket = state.bucket
+
+    elapsed = max(0.0, (now - bucket * window) / window)
+    used = previous * (1 - elapsed) + current
+
+    if used + cost > limit:
+        room = limit - cost
+        if room < 0:
+            wait = window
+        elif current <= room:
+            wait = (1 - (room - current) / previous - elapsed) * window
+        else:
+            wait = (2 - elapsed - room / current) * window
+        return False, math.ceil(used), max(1, math.ceil(wait))
+
+    if cost > 0:
+        state.bucket, state.current, state.previous = bucket, current + cost, previous
+    return True, math.ceil(used + cost), 0
 
 
 class InMemoryRateLimiter:
     """In-memory fallback rate limiter for single-instance deployments.
 
-    Uses fixed time windows with in-memory storage. Suitable for:
+    Uses the same sliding window as the Redis script: the count of the
+    current bucket plus the previous bucket's count weighted by how much
+    of it still falls in the last window. Unlike fixed windows, this
+    does not allow twice the limit across a window boundary.
+
+    Tenants are spread over shards, each an OrderedDict in last-update
+    order. Every check drops at most EXPIRE_PER_CHECK expired tenants
+    from the front of the next shard in rotation, so expiry is
+    incremental (it keeps up with any rate of new tenants) and a check
+    costs O(1). Checks never await, so they are atomic on the event loop
+    and need no lock.
+
+    Suitable for:
     - Single API server instances
     - Development/testing
     - Fallback when Redis is unavailable
@@ -143,59 +253,61 @@ class InMemoryRateLimiter:
             pass
     """
 
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    # Expired tenants removed per check
+    EXPIRE_PER_CHECK = 2
+
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        shards: int = 16,
+        clock: Callable[[], float] = time.time,
+    ):
         """Initialize in-memory rate limiter.
 
         Args:
             config: Rate limit configuration
+            shards: Number of tenant shards
+            clock: Time source in seconds (for tests)
         """
         self.config = config or RateLimitConfig()
-        # Store: {tenant_id: {bucket: _BucketCounter}}
-        self._counters: dict[str, dict[int, _BucketCounter]] = defaultdict(dict)
-        self._lock = asyncio.Lock()
-        self._last_cleanup = time.time()
-        # Clean up old buckets every 5 minutes
-        self._cleanup_interval = 300
-
-    def _get_current_bucket(self) -> int:
-        """Get current time bucket.
-
-        Returns:
-            Bucket identifier (Unix timestamp / window_seconds)
-        """
-        return int(time.time() // self.config.window_seconds)
-
-    async def _cleanup_old_buckets(self) -> None:
-        """Remove expired buckets to prevent memory growth.
-
-        This is called periodically during check_rate_limit.
-        """
-        now = time.time()
-
-        # Only cleanup every N seconds
-        if now - self._last_cleanup < self._cleanup_interval:
-            return
-
-        async with self._lock:
-            for tenant_id in list(self._counters.keys()):
-                tenant_buckets = self._counters[tenant_id]
-
-                # Remove expired buckets
-                for bucket in list(tenant_buckets.keys()):
-                    counter = tenant_buckets[bucket]
-                    if counter.expires_at < now:
-                        del tenant_buckets[bucket]
-
-                # Remove tenant entry if no buckets remain
-                if not tenant_buckets:
-                    del self._counters[tenant_id]
-
-            self._last_cleanup = now
-
-            logger.debug(
-                f"Cleaned up rate limit buckets. "
-                f"Active tenants: {len(self._counters)}"
-            )
+        self._clock = clock
+        # Each shard: {tenant_id: _WindowState}, least recently updated first
+        self._shards: list[OrderedDict[str, _WindowState]] = [
+            OrderedDict() for _ in range(max(1, shards))
+        ]
+        # Next shard to expire tenants from
+        self._sweep_index = 0
+
+    @property
+    def active_tenants(self) -> int:
+        """Tenants with counters that have not been expired yet."""
+        return sum(len(shard) for shard in self._shards)
+
+    def _check(self, tenant_id: str, cost: int) -> tuple[bool, int, int]:
+        now = self._clock()
+        window = self.config.window_seconds
+        shards = self._shards
+
+        # Incremental expiry: tenants idle for two buckets count nothing
+        self._sweep_index = (self._sweep_index + 1) % len(shards)
+        sweep = shards[self._sweep_index]
+        oldest_live = now // window - 1
+        for _ in range(self.EXPIRE_PER_CHECK):
+            if not sweep or next(iter(sweep.values())).bucket >= oldest_live:
+                break
+            sweep.popitem(last=False)
+
+        shard = shards[hash(tenant_id) % len(shards)]
+        state = shard.get(tenant_id)
+        if state is None:
+            state = _WindowState()
+        allowed, used, retry_after = _check_window(
+            state, now, window, self.config.requests_per_window, cost
+        )
+        if allowed and cost:
+            shard[tenant_id] = state
+            shard.move_to_end(tenant_id)
+        return allowed, used, retry_after
 
     async def check_rate_limit(self, tenant_id: str) -> None:
         """Check if tenant is within rate limit.
@@ -209,43 +321,19 @@ class InMemoryRateLimiter:
         if not self.config.enabled:
             return
 
-        # Periodic cleanup
-        await self._cleanup_old_buckets()
+        allowed, used, retry_after = self._check(tenant_id, 1)
 
-        bucket = self._get_current_bucket()
-        now = time.time()
-
-        async with self._lock:
-            # Get or create bucket counter
-            if bucket not in self._counters[tenant_id]:
-                self._counters[tenant_id][bucket] = _BucketCounter(
-                    count=0,
-                    expires_at=now + self.config.window_seconds,
-                )
-
-            counter = self._counters[tenant_id][bucket]
-
-            # Check if limit exceeded
-            if counter.count >= self.config.requests_per_window:
-                retry_after = max(1, int(counter.expires_at - now))
-                logger.warning(
-                    f"Rate limit exceeded for tenant {tenant_id}: "
-                    f"{counter.count}/{self.config.requests_per_window} "
-                    f"(in-memory fallback)"
-                )
-                raise RateLimitExceededError(
-                    tenant_id=tenant_id,
-                    limit=self.config.requests_per_window,
-                    window_seconds=self.config.window_seconds,
-                    retry_after=retry_after,
-                )
-
-            # Increment counter
-            counter.count += 1
-
-            logger.debug(
-                f"Tenant {tenant_id} rate limit (in-memory): "
-                f"{counter.count}/{self.config.requests_per_window}"
+        if not allowed:
+            logger.warning(
+                f"Rate limit exceeded for tenant {tenant_id}: "
+                f"{used}/{self.config.requests_per_window} "
+                f"(in-memory fallback)"
+            )
+            raise RateLimitExceededError(
+                tenant_id=tenant_id,
+                limit=self.config.requests_per_window,
+                window_seconds=self.config.window_seconds,
+                retry_after=retry_after,
             )
 
     async def get_rate_limit_info(self, tenant_id: str) -> dict:
@@ -263,36 +351,30 @@ class InMemoryRateLimiter:
                 "enabled": False,
             }
 
-        bucket = self._get_current_bucket()
+        _, current, _ = self._check(tenant_id, 0)
 
-        async with self._lock:
-            counter = self._counters[tenant_id].get(bucket)
-
-            if not counter:
-                current = 0
-            else:
-                current = counter.count
-
-            return {
-                "tenant_id": tenant_id,
-                "current_requests": current,
-                "limit": self.config.requests_per_window,
-                "window_seconds": self.config.window_seconds,
-                "remaining": max(0, self.config.requests_per_window - current),
-                "storage": "in-memory",
-            }
+        return {
+            "tenant_id": tenant_id,
+            "current_requests": current,
+            "limit": self.config.requests_per_window,
+            "window_seconds": self.config.window_seconds,
+            "remaining": max(0, self.config.requests_per_window - current),
+            "storage": "in-memory",
+        }
 
     def reset(self) -> None:
         """Reset all counters (useful for testing)."""
-        self._counters.clear()
-        self._last_cleanup = time.time()
+        for shard in self._shards:
+            shard.clear()
 
 
 class TenantRateLimiter:
     """Tenant-based rate limiter using Redis sliding window.
 
-    Uses a sliding window counter algorithm for smooth rate limiting.
-    Falls back to allowing requests if Redis is unavailable.
+    Runs SLIDING_WINDOW_SCRIPT, one round trip and one hash key per
+    tenant, with the same window semantics as InMemoryRateLimiter.
+    Falls back to the in-memory limiter (fail closed) or to allowing
+    requests (fail open) if Redis is unavailable.
 
     Usage:
         limiter = TenantRateLimiter(redis_client)
@@ -303,35 +385,6 @@ class TenantRateLimiter:
             pass
     """
 
-    # Lua script for atomic sliding window rate limiting
-    # Returns: (allowed: 0/1, current_count, ttl_remaining)
-    _SLIDING_WINDOW_SCRIPT = """
-    local key = KEYS[1]
-    local window = tonumber(ARGV[1])
-    local limit = tonumber(ARGV[2])
-    local now = tonumber(ARGV[3])
-
-    -- Get current count
-    local current = tonumber(redis.call('GET', key) or '0')
-
-    -- Check if limit exceeded
-    if current >= limit then
-        local ttl = redis.call('TTL', key)
-        return {0, current, ttl}
-    end
-
-    -- Increment counter
-    local new_count = redis.call('INCR', key)
-
-    -- Set expiration if this is a new key
-    if new_count == 1 then
-        redis.call('EXPIRE', key, window)
-    end
-
-    local ttl = redis.call('TTL', key)
-    return {1, new_count, ttl}
-    """
-
     def __init__(
         self,
         redis: Optional[IRedisClient] = None,
@@ -349,13 +402,19 @@ class TenantRateLimiter:
         self._in_memory_fallback: Optional[InMemoryRateLimiter] = None
 
     def _get_key(self, tenant_id: str) -> str:
-        """Get Redis key for a tenant's rate limit.
-
-        Uses a time bucket for sliding window.
-        """
-        # Simple fixed window key (tenant + current minute bucket)
-        bucket = int(time.time() // self.config.window_seconds)
-        return f"{self.config.key_prefix}:{tenant_id}:{bucket}"
+        """Get Redis key for a tenant's rate limit counters."""
+        return f"{self.config.key_prefix}:{tenant_id}"
+
+    async def _run_script(self, tenant_id: str, cost: int) -> tuple[int, int, int]:
+        return await self.redis.eval(
+            SLIDING_WINDOW_SCRIPT,
+            1,  # Number of keys
+            self._get_key(tenant_id),
+            self.config.window_seconds,
+            self.config.requests_per_window,
+            time.time(),
+            cost,
+        )
 
     async def check_rate_limit(self, tenant_id: str) -> None:
         """Check if tenant is within rate limit.
@@ -373,21 +432,9 @@ class TenantRateLimiter:
             logger.debug("Redis not configured - rate limiting disabled")
             return
 
-        key = self._get_key(tenant_id)
-        now = int(time.time())
-
         try:
             # Use Lua script for atomic operation
-            result = await self.redis.eval(
-                self._SLIDING_WINDOW_SCRIPT,
-                1,  # Number of keys
-                key,
-                self.config.window_seconds,
-                self.config.requests_per_window,
-                now,
-            )
-
-            allowed, current_count, ttl_remaining = result
+            allowed, current_count, retry_after = await self._run_script(tenant_id, 1)
 
             if not allowed:
                 logger.warning(
@@ -398,7 +445,7 @@ class TenantRateLimiter:
                     tenant_id=tenant_id,
                     limit=self.config.requests_per_window,
                     window_seconds=self.config.window_seconds,
-                    retry_after=max(1, ttl_remaining),
+                    retry_after=max(1, int(retry_after)),
                 )
 
             logger.debug(
@@ -440,18 +487,16 @@ class TenantRateLimiter:
                 "reason": "Redis not configured",
             }
 
-        key = self._get_key(tenant_id)
-
         try:
-            current_str = await self.redis.get(key)
-            current = int(current_str) if current_str else 0
+            # Cost 0 reads the window without counting a request
+            _, current, _ = await self._run_script(tenant_id, 0)
 
             return {
                 "tenant_id": tenant_id,
-                "current_requests": current,
+                "current_requests": int(current),
                 "limit": self.config.requests_per_window,
                 "window_seconds": self.config.window_seconds,
-                "remaining": max(0, self.config.requests_per_window - current),
+                "remaining": max(0, self.config.requests_per_window - int(current)),
             }
         except Exception as e:
             logger.warning(f"Failed to get rate limit info: {e}")
@@ -4,12 +4,14 @@ Provides:
 - MCP client for read-only database operations
 - Write executor for REST API mutations
 - Tool registry and definitions
+- Result shaping to keep large results out of the LLM context
 - Audit logging for all operations
 """
 
 from .mcp_client import MCPClient, MCPToolError
 from .write_executor import WriteExecutor, WriteOperation
 from .registry import ToolRegistry, get_all_tools
+from .result_shaper import ResultShaper, ShapedResult, ToolResultStore
 
 __all__ = [
     "MCPClient",
@@ -18,4 +20,7 @@ __all__ = [
     "WriteOperation",
     "ToolRegistry",
     "get_all_tools",
+    "ResultShaper",
+    "ShapedResult",
+    "ToolResultStore",
 ]
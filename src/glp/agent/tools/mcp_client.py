@@ -76,11 +76,15 @@ class MCPClient(IMCPClient):
     Architecture:
         - Uses HTTP transport to connect to FastMCP server
         - Passes user context for audit logging on server side
-        - Caches tool definitions for performance
+        - Caches tool definitions and revalidates them by ETag, so the
+          catalogue is only downloaded again when the server's catalogue changes
     """
 
-    # Cache TTL for tool definitions
-    TOOL_CACHE_TTL_SECONDS = 300
+    # Seconds before the cached tool definitions are revalidated
+    TOOL_CACHE_TTL_SECONDS = 60
+
+    # Seconds to keep serving cached tools after a failed revalidation
+    TOOL_REFRESH_BACKOFF_SECONDS = 15
 
     def __init__(self, config: MCPClientConfig):
         """Initialize the MCP client.
@@ -92,6 +96,12 @@ class MCPClient(IMCPClient):
         self._session: Optional[aiohttp.ClientSession] = None
         self._tools_cache: Optional[list[ToolDefinition]] = None
         self._tools_cache_time: float = 0
+        self._tools_etag: Optional[str] = None
+
+    @property
+    def tools_version(self) -> Optional[str]:
+        """ETag of the cached tool catalogue, if the server sent one."""
+        return self._tools_etag
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
@@ -144,28 +154,93 @@ class MCPClient(IMCPClient):
     async def list_tools(self) -> list[ToolDefinition]:
         """List available tools from the MCP server.
 
-        Caches results for TOOL_CACHE_TTL_SECONDS.
+        Caches results for TOOL_CACHE_TTL_SECONDS, then revalidates them
+        with If-None-Match. An unchanged catalogue returns the same list
+        object, so callers can detect changes by identity. If revalidation
+        fails the cached tools are kept and retried after
+        TOOL_REFRESH_BACKOFF_SECONDS.
 
         Returns:
             List of tool definitions
+
+        Raises:
+            MCPToolError: If no tools are cached and the server fails
         """
         import time
 
         # Check cache
-        if self._tools_cache and (
+        if self._tools_cache is not None and (
             time.time() - self._tools_cache_time < self.TOOL_CACHE_TTL_SECONDS
         ):
             return self._tools_cache
 
+        headers = self._get_headers()
+        if self._tools_cache is not None and self._tools_etag:
+            headers["If-None-Match"] = self._tools_etag
+
+        try:
+            response = await self._request_tools(headers)
+        except MCPToolError as e:
+            if self._tools_cache is None:
+                raise
+            logger.warning(f"Tool refresh failed, using cached tools: {e}")
+            self._tools_cache_time = (
+                time.time()
+                - self.TOOL_CACHE_TTL_SECONDS
+                + self.TOOL_REFRESH_BACKOFF_SECONDS
+            )
+            return self._tools_cache
+
+        self._tools_cache_time = time.time()
+
+        # 304 Not Modified, or a server that ignores If-None-Match
+        if response is None:
+            return self._tools_cache
+        data, etag = response
+        if etag and etag == self._tools_etag and self._tools_cache is not None:
+            return self._tools_cache
+
+        tools = []
+        for tool_data in data.get("tools", []):
+            tool = ToolDefinition(
+                name=tool_data["name"],
+                description=tool_data.get("description", ""),
+                parameters=tool_data.get("inputSchema", {}),
+                is_read_only=tool_data.get("annotations", {}).get(
+                    "readOnlyHint", True
+                ),
+            )
+            tools.append(tool)
+
+        # Update cache
+        self._tools_cache = tools
+        self._tools_etag = etag
+
+        logger.info(f"Discovered {len(tools)} MCP tools (version {etag})")
+        return tools
+
+    async def _request_tools(
+        self, headers: dict[str, str]
+    ) -> Optional[tuple[dict[str, Any], Optional[str]]]:
+        """POST to the tools/list endpoint.
+
+        Args:
+            headers: Request headers, including any If-None-Match
+
+        Returns:
+            (response body, ETag), or None if the server answered 304
+
+        Raises:
+            MCPToolError: On connection failure or an error status
+        """
         session = await self._get_session()
         url = f"{self.config.base_url}/mcp/v1/tools/list"
 
         try:
-            async with session.post(
-                url,
-                headers=self._get_headers(),
-                json={},
-            ) as response:
+            async with session.post(url, headers=headers, json={}) as response:
+                if response.status == 304:
+                    return None
+
                 if response.status != 200:
                     text = await response.text()
                     raise MCPToolError(
@@ -174,28 +249,10 @@ class MCPClient(IMCPClient):
                     )
 
                 data = await response.json()
-                tools_data = data.get("tools", [])
-
-                tools = []
-                for tool_data in tools_data:
-                    tool = ToolDefinition(
-                        name=tool_data["name"],
-                        description=tool_data.get("description", ""),
-                        parameters=tool_data.get("inputSchema", {}),
-                        is_read_only=tool_data.get("annotations", {}).get(
-                            "readOnlyHint", True
-                        ),
-                    )
-                    tools.append(tool)
+                etag = response.headers.get("ETag") or data.get("version")
+                return data, etag
 
-                # Update cache
-                self._tools_cache = tools
-                self._tools_cache_time = time.time()
-
-                logger.info(f"Discovered {len(tools)} MCP tools")
-                return tools
-
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise MCPToolError(
                 f"Failed to connect to MCP server: {e}",
                 tool_name="list_tools",
@@ -358,6 +415,8 @@ class InProcessMCPClient(IMCPClient):
             tools: Dict mapping tool names to async functions
         """
         self.tools = tools
+        self._definitions: Optional[list[ToolDefinition]] = None
+        self._definitions_key: tuple = ()
 
     async def health_check(self) -> bool:
         """In-process client is always healthy."""
@@ -366,8 +425,13 @@ class InProcessMCPClient(IMCPClient):
     async def list_tools(self) -> list[ToolDefinition]:
         """List available tools.
 
-        Returns tool definitions from function docstrings.
+        Returns tool definitions from function docstrings. Definitions are
+        built once and rebuilt only when the tools dict changes.
         """
+        key = tuple(self.tools.items())
+        if self._definitions is not None and key == self._definitions_key:
+            return self._definitions
+
         definitions = []
         for name, func in self.tools.items():
             doc = func.__doc__ or ""
@@ -379,6 +443,8 @@ class InProcessMCPClient(IMCPClient):
                     is_read_only=True,
                 )
             )
+        self._definitions = definitions
+        self._definitions_key = key
         return definitions
 
     async def call_tool(
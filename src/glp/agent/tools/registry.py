@@ -7,14 +7,18 @@ for the agent chatbot. Handles tool discovery and execution routing.
 
 from __future__ import annotations
 
+import inspect
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..domain.entities import ToolCall, ToolDefinition, UserContext
 from ..domain.ports import IMCPClient, IToolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Handler for a local tool: (arguments, context) -> result
+LocalToolHandler = Callable[[dict[str, Any], UserContext], Any]
+
 
 class ToolRegistry:
     """Unified registry of all agent tools.
@@ -22,6 +26,7 @@ class ToolRegistry:
     Combines:
     - Read tools from MCP server (database queries)
     - Write tools from WriteExecutor (REST API mutations)
+    - Local tools registered with register_tool() (e.g. result paging)
 
     Handles tool discovery, execution routing, and result aggregation.
 
@@ -38,6 +43,8 @@ class ToolRegistry:
         - MCP tools are discovered dynamically from the server
         - Write tools are statically defined in WriteExecutor
         - Tool calls are routed based on is_read_only flag
+        - The combined list is rebuilt only when a source list changes,
+          so providers can reuse the API payload they built from it
     """
 
     def __init__(
@@ -54,44 +61,91 @@ class ToolRegistry:
         self.mcp_client = mcp_client
         self.write_executor = write_executor
         self._tools_cache: Optional[list[ToolDefinition]] = None
+        self._mcp_tools: Optional[list[ToolDefinition]] = None
+        self._write_tools: Optional[list[ToolDefinition]] = None
+        self._local_tools: list[ToolDefinition] = []
+        self._local_handlers: dict[str, LocalToolHandler] = {}
+        self._cache_sources: tuple = ()
+
+    def register_tool(self, definition: ToolDefinition, handler: LocalToolHandler) -> None:
+        """Register a tool executed in process.
+
+        Local tools are listed after MCP and write tools and take
+        precedence over them when a name clashes.
+
+        Args:
+            definition: Tool definition shown to the LLM
+            handler: Function called with (arguments, context); may be async
+        """
+        self._local_tools = [
+            t for t in self._local_tools if t.name != definition.name
+        ] + [definition]
+        self._local_handlers[definition.name] = handler
 
     async def get_all_tools(self, refresh: bool = False) -> list[ToolDefinition]:
         """Get all available tools.
 
-        Combines MCP tools and write tools into a single list.
+        Combines MCP tools and write tools into a single list. The MCP
+        client is asked on every call (it caches and revalidates on its
+        own); the combined list is rebuilt only when the client returns a
+        different list. If the MCP server is unreachable the last tools
+        it returned are kept.
 
         Args:
-            refresh: Force refresh of cached tools
+            refresh: Force a rebuild of the combined list and write tools
 
         Returns:
             List of all tool definitions
         """
-        if self._tools_cache and not refresh:
-            return self._tools_cache
-
-        tools: list[ToolDefinition] = []
-
         # Get MCP tools (read operations)
         if self.mcp_client:
             try:
-                mcp_tools = await self.mcp_client.list_tools()
-                tools.extend(mcp_tools)
-                logger.info(f"Loaded {len(mcp_tools)} MCP tools")
+                self._mcp_tools = await self.mcp_client.list_tools()
             except Exception as e:
                 logger.error(f"Failed to load MCP tools: {e}")
 
-        # Get write tools
-        if self.write_executor:
+        # Get write tools (static, loaded once)
+        if self.write_executor and (self._write_tools is None or refresh):
             try:
-                write_tools = self.write_executor.get_tool_definitions()
-                tools.extend(write_tools)
-                logger.info(f"Loaded {len(write_tools)} write tools")
+                self._write_tools = self.write_executor.get_tool_definitions()
             except Exception as e:
                 logger.error(f"Failed to load write tools: {e}")
 
+        sources = (self._mcp_tools, self._write_tools, self._local_tools)
+        if (
+            self._tools_cache is not None
+            and not refresh
+            and len(sources) == len(self._cache_sources)
+            and all(a is b for a, b in zip(sources, self._cache_sources))
+        ):
+            return self._tools_cache
+
+        tools: list[ToolDefinition] = []
+        for source in sources:
+            if source:
+                tools.extend(source)
+
         self._tools_cache = tools
-        logger.info(f"Tool registry loaded {len(tools)} total tools")
+        self._cache_sources = sources
+        logger.info(
+            f"Tool registry loaded {len(tools)} total tools "
+            f"({len(self._mcp_tools or [])} MCP, {len(self._write_tools or [])} write)"
+        )
+
+        return tools
 
+    async def warm_up(self) -> list[ToolDefinition]:
+        """Load the tool catalogue ahead of the first chat.
+
+        Connects to the MCP server and fetches its tools so the first
+        request does not pay for connection setup and discovery.
+
+        Returns:
+            List of all tool definitions
+        """
+        tools = await self.get_all_tools()
+        if self.mcp_client and self._mcp_tools is None:
+            logger.warning("MCP tools not loaded at startup, will retry on first use")
         return tools
 
     async def get_read_tools(self) -> list[ToolDefinition]:
@@ -161,6 +215,14 @@ class ToolRegistry:
         """
         logger.debug(f"Executing tool: {tool_call.name}")
 
+        handler = self._local_handlers.get(tool_call.name)
+        if handler:
+            result = handler(tool_call.arguments, context)
+            if inspect.isawaitable(result):
+                result = await result
+            tool_call.result = result
+            return tool_call
+
         if self.is_write_tool(tool_call.name):
             # Route to write executor
             if not self.write_executor:
@@ -226,9 +288,13 @@ class ToolRegistry:
     def clear_cache(self) -> None:
         """Clear the tools cache.
 
-        Call this to force re-discovery of tools.
+        Call this to force re-discovery of tools. Registered local
+        tools are kept.
         """
         self._tools_cache = None
+        self._mcp_tools = None
+        self._write_tools = None
+        self._cache_sources = ()
 
 
 def get_all_tools() -> list[ToolDefinition]:
@@ -0,0 +1,418 @@
+"""
+Tool Result Shaping.
+
+Keeps large tool results out of the LLM context. A result whose
+serialized form is over the token budget is replaced with a summary
+(row count, columns, value counts and a few sample rows) plus a
+handle. The full rows stay in a ToolResultStore and the model reads
+them a page at a time with the get_tool_result_page tool.
+
+Results under the budget pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from ..domain.entities import ToolDefinition, UserContext
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "PAGE_TOOL_NAME",
+    "ResultShaper",
+    "ShapedResult",
+    "ToolResultStore",
+    "estimate_tokens",
+    "serialize_result",
+]
+
+PAGE_TOOL_NAME = "get_tool_result_page"
+
+# Rough size of a token in characters; close enough for budgeting
+CHARS_PER_TOKEN = 4
+
+# Columns with at most this many distinct values get value counts
+MAX_CATEGORIES = 10
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def serialize_result(result: Any) -> str:
+    """Serialize a tool result for the LLM.
+
+    Strings are passed through; everything else is compact JSON, with
+    values JSON cannot represent (datetimes, UUIDs) written as strings.
+
+    Args:
+        result: Tool result
+
+    Returns:
+        Serialized result
+    """
+    if isinstance(result, str):
+        return result
+    try:
+        return json.dumps(result, default=str, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return str(result)
+
+
+# ============================================
+# Result Store
+# ============================================
+
+
+@dataclass
+class StoredResult:
+    """Rows of a shaped result, kept for paging.
+
+    Attributes:
+        tool_name: Tool that produced the rows
+        tenant_id: Tenant the rows belong to
+        rows: Full row set
+        stored_at: Monotonic time the rows were stored
+    """
+
+    tool_name: str
+    tenant_id: str
+    rows: list[Any]
+    stored_at: float
+
+
+class ToolResultStore:
+    """Bounded in-memory store of row sets behind result handles.
+
+    Least recently used entries are evicted once ``max_entries`` is
+    reached, and entries expire after ``ttl_seconds``. Handles are
+    scoped to the tenant that created them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl_seconds: float = 1800,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of row sets kept
+            ttl_seconds: Lifetime of a row set
+            clock: Time source (monotonic seconds)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, StoredResult] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, tool_name: str, rows: list[Any], context: UserContext) -> str:
+        """Store a row set.
+
+        Args:
+            tool_name: Tool that produced the rows
+            rows: Full row set
+            context: User context (for tenant scoping)
+
+        Returns:
+            Handle for reading the rows back
+        """
+        handle = f"res_{uuid.uuid4().hex[:12]}"
+        self._entries[handle] = StoredResult(
+            tool_name=tool_name,
+            tenant_id=context.tenant_id,
+            rows=rows,
+            stored_at=self._clock(),
+        )
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return handle
+
+    def get(self, handle: str, context: UserContext) -> Optional[StoredResult]:
+        """Look up a row set.
+
+        Args:
+            handle: Handle returned by put()
+            context: User context (must match the storing tenant)
+
+        Returns:
+            Stored rows, or None if unknown, expired or another tenant's
+        """
+        entry = self._entries.get(handle)
+        if entry is None:
+            return None
+        if self._clock() - entry.stored_at > self.ttl_seconds:
+            del self._entries[handle]
+            return None
+        if entry.tenant_id != context.tenant_id:
+            return None
+        self._entries.move_to_end(handle)
+        return entry
+
+
+# ============================================
+# Result Shaper
+# ============================================
+
+
+@dataclass
+class ShapedResult:
+    """A tool result prepared for the LLM context.
+
+    Attributes:
+        result: Result to keep in the conversation (original or summary)
+        content: Serialized result for the LLM
+        truncated: Whether the original result was cut down
+        handle: Handle for paging through the full rows, if stored
+        total_rows: Number of rows in the original row set
+        rows: The original row set (for streaming to the UI)
+    """
+
+    result: Any
+    content: str
+    truncated: bool = False
+    handle: Optional[str] = None
+    total_rows: Optional[int] = None
+    rows: list[Any] = field(default_factory=list)
+
+
+class ResultShaper:
+    """Caps tool results to a token budget.
+
+    Usage:
+        shaper = ResultShaper(ToolResultStore(), token_budget=2000)
+
+        shaped = shaper.shape("list_devices", rows, context)
+        # shaped.content fits the budget; shaped.handle pages the rest
+        page = shaper.page({"handle": shaped.handle, "offset": 50}, context)
+
+    Architecture:
+        - Row sets are a list of rows, or the largest list inside a dict
+          result (e.g. ``{"devices": [...], "summary": [...]}``); the other
+          keys of the dict are kept
+        - Over-budget row sets become a summary with sample rows and a
+          handle; other over-budget results are cut to the budget
+        - Pages are trimmed to the budget too, so no single tool result
+          grows the context past it
+    """
+
+    def __init__(
+        self,
+        store: Optional[ToolResultStore] = None,
+        token_budget: int = 2000,
+        sample_rows: int = 5,
+        page_size: int = 50,
+    ):
+        """Initialize the shaper.
+
+        Args:
+            store: Store for full row sets
+            token_budget: Maximum tokens of a serialized tool result
+            sample_rows: Rows included in a summary
+            page_size: Default and maximum rows per page
+        """
+        self.store = store or ToolResultStore()
+        self.token_budget = token_budget
+        self.sample_rows = sample_rows
+        self.page_size = page_size
+
+    def shape(self, tool_name: str, result: Any, context: UserContext) -> ShapedResult:
+        """Fit a tool result into the token budget.
+
+        Args:
+            tool_name: Tool that produced the result
+            result: Tool result
+            context: User context (for tenant scoping of the handle)
+
+        Returns:
+            Shaped result
+        """
+        content = serialize_result(result)
+        if estimate_tokens(content) <= self.token_budget:
+            return ShapedResult(result=result, content=content)
+
+        key, rows = self._find_rows(result)
+        if rows:
+            handle = self.store.put(tool_name, rows, context)
+            summary = self._summarize(rows, handle)
+            shaped = self._fit_summary(result, key, summary)
+            if shaped is not None:
+                logger.info(
+                    f"Shaped {tool_name} result: {len(rows)} rows, "
+                    f"{estimate_tokens(content)} -> {estimate_tokens(shaped[1])} tokens"
+                )
+                return ShapedResult(
+                    result=shaped[0],
+                    content=shaped[1],
+                    truncated=True,
+                    handle=handle,
+                    total_rows=len(rows),
+                    rows=rows,
+                )
+
+        text = self._truncate(content)
+        return ShapedResult(result=text, content=text, truncated=True)
+
+    def page(self, arguments: dict[str, Any], context: UserContext) -> dict[str, Any]:
+        """Read a page of a stored row set.
+
+        Handler for the get_tool_result_page tool.
+
+        Args:
+            arguments: Tool arguments (handle, offset, limit)
+            context: User context
+
+        Returns:
+            Page of rows with the offset of the next page
+        """
+        handle = str(arguments.get("handle", ""))
+        entry = self.store.get(handle, context)
+        if entry is None:
+            return {
+                "error": f"Result {handle} not found or expired. Run the original query again.",
+                "recoverable": True,
+            }
+
+        try:
+            offset = max(int(arguments.get("offset", 0)), 0)
+            limit = min(max(int(arguments.get("limit", self.page_size)), 1), self.page_size)
+        except (TypeError, ValueError):
+            return {"error": "offset and limit must be integers", "recoverable": True}
+
+        rows = entry.rows[offset:offset + limit]
+        while True:
+            end = offset + len(rows)
+            page = {
+                "handle": handle,
+                "offset": offset,
+                "total_rows": len(entry.rows),
+                "rows": rows,
+                "next_offset": end if end < len(entry.rows) else None,
+            }
+            if len(rows) <= 1 or estimate_tokens(serialize_result(page)) <= self.token_budget:
+                return page
+            rows = rows[:len(rows) // 2]
+
+    @property
+    def page_tool(self) -> ToolDefinition:
+        """Definition of the paging tool."""
+        return ToolDefinition(
+            name=PAGE_TOOL_NAME,
+            description=(
+                "Read more rows of a large tool result that was summarized. "
+                "Use the handle from the summary and next_offset from the previous page. "
+                "Prefer a narrower query when you only need counts or a few rows."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "handle": {
+                        "type": "string",
+                        "description": "Result handle from the summary",
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Index of the first row (default 0)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": f"Rows to return (max {self.page_size})",
+                    },
+                },
+                "required": ["handle"],
+            },
+        )
+
+    @staticmethod
+    def _find_rows(result: Any) -> tuple[Optional[str], Optional[list[Any]]]:
+        """Find the row set in a result.
+
+        Returns:
+            Tuple of (dict key or None for a top-level list, rows)
+        """
+        if isinstance(result, list):
+            return None, result
+        if isinstance(result, dict):
+            lists = [(k, v) for k, v in result.items() if isinstance(v, list) and v]
+            if lists:
+                return max(lists, key=lambda item: len(item[1]))
+        return None, None
+
+    def _summarize(self, rows: list[Any], handle: str) -> dict[str, Any]:
+        """Describe a row set: size, columns and common values."""
+        summary: dict[str, Any] = {"total_rows": len(rows)}
+
+        if isinstance(rows[0], dict):
+            columns: dict[str, None] = {}
+            for row in rows[:100]:
+                if isinstance(row, dict):
+                    columns.update(dict.fromkeys(row))
+            summary["columns"] = list(columns)
+
+            value_counts = {}
+            for column in columns:
+                counts = Counter(
+                    str(row.get(column)) for row in rows if isinstance(row, dict)
+                )
+                if 1 < len(counts) <= MAX_CATEGORIES and len(counts) < len(rows):
+                    value_counts[column] = dict(counts.most_common())
+            if value_counts:
+                summary["value_counts"] = value_counts
+
+        summary["sample_rows"] = rows[:self.sample_rows]
+        summary["handle"] = handle
+        summary["note"] = (
+            f"Result too large for context; showing {{shown}} of {len(rows)} rows. "
+            f"Call {PAGE_TOOL_NAME} with this handle to read more."
+        )
+        return summary
+
+    def _fit_summary(
+        self, result: Any, key: Optional[str], summary: dict[str, Any]
+    ) -> Optional[tuple[Any, str]]:
+        """Shrink the sample rows until the summary fits the budget.
+
+        Returns:
+            Tuple of (shaped result, serialized), or None if it cannot fit
+        """
+        samples = summary["sample_rows"]
+        note = summary["note"]
+        while True:
+            summary["sample_rows"] = samples
+            summary["note"] = note.format(shown=len(samples))
+            shaped = summary if key is None else {**result, key: summary}
+            content = serialize_result(shaped)
+            if estimate_tokens(content) <= self.token_budget:
+                return shaped, content
+            if samples:
+                samples = samples[:len(samples) // 2]
+            elif "value_counts" in summary:
+                del summary["value_counts"]
+            else:
+                return None
+
+    def _truncate(self, content: str) -> str:
+        """Cut serialized content to the budget."""
+        marker = f"\n... [truncated, {len(content)} characters in full result]"
+        keep = max(self.token_budget * CHARS_PER_TOKEN - len(marker), 0)
+        return content[:keep] + marker
@@ -27,6 +27,9 @@ Exceptions:
     DeviceLimitError: Device count exceeds API limits
     AsyncOperationError: Async operation failed
 
+Scheduling:
+    JobScheduler: Independent sync jobs with intervals, dependencies and advisory locks
+
 Resilience:
     CircuitBreaker: Prevent cascading failures
     retry: Decorator for retry with exponential backoff
@@ -51,10 +54,15 @@ from .client import (
     PaginationConfig,
 )
 from .database import (
+    DEFAULT_POOL_CONFIGS,
     BatchExecutor,
+    InstrumentedPool,
+    PoolConfig,
+    PoolRegistry,
     batch_transaction,
     check_database_health,
     close_pool,
+    create_named_pool,
     create_pool,
     database_connection,
     database_transaction,
@@ -88,6 +96,13 @@ from .exceptions import (
     TransactionError,
     ValidationError,
 )
+from .job_scheduler import AdvisoryLocks, JobScheduler, JobState, SyncJob
+from .query_metrics import (
+    InstrumentedConnection,
+    QueryMetrics,
+    QueryMetricsMiddleware,
+    get_query_metrics,
+)
 from .resilience import (
     DEFAULT_RETRYABLE_EXCEPTIONS,
     CircuitBreaker,
@@ -170,6 +185,21 @@ __all__ = [
     "create_pool",
     "close_pool",
     "check_database_health",
+    "PoolConfig",
+    "PoolRegistry",
+    "InstrumentedPool",
+    "DEFAULT_POOL_CONFIGS",
+    "create_named_pool",
+    # Sync job scheduling
+    "AdvisoryLocks",
+    "JobScheduler",
+    "JobState",
+    "SyncJob",
+    # Query metrics
+    "QueryMetrics",
+    "QueryMetricsMiddleware",
+    "InstrumentedConnection",
+    "get_query_metrics",
     # Syncers - GreenLake (read operations)
     "DeviceSyncer",
     "SubscriptionSyncer",
@@ -57,7 +57,7 @@ from .exceptions import (
     TokenExpiredError,
     ValidationError,
 )
-from .resilience import CircuitBreaker
+from .resilience import AdaptiveRateLimiter, CircuitBreaker, get_shared_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +139,7 @@ class ArubaCentralClient:
         - Bearer token authentication (via ArubaTokenManager)
         - Automatic token refresh on 401 responses
         - Rate limit backoff on 429 responses (reads X-RateLimit headers)
+        - Adaptive request pacing driven by X-RateLimit headers (AdaptiveRateLimiter)
         - Connection pooling via shared aiohttp session
         - Circuit breaker for resilience
 
@@ -154,6 +155,8 @@ class ArubaCentralClient:
         enable_circuit_breaker: bool = True,
         circuit_failure_threshold: int = 5,
         circuit_timeout: float = 60.0,
+        enable_rate_limiter: bool = True,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
     ):
         """Initialize the ArubaCentralClient.
 
@@ -164,6 +167,9 @@ class ArubaCentralClient:
             enable_circuit_breaker: Enable circuit breaker for resilience
             circuit_failure_threshold: Failures before circuit opens
             circuit_timeout: Seconds before circuit attempts to close
+            enable_rate_limiter: Pace requests through an AdaptiveRateLimiter
+            rate_limiter: Limiter to use. Defaults to the process-wide
+                          "aruba_central" limiter shared by all Central clients.
 
         Raises:
             ConfigurationError: If base_url is not provided and ARUBA_BASE_URL is not set.
@@ -196,6 +202,11 @@ class ArubaCentralClient:
                 name="aruba_central_api",
             )
 
+        # Adaptive rate limiter (learns from X-RateLimit headers and 429s)
+        self._rate_limiter: Optional[AdaptiveRateLimiter] = None
+        if enable_rate_limiter:
+            self._rate_limiter = rate_limiter or get_shared_rate_limiter("aruba_central")
+
     # ----------------------------------------
     # Context Manager Protocol
     # ----------------------------------------
@@ -345,6 +356,12 @@ class ArubaCentralClient:
                 rate_info = self._extract_rate_limit_info(dict(response.headers))
                 if rate_info:
                     self._last_rate_limit = rate_info
+                    if self._rate_limiter and rate_info.reset_at:
+                        self._rate_limiter.record_rate_limit_headers(
+                            AdaptiveRateLimiter.classify(method, endpoint),
+                            remaining=rate_info.remaining,
+                            reset_in_seconds=rate_info.seconds_until_reset,
+                        )
 
                 # Handle specific error statuses with typed exceptions
                 if response.status >= 400:
@@ -484,17 +501,23 @@ class ArubaCentralClient:
 
         last_error: Optional[Exception] = None
         backoff_delay = 1.0  # Initial backoff delay
+        endpoint_class = AdaptiveRateLimiter.classify(method, endpoint)
 
         for attempt in range(1, max_retries + 1):
             try:
                 # Check rate limit before request
-                await self._handle_rate_limit(self._last_rate_limit)
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire(endpoint_class)
+                else:
+                    await self._handle_rate_limit(self._last_rate_limit)
 
                 result = await self._request(method, endpoint, params, json_body)
 
                 # Success - reset circuit breaker
                 if self._circuit_breaker:
                     await self._circuit_breaker._on_success()
+                if self._rate_limiter:
+                    self._rate_limiter.record_success(endpoint_class)
 
                 return result
 
@@ -512,7 +535,11 @@ class ArubaCentralClient:
                     f"Aruba Central rate limited, waiting {wait_time}s "
                     f"(attempt {attempt}/{max_retries})"
                 )
-                await asyncio.sleep(wait_time)
+                if self._rate_limiter:
+                    # Blocks the bucket for Retry-After; next acquire() waits
+                    self._rate_limiter.record_rate_limited(endpoint_class, wait_time)
+                else:
+                    await asyncio.sleep(wait_time)
                 continue
 
             except ServerError as e:
@@ -589,6 +616,13 @@ class ArubaCentralClient:
         """Get the last known rate limit info."""
         return self._last_rate_limit
 
+    @property
+    def rate_limit_status(self) -> Optional[dict[str, Any]]:
+        """Get rate limiter metrics (effective rate, throttled time) for monitoring."""
+        if self._rate_limiter:
+            return self._rate_limiter.get_metrics()
+        return None
+
     @property
     def circuit_status(self) -> Optional[dict[str, Any]]:
         """Get circuit breaker status for monitoring."""
@@ -77,15 +77,19 @@ class ArubaClientsSyncer:
         self,
         client: ArubaCentralClient,
         db_pool=None,
+        *,
+        pagination: Optional[ArubaPaginationConfig] = None,
     ):
         """Initialize ArubaClientsSyncer.
 
         Args:
             client: Configured ArubaCentralClient instance
             db_pool: asyncpg connection pool (required for sync)
+            pagination: Page size and inter-page delay (defaults to CLIENTS_PAGINATION)
         """
         self.client = client
         self.db_pool = db_pool
+        self.pagination = pagination or CLIENTS_PAGINATION
 
     # ----------------------------------------
     # Field Mapping and Normalization
@@ -338,12 +342,15 @@ class ArubaClientsSyncer:
         Returns:
             Number of clients marked as removed
         """
+        # synced_at is stamped with this run's timestamp on every upserted
+        # client, so it acts as the sync generation; the predicate matches
+        # the partial index idx_clients_site_synced_active.
         result = await conn.execute('''
             UPDATE clients
             SET status = 'REMOVED', updated_at = NOW()
             WHERE site_id = $1
               AND synced_at < $2
-              AND (status IS NULL OR status != 'REMOVED')
+              AND status IS DISTINCT FROM 'REMOVED'
         ''', site_id, sync_timestamp)
 
         try:
@@ -391,7 +398,7 @@ class ArubaClientsSyncer:
         try:
             async for page in self.client.paginate(
                 self.ENDPOINT,
-                config=CLIENTS_PAGINATION,
+                config=self.pagination,
                 params={"site-id": site_id},
             ):
                 upserted, skipped = await self._upsert_clients_page(
@@ -569,7 +576,7 @@ class ArubaClientsSyncer:
         all_clients = []
         async for page in self.client.paginate(
             self.ENDPOINT,
-            config=CLIENTS_PAGINATION,
+            config=self.pagination,
             params={"site-id": site_id},
         ):
             all_clients.extend(page)
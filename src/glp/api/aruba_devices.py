@@ -17,6 +17,10 @@ Key Design Decisions:
     - Platform-specific columns prevent data overwrites
     - Streaming writes process page-by-page (memory efficient)
     - Serial numbers are normalized (stripped, uppercased, NULL filtered)
+    - Pages are COPY'd into a staging table and merged with one UPDATE ... FROM
+      that only rewrites devices whose Central columns changed; per-poll
+      columns (uptime, Central last-seen time) are refreshed hourly instead
+    - Devices missing from the staging table are marked removed (anti-join)
 
 Database Columns Updated:
     - central_id, central_device_name, central_device_type
@@ -35,13 +39,14 @@ Author: HPE GreenLake Team
 """
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import asyncpg
 
-from .aruba_client import ARUBA_DEVICES_PAGINATION, ArubaCentralClient
-from .database import database_transaction
+from .aruba_client import ARUBA_DEVICES_PAGINATION, ArubaCentralClient, ArubaPaginationConfig
+from .database import affected_rows, database_transaction
 from .exceptions import (
     ConnectionPoolError,
     DatabaseError,
@@ -54,6 +59,95 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Per-sync staging table; pages are COPY'd here and merged set-based
+STAGING_TABLE = "central_device_staging"
+
+# Central columns written by the sync, in _prepare_upsert_record order
+CENTRAL_COLUMNS = (
+    "central_id",
+    "central_device_name",
+    "central_device_type",
+    "central_model",
+    "central_part_number",
+    "central_status",
+    "central_software_version",
+    "central_ipv4",
+    "central_ipv6",
+    "central_uptime_millis",
+    "central_last_seen_at",
+    "central_deployment",
+    "central_device_role",
+    "central_device_function",
+    "central_is_provisioned",
+    "central_tier",
+    "central_site_id",
+    "central_site_name",
+    "central_building_id",
+    "central_floor_id",
+    "central_device_group_id",
+    "central_device_group_name",
+    "central_scope_id",
+    "central_stack_id",
+    "central_cluster_name",
+    "central_config_status",
+    "central_config_last_modified_at",
+)
+
+STAGING_COLUMNS = (
+    "page_no",
+    "serial_number",
+    "mac_address",
+    *CENTRAL_COLUMNS,
+    "central_raw_data",
+)
+
+# Central columns that change on every poll. They are left out of the merge's
+# change check and refreshed with last_seen_central instead, so an online
+# device isn't rewritten on every sync just because its uptime ticked.
+VOLATILE_CENTRAL_COLUMNS = (
+    "central_uptime_millis",
+    "central_last_seen_at",
+)
+
+_COMPARED_COLUMNS = tuple(c for c in CENTRAL_COLUMNS if c not in VOLATILE_CENTRAL_COLUMNS)
+
+_SET_CENTRAL = ",\n        ".join(f"{c} = s.{c}" for c in CENTRAL_COLUMNS)
+
+# Rewrite only devices whose mapped Central columns (other than the volatile
+# ones) changed, or that are returning to Central. central_raw_data and the
+# volatile columns are refreshed along with them.
+MERGE_CHANGED_SQL = f'''
+    UPDATE devices AS d SET
+        mac_address = COALESCE(d.mac_address, s.mac_address),
+        {_SET_CENTRAL},
+        central_raw_data = s.central_raw_data,
+        in_central = TRUE,
+        last_seen_central = $2,
+        synced_at = NOW()
+    FROM {STAGING_TABLE} s
+    WHERE s.page_no = $1
+      AND d.serial_number = s.serial_number
+      AND (
+          d.in_central IS DISTINCT FROM TRUE
+          OR (d.mac_address IS NULL AND s.mac_address IS NOT NULL)
+          OR ({", ".join(f"d.{c}" for c in _COMPARED_COLUMNS)})
+             IS DISTINCT FROM
+             ({", ".join(f"s.{c}" for c in _COMPARED_COLUMNS)})
+      )
+'''
+
+# Bump last_seen_central and the volatile columns on unchanged devices, but
+# only once last_seen_central is older than $2, so most syncs skip them.
+TOUCH_UNCHANGED_SQL = f'''
+    UPDATE devices AS d SET
+        last_seen_central = $1,
+        {", ".join(f"{c} = s.{c}" for c in VOLATILE_CENTRAL_COLUMNS)}
+    FROM {STAGING_TABLE} s
+    WHERE d.serial_number = s.serial_number
+      AND d.in_central = TRUE
+      AND (d.last_seen_central IS NULL OR d.last_seen_central < $2)
+'''
+
 
 class ArubaCentralSyncer:
     """Device inventory synchronizer for Aruba Central.
@@ -69,19 +163,27 @@ class ArubaCentralSyncer:
     # API endpoint for device inventory
     ENDPOINT = "/network-monitoring/v1alpha1/device-inventory"
 
+    # How stale last_seen_central may get for devices whose data is unchanged
+    LAST_SEEN_RESOLUTION = timedelta(hours=1)
+
     def __init__(
         self,
         client: ArubaCentralClient,
         db_pool=None,
+        *,
+        pagination: Optional[ArubaPaginationConfig] = None,
     ):
         """Initialize ArubaCentralSyncer.
 
         Args:
             client: Configured ArubaCentralClient instance
             db_pool: asyncpg connection pool (required for sync)
+            pagination: Page size and inter-page delay
+                        (defaults to ARUBA_DEVICES_PAGINATION)
         """
         self.client = client
         self.db_pool = db_pool
+        self.pagination = pagination or ARUBA_DEVICES_PAGINATION
 
     # ----------------------------------------
     # Field Mapping and Normalization
@@ -195,7 +297,8 @@ class ArubaCentralSyncer:
             device: Raw device dict from Central API
 
         Returns:
-            Tuple of values for the upsert query, or None if invalid
+            Tuple of values in STAGING_COLUMNS order (without page_no),
+            or None if invalid
         """
         serial = self.normalize_serial(device.get("serialNumber"))
         if not serial:
@@ -241,114 +344,138 @@ class ArubaCentralSyncer:
     # Database Operations
     # ----------------------------------------
 
-    async def _upsert_page(self, conn, devices: list[dict]) -> tuple[int, int, list[str]]:
-        """Upsert a page of devices to the database.
+    async def _create_staging_table(self, conn) -> None:
+        """Create the per-sync staging table (dropped at commit).
 
-        Uses UPSERT (INSERT ON CONFLICT) with serial_number as the key.
-        - Existing devices: Update Central-specific columns only
-        - New devices: Insert with Central data, mark in_greenlake=FALSE
+        Column types are copied from devices so COPY input matches exactly.
+        The table keeps every page of the run, which also serves as the set
+        of serials seen for removal detection.
+        """
+        await conn.execute(f'''
+            CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS
+            SELECT {", ".join(STAGING_COLUMNS[1:])}
+            FROM devices
+            WITH NO DATA
+        ''')
+        await conn.execute(f"ALTER TABLE {STAGING_TABLE} ADD COLUMN page_no INTEGER")
+        await conn.execute(f"CREATE INDEX ON {STAGING_TABLE} (page_no)")
+        await conn.execute(f"CREATE INDEX ON {STAGING_TABLE} (serial_number)")
+
+    async def _upsert_page(
+        self, conn, devices: list[dict], page_no: int, seen_at: datetime
+    ) -> tuple[int, int, int]:
+        """Merge a page of devices into the devices table.
+
+        The page is COPY'd into the staging table and merged with a single
+        UPDATE ... FROM that only rewrites devices whose Central columns
+        changed (or that are returning to Central). Devices must already
+        exist in GreenLake; this enriches existing records only.
 
         Args:
             conn: Database connection
             devices: List of device dicts from Central API
+            page_no: Page number within this sync (staging partition)
+            seen_at: Sync start time, written to last_seen_central
 
         Returns:
-            Tuple of (upserted_count, skipped_count, list of serial numbers synced)
+            Tuple of (records_staged, skipped_count, devices_changed)
         """
         records = []
-        serials_synced = []
-
         for device in devices:
             record = self._prepare_upsert_record(device)
             if record:
-                records.append(record)
-                serials_synced.append(record[0])  # serial_number
+                records.append((page_no, *record))
 
         if not records:
-            return 0, len(devices), []
-
-        # UPDATE existing GreenLake devices with Central data
-        # This enriches existing records - does NOT create new ones
-        # Devices must already exist in GreenLake (synced from GLP API)
-        await conn.executemany('''
-            UPDATE devices SET
-                mac_address = COALESCE(mac_address, $2),
-                central_id = $3,
-                central_device_name = $4,
-                central_device_type = $5,
-                central_model = $6,
-                central_part_number = $7,
-                central_status = $8,
-                central_software_version = $9,
-                central_ipv4 = $10,
-                central_ipv6 = $11,
-                central_uptime_millis = $12,
-                central_last_seen_at = $13,
-                central_deployment = $14,
-                central_device_role = $15,
-                central_device_function = $16,
-                central_is_provisioned = $17,
-                central_tier = $18,
-                central_site_id = $19,
-                central_site_name = $20,
-                central_building_id = $21,
-                central_floor_id = $22,
-                central_device_group_id = $23,
-                central_device_group_name = $24,
-                central_scope_id = $25,
-                central_stack_id = $26,
-                central_cluster_name = $27,
-                central_config_status = $28,
-                central_config_last_modified_at = $29,
-                central_raw_data = $30::jsonb,
-                in_central = TRUE,
-                last_seen_central = NOW(),
-                synced_at = NOW()
-            WHERE serial_number = $1
-        ''', records)
+            return 0, len(devices), 0
+
+        await conn.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=list(STAGING_COLUMNS)
+        )
+
+        result = await conn.execute(MERGE_CHANGED_SQL, page_no, seen_at)
 
         skipped = len(devices) - len(records)
-        return len(records), skipped, serials_synced
+        return len(records), skipped, affected_rows(result)
+
+    async def _touch_unchanged_devices(self, conn, seen_at: datetime) -> int:
+        """Refresh last_seen_central and volatile columns, at most hourly.
 
-    async def _mark_removed_devices(self, conn, serials_seen: list[str]) -> int:
+        Unchanged devices are skipped by the merge, so their
+        last_seen_central, uptime and Central last-seen time are only
+        bumped once last_seen_central is older than LAST_SEEN_RESOLUTION.
+        This keeps them accurate to that resolution without rewriting
+        every row on every sync.
+
+        Returns:
+            Number of devices touched
+        """
+        result = await conn.execute(
+            TOUCH_UNCHANGED_SQL, seen_at, seen_at - self.LAST_SEEN_RESOLUTION
+        )
+        return affected_rows(result)
+
+    async def _mark_removed_devices(self, conn, seen_count: int) -> int:
         """Mark devices no longer in Central as removed.
 
-        Sets in_central = FALSE for devices that weren't in this sync.
+        Sets in_central = FALSE for devices with no row in this sync's
+        staging table (a hash anti-join; no list of serials is shipped).
 
         Args:
             conn: Database connection
-            serials_seen: List of serial numbers seen in this sync
+            seen_count: Number of devices staged in this run (0 skips cleanup
+                so an empty API response can't mark everything removed)
 
         Returns:
             Number of devices marked as removed
         """
-        if not serials_seen:
+        if not seen_count:
             return 0
 
-        # Use execute() and check rowcount - RETURNING COUNT(*) is invalid SQL
-        result = await conn.execute('''
-            UPDATE devices
+        result = await conn.execute(f'''
+            UPDATE devices d
             SET in_central = FALSE
-            WHERE in_central = TRUE
-              AND serial_number IS NOT NULL
-              AND serial_number != ''
-              AND serial_number != ALL($1::text[])
-        ''', serials_seen)
+            WHERE d.in_central = TRUE
+              AND d.serial_number IS NOT NULL
+              AND d.serial_number != ''
+              AND NOT EXISTS (
+                  SELECT 1 FROM {STAGING_TABLE} s
+                  WHERE s.serial_number = d.serial_number
+              )
+        ''')
+        return affected_rows(result)
 
-        # asyncpg returns "UPDATE N" where N is the row count
+    @staticmethod
+    async def _current_wal_lsn(conn) -> Optional[str]:
+        """Current WAL position (None where unavailable, e.g. on a replica)."""
         try:
-            return int(result.split()[-1])
-        except (ValueError, IndexError, AttributeError):
-            return 0
+            return await conn.fetchval("SELECT pg_current_wal_lsn()::text")
+        except asyncpg.PostgresError:
+            return None
+
+    @staticmethod
+    async def _wal_bytes_since(conn, start_lsn: Optional[str]) -> Optional[int]:
+        """WAL bytes written since start_lsn (includes concurrent activity)."""
+        if start_lsn is None:
+            return None
+        try:
+            return await conn.fetchval(
+                "SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), $1::pg_lsn)::bigint",
+                start_lsn,
+            )
+        except asyncpg.PostgresError:
+            return None
 
     async def sync_to_postgres_streaming(self) -> dict:
         """Sync devices from Aruba Central using streaming writes.
 
-        Processes devices page-by-page to minimize memory usage.
-        After sync, marks devices not seen in this run as removed from Central.
+        Processes devices page-by-page to minimize memory usage: each page
+        is COPY'd into a staging table and merged set-based, rewriting only
+        devices whose Central data changed. After the last page, devices
+        not seen in this run are marked as removed from Central.
 
         Returns:
-            Dict with sync statistics
+            Dict with sync statistics, including throughput and WAL bytes
 
         Raises:
             ConnectionPoolError: If database pool is not available
@@ -362,25 +489,37 @@ class ArubaCentralSyncer:
         error_collector = ErrorCollector()
         total_upserted = 0
         total_skipped = 0
+        total_changed = 0
         total_pages = 0
-        all_serials_seen: list[str] = []
+        unique_serials = 0
+        wal_bytes = None
+        seen_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
 
         try:
             async with database_transaction(self.db_pool) as conn:
+                start_lsn = await self._current_wal_lsn(conn)
+                await self._create_staging_table(conn)
+
                 # Stream pages from API and write to DB
                 async for page in self.client.paginate(
                     self.ENDPOINT,
-                    config=ARUBA_DEVICES_PAGINATION,
+                    config=self.pagination,
                 ):
                     try:
-                        upserted, skipped, serials = await self._upsert_page(conn, page)
+                        # Savepoint so a failed page doesn't abort the sync
+                        async with conn.transaction():
+                            upserted, skipped, changed = await self._upsert_page(
+                                conn, page, total_pages, seen_at
+                            )
                         total_upserted += upserted
                         total_skipped += skipped
+                        total_changed += changed
                         total_pages += 1
-                        all_serials_seen.extend(serials)
 
                         logger.debug(
-                            f"Page {total_pages}: upserted {upserted}, skipped {skipped}"
+                            f"Page {total_pages}: staged {upserted}, changed {changed}, "
+                            f"skipped {skipped}"
                         )
 
                     except asyncpg.IntegrityConstraintViolationError as e:
@@ -399,11 +538,21 @@ class ArubaCentralSyncer:
                             context={"page": total_pages}
                         )
 
-                # After all pages, mark devices removed from Central
-                removed_count = await self._mark_removed_devices(conn, all_serials_seen)
+                unique_serials = await conn.fetchval(
+                    f"SELECT COUNT(DISTINCT serial_number) FROM {STAGING_TABLE}"
+                )
+                await self._touch_unchanged_devices(conn, seen_at)
+
+                # After all pages, mark devices removed from Central (skipped
+                # if a page failed, since its devices are missing from staging)
+                removed_count = 0
+                if not error_collector.has_errors():
+                    removed_count = await self._mark_removed_devices(conn, unique_serials)
                 if removed_count > 0:
                     logger.info(f"Marked {removed_count} devices as removed from Central")
 
+                wal_bytes = await self._wal_bytes_since(conn, start_lsn)
+
         except GLPError as e:
             logger.error(f"API error during Aruba Central sync: {e}")
             error_collector.add(e, context={"operation": "fetch"})
@@ -415,19 +564,27 @@ class ArubaCentralSyncer:
                 context={"operation": "sync"}
             )
 
+        duration = time.perf_counter() - started
         stats = {
             "source": "aruba_central",
             "total_pages": total_pages,
             "total_upserted": total_upserted,
+            "total_changed": total_changed,
+            "total_unchanged": total_upserted - total_changed,
             "total_skipped": total_skipped,
-            "unique_serials": len(set(all_serials_seen)),
+            "unique_serials": unique_serials,
+            "duration_seconds": round(duration, 3),
+            "devices_per_second": round(total_upserted / duration, 1) if duration else 0.0,
+            "wal_bytes": wal_bytes,
             "errors": error_collector.count(),
             "synced_at": datetime.utcnow().isoformat(),
         }
 
         logger.info(
-            f"Aruba Central sync complete: {total_upserted} devices upserted, "
-            f"{total_skipped} skipped, {error_collector.count()} errors"
+            f"Aruba Central sync complete: {total_upserted} devices "
+            f"({total_changed} changed), {total_skipped} skipped, "
+            f"{stats['devices_per_second']}/s, WAL {wal_bytes} bytes, "
+            f"{error_collector.count()} errors"
         )
 
         if error_collector.has_errors():
@@ -471,7 +628,7 @@ class ArubaCentralSyncer:
         """
         return await self.client.fetch_all(
             self.ENDPOINT,
-            config=ARUBA_DEVICES_PAGINATION,
+            config=self.pagination,
         )
 
     async def fetch_and_save_json(self, filepath: str = "central_devices.json") -> int:
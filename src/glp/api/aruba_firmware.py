@@ -14,12 +14,13 @@ Key Design Decisions:
     - Only enriches existing devices (does not create new ones)
     - Uses serial_number as the correlation key
     - Tracks firmware_synced_at for stale data detection
-    - Clears firmware columns when device not in API response
+    - Stamps firmware_sync_generation on updated devices; devices without the
+      current generation have their firmware columns cleared in one UPDATE
 
 Database Columns Updated:
     - firmware_version, firmware_recommended_version
     - firmware_upgrade_status, firmware_classification
-    - firmware_last_upgraded_at, firmware_synced_at
+    - firmware_last_upgraded_at, firmware_synced_at, firmware_sync_generation
 
 Example:
     async with ArubaCentralClient(token_manager) as client:
@@ -36,7 +37,7 @@ from typing import Optional
 import asyncpg
 
 from .aruba_client import ArubaCentralClient, ArubaPaginationConfig
-from .database import database_transaction
+from .database import affected_rows, database_transaction
 from .exceptions import (
     ConnectionPoolError,
     DatabaseError,
@@ -153,7 +154,7 @@ class ArubaFirmwareSyncer:
     # ----------------------------------------
 
     async def _update_firmware_page(
-        self, conn, firmware_items: list[dict], sync_timestamp: datetime
+        self, conn, firmware_items: list[dict], sync_timestamp: datetime, generation: int
     ) -> tuple[int, int, list[str]]:
         """Update firmware info for a page of devices.
 
@@ -161,6 +162,7 @@ class ArubaFirmwareSyncer:
             conn: Database connection
             firmware_items: List of firmware dicts from Central API
             sync_timestamp: Current sync timestamp
+            generation: Sync generation stamped on every updated device
 
         Returns:
             Tuple of (updated_count, skipped_count, list of serials updated)
@@ -189,9 +191,10 @@ class ArubaFirmwareSyncer:
                     firmware_classification = $5,
                     firmware_last_upgraded_at = $6,
                     firmware_synced_at = $7,
+                    firmware_sync_generation = $8,
                     synced_at = NOW()
                 WHERE serial_number = $1
-            ''', *record, sync_timestamp)
+            ''', *record, sync_timestamp, generation)
 
             # Check if update affected a row
             try:
@@ -204,42 +207,43 @@ class ArubaFirmwareSyncer:
         return updated_count, skipped, serials_updated
 
     async def _clear_stale_firmware(
-        self, conn, serials_seen: list[str], sync_timestamp: datetime
+        self, conn, generation: int, seen_count: int, sync_timestamp: datetime
     ) -> int:
         """Clear firmware data for devices not seen in this sync.
 
-        This prevents stale firmware data from lingering forever.
+        This prevents stale firmware data from lingering forever. Devices
+        not stamped with this sync's generation are cleared in one UPDATE.
 
         Args:
             conn: Database connection
-            serials_seen: List of serial numbers seen in this sync
+            generation: Sync generation of this run
+            seen_count: Number of devices seen in this run
             sync_timestamp: Current sync timestamp
 
         Returns:
             Number of devices with firmware data cleared
         """
-        if not serials_seen:
+        if not seen_count:
             # If no firmware data fetched, don't clear anything
             return 0
 
-        result = await conn.execute('''
+        result = await conn.execute(
+            """
             UPDATE devices SET
                 firmware_version = NULL,
                 firmware_recommended_version = NULL,
                 firmware_upgrade_status = NULL,
                 firmware_classification = NULL,
                 firmware_last_upgraded_at = NULL,
-                firmware_synced_at = $1
-            WHERE firmware_version IS NOT NULL
-              AND serial_number IS NOT NULL
-              AND serial_number != ''
-              AND serial_number != ALL($2::text[])
-        ''', sync_timestamp, serials_seen)
-
-        try:
-            return int(result.split()[-1])
-        except (ValueError, IndexError, AttributeError):
-            return 0
+                firmware_synced_at = $2
+            WHERE firmware_sync_generation IS DISTINCT FROM $1
+              AND firmware_version IS NOT NULL
+              AND serial_number IS NOT NULL AND serial_number != ''
+            """,
+            generation,
+            sync_timestamp,
+        )
+        return affected_rows(result)
 
     # ----------------------------------------
     # Sync Operations
@@ -271,10 +275,12 @@ class ArubaFirmwareSyncer:
         total_updated = 0
         total_skipped = 0
         total_pages = 0
-        all_serials_seen: list[str] = []
+        serials_seen: set[str] = set()
 
         try:
             async with database_transaction(self.db_pool) as conn:
+                generation = await conn.fetchval("SELECT nextval('sync_generation_seq')")
+
                 # Fetch and update firmware data page by page
                 async for page in self.client.paginate(
                     self.ENDPOINT,
@@ -282,12 +288,12 @@ class ArubaFirmwareSyncer:
                 ):
                     try:
                         updated, skipped, serials = await self._update_firmware_page(
-                            conn, page, sync_timestamp
+                            conn, page, sync_timestamp, generation
                         )
                         total_updated += updated
                         total_skipped += skipped
                         total_pages += 1
-                        all_serials_seen.extend(serials)
+                        serials_seen.update(serials)
 
                         logger.debug(
                             f"Firmware page {total_pages}: {updated} updated, {skipped} skipped"
@@ -302,7 +308,7 @@ class ArubaFirmwareSyncer:
 
                 # Clear stale firmware data
                 cleared = await self._clear_stale_firmware(
-                    conn, all_serials_seen, sync_timestamp
+                    conn, generation, len(serials_seen), sync_timestamp
                 )
                 if cleared > 0:
                     logger.info(f"Cleared stale firmware data from {cleared} devices")
@@ -323,7 +329,7 @@ class ArubaFirmwareSyncer:
             "total_pages": total_pages,
             "total_updated": total_updated,
             "total_skipped": total_skipped,
-            "unique_serials": len(set(all_serials_seen)),
+            "unique_serials": len(serials_seen),
             "stale_cleared": cleared if 'cleared' in locals() else 0,
             "errors": error_collector.count(),
             "synced_at": sync_timestamp.isoformat(),
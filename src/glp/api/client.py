@@ -7,6 +7,7 @@ common concerns of GreenLake API communication:
     - OAuth2 authentication via TokenManager
     - Automatic token refresh on 401 responses
     - Rate limit handling with exponential backoff on 429 responses
+    - Adaptive token-bucket pacing shared across clients (per endpoint class)
     - Offset-based pagination with configurable page sizes
     - Connection pooling via shared aiohttp session
     - Circuit breaker for resilience against API outages
@@ -54,7 +55,7 @@ from .exceptions import (
     TokenExpiredError,
     ValidationError,
 )
-from .resilience import CircuitBreaker
+from .resilience import AdaptiveRateLimiter, CircuitBreaker, get_shared_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,7 @@ class GLPClient:
         - Bearer token authentication (via TokenManager)
         - Automatic token refresh on 401 responses
         - Rate limit backoff on 429 responses
+        - Adaptive request pacing (AdaptiveRateLimiter, shared per process)
         - Connection pooling via shared aiohttp session
 
     Attributes:
@@ -143,6 +145,8 @@ class GLPClient:
         enable_circuit_breaker: bool = True,
         circuit_failure_threshold: int = 5,
         circuit_timeout: float = 60.0,
+        enable_rate_limiter: bool = True,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
     ):
         """Initialize the GLPClient.
 
@@ -152,6 +156,9 @@ class GLPClient:
             enable_circuit_breaker: Enable circuit breaker for resilience
             circuit_failure_threshold: Failures before circuit opens
             circuit_timeout: Seconds before circuit attempts to close
+            enable_rate_limiter: Pace requests through an AdaptiveRateLimiter
+            rate_limiter: Limiter to use. Defaults to the process-wide "glp"
+                          limiter so all GreenLake clients share one budget.
 
         Raises:
             ConfigurationError: If base_url is not provided and GLP_BASE_URL is not set.
@@ -179,6 +186,11 @@ class GLPClient:
                 name="glp_api",
             )
 
+        # Adaptive rate limiter (learns from 429s, shared across clients)
+        self._rate_limiter: Optional[AdaptiveRateLimiter] = None
+        if enable_rate_limiter:
+            self._rate_limiter = rate_limiter or get_shared_rate_limiter("glp")
+
     # ----------------------------------------
     # Context Manager Protocol
     # ----------------------------------------
@@ -557,9 +569,13 @@ class GLPClient:
 
         last_error: Optional[Exception] = None
         backoff_delay = 1.0  # Initial backoff delay
+        endpoint_class = AdaptiveRateLimiter.classify(method, endpoint)
 
         for attempt in range(1, max_retries + 1):
             try:
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire(endpoint_class)
+
                 result = await self._request(
                     method, endpoint, params, json_body, extra_headers, accept_202
                 )
@@ -567,6 +583,8 @@ class GLPClient:
                 # Success - record with circuit breaker (handles state transitions)
                 if self._circuit_breaker:
                     await self._circuit_breaker.record_success()
+                if self._rate_limiter:
+                    self._rate_limiter.record_success(endpoint_class)
 
                 return result
 
@@ -583,7 +601,11 @@ class GLPClient:
                 logger.warning(
                     f"Rate limited, waiting {wait_time}s (attempt {attempt}/{max_retries})"
                 )
-                await asyncio.sleep(wait_time)
+                if self._rate_limiter:
+                    # Blocks the bucket for Retry-After; next acquire() waits
+                    self._rate_limiter.record_rate_limited(endpoint_class, wait_time)
+                else:
+                    await asyncio.sleep(wait_time)
                 continue
 
             except ServerError as e:
@@ -661,6 +683,18 @@ class GLPClient:
             return self._circuit_breaker.get_status()
         return None
 
+    @property
+    def rate_limiter(self) -> Optional[AdaptiveRateLimiter]:
+        """Get the adaptive rate limiter pacing this client's requests."""
+        return self._rate_limiter
+
+    @property
+    def rate_limit_status(self) -> Optional[dict[str, Any]]:
+        """Get rate limiter metrics (effective rate, throttled time) for monitoring."""
+        if self._rate_limiter:
+            return self._rate_limiter.get_metrics()
+        return None
+
     # ----------------------------------------
     # High-Level Request Methods
     # ----------------------------------------
@@ -4,6 +4,7 @@
 This module provides database utilities including:
     - Transaction context managers with automatic commit/rollback
     - Connection pool management
+    - Named, instrumented pools per workload (interactive, bulk_sync, export, agent)
     - Error handling and retry for database operations
 
 Example:
@@ -16,8 +17,11 @@ Author: HPE GreenLake Team
 """
 import asyncio
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Optional
 
 from .exceptions import (
     ConnectionPoolError,
@@ -25,6 +29,7 @@ from .exceptions import (
     IntegrityError,
     TransactionError,
 )
+from .query_metrics import QUERY_METRICS_ENABLED, InstrumentedConnection, get_query_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +242,19 @@ class BatchExecutor:
         return self._executed_count
 
 
+# ============================================
+# Status Parsing
+# ============================================
+
+
+def affected_rows(status: str) -> int:
+    """Parse the row count from an asyncpg status string ("UPDATE 42")."""
+    try:
+        return int(status.split()[-1])
+    except (ValueError, IndexError, AttributeError):
+        return 0
+
+
 # ============================================
 # Error Conversion
 # ============================================
@@ -310,7 +328,10 @@ async def create_pool(
         min_size: Minimum pool connections
         max_size: Maximum pool connections
         command_timeout: Default query timeout in seconds
-        **kwargs: Additional asyncpg.create_pool arguments
+        **kwargs: Additional asyncpg.create_pool arguments. Unless a
+            connection_class is given, connections are InstrumentedConnection
+            so every statement is recorded in QueryMetrics
+            (QUERY_METRICS_ENABLED=false turns this off).
 
     Returns:
         asyncpg.Pool instance
@@ -321,6 +342,9 @@ async def create_pool(
     try:
         import asyncpg
 
+        if QUERY_METRICS_ENABLED and InstrumentedConnection is not None:
+            kwargs.setdefault("connection_class", InstrumentedConnection)
+
         pool = await asyncpg.create_pool(
             database_url,
             min_size=min_size,
@@ -365,6 +389,355 @@ async def close_pool(pool, timeout: float = 10.0):
         pool.terminate()
 
 
+# ============================================
+# Named Pools (per-workload separation)
+# ============================================
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Settings for one named connection pool.
+
+    Attributes:
+        name: Pool name (used in metrics and env var names)
+        min_size: Minimum pool connections
+        max_size: Maximum pool connections
+        command_timeout: Default query timeout in seconds
+        acquire_timeout: Max seconds to wait for a free connection
+        statement_cache_size: asyncpg per-connection prepared statement
+            cache size (0 disables it, e.g. behind pgbouncer)
+        max_cached_statement_lifetime: Seconds before a cached statement
+            is re-prepared (0 = never)
+        max_inactive_connection_lifetime: Seconds before idle connections
+            are closed
+    """
+    name: str
+    min_size: int = 2
+    max_size: int = 10
+    command_timeout: float = 60.0
+    acquire_timeout: float = 30.0
+    statement_cache_size: int = 100
+    max_cached_statement_lifetime: int = 300
+    max_inactive_connection_lifetime: float = 300.0
+
+    def with_env_overrides(self) -> "PoolConfig":
+        """Apply DB_POOL_<NAME>_<SETTING> environment overrides.
+
+        Example:
+            DB_POOL_INTERACTIVE_MAX=20
+            DB_POOL_BULK_SYNC_STATEMENT_CACHE_SIZE=0
+        """
+        prefix = f"DB_POOL_{self.name.upper()}_"
+        overrides: dict[str, Any] = {}
+        for env_suffix, attr, cast in (
+            ("MIN", "min_size", int),
+            ("MAX", "max_size", int),
+            ("COMMAND_TIMEOUT", "command_timeout", float),
+            ("ACQUIRE_TIMEOUT", "acquire_timeout", float),
+            ("STATEMENT_CACHE_SIZE", "statement_cache_size", int),
+            ("STATEMENT_LIFETIME", "max_cached_statement_lifetime", int),
+            ("IDLE_LIFETIME", "max_inactive_connection_lifetime", float),
+        ):
+            value = os.getenv(prefix + env_suffix)
+            if value is not None:
+                try:
+                    overrides[attr] = cast(value)
+                except ValueError:
+                    logger.warning(f"Ignoring invalid {prefix + env_suffix}={value!r}")
+        return replace(self, **overrides) if overrides else self
+
+
+# Defaults sized so a saturated sync or export can't starve the dashboard:
+# each workload has its own connections and queue.
+#
+# bulk_sync must fit the scheduler's five jobs (subscriptions, devices,
+# central, clients, firmware) running at once plus their advisory-lock
+# connections. AdvisoryLocks shares one connection (5 + 1), but the pool
+# allows one per job (5 + 5 = 10) so a sync never waits on a lock holder.
+#
+# Connections per process at max_size, to budget against the server's
+# max_connections (PostgreSQL default 100, less superuser_reserved_connections):
+#   API (app.py):           interactive 10 + bulk_sync 10 + export 3 + agent 5 = 28
+#   MCP server (server.py): interactive 10 + bulk_sync 10                     = 20
+#   scheduler.py, main.py:  bulk_sync 10                                      = 10
+# The docker-compose stack (one of each, plus sync-once) peaks at 68; add
+# 28 per extra API worker or replica and lower DB_POOL_<NAME>_MAX to fit.
+DEFAULT_POOL_CONFIGS: dict[str, PoolConfig] = {
+    "interactive": PoolConfig(
+        name="interactive", min_size=2, max_size=10,
+        command_timeout=30.0, acquire_timeout=10.0,
+    ),
+    "bulk_sync": PoolConfig(
+        name="bulk_sync", min_size=1, max_size=10,
+        command_timeout=300.0, acquire_timeout=120.0,
+    ),
+    "export": PoolConfig(
+        name="export", min_size=0, max_size=3,
+        command_timeout=300.0, acquire_timeout=60.0,
+    ),
+    "agent": PoolConfig(
+        name="agent", min_size=0, max_size=5,
+        command_timeout=60.0, acquire_timeout=15.0,
+    ),
+}
+
+
+@dataclass
+class PoolMetrics:
+    """Acquire-latency and wait-queue counters for one pool."""
+
+    # Upper bounds (ms) of the acquire latency histogram buckets
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    acquires: int = 0
+    timeouts: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    peak_waiting: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(PoolMetrics.BUCKETS_MS) + 1))
+
+    def record_acquire(self, wait_seconds: float) -> None:
+        self.acquires += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        wait_ms = wait_seconds * 1000
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if wait_ms <= bound:
+                self.histogram[i] += 1
+                return
+        self.histogram[-1] += 1
+
+    def percentile_ms(self, pct: float) -> float:
+        """Approximate acquire latency percentile (bucket upper bound)."""
+        if not self.acquires:
+            return 0.0
+        target = self.acquires * pct
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return float(self.BUCKETS_MS[i]) if i < len(self.BUCKETS_MS) else self.max_wait_seconds * 1000
+        return self.max_wait_seconds * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"le_{b}ms" for b in self.BUCKETS_MS] + ["gt_5000ms"]
+        return {
+            "acquires": self.acquires,
+            "timeouts": self.timeouts,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "peak_waiting": self.peak_waiting,
+            "avg_wait_ms": (self.total_wait_seconds / self.acquires * 1000) if self.acquires else 0.0,
+            "p50_wait_ms": self.percentile_ms(0.50),
+            "p99_wait_ms": self.percentile_ms(0.99),
+            "max_wait_ms": self.max_wait_seconds * 1000,
+            "wait_histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class _InstrumentedAcquire:
+    """Awaitable / async context manager returned by InstrumentedPool.acquire().
+
+    Mirrors asyncpg's PoolAcquireContext so both `await pool.acquire()`
+    and `async with pool.acquire() as conn` keep working.
+    """
+
+    __slots__ = ("_pool", "_timeout", "_conn")
+
+    def __init__(self, pool: "InstrumentedPool", timeout: Optional[float]):
+        self._pool = pool
+        self._timeout = timeout
+        self._conn = None
+
+    def __await__(self):
+        return self._pool._acquire(self._timeout).__await__()
+
+    async def __aenter__(self):
+        self._conn = await self._pool._acquire(self._timeout)
+        return self._conn
+
+    async def __aexit__(self, *exc_info):
+        conn, self._conn = self._conn, None
+        await self._pool.release(conn)
+
+
+class InstrumentedPool:
+    """asyncpg pool wrapper that records acquire latency and queue depth.
+
+    Drop-in for asyncpg.Pool in this codebase: acquire()/release() and the
+    fetch/execute shortcuts are instrumented, everything else is delegated.
+    """
+
+    def __init__(self, pool, config: PoolConfig):
+        self._pool = pool
+        self.config = config
+        self.metrics = PoolMetrics()
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def raw_pool(self):
+        """The underlying asyncpg.Pool."""
+        return self._pool
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _InstrumentedAcquire:
+        return _InstrumentedAcquire(self, timeout)
+
+    async def _acquire(self, timeout: Optional[float]):
+        metrics = self.metrics
+        metrics.waiting += 1
+        metrics.peak_waiting = max(metrics.peak_waiting, metrics.waiting)
+        start = time.perf_counter()
+        try:
+            conn = await self._pool.acquire(
+                timeout=timeout if timeout is not None else self.config.acquire_timeout
+            )
+        except asyncio.TimeoutError:
+            metrics.timeouts += 1
+            logger.warning(
+                f"Timed out acquiring connection from '{self.name}' pool "
+                f"({metrics.in_use} in use, {metrics.waiting - 1} other waiters)"
+            )
+            raise
+        finally:
+            metrics.waiting -= 1
+        waited = time.perf_counter() - start
+        metrics.record_acquire(waited)
+        get_query_metrics().record_pool_wait(waited)
+        metrics.in_use += 1
+        return conn
+
+    async def release(self, connection, *, timeout: Optional[float] = None) -> None:
+        if connection is None:
+            return
+        self.metrics.in_use -= 1
+        await self._pool.release(connection, timeout=timeout)
+
+    async def execute(self, query: str, *args, timeout: Optional[float] = None):
+        async with self.acquire() as conn:
+            return await conn.execute(query, *args, timeout=timeout)
+
+    async def executemany(self, command: str, args, *, timeout: Optional[float] = None):
+        async with self.acquire() as conn:
+            return await conn.executemany(command, args, timeout=timeout)
+
+    async def fetch(self, query: str, *args, timeout: Optional[float] = None, **kwargs):
+        async with self.acquire() as conn:
+            return await conn.fetch(query, *args, timeout=timeout, **kwargs)
+
+    async def fetchrow(self, query: str, *args, timeout: Optional[float] = None, **kwargs):
+        async with self.acquire() as conn:
+            return await conn.fetchrow(query, *args, timeout=timeout, **kwargs)
+
+    async def fetchval(self, query: str, *args, column: int = 0, timeout: Optional[float] = None):
+        async with self.acquire() as conn:
+            return await conn.fetchval(query, *args, column=column, timeout=timeout)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Pool size and acquire metrics."""
+        return {
+            "name": self.name,
+            "size": self._pool.get_size(),
+            "idle": self._pool.get_idle_size(),
+            "min_size": self.config.min_size,
+            "max_size": self.config.max_size,
+            **self.metrics.to_dict(),
+        }
+
+    def __getattr__(self, item):
+        return getattr(self._pool, item)
+
+
+async def create_named_pool(
+    database_url: str,
+    config: PoolConfig,
+    **kwargs,
+) -> InstrumentedPool:
+    """Create an instrumented pool from a PoolConfig.
+
+    Args:
+        database_url: PostgreSQL connection string
+        config: Pool settings
+        **kwargs: Additional asyncpg.create_pool arguments
+
+    Returns:
+        InstrumentedPool wrapping an asyncpg.Pool
+
+    Raises:
+        ConnectionPoolError: If pool creation fails
+    """
+    pool = await create_pool(
+        database_url,
+        min_size=config.min_size,
+        max_size=config.max_size,
+        command_timeout=config.command_timeout,
+        statement_cache_size=config.statement_cache_size,
+        max_cached_statement_lifetime=config.max_cached_statement_lifetime,
+        max_inactive_connection_lifetime=config.max_inactive_connection_lifetime,
+        **kwargs,
+    )
+    logger.info(f"Pool '{config.name}' ready")
+    return InstrumentedPool(pool, config)
+
+
+class PoolRegistry:
+    """Named pools for one process.
+
+    Each workload gets its own pool so one can saturate without stalling
+    the others. Unknown or unconfigured names fall back to the default pool.
+
+    Example:
+        pools = PoolRegistry(os.environ["DATABASE_URL"])
+        await pools.start(["interactive", "bulk_sync"])
+        async with pools.get("bulk_sync").acquire() as conn:
+            ...
+        await pools.close()
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        configs: Optional[dict[str, PoolConfig]] = None,
+        default: str = "interactive",
+    ):
+        self.database_url = database_url
+        self.configs = dict(configs or DEFAULT_POOL_CONFIGS)
+        self.default = default
+        self._pools: dict[str, InstrumentedPool] = {}
+
+    async def start(self, names: Optional[list[str]] = None, **kwargs) -> "PoolRegistry":
+        """Create the named pools (all configured pools if names is None)."""
+        for name in names or list(self.configs):
+            if name in self._pools:
+                continue
+            config = self.configs.get(name, PoolConfig(name=name)).with_env_overrides()
+            self._pools[name] = await create_named_pool(self.database_url, config, **kwargs)
+        return self
+
+    def get(self, name: Optional[str] = None) -> InstrumentedPool:
+        """Get a pool by name, falling back to the default pool."""
+        pool = self._pools.get(name or self.default) or self._pools.get(self.default)
+        if pool is None:
+            raise ConnectionPoolError(f"Database pool '{name or self.default}' is not initialized")
+        return pool
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pools
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Metrics for every pool, keyed by name."""
+        return {name: pool.get_metrics() for name, pool in self._pools.items()}
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Close all pools."""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await close_pool(pool.raw_pool, timeout=timeout)
+
+
 # ============================================
 # Health Check
 # ============================================
@@ -390,12 +763,15 @@ async def check_database_health(pool) -> dict[str, Any]:
             pool_size = pool.get_size()
             pool_free = pool.get_idle_size()
 
-            return {
+            health = {
                 "healthy": result == 1,
                 "pool_size": pool_size,
                 "pool_free": pool_free,
                 "pool_used": pool_size - pool_free,
             }
+            if isinstance(pool, InstrumentedPool):
+                health["pool_metrics"] = pool.get_metrics()
+            return health
 
     except Exception as e:
         return {
@@ -416,4 +792,11 @@ __all__ = [
     "create_pool",
     "close_pool",
     "check_database_health",
+    "PoolConfig",
+    "PoolMetrics",
+    "InstrumentedPool",
+    "PoolRegistry",
+    "DEFAULT_POOL_CONFIGS",
+    "create_named_pool",
+    "affected_rows",
 ]
@@ -55,6 +55,7 @@ from .exceptions import (
     DeviceLimitError,
     ValidationError,
 )
+from .resilience import AdaptiveRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +128,15 @@ class DeviceManager:
         """
         self.client = client
 
+    @property
+    def rate_limiter(self) -> Optional[AdaptiveRateLimiter]:
+        """Adaptive rate limiter shared with the underlying GLPClient.
+
+        Pass this to ApplyAssignmentsUseCase/DeviceActionsUseCase so batch
+        pacing draws from the same budget as the client's requests.
+        """
+        return getattr(self.client, "rate_limiter", None)
+
     # ----------------------------------------
     # Validation Helpers
     # ----------------------------------------
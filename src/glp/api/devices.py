@@ -39,7 +39,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from .client import DEVICES_PAGINATION, GLPClient
+from .client import DEVICES_PAGINATION, GLPClient, PaginationConfig
 from .database import database_transaction
 from .exceptions import (
     ConnectionPoolError,
@@ -80,6 +80,7 @@ class DeviceSyncer:
         *,
         use_clean_architecture: bool = True,
         use_streaming: bool = False,
+        pagination: Optional[PaginationConfig] = None,
     ):
         """Initialize DeviceSyncer.
 
@@ -91,9 +92,11 @@ class DeviceSyncer:
             use_streaming: If True, use streaming mode for memory-efficient
                           sync of large datasets (100K+ devices). Processes
                           page by page instead of loading all into memory.
+            pagination: Page size and inter-page delay (defaults to DEVICES_PAGINATION)
         """
         self.client = client
         self.db_pool = db_pool
+        self.pagination = pagination or DEVICES_PAGINATION
         self._use_clean_architecture = use_clean_architecture
         self._use_streaming = use_streaming
 
@@ -101,9 +104,10 @@ class DeviceSyncer:
         self._use_case: SyncDevicesUseCase | None = None
         if db_pool and use_clean_architecture:
             self._use_case = SyncDevicesUseCase(
-                device_api=GLPDeviceAPI(client),
+                device_api=GLPDeviceAPI(client, pagination_config=self.pagination),
                 device_repo=PostgresDeviceRepository(db_pool),
                 field_mapper=DeviceFieldMapper(),
+                direct_records=True,
             )
 
     # ----------------------------------------
@@ -122,7 +126,7 @@ class DeviceSyncer:
         """
         return await self.client.fetch_all(
             self.ENDPOINT,
-            config=DEVICES_PAGINATION,
+            config=self.pagination,
         )
 
     async def fetch_devices_generator(self):
@@ -136,7 +140,7 @@ class DeviceSyncer:
         """
         async for page in self.client.paginate(
             self.ENDPOINT,
-            config=DEVICES_PAGINATION,
+            config=self.pagination,
         ):
             yield page
 
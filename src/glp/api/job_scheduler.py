@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""Independent sync jobs with their own intervals, dependencies and locks.
+
+The scheduler used to run one sync cycle (subscriptions, then devices and
+Aruba Central in parallel) on a single interval, so volatile data (Central
+status, clients) was refreshed as rarely as slow-changing subscriptions,
+and one slow source delayed all the others. JobScheduler runs each source
+as a separate SyncJob instead:
+    - Own interval, with +/- jitter so replicas and jobs drift apart
+      instead of hitting the APIs together
+    - Dependencies: a job waits until every job it depends on is idle and
+      its last run succeeded (devices after subscriptions, for the
+      device_subscriptions foreign key)
+    - Single flight: each run holds a PostgreSQL advisory lock on the job
+      (and a shared lock on its dependencies), so several scheduler
+      replicas never sync the same source at once; a replica that loses
+      the race skips that run
+    - Failed runs are retried with exponential backoff, capped at the
+      job's interval
+    - Per-job health (JobState): last outcome, error, duration, next run
+      and staleness, served by the scheduler's health endpoint
+
+Advisory locks are session-level, so the lock connection must not go
+through a transaction-mode pooler (pgbouncer).
+
+Example:
+    scheduler = JobScheduler(
+        [
+            SyncJob("subscriptions", sync_subscriptions, interval_seconds=6 * 3600),
+            SyncJob("devices", sync_devices, 3600, depends_on=("subscriptions",)),
+        ],
+        locks=AdvisoryLocks(db_pool),
+    )
+    await scheduler.run(shutdown_event)
+
+Author: HPE GreenLake Team
+"""
+import asyncio
+import hashlib
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# A job whose last success is older than this many intervals is stale
+STALE_INTERVALS = 3
+
+# How often a job waiting on a dependency re-checks it
+DEPENDENCY_POLL_SECONDS = 30.0
+
+
+# ============================================
+# Jobs
+# ============================================
+
+@dataclass
+class SyncJob:
+    """One independently scheduled sync.
+
+    Args:
+        name: Job name, also the advisory lock name
+        run: Coroutine function performing one sync; raises on failure
+        interval_seconds: Time between the end of one run and the next
+        jitter: Fraction of the interval added or removed at random
+        depends_on: Jobs that must be idle and last have succeeded
+        retry_delay_seconds: Delay after the first failure, doubled after
+            each further failure up to interval_seconds
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    interval_seconds: float
+    jitter: float = 0.1
+    depends_on: tuple[str, ...] = ()
+    retry_delay_seconds: float = 300.0
+
+
+@dataclass
+class JobState:
+    """Runtime state and health of one job."""
+
+    name: str
+    interval_seconds: float
+    depends_on: tuple[str, ...] = ()
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    skipped_locked: int = 0
+    running: bool = False
+    waiting_on: Optional[str] = None
+    last_outcome: Optional[str] = None  # "success", "failed" or "locked"
+    last_error: Optional[str] = None
+    last_result: Any = None
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    next_run_at: Optional[datetime] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def satisfies_dependents(self) -> bool:
+        """Whether jobs depending on this one may run now.
+
+        A run skipped because another replica holds the lock counts: that
+        replica is syncing the source, and the shared lock taken by the
+        dependent waits for it.
+        """
+        return not self.running and self.last_outcome in ("success", "locked")
+
+    def is_stale(self, now: Optional[datetime] = None) -> bool:
+        """No success (or lock skip) within STALE_INTERVALS intervals."""
+        now = now or datetime.now(UTC)
+        reference = self.last_success_at or self.created_at
+        if self.last_outcome == "locked" and self.last_finished_at:
+            reference = max(reference, self.last_finished_at)
+        return now - reference > timedelta(seconds=self.interval_seconds * STALE_INTERVALS)
+
+    @property
+    def healthy(self) -> bool:
+        return self.consecutive_failures == 0 and not self.is_stale()
+
+    def to_dict(self) -> dict[str, Any]:
+        def iso(value: Optional[datetime]) -> Optional[str]:
+            return value.isoformat() if value else None
+
+        return {
+            "healthy": self.healthy,
+            "stale": self.is_stale(),
+            "running": self.running,
+            "waiting_on": self.waiting_on,
+            "interval_seconds": self.interval_seconds,
+            "depends_on": list(self.depends_on),
+            "runs": self.runs,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "skipped_locked": self.skipped_locked,
+            "last_outcome": self.last_outcome,
+            "last_error": self.last_error,
+            "last_started_at": iso(self.last_started_at),
+            "last_finished_at": iso(self.last_finished_at),
+            "last_success_at": iso(self.last_success_at),
+            "last_duration_seconds": self.last_duration_seconds,
+            "next_run_at": iso(self.next_run_at),
+        }
+
+
+# ============================================
+# Advisory Locks
+# ============================================
+
+class AdvisoryLocks:
+    """PostgreSQL session advisory locks, one per job name.
+
+    All locks are taken on one connection held for the scheduler's
+    lifetime, so a sync never waits for a pool connection to release its
+    lock. If that connection is lost, PostgreSQL drops its locks; the next
+    acquire opens a new one.
+
+    Args:
+        pool: asyncpg (or InstrumentedPool) pool to take the connection from
+        namespace: Prefix hashed into every lock key
+    """
+
+    def __init__(self, pool, namespace: str = "glp_sync"):
+        self.pool = pool
+        self.namespace = namespace
+        self._conn = None
+        self._lock = asyncio.Lock()
+
+    def key(self, name: str) -> int:
+        """Stable signed 64-bit lock key for a job name."""
+        digest = hashlib.blake2b(f"{self.namespace}:{name}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big", signed=True)
+
+    async def _connection(self):
+        if self._conn is not None and self._conn.is_closed():
+            conn, self._conn = self._conn, None
+            try:
+                await self.pool.release(conn)
+            except Exception as e:
+                logger.debug(f"Releasing closed lock connection failed: {e}")
+        if self._conn is None:
+            self._conn = await self.pool.acquire()
+        return self._conn
+
+    async def try_acquire(self, name: str, shared: tuple[str, ...] = ()) -> bool:
+        """Take the exclusive lock on name and shared locks on its dependencies.
+
+        Returns:
+            False, holding nothing, if any of the locks is held elsewhere
+        """
+        async with self._lock:
+            conn = await self._connection()
+            if not await conn.fetchval("SELECT pg_try_advisory_lock($1)", self.key(name)):
+                return False
+            taken: list[str] = []
+            for dependency in shared:
+                if not await conn.fetchval(
+                    "SELECT pg_try_advisory_lock_shared($1)", self.key(dependency)
+                ):
+                    for held in taken:
+                        await conn.execute("SELECT pg_advisory_unlock_shared($1)", self.key(held))
+                    await conn.execute("SELECT pg_advisory_unlock($1)", self.key(name))
+                    return False
+                taken.append(dependency)
+            return True
+
+    async def release(self, name: str, shared: tuple[str, ...] = ()) -> None:
+        """Release the locks taken by try_acquire()."""
+        async with self._lock:
+            conn = self._conn
+            if conn is None or conn.is_closed():
+                # The session is gone and its locks with it
+                return
+            for dependency in shared:
+                await conn.execute("SELECT pg_advisory_unlock_shared($1)", self.key(dependency))
+            await conn.execute("SELECT pg_advisory_unlock($1)", self.key(name))
+
+    async def close(self) -> None:
+        """Return the lock connection to the pool, releasing every lock."""
+        async with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                await self.pool.release(conn)
+
+
+# ============================================
+# Scheduler
+# ============================================
+
+class JobScheduler:
+    """Runs SyncJobs on their own schedules until shutdown.
+
+    Args:
+        jobs: Jobs to run; dependencies on jobs not in this list are ignored
+        locks: Advisory locks for single-flight across replicas (None runs
+            without, e.g. in fetch-only mode)
+        max_concurrent: Jobs allowed to run at the same time
+        run_on_startup: Run every job once at startup instead of after
+            its first interval
+        on_finished: Called with the JobState after every run
+        dependency_poll_seconds: Re-check interval while waiting on a
+            dependency held by another replica
+    """
+
+    def __init__(
+        self,
+        jobs: list[SyncJob],
+        locks: Optional[AdvisoryLocks] = None,
+        max_concurrent: int = 2,
+        run_on_startup: bool = True,
+        on_finished: Optional[Callable[[JobState], None]] = None,
+        dependency_poll_seconds: float = DEPENDENCY_POLL_SECONDS,
+    ):
+        self.jobs = {job.name: job for job in jobs}
+        self.locks = locks
+        self.run_on_startup = run_on_startup
+        self.on_finished = on_finished
+        self.dependency_poll_seconds = dependency_poll_seconds
+        self.states = {
+            job.name: JobState(
+                job.name,
+                job.interval_seconds,
+                tuple(d for d in job.depends_on if d in self.jobs),
+            )
+            for job in jobs
+        }
+        self._slots = asyncio.Semaphore(max(1, max_concurrent))
+        self._changed = asyncio.Condition()
+
+    def _dependencies(self, job: SyncJob) -> tuple[str, ...]:
+        return self.states[job.name].depends_on
+
+    def _delay(self, job: SyncJob, state: JobState) -> float:
+        """Seconds until the next run after the one that just finished."""
+        if state.last_outcome == "failed":
+            base = min(
+                job.retry_delay_seconds * 2 ** (state.consecutive_failures - 1),
+                job.interval_seconds,
+            )
+        else:
+            base = job.interval_seconds
+        return max(0.0, base * (1 + random.uniform(-job.jitter, job.jitter)))
+
+    async def run_job(self, job: SyncJob) -> JobState:
+        """Run one job once, under its advisory locks.
+
+        Returns:
+            The job's updated state
+        """
+        state = self.states[job.name]
+        dependencies = self._dependencies(job)
+        state.running = True
+        state.last_started_at = datetime.now(UTC)
+        locked = False
+        try:
+            if self.locks is not None:
+                locked = await self.locks.try_acquire(job.name, dependencies)
+                if not locked:
+                    logger.info(f"Sync job '{job.name}' is running elsewhere, skipping this run")
+                    state.skipped_locked += 1
+                    state.last_outcome = "locked"
+                    return state
+
+            logger.info(f"Sync job '{job.name}' started")
+            state.runs += 1
+            state.last_result = await job.run()
+            state.last_outcome = "success"
+            state.last_error = None
+            state.consecutive_failures = 0
+            state.last_success_at = datetime.now(UTC)
+            logger.info(f"Sync job '{job.name}' completed")
+        except Exception as e:
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.last_outcome = "failed"
+            state.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"Sync job '{job.name}' failed: {state.last_error}", exc_info=True)
+        finally:
+            if locked:
+                try:
+                    await self.locks.release(job.name, dependencies)
+                except Exception as e:
+                    logger.warning(f"Releasing lock for sync job '{job.name}' failed: {e}")
+            state.running = False
+            state.last_finished_at = datetime.now(UTC)
+            state.last_duration_seconds = (
+                state.last_finished_at - state.last_started_at
+            ).total_seconds()
+            async with self._changed:
+                self._changed.notify_all()
+            if self.on_finished is not None:
+                self.on_finished(state)
+        return state
+
+    async def _wait_for_dependencies(self, job: SyncJob, shutdown_event: asyncio.Event) -> bool:
+        """Wait until every dependency satisfies dependents.
+
+        Returns:
+            False if shutdown was requested while waiting
+        """
+        state = self.states[job.name]
+
+        def blocking() -> Optional[str]:
+            for name in self._dependencies(job):
+                if not self.states[name].satisfies_dependents:
+                    return name
+            return None
+
+        while (dependency := blocking()) is not None:
+            if state.waiting_on != dependency:
+                logger.info(f"Sync job '{job.name}' waiting for '{dependency}'")
+            state.waiting_on = dependency
+            async with self._changed:
+                try:
+                    await asyncio.wait_for(
+                        self._changed.wait(), timeout=self.dependency_poll_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            if shutdown_event.is_set():
+                return False
+        state.waiting_on = None
+        return True
+
+    async def _job_loop(self, job: SyncJob, shutdown_event: asyncio.Event) -> None:
+        state = self.states[job.name]
+        delay = 0.0 if self.run_on_startup else self._delay(job, state)
+
+        while not shutdown_event.is_set():
+            state.next_run_at = datetime.now(UTC) + timedelta(seconds=delay)
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            if not await self._wait_for_dependencies(job, shutdown_event):
+                break
+            async with self._slots:
+                await self.run_job(job)
+
+            delay = self._delay(job, state)
+            logger.info(
+                f"Sync job '{job.name}' next run in {delay / 60:.1f} minutes "
+                f"({state.last_outcome})"
+            )
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """Run every job until shutdown_event is set.
+
+        Runs in progress when shutdown is requested are allowed to finish.
+        """
+        logger.info(
+            "Starting sync jobs: "
+            + ", ".join(f"{job.name} every {job.interval_seconds / 60:g}m" for job in self.jobs.values())
+        )
+
+        async def wake_on_shutdown() -> None:
+            # Jobs waiting on a dependency wait on the condition, not the event
+            await shutdown_event.wait()
+            async with self._changed:
+                self._changed.notify_all()
+
+        waker = asyncio.create_task(wake_on_shutdown())
+        try:
+            await asyncio.gather(*(self._job_loop(job, shutdown_event) for job in self.jobs.values()))
+        finally:
+            waker.cancel()
+            if self.locks is not None:
+                await self.locks.close()
+
+    @property
+    def healthy(self) -> bool:
+        """No job failing or stale."""
+        return all(state.healthy for state in self.states.values())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-job state, keyed by job name."""
+        return {name: state.to_dict() for name, state in self.states.items()}
+
+
+__all__ = [
+    "AdvisoryLocks",
+    "JobScheduler",
+    "JobState",
+    "SyncJob",
+]
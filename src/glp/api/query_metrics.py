@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""Always-on query instrumentation for asyncpg pools.
+
+Every pool created through database.create_pool uses InstrumentedConnection,
+so every statement run by the routers, syncers, MCP tools and the scheduler
+is recorded without routing it through a profiler wrapper:
+    - Per-normalized-statement call counts, errors, rows and a latency
+      histogram (literals are replaced by "?" so "id = 5" and "id = 6"
+      share one entry)
+    - Per-scope (HTTP route, MCP tool, scheduler job) query counts, database
+      time and pool wait time
+    - N+1 detection: a scope that runs the same statement
+      QUERY_N_PLUS_ONE_THRESHOLD times or more is reported
+
+Recording costs a cached normalization lookup, a dict lookup and a few
+additions per statement (see `python benchmark.py --query-metrics`), so it
+stays enabled in production. Set QUERY_METRICS_ENABLED=false to create
+pools with the plain asyncpg connection class instead.
+
+Example:
+    metrics = get_query_metrics()
+    with metrics.scope("GET /api/devices"):
+        await handler()
+    metrics.snapshot()["statements"][:5]
+
+Author: HPE GreenLake Team
+"""
+import bisect
+import logging
+import os
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+QUERY_METRICS_ENABLED = os.getenv("QUERY_METRICS_ENABLED", "true").lower() == "true"
+
+# Upper bounds (ms) of the statement latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Statements beyond this many distinct shapes are folded into one entry
+MAX_STATEMENTS = 500
+MAX_SCOPES = 200
+OVERFLOW_KEY = "<other>"
+
+
+# ============================================
+# Statement Normalization
+# ============================================
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+# Numbers that are not part of an identifier or a $n placeholder
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+
+
+@lru_cache(maxsize=4096)
+def normalize_statement(query: str) -> str:
+    """Reduce a SQL statement to its shape.
+
+    Collapses whitespace and replaces string and numeric literals with "?"
+    and literal lists with "(?)", so statements that differ only in inlined
+    values share one metrics entry. $n placeholders are kept.
+    """
+    text = _WHITESPACE.sub(" ", query).strip()
+    text = _STRING_LITERAL.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _VALUE_LIST.sub("(?)", text)
+    return text[:1000]
+
+
+def _status_rows(status: Any) -> int:
+    """Row count from a command status such as "UPDATE 3" or "COPY 100"."""
+    if not status:
+        return 0
+    count = str(status).rsplit(" ", 1)[-1]
+    return int(count) if count.isdigit() else 0
+
+
+# ============================================
+# Statistics
+# ============================================
+
+@dataclass
+class StatementStats:
+    """Counters and latency histogram for one normalized statement."""
+
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def record(self, seconds: float, rows: int, error: bool) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        if error:
+            self.errors += 1
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    def percentile_ms(self, pct: float) -> float:
+        """Approximate latency percentile (bucket upper bound)."""
+        if not self.calls:
+            return 0.0
+        target = self.calls * pct
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_seconds * 1000
+        return self.max_seconds * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"le_{b}ms" for b in LATENCY_BUCKETS_MS] + ["gt_5000ms"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": self.total_seconds * 1000,
+            "avg_ms": (self.total_seconds / self.calls * 1000) if self.calls else 0.0,
+            "p50_ms": self.percentile_ms(0.50),
+            "p99_ms": self.percentile_ms(0.99),
+            "max_ms": self.max_seconds * 1000,
+            "latency_histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+@dataclass
+class ScopeStats:
+    """Aggregate query load of one scope name (route, tool or job)."""
+
+    runs: int = 0
+    queries: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    max_queries: int = 0
+    n_plus_one: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "queries": self.queries,
+            "avg_queries": self.queries / self.runs if self.runs else 0.0,
+            "max_queries": self.max_queries,
+            "db_ms": self.db_seconds * 1000,
+            "pool_wait_ms": self.pool_wait_seconds * 1000,
+            "n_plus_one": self.n_plus_one,
+        }
+
+
+class QueryScope:
+    """Queries run by one request, tool call or job.
+
+    Child tasks started inside the scope inherit it, so parallel work is
+    attributed to the scope that spawned it.
+    """
+
+    __slots__ = ("name", "queries", "db_seconds", "pool_wait_seconds", "statements")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.statements: dict[str, int] = {}
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least threshold times, most frequent first."""
+        hits = [(sql, n) for sql, n in self.statements.items() if n >= threshold]
+        return sorted(hits, key=lambda item: item[1], reverse=True)
+
+
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar("query_scope", default=None)
+
+
+def current_scope() -> Optional[QueryScope]:
+    """The QueryScope of the running request/tool/job, if any."""
+    return _current_scope.get()
+
+
+# ============================================
+# Registry
+# ============================================
+
+class QueryMetrics:
+    """Process-wide statement and scope metrics.
+
+    Args:
+        n_plus_one_threshold: Repetitions of one statement within a scope
+            that count as an N+1 pattern
+        max_statements: Distinct statement shapes kept before new ones are
+            folded into "<other>"
+        max_events: N+1 events kept for the endpoint
+    """
+
+    def __init__(
+        self,
+        n_plus_one_threshold: Optional[int] = None,
+        max_statements: int = MAX_STATEMENTS,
+        max_events: int = 100,
+    ):
+        if n_plus_one_threshold is None:
+            n_plus_one_threshold = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", "10"))
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_statements = max_statements
+        self.statements: dict[str, StatementStats] = {}
+        self.scopes: dict[str, ScopeStats] = {}
+        self.n_plus_one_events: deque = deque(maxlen=max_events)
+        self.started_at = datetime.now(timezone.utc)
+
+    def record(self, query: str, seconds: float, rows: int = 0, error: bool = False) -> None:
+        """Record one executed statement."""
+        key = normalize_statement(query)
+        stats = self.statements.get(key)
+        if stats is None:
+            if len(self.statements) >= self.max_statements:
+                key = OVERFLOW_KEY
+                stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = StatementStats()
+        stats.record(seconds, rows, error)
+
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.queries += 1
+            scope.db_seconds += seconds
+            scope.statements[key] = scope.statements.get(key, 0) + 1
+
+    def record_pool_wait(self, seconds: float) -> None:
+        """Attribute connection acquire time to the current scope."""
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.pool_wait_seconds += seconds
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[QueryScope]:
+        """Attribute queries run inside the block to name.
+
+        Nested scopes are merged into the outermost one.
+        """
+        if _current_scope.get() is not None:
+            yield _current_scope.get()
+            return
+
+        scope = QueryScope(name)
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            self._finish(scope)
+
+    def _finish(self, scope: QueryScope) -> None:
+        stats = self.scopes.get(scope.name)
+        if stats is None:
+            key = scope.name if len(self.scopes) < MAX_SCOPES else OVERFLOW_KEY
+            stats = self.scopes.setdefault(key, ScopeStats())
+        stats.runs += 1
+        stats.queries += scope.queries
+        stats.db_seconds += scope.db_seconds
+        stats.pool_wait_seconds += scope.pool_wait_seconds
+        stats.max_queries = max(stats.max_queries, scope.queries)
+
+        repeated = scope.repeated(self.n_plus_one_threshold)
+        if not repeated:
+            return
+        stats.n_plus_one += 1
+        for statement, count in repeated:
+            self.n_plus_one_events.append({
+                "scope": scope.name,
+                "statement": statement,
+                "count": count,
+                "scope_queries": scope.queries,
+                "at": datetime.now(timezone.utc).isoformat(),
+            })
+        statement, count = repeated[0]
+        logger.warning(
+            f"Possible N+1 in '{scope.name}': statement ran {count} times "
+            f"({scope.queries} queries total): {statement[:200]}"
+        )
+
+    def top_statements(self, limit: int = 20, order_by: str = "total_ms") -> list[dict[str, Any]]:
+        """Statements sorted by total time (or calls/max_ms/p99_ms)."""
+        rows = [{"statement": sql, **stats.to_dict()} for sql, stats in self.statements.items()]
+        rows.sort(key=lambda row: row.get(order_by, 0), reverse=True)
+        return rows[:limit]
+
+    def snapshot(self, limit: int = 50, order_by: str = "total_ms") -> dict[str, Any]:
+        """Metrics for the /health/queries endpoints."""
+        return {
+            "enabled": QUERY_METRICS_ENABLED,
+            "since": self.started_at.isoformat(),
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "statement_count": len(self.statements),
+            "total_queries": sum(s.calls for s in self.statements.values()),
+            "statements": self.top_statements(limit, order_by),
+            "scopes": {name: stats.to_dict() for name, stats in self.scopes.items()},
+            "n_plus_one": list(self.n_plus_one_events),
+        }
+
+    def reset(self) -> None:
+        """Drop all collected metrics."""
+        self.statements.clear()
+        self.scopes.clear()
+        self.n_plus_one_events.clear()
+        self.started_at = datetime.now(timezone.utc)
+
+
+_query_metrics: Optional[QueryMetrics] = None
+
+
+def get_query_metrics() -> QueryMetrics:
+    """The process-wide QueryMetrics registry."""
+    global _query_metrics
+    if _query_metrics is None:
+        _query_metrics = QueryMetrics()
+    return _query_metrics
+
+
+# ============================================
+# ASGI Middleware
+# ============================================
+
+class QueryMetricsMiddleware:
+    """ASGI middleware that runs each HTTP request in a query scope.
+
+    The scope is named "<METHOD> <route path>" (e.g. "GET /api/devices/{id}")
+    once routing has matched, so path parameters don't create new entries.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = get_query_metrics()
+        query_scope = QueryScope("")
+        token = _current_scope.set(query_scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "<unmatched>"
+            query_scope.name = f"{scope.get('method', 'GET')} {path}"
+            if query_scope.queries:
+                metrics._finish(query_scope)
+
+
+# ============================================
+# Instrumented Connection
+# ============================================
+
+try:
+    import asyncpg
+
+    class InstrumentedConnection(asyncpg.Connection):
+        """asyncpg connection that records every statement in QueryMetrics.
+
+        Covers execute, executemany, fetch, fetchrow, fetchval, fetchmany and
+        copy_records_to_table. Cursors and prepared statements are not
+        timed. The pool's reset query on release is not recorded.
+        """
+
+        __slots__ = ("_record_queries",)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._record_queries = True
+
+        def _record(self, query: str, started: float, rows: int, error: bool = False) -> None:
+            if self._record_queries:
+                get_query_metrics().record(query, time.perf_counter() - started, rows, error)
+
+        async def execute(self, query: str, *args, timeout: Optional[float] = None) -> str:
+            started = time.perf_counter()
+            try:
+                status = await super().execute(query, *args, timeout=timeout)
+            except BaseException:
+                self._record(query, started, 0, error=True)
+                raise
+            self._record(query, started, _status_rows(status))
+            return status
+
+        async def executemany(self, command: str, args, *, timeout: Optional[float] = None):
+            started = time.perf_counter()
+            try:
+                result = await super().executemany(command, args, timeout=timeout)
+            except BaseException:
+                self._record(command, started, 0, error=True)
+                raise
+            self._record(command, started, len(args) if hasattr(args, "__len__") else 0)
+            return result
+
+        async def fetch(self, query: str, *args, timeout=None, record_class=None) -> list:
+            started = time.perf_counter()
+            try:
+                rows = await super().fetch(query, *args, timeout=timeout, record_class=record_class)
+            except BaseException:
+                self._record(query, started, 0, error=True)
+                raise
+            self._record(query, started, len(rows))
+            return rows
+
+        async def fetchrow(self, query: str, *args, timeout=None, record_class=None):
+            started = time.perf_counter()
+            try:
+                row = await super().fetchrow(query, *args, timeout=timeout, record_class=record_class)
+            except BaseException:
+                self._record(query, started, 0, error=True)
+                raise
+            self._record(query, started, 0 if row is None else 1)
+            return row
+
+        async def fetchval(self, query: str, *args, column=0, timeout=None):
+            started = time.perf_counter()
+            try:
+                value = await super().fetchval(query, *args, column=column, timeout=timeout)
+            except BaseException:
+                self._record(query, started, 0, error=True)
+                raise
+            self._record(query, started, 0 if value is None else 1)
+            return value
+
+        async def fetchmany(self, query: str, args, *, timeout=None, record_class=None) -> list:
+            started = time.perf_counter()
+            try:
+                rows = await super().fetchmany(query, args, timeout=timeout, record_class=record_class)
+            except BaseException:
+                self._record(query, started, 0, error=True)
+                raise
+            self._record(query, started, len(rows))
+            return rows
+
+        async def copy_records_to_table(self, table_name, *, records, **kwargs) -> str:
+            statement = f"COPY {table_name} FROM STDIN"
+            started = time.perf_counter()
+            try:
+                status = await super().copy_records_to_table(table_name, records=records, **kwargs)
+            except BaseException:
+                self._record(statement, started, 0, error=True)
+                raise
+            self._record(statement, started, _status_rows(status))
+            return status
+
+        async def reset(self, *, timeout=None):
+            self._record_queries = False
+            try:
+                await super().reset(timeout=timeout)
+            finally:
+                self._record_queries = True
+
+except ImportError:
+    InstrumentedConnection = None
+
+
+# ============================================
+# Exports
+# ============================================
+
+__all__ = [
+    "QUERY_METRICS_ENABLED",
+    "LATENCY_BUCKETS_MS",
+    "normalize_statement",
+    "StatementStats",
+    "ScopeStats",
+    "QueryScope",
+    "QueryMetrics",
+    "QueryMetricsMiddleware",
+    "InstrumentedConnection",
+    "current_scope",
+    "get_query_metrics",
+]
@@ -5,6 +5,7 @@ This module provides resilience patterns to handle transient failures:
     - Retry with exponential backoff
     - Circuit breaker
     - Graceful degradation helpers
+    - Rate limiting (fixed-interval and adaptive token bucket)
 
 These patterns help build fault-tolerant applications that can handle
 network issues, rate limits, and service outages gracefully.
@@ -24,6 +25,8 @@ Author: HPE GreenLake Team
 import asyncio
 import logging
 import random
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import wraps
@@ -1010,14 +1013,19 @@ class SequentialRateLimiter:
         self,
         operation_type: str = "patch",
         custom_interval: float | None = None,
+        limiter: "AdaptiveRateLimiter | None" = None,
     ):
         """Initialize rate limiter.
 
         Args:
             operation_type: "patch" (20/min), "post" (25/min), or "get" (60/min)
             custom_interval: Override the default interval for this operation type
+            limiter: Optional AdaptiveRateLimiter. When provided, each call waits
+                     until the shared bucket for operation_type has budget instead
+                     of sleeping the fixed interval.
         """
         self.operation_type = operation_type
+        self.limiter = limiter
 
         if custom_interval is not None:
             self.interval = custom_interval
@@ -1038,7 +1046,13 @@ class SequentialRateLimiter:
             batch_index: The index of this batch (0-based).
                         First batch (index 0) doesn't wait.
         """
-        if batch_index > 0:
+        if self.limiter is not None:
+            # Adaptive mode: the HTTP client consumes the token when the request
+            # is sent, so we only wait for budget here (no double counting).
+            self._total_wait_time += await self.limiter.wait_until_available(
+                self.operation_type
+            )
+        elif batch_index > 0:
             logger.debug(
                 f"Rate limiter: waiting {self.interval:.1f}s before batch {batch_index + 1} "
                 f"({self.operation_type.upper()} rate limit protection)"
@@ -1068,6 +1082,8 @@ class SequentialRateLimiter:
         """
         if num_batches <= 1:
             return 0.0
+        if self.limiter is not None:
+            return self.limiter.estimate_time(self.operation_type, num_batches)
         return (num_batches - 1) * self.interval
 
     def reset(self) -> None:
@@ -1076,6 +1092,435 @@ class SequentialRateLimiter:
         self._total_wait_time = 0.0
 
 
+# ============================================
+# Adaptive Rate Limiter
+# ============================================
+
+
+@dataclass
+class RateLimitBucket:
+    """Token bucket state for one endpoint class.
+
+    Attributes:
+        rate: Currently allowed requests per second (learned)
+        burst: Maximum tokens that can accumulate (burst size)
+        min_rate: Floor for the learned rate
+        max_rate: Ceiling for the learned rate (lowered when we observe 429s)
+        tokens: Tokens currently available
+        updated_at: Monotonic time of the last refill
+        blocked_until: Monotonic time before which no request may be sent
+    """
+    rate: float
+    burst: int
+    min_rate: float
+    max_rate: float
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+
+    # Metrics
+    requests: int = 0
+    throttled_seconds: float = 0.0
+    rate_limited_responses: int = 0
+    first_request_at: Optional[float] = None
+    last_request_at: Optional[float] = None
+    successes_since_increase: int = 0
+
+    def refill(self, now: float) -> None:
+        """Add tokens accrued since the last refill."""
+        if now > self.updated_at:
+            self.tokens = min(
+                float(self.burst),
+                self.tokens + (now - self.updated_at) * self.rate,
+            )
+            self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        blocked = max(0.0, self.blocked_until - now)
+        deficit = 1.0 - self.tokens
+        token_wait = deficit / self.rate if deficit > 0 else 0.0
+        return max(blocked, token_wait)
+
+    @property
+    def effective_rate(self) -> float:
+        """Observed requests per second since the first request."""
+        if (
+            self.requests < 2
+            or self.first_request_at is None
+            or self.last_request_at is None
+            or self.last_request_at <= self.first_request_at
+        ):
+            return 0.0
+        return (self.requests - 1) / (self.last_request_at - self.first_request_at)
+
+
+class AdaptiveRateLimiter:
+    """Token-bucket rate limiter that learns its rate from API feedback.
+
+    Each endpoint class (GET, PATCH, POST, async-operation status polls) has
+    its own bucket. Requests may burst while tokens are available, then are
+    paced at the bucket's current rate. The rate adapts to what the API tells us:
+
+    - 429 responses: rate is halved (multiplicative decrease), the bucket is
+      blocked for Retry-After seconds, and the rate ceiling is lowered to just
+      below the rate that triggered the 429.
+    - Rate-limit headers (remaining/reset): once fewer than a minute's worth
+      of requests remain, rate is set to the sustainable rate for the rest of
+      the window (never above the configured rate), and blocked if the
+      budget is exhausted.
+    - Successes: rate creeps back up (additive increase) towards the ceiling.
+
+    A single instance is meant to be shared by everything that talks to the
+    same API (GLPClient, DeviceManager, the assignment use cases and the
+    syncers) so they draw from one budget. Use get_shared_rate_limiter().
+
+    Reservations are computed synchronously before sleeping, so concurrent
+    callers on the same event loop are served in FIFO order without a lock.
+
+    Example:
+        limiter = AdaptiveRateLimiter()
+
+        await limiter.acquire("patch")
+        try:
+            await api.patch(batch)
+            limiter.record_success("patch")
+        except RateLimitError as e:
+            limiter.record_rate_limited("patch", e.retry_after)
+
+        print(limiter.get_metrics())
+    """
+
+    # (requests per minute, burst, ceiling requests per minute)
+    # Initial rates carry the same safety margins as SequentialRateLimiter.
+    DEFAULT_LIMITS: dict[str, tuple[float, int, float]] = {
+        "get": (150.0, 10, 160.0),          # Devices API: 160/min
+        "patch": (17.0, 3, 20.0),           # 20/min per workspace
+        "post": (23.0, 3, 25.0),            # 25/min per workspace
+        "async_status": (60.0, 5, 60.0),    # Async operation status polls
+    }
+
+    # Rate never drops below this (requests per minute)
+    MIN_RATE_PER_MINUTE = 1.0
+
+    # Successes required before each additive rate increase
+    INCREASE_AFTER_SUCCESSES = 10
+
+    # Fraction of the ceiling added on each increase
+    INCREASE_STEP = 0.05
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, tuple[float, int, float]]] = None,
+        name: str = "default",
+    ):
+        """Initialize the limiter.
+
+        Args:
+            limits: Optional overrides of DEFAULT_LIMITS, mapping endpoint class
+                    to (requests per minute, burst, ceiling requests per minute)
+            name: Limiter name for logging and metrics
+        """
+        self.name = name
+        self._limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self._buckets: dict[str, RateLimitBucket] = {}
+
+    # ----------------------------------------
+    # Endpoint Classification
+    # ----------------------------------------
+
+    @staticmethod
+    def classify(method: str, endpoint: str) -> str:
+        """Map an HTTP method and endpoint to an endpoint class.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE, ...)
+            endpoint: API endpoint path
+
+        Returns:
+            One of "get", "patch", "post", "async_status"
+        """
+        method = method.upper()
+        if method == "GET":
+            if "async-operations" in endpoint:
+                return "async_status"
+            return "get"
+        if method == "POST":
+            return "post"
+        # PATCH, PUT and DELETE share the write budget
+        return "patch"
+
+    def _bucket(self, endpoint_class: str) -> RateLimitBucket:
+        """Get or lazily create the bucket for an endpoint class."""
+        bucket = self._buckets.get(endpoint_class)
+        if bucket is None:
+            per_minute, burst, ceiling = self._limits.get(
+                endpoint_class, self._limits["get"]
+            )
+            bucket = RateLimitBucket(
+                rate=per_minute / 60.0,
+                burst=burst,
+                min_rate=self.MIN_RATE_PER_MINUTE / 60.0,
+                max_rate=ceiling / 60.0,
+                tokens=float(burst),
+                updated_at=time.monotonic(),
+            )
+            self._buckets[endpoint_class] = bucket
+        return bucket
+
+    # ----------------------------------------
+    # Acquiring Budget
+    # ----------------------------------------
+
+    def reserve(self, endpoint_class: str) -> float:
+        """Reserve one token and return how long the caller must wait.
+
+        The token is deducted immediately (the balance may go negative), so
+        callers that reserve later queue up behind earlier ones.
+
+        Args:
+            endpoint_class: Endpoint class from classify()
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        now = time.monotonic()
+        bucket = self._bucket(endpoint_class)
+        bucket.refill(now)
+        wait = bucket.wait_time(now)
+        bucket.tokens -= 1.0
+
+        send_at = now + wait
+        bucket.requests += 1
+        if bucket.first_request_at is None:
+            bucket.first_request_at = send_at
+        bucket.last_request_at = max(bucket.last_request_at or send_at, send_at)
+        bucket.throttled_seconds += wait
+        return wait
+
+    async def acquire(self, endpoint_class: str) -> float:
+        """Wait until a request of this class may be sent, consuming a token.
+
+        Args:
+            endpoint_class: Endpoint class from classify()
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(endpoint_class)
+        if wait > 0:
+            logger.debug(
+                f"Rate limiter '{self.name}': waiting {wait:.2f}s for "
+                f"{endpoint_class.upper()} budget"
+            )
+            await asyncio.sleep(wait)
+        return wait
+
+    async def wait_until_available(self, endpoint_class: str) -> float:
+        """Wait until the bucket has budget, without consuming a token.
+
+        Used by callers that pace their own loop while the HTTP client
+        consumes the token when the request is actually sent.
+
+        Args:
+            endpoint_class: Endpoint class from classify()
+
+        Returns:
+            Seconds spent waiting
+        """
+        now = time.monotonic()
+        bucket = self._bucket(endpoint_class)
+        bucket.refill(now)
+        wait = bucket.wait_time(now)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def estimate_time(self, endpoint_class: str, num_requests: int) -> float:
+        """Estimate wait time for N requests at the current learned rate.
+
+        Args:
+            endpoint_class: Endpoint class from classify()
+            num_requests: Number of requests to send
+
+        Returns:
+            Estimated wait time in seconds (excludes API call time)
+        """
+        now = time.monotonic()
+        bucket = self._bucket(endpoint_class)
+        bucket.refill(now)
+        paced = max(0.0, num_requests - max(bucket.tokens, 0.0))
+        return max(0.0, bucket.blocked_until - now) + paced / bucket.rate
+
+    # ----------------------------------------
+    # Feedback From Responses
+    # ----------------------------------------
+
+    def record_success(self, endpoint_class: str) -> None:
+        """Record a successful response (additive rate increase)."""
+        bucket = self._bucket(endpoint_class)
+        bucket.successes_since_increase += 1
+        if (
+            bucket.successes_since_increase >= self.INCREASE_AFTER_SUCCESSES
+            and bucket.rate < bucket.max_rate
+        ):
+            bucket.refill(time.monotonic())
+            bucket.rate = min(
+                bucket.max_rate, bucket.rate + bucket.max_rate * self.INCREASE_STEP
+            )
+            bucket.successes_since_increase = 0
+
+    def record_rate_limited(
+        self,
+        endpoint_class: str,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Record a 429 response (multiplicative decrease and block).
+
+        Args:
+            endpoint_class: Endpoint class from classify()
+            retry_after: Seconds from the Retry-After header, if known
+        """
+        now = time.monotonic()
+        bucket = self._bucket(endpoint_class)
+        bucket.refill(now)
+
+        # The rate that triggered the 429 is above the real limit: learn it
+        bucket.max_rate = max(bucket.min_rate, min(bucket.max_rate, bucket.rate * 0.95))
+        bucket.rate = max(bucket.min_rate, bucket.rate * 0.5)
+        bucket.successes_since_increase = 0
+        bucket.rate_limited_responses += 1
+        if retry_after:
+            # Drain the bucket so exactly one request is allowed when the block
+            # ends, then pace at the reduced rate (no burst right after a 429)
+            bucket.blocked_until = max(bucket.blocked_until, now + float(retry_after))
+            bucket.tokens = min(
+                bucket.tokens, 1.0 - (bucket.blocked_until - now) * bucket.rate
+            )
+        else:
+            bucket.tokens = min(bucket.tokens, 0.0)
+
+        logger.warning(
+            f"Rate limiter '{self.name}': 429 on {endpoint_class.upper()}, "
+            f"rate now {bucket.rate * 60:.1f}/min (ceiling {bucket.max_rate * 60:.1f}/min)"
+        )
+
+    def record_rate_limit_headers(
+        self,
+        endpoint_class: str,
+        remaining: int,
+        reset_in_seconds: float,
+    ) -> None:
+        """Adapt the rate to rate-limit headers from a response.
+
+        Windows can be much longer than a minute (Aruba Central reports an
+        hourly quota), so spreading a large remaining budget over the whole
+        window would pace far below the configured rate. Headers only take
+        over once fewer requests remain than the configured per-minute rate;
+        the remaining budget is then spread over the rest of the window,
+        capped at the configured rate.
+
+        Args:
+            endpoint_class: Endpoint class from classify()
+            remaining: Requests left in the current window
+            reset_in_seconds: Seconds until the window resets
+        """
+        if reset_in_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        bucket = self._bucket(endpoint_class)
+        bucket.refill(now)
+
+        if remaining <= 0:
+            bucket.blocked_until = max(bucket.blocked_until, now + reset_in_seconds)
+            bucket.tokens = min(
+                bucket.tokens, 1.0 - (bucket.blocked_until - now) * bucket.rate
+            )
+            return
+
+        configured_per_minute = self._limits.get(endpoint_class, self._limits["get"])[0]
+        if remaining >= configured_per_minute:
+            return
+
+        sustainable = remaining / reset_in_seconds
+        bucket.rate = max(bucket.min_rate, min(configured_per_minute / 60.0, sustainable))
+
+    # ----------------------------------------
+    # Monitoring
+    # ----------------------------------------
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get per-class and total metrics for monitoring.
+
+        Returns:
+            Dict with per-class rate, effective request rate, throttled time
+            and 429 counts, plus totals across classes.
+        """
+        classes = {}
+        total_requests = 0
+        total_throttled = 0.0
+        total_rate_limited = 0
+        for endpoint_class, bucket in self._buckets.items():
+            total_requests += bucket.requests
+            total_throttled += bucket.throttled_seconds
+            total_rate_limited += bucket.rate_limited_responses
+            classes[endpoint_class] = {
+                "rate_per_minute": round(bucket.rate * 60, 2),
+                "ceiling_per_minute": round(bucket.max_rate * 60, 2),
+                "burst": bucket.burst,
+                "tokens_available": round(max(bucket.tokens, 0.0), 2),
+                "requests": bucket.requests,
+                "effective_rate_per_minute": round(bucket.effective_rate * 60, 2),
+                "throttled_seconds": round(bucket.throttled_seconds, 3),
+                "rate_limited_responses": bucket.rate_limited_responses,
+            }
+        return {
+            "name": self.name,
+            "requests": total_requests,
+            "throttled_seconds": round(total_throttled, 3),
+            "rate_limited_responses": total_rate_limited,
+            "classes": classes,
+        }
+
+    def reset(self) -> None:
+        """Forget all learned rates and metrics."""
+        self._buckets.clear()
+
+
+# Per-API overrides of AdaptiveRateLimiter.DEFAULT_LIMITS for shared limiters.
+# Aruba Central allows ~7 requests/second; its X-RateLimit headers refine this.
+SHARED_RATE_LIMITS: dict[str, dict[str, tuple[float, int, float]]] = {
+    "aruba_central": {
+        "get": (300.0, 7, 420.0),
+        "post": (60.0, 5, 420.0),
+        "patch": (60.0, 5, 420.0),
+    },
+}
+
+_shared_rate_limiters: dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_shared_rate_limiter(name: str = "glp") -> AdaptiveRateLimiter:
+    """Get the process-wide AdaptiveRateLimiter for an API.
+
+    All clients and use cases talking to the same API should use the same
+    limiter so they draw from a single budget.
+
+    Args:
+        name: API name ("glp" for GreenLake, "aruba_central" for Central)
+
+    Returns:
+        The shared AdaptiveRateLimiter for that API
+    """
+    limiter = _shared_rate_limiters.get(name)
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(limits=SHARED_RATE_LIMITS.get(name), name=name)
+        _shared_rate_limiters[name] = limiter
+    return limiter
+
+
+
 # ============================================
 # Exports
 # ============================================
@@ -1100,4 +1545,7 @@ __all__ = [
     "ConcurrentBatcher",
     # Rate Limiting
     "SequentialRateLimiter",
+    "AdaptiveRateLimiter",
+    "RateLimitBucket",
+    "get_shared_rate_limiter",
 ]
@@ -33,7 +33,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
-from .client import SUBSCRIPTIONS_PAGINATION, GLPClient
+from .client import SUBSCRIPTIONS_PAGINATION, GLPClient, PaginationConfig
 from .database import database_transaction
 from .exceptions import (
     ConnectionPoolError,
@@ -82,6 +82,7 @@ class SubscriptionSyncer:
         *,
         use_clean_architecture: bool = True,
         use_streaming: bool = False,
+        pagination: Optional[PaginationConfig] = None,
     ):
         """Initialize SubscriptionSyncer.
 
@@ -93,9 +94,12 @@ class SubscriptionSyncer:
             use_streaming: If True, use streaming mode for memory-efficient
                           sync. Processes page by page instead of loading
                           all subscriptions into memory.
+            pagination: Page size and inter-page delay
+                        (defaults to SUBSCRIPTIONS_PAGINATION)
         """
         self.client = client
         self.db_pool = db_pool
+        self.pagination = pagination or SUBSCRIPTIONS_PAGINATION
         self._use_clean_architecture = use_clean_architecture
         self._use_streaming = use_streaming
 
@@ -103,9 +107,10 @@ class SubscriptionSyncer:
         self._use_case: SyncSubscriptionsUseCase | None = None
         if db_pool and use_clean_architecture:
             self._use_case = SyncSubscriptionsUseCase(
-                subscription_api=GLPSubscriptionAPI(client),
+                subscription_api=GLPSubscriptionAPI(client, pagination_config=self.pagination),
                 subscription_repo=PostgresSubscriptionRepository(db_pool),
                 field_mapper=SubscriptionFieldMapper(),
+                direct_records=True,
             )
 
     # ----------------------------------------
@@ -120,7 +125,7 @@ class SubscriptionSyncer:
         """
         return await self.client.fetch_all(
             self.ENDPOINT,
-            config=SUBSCRIPTIONS_PAGINATION,
+            config=self.pagination,
         )
 
     async def fetch_subscriptions_generator(self):
@@ -134,7 +139,7 @@ class SubscriptionSyncer:
         """
         async for page in self.client.paginate(
             self.ENDPOINT,
-            config=SUBSCRIPTIONS_PAGINATION,
+            config=self.pagination,
         ):
             yield page
 
@@ -177,7 +182,7 @@ class SubscriptionSyncer:
 
         return await self.client.fetch_all(
             self.ENDPOINT,
-            config=SUBSCRIPTIONS_PAGINATION,
+            config=self.pagination,
             params=params,
         )
 
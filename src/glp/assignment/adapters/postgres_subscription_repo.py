@@ -2,6 +2,10 @@
 
 This adapter implements ISubscriptionRepository using asyncpg
 to query the subscriptions table and derive region mappings.
+
+Available subscriptions are served from a SubscriptionCompatibilityIndex
+that is rebuilt only when the subscriptions table changes (detected via
+MAX(synced_at), which every sync bumps).
 """
 
 import logging
@@ -10,11 +14,19 @@ from uuid import UUID
 
 import asyncpg
 
-from ..domain.entities import RegionMapping, SubscriptionOption
+from ..domain.entities import (
+    RegionMapping,
+    SubscriptionCompatibilityIndex,
+    SubscriptionOption,
+)
 from ..domain.ports import ISubscriptionRepository
 
 logger = logging.getLogger(__name__)
 
+# Process-wide index shared by all repository instances (one is created
+# per request); replaced whenever the subscription sync generation changes.
+_compatibility_index: Optional[SubscriptionCompatibilityIndex] = None
+
 
 class PostgresSubscriptionRepository(ISubscriptionRepository):
     """PostgreSQL implementation of ISubscriptionRepository."""
@@ -41,7 +53,26 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
         Returns:
             List of compatible subscription options
         """
+        index = await self.get_compatibility_index()
+        return index.get(device_type=device_type, model=model)
+
+    async def get_compatibility_index(self) -> SubscriptionCompatibilityIndex:
+        """Get the compatibility index for the current subscription data.
+
+        Checks the sync generation (one indexed MAX query) and only reloads
+        subscriptions and recomputes compatibility when it has changed.
+        """
+        global _compatibility_index
+
         async with self.pool.acquire() as conn:
+            generation = await conn.fetchval(
+                "SELECT MAX(synced_at) FROM subscriptions"
+            )
+
+            index = _compatibility_index
+            if index is not None and index.generation == generation:
+                return index
+
             rows = await conn.fetch(
                 """
                 SELECT
@@ -61,21 +92,16 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
                 """
             )
 
-            subscriptions = [self._row_to_option(row) for row in rows]
-
-            # Filter by device type if specified
-            if device_type:
-                subscriptions = [
-                    s for s in subscriptions if s.is_compatible_with(device_type)
-                ]
-
-            # Filter by model if specified (checks model series compatibility)
-            if model:
-                subscriptions = [
-                    s for s in subscriptions if s.is_compatible_with_model(model)
-                ]
-
-            return subscriptions
+        index = SubscriptionCompatibilityIndex(
+            [self._row_to_option(row) for row in rows],
+            generation=generation,
+        )
+        _compatibility_index = index
+        logger.info(
+            f"Rebuilt subscription compatibility index: {len(index)} subscriptions "
+            f"(generation {generation})"
+        )
+        return index
 
     async def get_region_mappings(self) -> list[RegionMapping]:
         """Get all available region mappings.
@@ -10,7 +10,8 @@ from pydantic import BaseModel, Field
 
 from src.glp.api.error_sanitizer import sanitize_error_message
 
-from .dependencies import get_db_pool, verify_api_key
+from .dependencies import get_db_pool, get_sync_pool, verify_api_key
+from .typeahead import get_inventory_typeahead, get_search_history_cache
 
 logger = logging.getLogger(__name__)
 
@@ -471,6 +472,25 @@ async def search_devices(
         return [dict(row) for row in rows]
 
 
+@router.get("/devices/typeahead")
+async def typeahead(
+    q: str = Query(..., min_length=1, description="Identifier prefix (serial, MAC, name or subscription key)"),
+    type: Optional[str] = Query(default=None, pattern="^(device|subscription)$", description="Restrict to devices or subscriptions"),
+    limit: int = Query(default=10, ge=1, le=50),
+    include_archived: bool = Query(default=False),
+    pool=Depends(get_db_pool),
+    _auth: bool = Depends(verify_api_key),
+):
+    """Prefix-match devices and subscriptions from the in-memory typeahead index.
+
+    Intended for search-as-you-type; use /devices/search for full-text search.
+    """
+    index = get_inventory_typeahead()
+    await index.ensure_fresh(pool)
+    entries = index.search(q, kind=type, limit=limit, include_archived=include_archived)
+    return [entry.to_dict() for entry in entries]
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -640,6 +660,14 @@ async def run_greenlake_sync(pool) -> dict:
                 {}, "failed", str(e)
             )
 
+        # Pick up new/changed identifiers in the typeahead index (incremental)
+        index = get_inventory_typeahead()
+        if index.is_loaded:
+            try:
+                await index.refresh(pool)
+            except Exception as e:
+                logger.warning(f"Typeahead refresh after sync failed: {e}")
+
         _sync_status["progress"] = "Sync complete!"
         return results
 
@@ -651,7 +679,7 @@ async def run_greenlake_sync(pool) -> dict:
 
 @router.post("/sync", response_model=SyncResponse)
 async def trigger_sync(
-    pool=Depends(get_db_pool),
+    pool=Depends(get_sync_pool),
     _auth: bool = Depends(verify_api_key),
 ):
     """Trigger a full sync with GreenLake API.
@@ -1190,6 +1218,25 @@ async def get_filter_options(
         )
 
 
+# Set once the search_history table has been seen; a missing table is
+# re-checked on each request so migrations take effect without a restart.
+_search_history_available = False
+
+
+async def _search_history_table_exists(conn) -> bool:
+    """Check (and remember) whether the search_history table exists."""
+    global _search_history_available
+
+    if not _search_history_available:
+        _search_history_available = bool(await conn.fetchval("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables
+                WHERE table_schema = 'public' AND table_name = 'search_history'
+            )
+        """))
+    return _search_history_available
+
+
 @router.get("/search-history", response_model=SearchHistoryResponse)
 async def get_search_history(
     tenant_id: str = Query(..., description="Tenant identifier for multi-tenancy isolation"),
@@ -1205,13 +1252,7 @@ async def get_search_history(
     sorted by created_at DESC (most recent first).
     """
     async with pool.acquire() as conn:
-        # Check if search_history table exists
-        table_exists = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = 'search_history'
-            )
-        """)
+        table_exists = await _search_history_table_exists(conn)
 
         if not table_exists:
             # Return empty response if table doesn't exist yet
@@ -1282,13 +1323,7 @@ async def create_search_history(
     Returns the created record with HTTP 201 status.
     """
     async with pool.acquire() as conn:
-        # Check if search_history table exists
-        table_exists = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = 'search_history'
-            )
-        """)
+        table_exists = await _search_history_table_exists(conn)
 
         if not table_exists:
             raise HTTPException(
@@ -1324,6 +1359,10 @@ async def create_search_history(
             json_module.dumps(request.metadata),
         )
 
+        get_search_history_cache().record(
+            row['tenant_id'], row['user_id'], row['query'], row['search_type']
+        )
+
         return SearchHistoryItem(
             id=row['id'],
             tenant_id=row['tenant_id'],
@@ -1348,13 +1387,7 @@ async def delete_search_history(
     Raises 404 if the record doesn't exist.
     """
     async with pool.acquire() as conn:
-        # Check if search_history table exists
-        table_exists = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = 'search_history'
-            )
-        """)
+        table_exists = await _search_history_table_exists(conn)
 
         if not table_exists:
             raise HTTPException(
@@ -1363,19 +1396,78 @@ async def delete_search_history(
             )
 
         # Delete the search history record
-        result = await conn.execute("""
+        deleted = await conn.fetchrow("""
             DELETE FROM search_history WHERE id = $1::uuid
+            RETURNING tenant_id, user_id
         """, id)
 
-        # Check if a record was actually deleted
-        # result is a string like "DELETE 1" or "DELETE 0"
-        rows_deleted = int(result.split()[-1])
-        if rows_deleted == 0:
+        if deleted is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Search history record with id '{id}' not found"
             )
 
+        get_search_history_cache().invalidate(deleted['tenant_id'], deleted['user_id'])
+
+
+async def _load_history_items(
+    conn, cache, tenant_id: str, user_id: str
+) -> tuple[list[tuple[str, str]], bool]:
+    """Load a user's distinct (query, search_type) pairs into the cache.
+
+    Returns:
+        The cached pairs, most recently used first, and whether they cover
+        the whole history
+    """
+    # One row per distinct query, so frequent old queries aren't crowded
+    # out by repeats; the extra row tells us whether any were cut off
+    rows = await conn.fetch("""
+        SELECT query, search_type
+        FROM search_history
+        WHERE tenant_id = $1 AND user_id = $2
+        GROUP BY query, search_type
+        ORDER BY MAX(created_at) DESC
+        LIMIT $3
+    """, tenant_id, user_id, cache.max_items_per_user + 1)
+    items = [(row['query'], row['search_type']) for row in rows]
+    complete = len(items) <= cache.max_items_per_user
+    cache.put(tenant_id, user_id, items, complete=complete)
+    return items[: cache.max_items_per_user], complete
+
+
+async def _fetch_history_suggestions(
+    pool,
+    tenant_id: str,
+    user_id: str,
+    prefix: str,
+    search_type: Optional[str],
+    limit: int,
+) -> list[str]:
+    """Unique history queries matching prefix, most recent first, from the database."""
+    where_clauses = ["tenant_id = $1", "user_id = $2", "query ILIKE $3"]
+    params = [tenant_id, user_id, f"{prefix}%"]
+    param_idx = 4
+
+    if search_type:
+        where_clauses.append(f"search_type = ${param_idx}")
+        params.append(search_type)
+        param_idx += 1
+
+    where_sql = " AND ".join(where_clauses)
+    params.append(limit)
+
+    # GROUP BY so ORDER BY MAX(created_at) works for unique queries
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(f"""
+            SELECT query
+            FROM search_history
+            WHERE {where_sql}
+            GROUP BY query
+            ORDER BY MAX(created_at) DESC
+            LIMIT ${param_idx}
+        """, *params)
+    return [row['query'] for row in rows]
+
 
 @router.get("/search-suggestions", response_model=SearchSuggestionsResponse)
 async def get_search_suggestions(
@@ -1384,6 +1476,7 @@ async def get_search_suggestions(
     prefix: str = Query(..., min_length=1, description="Search query prefix to match"),
     search_type: Optional[str] = Query(default=None, description="Filter by search type (device or subscription)"),
     limit: int = Query(default=5, ge=1, le=20, description="Maximum number of suggestions to return"),
+    include_inventory: bool = Query(default=False, description="Also suggest matching serial numbers, MACs, device names and subscription keys"),
     pool=Depends(get_db_pool),
     _auth: bool = Depends(verify_api_key),
 ):
@@ -1391,46 +1484,40 @@ async def get_search_suggestions(
 
     Returns unique search queries that match the given prefix, filtered by tenant/user.
     Results are sorted by most recent first, limited to the specified number of suggestions.
-    """
-    async with pool.acquire() as conn:
-        # Check if search_history table exists
-        table_exists = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = 'search_history'
-            )
-        """)
 
-        if not table_exists:
-            # Return empty suggestions if table doesn't exist yet
-            return SearchSuggestionsResponse(suggestions=[])
-
-        # Build the query dynamically
-        where_clauses = ["tenant_id = $1", "user_id = $2", "query ILIKE $3"]
-        params = [tenant_id, user_id, f"{prefix}%"]
-        param_idx = 4
-
-        if search_type:
-            where_clauses.append(f"search_type = ${param_idx}")
-            params.append(search_type)
-            param_idx += 1
-
-        where_sql = " AND ".join(where_clauses)
+    Suggestions are served from an in-memory cache of the user's distinct queries
+    (loaded once per user, kept current by the history endpoints). Users with more
+    distinct queries than the cache holds fall back to the aggregate query when the
+    cache can't fill the limit. With include_inventory, remaining slots are filled
+    from the inventory typeahead index.
+    """
+    cache = get_search_history_cache()
+    items = cache.get(tenant_id, user_id)
+    complete = items is not None and cache.is_complete(tenant_id, user_id)
 
-        # Fetch unique suggestions matching the prefix, ordered by most recent
-        # Use GROUP BY to enable ORDER BY MAX(created_at) for unique queries
-        query_sql = f"""
-            SELECT query
-            FROM search_history
-            WHERE {where_sql}
-            GROUP BY query
-            ORDER BY MAX(created_at) DESC
-            LIMIT ${param_idx}
-        """
-        params.append(limit)
+    if items is None:
+        async with pool.acquire() as conn:
+            if not await _search_history_table_exists(conn):
+                items, complete = [], True
+            else:
+                items, complete = await _load_history_items(conn, cache, tenant_id, user_id)
 
-        rows = await conn.fetch(query_sql, *params)
+    suggestions = cache.suggest(items, prefix, search_type=search_type, limit=limit)
 
-        suggestions = [row['query'] for row in rows]
+    if len(suggestions) < limit and not complete:
+        suggestions = await _fetch_history_suggestions(
+            pool, tenant_id, user_id, prefix, search_type, limit
+        )
 
-        return SearchSuggestionsResponse(suggestions=suggestions)
+    if include_inventory and len(suggestions) < limit:
+        index = get_inventory_typeahead()
+        await index.ensure_fresh(pool)
+        seen = set(suggestions)
+        for entry in index.search(prefix, kind=search_type, limit=limit):
+            if entry.label not in seen:
+                seen.add(entry.label)
+                suggestions.append(entry.label)
+            if len(suggestions) >= limit:
+                break
+
+    return SearchSuggestionsResponse(suggestions=suggestions)
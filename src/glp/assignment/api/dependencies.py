@@ -4,7 +4,9 @@ This module provides dependency injection functions that create
 and return adapter instances for use in API endpoints.
 
 Lifecycle Management:
-- Database pool: Initialized at startup, shared across requests
+- Database pools: Initialized at startup, shared across requests. Each
+  workload (interactive, bulk_sync, export, agent) has its own named pool
+  so long syncs and exports can't starve dashboard queries.
 - GLP Client: Initialized at startup, shared across requests
 - Both are closed at application shutdown
 
@@ -26,6 +28,8 @@ import asyncpg
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader
 
+from ...api.database import DEFAULT_POOL_CONFIGS, InstrumentedPool, PoolRegistry
+from ...api.resilience import AdaptiveRateLimiter
 from ..adapters import (
     GLPDeviceManagerAdapter,
     OpenpyxlExcelParser,
@@ -125,8 +129,9 @@ async def verify_api_key(
 
 # ========== Global State ==========
 
-# Global connection pool (initialized on startup)
+# Named connection pools (initialized on startup); _db_pool is the interactive one
 _db_pool: Optional[asyncpg.Pool] = None
+_pools: Optional[PoolRegistry] = None
 
 # Global GLP client and related objects (initialized on startup)
 _glp_client = None
@@ -137,21 +142,21 @@ _subscription_syncer = None
 
 
 async def init_db_pool():
-    """Initialize the database connection pool.
+    """Initialize the named database connection pools.
 
-    Should be called on application startup.
+    Should be called on application startup. Pool sizes and statement
+    cache settings can be overridden per pool with DB_POOL_<NAME>_* env vars.
     """
-    global _db_pool
+    global _db_pool, _pools
 
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         raise ValueError("DATABASE_URL environment variable is required")
 
-    _db_pool = await asyncpg.create_pool(
-        database_url,
-        min_size=2,
-        max_size=10,
+    _pools = await PoolRegistry(database_url, DEFAULT_POOL_CONFIGS).start(
+        ["interactive", "bulk_sync", "export", "agent"]
     )
+    _db_pool = _pools.get("interactive")
 
 
 async def init_glp_client():
@@ -174,22 +179,24 @@ async def init_glp_client():
 
     _device_manager = DeviceManager(_glp_client)
 
-    if _db_pool:
-        _device_syncer = DeviceSyncer(_glp_client, _db_pool)
-        _subscription_syncer = SubscriptionSyncer(_glp_client, _db_pool)
+    if _pools:
+        sync_pool = _pools.get("bulk_sync")
+        _device_syncer = DeviceSyncer(_glp_client, sync_pool)
+        _subscription_syncer = SubscriptionSyncer(_glp_client, sync_pool)
 
     logger.info("GLP client initialized")
 
 
 async def close_db_pool():
-    """Close the database connection pool.
+    """Close the database connection pools.
 
     Should be called on application shutdown.
     """
-    global _db_pool
-    if _db_pool:
-        await _db_pool.close()
-        _db_pool = None
+    global _db_pool, _pools
+    if _pools:
+        await _pools.close()
+        _pools = None
+    _db_pool = None
 
 
 async def close_glp_client():
@@ -213,12 +220,38 @@ async def close_glp_client():
 
 
 def get_db_pool() -> asyncpg.Pool:
-    """Get the database connection pool."""
+    """Get the interactive database connection pool (dashboard/API queries)."""
     if _db_pool is None:
         raise RuntimeError("Database pool not initialized. Call init_db_pool() first.")
     return _db_pool
 
 
+def _get_named_pool(name: str) -> InstrumentedPool:
+    if _pools is None:
+        raise RuntimeError("Database pool not initialized. Call init_db_pool() first.")
+    return _pools.get(name)
+
+
+def get_sync_pool() -> asyncpg.Pool:
+    """Get the bulk-sync pool (GreenLake/Aruba Central syncs)."""
+    return _get_named_pool("bulk_sync")
+
+
+def get_export_pool() -> asyncpg.Pool:
+    """Get the export pool (report generation and downloads)."""
+    return _get_named_pool("export")
+
+
+def get_agent_pool() -> asyncpg.Pool:
+    """Get the agent pool (chatbot memory and conversations)."""
+    return _get_named_pool("agent")
+
+
+def get_pool_metrics() -> dict:
+    """Acquire-latency and wait-queue metrics for all named pools."""
+    return _pools.get_metrics() if _pools else {}
+
+
 # ========== Dependency Functions ==========
 
 
@@ -252,6 +285,17 @@ def get_device_manager() -> IDeviceManagerPort:
     return GLPDeviceManagerAdapter(_device_manager)
 
 
+def get_rate_limiter() -> Optional[AdaptiveRateLimiter]:
+    """Get the adaptive rate limiter shared with the GLPClient.
+
+    Use cases pace their batches with this limiter so that they draw from
+    the same learned API budget as the client's own requests.
+    """
+    if _device_manager is None:
+        return None
+    return _device_manager.rate_limiter
+
+
 def get_sync_service() -> ISyncService:
     """Get a sync service instance.
 
@@ -267,7 +311,7 @@ def get_sync_service() -> ISyncService:
     return DeviceSyncerAdapter(
         _device_syncer,
         _subscription_syncer,
-        db_pool=_db_pool,
+        db_pool=get_sync_pool(),
     )
 
 
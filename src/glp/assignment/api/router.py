@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Upl
 from fastapi.responses import StreamingResponse
 
 from ...api.error_sanitizer import sanitize_error_message
+from ...api.resilience import AdaptiveRateLimiter
 from ..domain.entities import DeviceAssignment
 from ..domain.ports import (
     IDeviceManagerPort,
@@ -30,6 +31,7 @@ from .dependencies import (
     get_device_manager,
     get_device_repo,
     get_excel_parser,
+    get_rate_limiter,
     get_report_generator,
     get_subscription_repo,
     get_sync_service,
@@ -170,6 +172,10 @@ async def get_options(
         Optional[str],
         Query(description="Filter subscriptions by device type (NETWORK, COMPUTE, STORAGE)"),
     ] = None,
+    model: Annotated[
+        Optional[str],
+        Query(description="Filter subscriptions by device model series (e.g. 6200F-24G-4SFP+)"),
+    ] = None,
     subscription_repo: ISubscriptionRepository = Depends(get_subscription_repo),
     device_repo: IDeviceRepository = Depends(get_device_repo),
     _auth: bool = Depends(verify_api_key),
@@ -186,7 +192,7 @@ async def get_options(
         device_repo=device_repo,
     )
 
-    result = await use_case.execute(device_type=device_type)
+    result = await use_case.execute(device_type=device_type, model=model)
 
     # Convert to response DTOs
     subscriptions = [
@@ -228,6 +234,7 @@ async def get_options(
 async def apply_assignments(
     request: ApplyRequest,
     device_manager: IDeviceManagerPort = Depends(get_device_manager),
+    rate_limiter: Optional[AdaptiveRateLimiter] = Depends(get_rate_limiter),
     _auth: bool = Depends(verify_api_key),
 ):
     """Apply selected assignments to devices.
@@ -256,7 +263,9 @@ async def apply_assignments(
             f"selected_tags={d.selected_tags}"
         )
 
-    use_case = ApplyAssignmentsUseCase(device_manager=device_manager)
+    use_case = ApplyAssignmentsUseCase(
+        device_manager=device_manager, rate_limiter=rate_limiter
+    )
 
     # Convert request DTOs to domain entities
     assignments = [
@@ -316,6 +325,7 @@ async def apply_assignments_stream(
     request: Request,
     body: ApplyRequest,
     device_manager: IDeviceManagerPort = Depends(get_device_manager),
+    rate_limiter: Optional[AdaptiveRateLimiter] = Depends(get_rate_limiter),
     _auth: bool = Depends(verify_api_key),
 ):
     """Apply assignments to devices with real-time progress streaming via SSE.
@@ -366,7 +376,9 @@ async def apply_assignments_stream(
                 for d in body.devices
             ]
 
-            use_case = ApplyAssignmentsUseCase(device_manager=device_manager)
+            use_case = ApplyAssignmentsUseCase(
+                device_manager=device_manager, rate_limiter=rate_limiter
+            )
 
             # Execute with progress callback
             async for event in use_case.execute_with_progress(
@@ -0,0 +1,544 @@
+"""In-memory typeahead indexes for the dashboard search box.
+
+The dashboard asks for suggestions on every keystroke. Instead of running
+ILIKE queries against Postgres each time, this module keeps per-process
+indexes that answer prefix lookups in microseconds:
+
+- InventoryTypeahead: serial numbers, MAC addresses, device names and
+  subscription keys. Built once from Postgres, then refreshed incrementally
+  (rows whose updated_at is at or past the newest one already seen) after
+  each sync, and rebuilt in full periodically.
+- SearchHistoryCache: each user's distinct search queries, loaded on first
+  use and kept current by the search-history write endpoints.
+
+Both are process-local. Other processes (the scheduler, other API workers)
+write to the same tables, so the inventory index refreshes itself in the
+background once it is older than its max age, and history entries expire
+after a TTL.
+
+Example:
+    index = get_inventory_typeahead()
+    await index.ensure_fresh(pool)
+    matches = index.search("SN1234", kind="device", limit=10)
+"""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ========== Prefix Index ==========
+
+
+def normalize(text: str) -> str:
+    """Normalize text for case-insensitive prefix matching."""
+    return text.strip().lower()
+
+
+def normalize_mac(mac: str) -> str:
+    """Normalize a MAC address to bare lowercase hex (no separators)."""
+    return "".join(c for c in mac.lower() if c not in ":-. ")
+
+
+class PrefixIndex:
+    """Sorted-array prefix index.
+
+    Keys are kept in a sorted list of (normalized_key, entry_id) tuples, so a
+    prefix lookup is a binary search followed by a short forward scan.
+    Incremental updates use insort; large batches fall back to a full re-sort.
+    """
+
+    # Re-sort instead of insort when a batch touches more than this fraction
+    REBUILD_FRACTION = 0.1
+
+    def __init__(self):
+        self._keys: list[tuple[str, str]] = []
+        self._by_entry: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self, items: Iterable[tuple[str, Iterable[str]]]) -> None:
+        """Replace the index contents.
+
+        Args:
+            items: (entry_id, normalized keys) pairs
+        """
+        by_entry: dict[str, list[str]] = {}
+        keys: list[tuple[str, str]] = []
+        for entry_id, entry_keys in items:
+            unique = sorted({k for k in entry_keys if k})
+            by_entry[entry_id] = unique
+            keys.extend((k, entry_id) for k in unique)
+        keys.sort()
+        self._keys = keys
+        self._by_entry = by_entry
+
+    def update(self, items: list[tuple[str, Iterable[str]]]) -> None:
+        """Insert or replace the keys for a batch of entries.
+
+        Args:
+            items: (entry_id, normalized keys) pairs
+        """
+        if len(items) > max(len(self._by_entry), 1) * self.REBUILD_FRACTION:
+            merged = dict(self._by_entry)
+            for entry_id, entry_keys in items:
+                merged[entry_id] = list(entry_keys)
+            self.build(merged.items())
+            return
+
+        for entry_id, entry_keys in items:
+            self.remove(entry_id)
+            unique = sorted({k for k in entry_keys if k})
+            self._by_entry[entry_id] = unique
+            for key in unique:
+                insort(self._keys, (key, entry_id))
+
+    def remove(self, entry_id: str) -> None:
+        """Remove all keys for an entry."""
+        for key in self._by_entry.pop(entry_id, ()):
+            pos = bisect_left(self._keys, (key, entry_id))
+            if pos < len(self._keys) and self._keys[pos] == (key, entry_id):
+                del self._keys[pos]
+
+    def search(self, prefix: str, limit: int, max_scan: int = 1000) -> list[str]:
+        """Find entry IDs with a key starting with prefix.
+
+        Args:
+            prefix: Normalized prefix
+            limit: Maximum entry IDs to return
+            max_scan: Maximum keys to inspect (bounds worst-case latency)
+
+        Returns:
+            Entry IDs in key order, without duplicates
+        """
+        if not prefix:
+            return []
+        found: list[str] = []
+        seen: set[str] = set()
+        pos = bisect_left(self._keys, (prefix,))
+        end = min(len(self._keys), pos + max_scan)
+        while pos < end and len(found) < limit:
+            key, entry_id = self._keys[pos]
+            if not key.startswith(prefix):
+                break
+            if entry_id not in seen:
+                seen.add(entry_id)
+                found.append(entry_id)
+            pos += 1
+        return found
+
+
+# ========== Inventory Typeahead ==========
+
+
+@dataclass(slots=True)
+class TypeaheadEntry:
+    """A device or subscription that can be suggested."""
+    id: str
+    kind: str  # 'device' or 'subscription'
+    label: str  # serial_number or subscription key
+    name: Optional[str] = None  # device_name
+    mac_address: Optional[str] = None
+    sub_type: Optional[str] = None  # device_type or subscription_type
+    archived: bool = False
+
+    def keys(self) -> list[str]:
+        """Normalized keys this entry is findable by."""
+        keys = [normalize(self.label)]
+        if self.name:
+            keys.append(normalize(self.name))
+        if self.mac_address:
+            keys.append(normalize(self.mac_address))
+            keys.append(normalize_mac(self.mac_address))
+        return keys
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "type": self.kind,
+            "label": self.label,
+            "name": self.name,
+            "mac_address": self.mac_address,
+            "sub_type": self.sub_type,
+            "archived": self.archived,
+        }
+
+
+# Incremental refresh queries ($1 = updated_at cursor, NULL for a full load).
+DEVICE_REFRESH_SQL = """
+    SELECT id::text, serial_number, mac_address, device_name,
+           device_type, archived, updated_at
+    FROM devices
+    WHERE $1::timestamptz IS NULL OR updated_at >= $1
+"""
+
+SUBSCRIPTION_REFRESH_SQL = """
+    SELECT id::text, key, subscription_type, updated_at
+    FROM subscriptions
+    WHERE key IS NOT NULL
+      AND ($1::timestamptz IS NULL OR updated_at >= $1)
+"""
+
+
+def _max_updated_at(rows, current: Optional[datetime]) -> Optional[datetime]:
+    """Advance a cursor to the newest updated_at in rows."""
+    for row in rows:
+        updated_at = row["updated_at"]
+        if updated_at is not None and (current is None or updated_at > current):
+            current = updated_at
+    return current
+
+
+class InventoryTypeahead:
+    """Prefix index over device and subscription identifiers.
+
+    The first ensure_fresh() call loads everything; later refreshes fetch
+    rows whose updated_at (the GreenLake change time, not our synced_at)
+    is at or past the newest one seen so far. A full sync that rewrites
+    every row leaves updated_at alone, so it doesn't trigger a reload.
+
+    Rows sharing the cursor's timestamp are re-read and skipped if
+    unchanged. A full rebuild every ``full_refresh_seconds`` picks up rows
+    committed with an older updated_at and drops deleted rows.
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = 60.0,
+        full_refresh_seconds: float = 3600.0,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            max_age_seconds: Age after which ensure_fresh() schedules a
+                             background refresh
+            full_refresh_seconds: Interval between full rebuilds
+        """
+        self.max_age_seconds = max_age_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self._entries: dict[str, TypeaheadEntry] = {}
+        self._index = PrefixIndex()
+        self._device_cursor: Optional[datetime] = None
+        self._subscription_cursor: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None
+        self._full_refresh_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._refreshed_at is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----- Loading -----
+
+    def load(self, entries: Iterable[TypeaheadEntry]) -> None:
+        """Replace the index with the given entries (no database needed)."""
+        self._entries = {f"{e.kind}:{e.id}": e for e in entries}
+        self._index.build((eid, e.keys()) for eid, e in self._entries.items())
+        self._refreshed_at = time.monotonic()
+
+    def apply(self, entries: list[TypeaheadEntry]) -> int:
+        """Insert or replace a batch of entries, skipping unchanged ones.
+
+        Returns:
+            Number of entries added or changed
+        """
+        changed = []
+        for entry in entries:
+            entry_id = f"{entry.kind}:{entry.id}"
+            if self._entries.get(entry_id) == entry:
+                continue
+            self._entries[entry_id] = entry
+            changed.append((entry_id, entry.keys()))
+        if changed:
+            self._index.update(changed)
+        self._refreshed_at = time.monotonic()
+        return len(changed)
+
+    async def refresh(self, pool, full: bool = False) -> int:
+        """Fetch rows changed since the last refresh and apply them.
+
+        Runs a full rebuild instead on the first call, when ``full`` is
+        set, or once ``full_refresh_seconds`` have passed since the last.
+
+        Args:
+            pool: asyncpg connection pool
+            full: Rebuild from every row, dropping entries that are gone
+
+        Returns:
+            Number of entries loaded (full) or added/changed (incremental)
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            full = full or self._full_refresh_at is None or (
+                time.monotonic() - self._full_refresh_at > self.full_refresh_seconds
+            )
+            if full:
+                device_since = subscription_since = None
+            else:
+                device_since = self._device_cursor
+                subscription_since = self._subscription_cursor
+
+            async with pool.acquire() as conn:
+                device_rows = await conn.fetch(DEVICE_REFRESH_SQL, device_since)
+                subscription_rows = await conn.fetch(
+                    SUBSCRIPTION_REFRESH_SQL, subscription_since
+                )
+
+            entries = [
+                TypeaheadEntry(
+                    id=row["id"],
+                    kind="device",
+                    label=row["serial_number"],
+                    name=row["device_name"],
+                    mac_address=row["mac_address"],
+                    sub_type=row["device_type"],
+                    archived=bool(row["archived"]),
+                )
+                for row in device_rows
+            ]
+            entries.extend(
+                TypeaheadEntry(
+                    id=row["id"],
+                    kind="subscription",
+                    label=row["key"],
+                    sub_type=row["subscription_type"],
+                )
+                for row in subscription_rows
+            )
+
+            if full:
+                self.load(entries)
+                self._full_refresh_at = time.monotonic()
+                self._device_cursor = _max_updated_at(device_rows, None)
+                self._subscription_cursor = _max_updated_at(subscription_rows, None)
+                logger.info(f"Typeahead index rebuilt: {len(self)} entries")
+                return len(entries)
+
+            changed = self.apply(entries)
+            self._device_cursor = _max_updated_at(device_rows, self._device_cursor)
+            self._subscription_cursor = _max_updated_at(
+                subscription_rows, self._subscription_cursor
+            )
+
+            if changed:
+                logger.info(f"Typeahead index refreshed: {changed} changed, {len(self)} total")
+            return changed
+
+    async def ensure_fresh(self, pool) -> None:
+        """Make sure the index is usable without blocking on refreshes.
+
+        The first call waits for the initial load. Afterwards, a stale index
+        keeps serving while a single background task refreshes it.
+        """
+        if self._refreshed_at is None:
+            await self.refresh(pool)
+            return
+
+        age = time.monotonic() - self._refreshed_at
+        if age > self.max_age_seconds and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._background_refresh(pool))
+
+    async def _background_refresh(self, pool) -> None:
+        try:
+            await self.refresh(pool)
+        except Exception as e:
+            logger.warning(f"Typeahead background refresh failed: {e}")
+            # Don't retry on every keystroke; wait another max_age
+            self._refreshed_at = time.monotonic()
+
+    # ----- Querying -----
+
+    def search(
+        self,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: int = 10,
+        include_archived: bool = False,
+    ) -> list[TypeaheadEntry]:
+        """Find devices/subscriptions whose identifiers start with prefix.
+
+        Args:
+            prefix: Text typed so far (case-insensitive; MACs match with or
+                    without separators)
+            kind: Restrict to 'device' or 'subscription'
+            limit: Maximum entries to return
+            include_archived: Include archived devices
+
+        Returns:
+            Matching entries in identifier order
+        """
+        norm = normalize(prefix)
+        candidates = self._index.search(norm, limit=limit * 4)
+        bare = normalize_mac(norm)
+        if bare and bare != norm and len(candidates) < limit * 4:
+            for entry_id in self._index.search(bare, limit=limit * 4):
+                if entry_id not in candidates:
+                    candidates.append(entry_id)
+
+        results = []
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            if kind and entry.kind != kind:
+                continue
+            if entry.archived and not include_archived:
+                continue
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+
+# ========== Search History Cache ==========
+
+
+@dataclass(slots=True)
+class _UserHistory:
+    """Distinct queries for one tenant/user, most recently used first."""
+    loaded_at: float
+    items: list[tuple[str, str]]  # (query, search_type)
+    complete: bool  # False if older pairs were cut off at max_items_per_user
+
+
+class SearchHistoryCache:
+    """Per-user cache of distinct search queries for suggestions.
+
+    Each user holds their distinct (query, search_type) pairs ordered by
+    last use, as loaded by a GROUP BY over the whole history. Users with
+    more than max_items_per_user pairs are marked incomplete, and callers
+    fall back to the database when the cache can't fill a request.
+
+    Entries are loaded from search_history on first use, updated in place
+    by record() when this process writes history, dropped by invalidate()
+    on deletes, and expire after ttl_seconds to pick up writes from other
+    processes. Least recently used users are evicted beyond max_users.
+    """
+
+    def __init__(
+        self,
+        max_items_per_user: int = 200,
+        ttl_seconds: float = 300.0,
+        max_users: int = 10_000,
+    ):
+        self.max_items_per_user = max_items_per_user
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._users: OrderedDict[tuple[str, str], _UserHistory] = OrderedDict()
+
+    def get(self, tenant_id: str, user_id: str) -> Optional[list[tuple[str, str]]]:
+        """Cached (query, search_type) pairs newest first, or None if not cached."""
+        key = (tenant_id, user_id)
+        history = self._users.get(key)
+        if history is None:
+            return None
+        if time.monotonic() - history.loaded_at > self.ttl_seconds:
+            del self._users[key]
+            return None
+        self._users.move_to_end(key)
+        return history.items
+
+    def is_complete(self, tenant_id: str, user_id: str) -> bool:
+        """Whether the cached pairs cover the user's whole history."""
+        history = self._users.get((tenant_id, user_id))
+        return history is not None and history.complete
+
+    def put(
+        self,
+        tenant_id: str,
+        user_id: str,
+        items: list[tuple[str, str]],
+        complete: Optional[bool] = None,
+    ) -> None:
+        """Store distinct pairs (newest first) loaded from the database.
+
+        Args:
+            tenant_id: Tenant identifier
+            user_id: User identifier
+            items: (query, search_type) pairs, most recently used first
+            complete: Whether items is the whole history; defaults to
+                      True when fewer than max_items_per_user were given
+        """
+        if complete is None:
+            complete = len(items) < self.max_items_per_user
+        key = (tenant_id, user_id)
+        self._users[key] = _UserHistory(
+            loaded_at=time.monotonic(),
+            items=list(items[: self.max_items_per_user]),
+            complete=complete and len(items) <= self.max_items_per_user,
+        )
+        self._users.move_to_end(key)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+
+    def record(self, tenant_id: str, user_id: str, query: str, search_type: str) -> None:
+        """Move a query to the front for a cached user (no-op if not cached)."""
+        history = self._users.get((tenant_id, user_id))
+        if history is None:
+            return
+        item = (query, search_type)
+        if item in history.items:
+            history.items.remove(item)
+        history.items.insert(0, item)
+        if len(history.items) > self.max_items_per_user:
+            del history.items[self.max_items_per_user:]
+            history.complete = False
+
+    def invalidate(self, tenant_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+        """Drop cached history for one user, or everything if no user is given."""
+        if tenant_id is None or user_id is None:
+            self._users.clear()
+        else:
+            self._users.pop((tenant_id, user_id), None)
+
+    @staticmethod
+    def suggest(
+        items: list[tuple[str, str]],
+        prefix: str,
+        search_type: Optional[str] = None,
+        limit: int = 5,
+    ) -> list[str]:
+        """Unique queries matching prefix (case-insensitive), most recent first."""
+        norm = normalize(prefix)
+        suggestions: list[str] = []
+        seen: set[str] = set()
+        for query, item_type in items:
+            if search_type and item_type != search_type:
+                continue
+            if query in seen or not query.lower().startswith(norm):
+                continue
+            seen.add(query)
+            suggestions.append(query)
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+
+# ========== Process-wide Instances ==========
+
+_inventory_typeahead = InventoryTypeahead()
+_search_history_cache = SearchHistoryCache()
+
+
+def get_inventory_typeahead() -> InventoryTypeahead:
+    """Get the process-wide inventory typeahead index."""
+    return _inventory_typeahead
+
+
+def get_search_history_cache() -> SearchHistoryCache:
+    """Get the process-wide search history cache."""
+    return _search_history_cache
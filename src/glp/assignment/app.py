@@ -3,26 +3,33 @@
 This is the main entry point for the assignment API server.
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
 
+from ..api.query_metrics import QueryMetricsMiddleware, get_query_metrics
 from .api.clients_router import router as clients_router
 from .api.dashboard_router import router as dashboard_router
 from .api.dependencies import (
     close_db_pool,
     close_glp_client,
+    get_agent_pool,
+    get_pool_metrics,
     init_db_pool,
     init_glp_client,
+    verify_api_key,
 )
 from .api.router import router
 
 # Import reports routers
 from ..reports.api import router as reports_router
 from ..reports.custom_reports_api import router as custom_reports_router
+from ..reports.render_pool import close_render_pool, get_render_pool
 
 # Import agent router and components (optional - only if agent module exists)
 try:
@@ -30,13 +37,19 @@ try:
         AgentConfig,
         AgentOrchestrator,
         AnthropicProvider,
+        EmbeddingWorker,
+        FactExtractor,
         OpenAIProvider,
+        SemanticMemoryStore,
         VoyageAIProvider,
         ToolRegistry,
     )
     from ..agent.api import create_agent_dependencies
     from ..agent.api import router as agent_router
+    from ..agent.api.chat_scheduler import get_chat_scheduler
+    from ..agent.api.stream_replay import create_stream_manager
     from ..agent.providers.base import LLMProviderConfig
+    from ..agent.providers.batching import MicroBatchEmbedder
     from ..agent.security import TicketAuth
     from ..agent.tools.mcp_client import MCPClient, MCPClientConfig
     from ..agent.background_worker import (
@@ -48,6 +61,8 @@ except ImportError:
     AGENT_AVAILABLE = False
     agent_router = None
     create_agent_dependencies = None
+    create_stream_manager = None
+    get_chat_scheduler = None
     TicketAuth = None
     MCPClient = None
     MCPClientConfig = None
@@ -61,6 +76,13 @@ _redis_client = None
 # Chatbot availability flag (set during init)
 _chatbot_enabled = False
 
+# Background embedding worker for agent memory (started in lifespan)
+_embedding_worker = None
+_embedding_worker_task = None
+
+# Micro-batching wrapper around the embedding provider (closed on shutdown)
+_batch_embedder = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -69,15 +91,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _init_agent_orchestrator(redis_client=None) -> None:
+def _init_agent_orchestrator(redis_client=None) -> Optional["AgentOrchestrator"]:
     """Initialize the agent orchestrator with LLM provider and tools.
 
     Args:
         redis_client: Optional Redis client for WebSocket ticket auth
+
+    Returns:
+        The registered orchestrator, or None if the chatbot is unavailable
     """
     if not AGENT_AVAILABLE or not create_agent_dependencies:
         logger.info("Agent module not available, skipping orchestrator init")
-        return
+        return None
 
     # Check for API keys
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
@@ -85,7 +110,7 @@ def _init_agent_orchestrator(redis_client=None) -> None:
 
     if not anthropic_key and not openai_key:
         logger.warning("No LLM API keys configured (ANTHROPIC_API_KEY or OPENAI_API_KEY)")
-        return
+        return None
 
     llm_provider = None
 
@@ -115,7 +140,7 @@ def _init_agent_orchestrator(redis_client=None) -> None:
 
     if not llm_provider:
         logger.warning("No LLM provider could be initialized - chatbot will be unavailable")
-        return
+        return None
 
     # Create embedding provider with fallback logic
     embedding_provider = None
@@ -166,6 +191,29 @@ def _init_agent_orchestrator(redis_client=None) -> None:
 
     if not embedding_provider:
         logger.warning("No embedding provider could be initialized - semantic memory will be unavailable")
+    elif os.getenv("EMBEDDING_MICRO_BATCH", "true").lower() == "true":
+        # Memory search, memory writes and the embedding worker embed one
+        # text at a time; coalesce concurrent calls into embed_batch()
+        global _batch_embedder
+        _batch_embedder = MicroBatchEmbedder(
+            embedding_provider,
+            linger_seconds=float(os.getenv("EMBEDDING_MICRO_BATCH_LINGER_MS", "5")) / 1000,
+        )
+        embedding_provider = _batch_embedder
+        logger.info("Embedding calls are micro-batched")
+
+    # Semantic memory lives on the agent pool so memory search and fact
+    # storage can't starve dashboard queries
+    memory_store = None
+    fact_extractor = None
+    if embedding_provider and os.getenv("AGENT_MEMORY_ENABLED", "true").lower() == "true":
+        try:
+            memory_store = SemanticMemoryStore(get_agent_pool(), embedding_provider)
+            fact_extractor = FactExtractor(llm_provider)
+            logger.info("Semantic memory enabled on the agent pool")
+        except Exception as e:
+            logger.warning(f"Failed to initialize semantic memory: {e}")
+            memory_store = None
 
     try:
         # Create MCP client for read-only database operations
@@ -186,8 +234,9 @@ def _init_agent_orchestrator(redis_client=None) -> None:
         orchestrator = AgentOrchestrator(
             llm_provider=llm_provider,
             tool_registry=tool_registry,
+            memory_store=memory_store,
+            fact_extractor=fact_extractor if memory_store else None,
             config=AgentConfig(),
-            # embedding_provider is passed to memory store inside orchestrator if needed
         )
 
         # Initialize ticket auth if Redis is available
@@ -198,16 +247,22 @@ def _init_agent_orchestrator(redis_client=None) -> None:
         else:
             logger.warning("Redis not available - WebSocket ticket auth disabled")
 
+        # Chat stream replay buffer (Redis when CHAT_STREAM_BACKEND=redis)
+        stream_manager = create_stream_manager(redis_client)
+
         # Register with router
-        create_agent_dependencies(orchestrator, ticket_auth)
+        create_agent_dependencies(orchestrator, ticket_auth, stream_manager)
         logger.info("Agent orchestrator initialized successfully")
 
         # Mark chatbot as enabled
         global _chatbot_enabled
         _chatbot_enabled = True
 
+        return orchestrator
+
     except Exception as e:
         logger.error(f"Failed to initialize agent orchestrator: {e}")
+        return None
 
 
 @asynccontextmanager
@@ -215,10 +270,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize database pool, GLP client, and Redis
-    - Shutdown: Close Redis, GLP client, and database pool
+    - Startup: Initialize database pool, GLP client, Redis and the agent
+      (orchestrator and memory embedding worker)
+    - Shutdown: Stop the embedding worker, close Redis, report render pool,
+      GLP client, and database pool
     """
-    global _redis_client
+    global _redis_client, _embedding_worker, _embedding_worker_task, _batch_embedder
 
     # Startup
     logger.info("Starting Device Assignment API...")
@@ -262,13 +319,44 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Failed to initialize background worker: {e}")
 
     # Initialize agent orchestrator with Redis
-    _init_agent_orchestrator(_redis_client)
+    orchestrator = _init_agent_orchestrator(_redis_client)
+
+    # Load tools and open the MCP connection in the background so the
+    # first chat does not wait for them (and startup does not either)
+    warm_up_task = None
+    if orchestrator:
+        warm_up_task = asyncio.create_task(orchestrator.warm_up())
+
+    # Embed messages and memories queued by the agent_embedding_jobs triggers
+    if orchestrator and orchestrator.memory:
+        _embedding_worker = EmbeddingWorker(
+            get_agent_pool(), orchestrator.memory.embedding_provider
+        )
+        _embedding_worker_task = asyncio.create_task(_embedding_worker.start())
+        logger.info("Embedding worker started")
 
     yield
 
     # Shutdown (reverse order of initialization)
     logger.info("Shutting down Device Assignment API...")
 
+    if warm_up_task and not warm_up_task.done():
+        warm_up_task.cancel()
+
+    if _embedding_worker_task:
+        _embedding_worker.stop()
+        try:
+            await asyncio.wait_for(_embedding_worker_task, timeout=10.0)
+        except asyncio.TimeoutError:
+            _embedding_worker_task.cancel()
+        _embedding_worker = None
+        _embedding_worker_task = None
+        logger.info("Embedding worker stopped")
+
+    if _batch_embedder:
+        await _batch_embedder.close()
+        _batch_embedder = None
+
     # Shutdown background worker first (allow tasks to complete)
     if AGENT_AVAILABLE and shutdown_background_worker:
         try:
@@ -282,6 +370,9 @@ async def lifespan(app: FastAPI):
         await _redis_client.aclose()
         logger.info("Redis connection closed")
 
+    close_render_pool()
+    logger.info("Report render pool stopped")
+
     await close_glp_client()
     logger.info("GLP client closed")
 
@@ -325,6 +416,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Attribute every database statement to the route that ran it
+app.add_middleware(QueryMetricsMiddleware)
+
 # Include routers
 app.include_router(router)
 app.include_router(dashboard_router)
@@ -355,6 +449,35 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/health/pools", dependencies=[Depends(verify_api_key)])
+async def pool_health():
+    """Per-pool size, acquire latency and wait-queue metrics."""
+    return {"pools": get_pool_metrics()}
+
+
+@app.get("/health/queries", dependencies=[Depends(verify_api_key)])
+async def query_health(
+    limit: int = Query(default=50, ge=1, le=1000),
+    order_by: str = "total_ms",
+):
+    """Per-statement latency histograms, per-route query load and N+1 events."""
+    return get_query_metrics().snapshot(limit=limit, order_by=order_by)
+
+
+@app.get("/health/reports", dependencies=[Depends(verify_api_key)])
+async def report_render_health():
+    """Per report type render counts, queue time and render time histograms."""
+    return get_render_pool().snapshot()
+
+
+@app.get("/health/chats", dependencies=[Depends(verify_api_key)])
+async def chat_scheduler_health():
+    """Chat concurrency limits, running and queued chats, queue wait histograms."""
+    if not get_chat_scheduler:
+        return {"enabled": False}
+    return get_chat_scheduler().snapshot()
+
+
 @app.get("/api/config")
 async def get_config():
     """Get frontend configuration.
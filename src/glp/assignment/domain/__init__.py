@@ -12,6 +12,7 @@ from .entities import (
     OperationResult,
     ProcessResult,
     RegionMapping,
+    SubscriptionCompatibilityIndex,
     SubscriptionOption,
     ValidationResult,
 )
@@ -33,6 +34,7 @@ __all__ = [
     "AssignmentGap",
     "RegionMapping",
     "SubscriptionOption",
+    "SubscriptionCompatibilityIndex",
     "ExcelRow",
     "ValidationResult",
     "DomainValidationError",
@@ -8,7 +8,8 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 from uuid import UUID
 
 
@@ -72,7 +73,7 @@ class ValidationResult:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAssignment:
     """Represents a device from Excel with its current and selected state.
 
@@ -241,6 +242,7 @@ class DeviceAssignment:
         }
 
 
+@lru_cache(maxsize=4096)
 def extract_model_series(model: str) -> Optional[str]:
     """Extract the model series from a device model string.
 
@@ -328,7 +330,7 @@ class RegionMapping:
     display_name: str  # e.g., "US West", "EU Central"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionOption:
     """A subscription available for assignment."""
 
@@ -421,6 +423,7 @@ class SubscriptionOption:
         }
 
 
+@lru_cache(maxsize=1024)
 def extract_tier_model_series(tier: str) -> Optional[str]:
     """Extract the model series from a subscription tier.
 
@@ -454,6 +457,85 @@ def extract_tier_model_series(tier: str) -> Optional[str]:
     return None
 
 
+class SubscriptionCompatibilityIndex:
+    """Precomputed subscription option lists per device type and model series.
+
+    Compatibility (device types, tier model series) is evaluated once when
+    the index is built, so lookups don't re-parse tiers or rescan every
+    subscription. Build one per subscription sync generation and reuse it
+    until the subscriptions change.
+
+    Lookup rules match SubscriptionOption.is_compatible_with and
+    is_compatible_with_model: subscriptions without a series fit every
+    model, and models whose series can't be determined fit every
+    subscription of the device type.
+
+    Example:
+        index = SubscriptionCompatibilityIndex(options, generation=synced_at)
+        switch_subs = index.get(device_type="NETWORK", model="6200F-24G-4SFP+")
+    """
+
+    # Model key for devices whose series matches no subscription tier
+    _NO_SERIES_MATCH = ""
+
+    def __init__(
+        self,
+        subscriptions: list[SubscriptionOption],
+        generation: Any = None,
+    ):
+        """Build the index.
+
+        Args:
+            subscriptions: Options in display order (order is preserved)
+            generation: Token identifying the subscription data this index
+                        was built from (e.g. last sync timestamp)
+        """
+        self.generation = generation
+        self._all = list(subscriptions)
+        self._series = {s.model_series for s in self._all} - {None}
+
+        self._by_type: dict[Optional[str], list[SubscriptionOption]] = {None: self._all}
+        for sub in self._all:
+            for device_type in sub.compatible_device_types:
+                self._by_type.setdefault(device_type, []).append(sub)
+
+        # (device_type, model series) -> options; filled on first lookup
+        self._by_type_and_series: dict[tuple[Optional[str], str], list[SubscriptionOption]] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def get(
+        self,
+        device_type: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> list[SubscriptionOption]:
+        """Get options compatible with a device type and/or model.
+
+        Args:
+            device_type: Device type (NETWORK, COMPUTE, STORAGE)
+            model: Device model (e.g., "6200F-24G-4SFP+")
+
+        Returns:
+            Compatible options in their original order
+        """
+        candidates = self._by_type.get(device_type, [])
+        device_series = extract_model_series(model) if model else None
+        if device_series is None:
+            return list(candidates)
+
+        series = device_series if device_series in self._series else self._NO_SERIES_MATCH
+        key = (device_type, series)
+        options = self._by_type_and_series.get(key)
+        if options is None:
+            options = [
+                s for s in candidates
+                if s.model_series is None or s.model_series == series
+            ]
+            self._by_type_and_series[key] = options
+        return list(options)
+
+
 @dataclass
 class ProcessResult:
     """Result of processing an Excel file."""
@@ -46,7 +46,8 @@ Example for 308 devices:
 Key Design Decisions:
 - Application MUST be assigned BEFORE subscription (GreenLake requirement)
 - Both application_id AND region are required for application assignment
-- Rate limiting: PATCH=3.5s interval, POST=2.6s interval
+- Rate limiting: PATCH=3.5s interval, POST=2.6s interval, or the shared
+  AdaptiveRateLimiter budget when one is injected (bursts, learns from 429s)
 - Max 25 devices per API call
 - SEQUENTIAL execution guarantees no rate limit hits
 - Continue on individual failures, collect all errors for report
@@ -60,7 +61,7 @@ from datetime import datetime
 from typing import Any, AsyncGenerator, Iterator, Optional, TypeVar
 from uuid import UUID
 
-from ...api.resilience import SequentialRateLimiter
+from ...api.resilience import AdaptiveRateLimiter, SequentialRateLimiter
 from ..domain.entities import DeviceAssignment, OperationResult
 from ..domain.ports import IDeviceManagerPort, IDeviceRepository, ISyncService
 
@@ -134,6 +135,7 @@ class ApplyAssignmentsUseCase:
         device_manager: IDeviceManagerPort,
         device_repository: Optional[IDeviceRepository] = None,
         sync_service: Optional[ISyncService] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
     ):
         """Initialize the use case.
 
@@ -141,10 +143,15 @@ class ApplyAssignmentsUseCase:
             device_manager: Manager for device operations
             device_repository: Repository to look up devices after sync
             sync_service: Service for syncing with GreenLake
+            rate_limiter: Adaptive limiter shared with the GLPClient behind
+                          device_manager. When provided, batches are paced by the
+                          learned API budget (with bursts) instead of fixed
+                          3.5s/2.6s intervals.
         """
         self.manager = device_manager
         self.device_repo = device_repository
         self.sync_service = sync_service
+        self.rate_limiter = rate_limiter
 
     async def execute(
         self,
@@ -651,7 +658,7 @@ class ApplyAssignmentsUseCase:
         logger.info(f"PHASE 2: Adding {len(devices)} new devices")
 
         operations: list[OperationResult] = []
-        rate_limiter = SequentialRateLimiter("post")
+        rate_limiter = SequentialRateLimiter("post", limiter=self.rate_limiter)
 
         # Log estimated time
         if devices:
@@ -894,7 +901,7 @@ class ApplyAssignmentsUseCase:
         """
         results = []
         pending_operations: list[tuple[OperationResult, list[str], list[str]]] = []  # (result, device_ids, serials)
-        rate_limiter = SequentialRateLimiter("patch")
+        rate_limiter = SequentialRateLimiter("patch", limiter=self.rate_limiter)
 
         # Group by (application_id, region) tuple for efficient batching
         by_app_region: dict[tuple[UUID, str], list[DeviceAssignment]] = {}
@@ -1026,7 +1033,7 @@ class ApplyAssignmentsUseCase:
         """
         results = []
         pending_operations: list[tuple] = []  # (op_result, device_ids, device_serials)
-        rate_limiter = SequentialRateLimiter("patch")
+        rate_limiter = SequentialRateLimiter("patch", limiter=self.rate_limiter)
 
         # Group by subscription_id for efficient batching
         by_subscription: dict[UUID, list[DeviceAssignment]] = {}
@@ -1153,7 +1160,7 @@ class ApplyAssignmentsUseCase:
         """
         results = []
         pending_operations: list[tuple] = []  # (op_result, device_ids, device_serials)
-        rate_limiter = SequentialRateLimiter("patch")
+        rate_limiter = SequentialRateLimiter("patch", limiter=self.rate_limiter)
 
         # Group by tag set for efficient batching
         by_tags: dict[tuple, list[DeviceAssignment]] = {}
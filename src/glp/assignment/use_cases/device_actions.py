@@ -17,6 +17,7 @@ from datetime import datetime
 from typing import Iterator, TypeVar
 from uuid import UUID
 
+from ...api.resilience import AdaptiveRateLimiter
 from ..domain.entities import DeviceAssignment, OperationResult, WorkflowAction
 from ..domain.ports import IDeviceManagerPort, ISyncService
 
@@ -88,15 +89,20 @@ class DeviceActionsUseCase:
         self,
         device_manager: IDeviceManagerPort,
         sync_service: ISyncService | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
     ):
         """Initialize the use case.
 
         Args:
             device_manager: Manager for device operations
             sync_service: Optional service for syncing after actions
+            rate_limiter: Optional adaptive limiter shared with the GLPClient
+                          behind device_manager. When provided, each batch waits
+                          for write budget before it is sent.
         """
         self.manager = device_manager
         self.sync_service = sync_service
+        self.rate_limiter = rate_limiter
 
     async def execute(
         self,
@@ -236,6 +242,10 @@ class DeviceActionsUseCase:
         ):
             logger.debug(f"Processing batch {i + 1}/{len(device_id_batches)}")
 
+            # Archive/unarchive (PATCH) and remove (DELETE) share the write budget
+            if self.rate_limiter:
+                await self.rate_limiter.wait_until_available("patch")
+
             try:
                 op_result = await action_func(device_ids=id_batch)
 
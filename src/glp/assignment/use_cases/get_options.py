@@ -51,20 +51,26 @@ class GetOptionsUseCase:
     async def execute(
         self,
         device_type: Optional[str] = None,
+        model: Optional[str] = None,
     ) -> OptionsResult:
         """Execute the use case.
 
         Args:
             device_type: Optional device type to filter subscriptions
+            model: Optional device model to filter subscriptions by model series
 
         Returns:
             OptionsResult with available subscriptions, regions, and tags
         """
-        logger.info(f"Getting options for device_type={device_type or 'all'}")
+        logger.info(
+            f"Getting options for device_type={device_type or 'all'}"
+            + (f", model={model}" if model else "")
+        )
 
-        # 1. Get available subscriptions
+        # 1. Get available subscriptions (served from the repository's
+        # precomputed compatibility index)
         all_subscriptions = await self.subscriptions.get_available_subscriptions(
-            device_type=device_type
+            device_type=device_type, model=model
         )
 
         # Filter to only show subscriptions with available quantity
@@ -101,13 +107,11 @@ class GetOptionsUseCase:
         Returns:
             List of compatible subscriptions with available quantity
         """
-        all_subs = await self.subscriptions.get_available_subscriptions()
+        subs = await self.subscriptions.get_available_subscriptions(
+            device_type=device_type
+        )
 
-        compatible = [
-            s
-            for s in all_subs
-            if s.is_compatible_with(device_type) and s.available_quantity > 0
-        ]
+        compatible = [s for s in subs if s.available_quantity > 0]
 
         logger.info(
             f"Found {len(compatible)} compatible subscriptions for {device_type}"
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Local stand-in for the GreenLake and Aruba Central APIs.
+
+Serves in-memory inventory over HTTP so syncers and use cases can be run end
+to end (real GLPClient/ArubaCentralClient, real Postgres) without
+credentials or network access. Used by `python benchmark.py --e2e`.
+
+Endpoints:
+    POST  /oauth/token                                   OAuth2 client credentials
+    GET   /devices/v1/devices                            offset/limit pagination
+    GET   /subscriptions/v1/subscriptions                offset/limit pagination
+    POST  /devices/v2beta1/devices                       202 + async operation
+    PATCH /devices/v2beta1/devices?id=...                202 + async operation
+    GET   /devices/v2beta1/async-operations/{id}         operation status
+    GET   /network-monitoring/v1alpha1/device-inventory  cursor pagination
+    GET   /network-monitoring/v1alpha1/clients           cursor pagination (site-id)
+
+Behaviour is set by MockAPIConfig: response latency and jitter, maximum
+page sizes, per-endpoint-class rate limits (answered with 429 and
+Retry-After), randomly injected 429s, and how many status polls an async
+operation takes to complete.
+
+Usage:
+    async with MockGreenLakeServer(devices, subscriptions) as server:
+        token_manager = TokenManager("bench", "bench", server.token_url)
+        async with GLPClient(token_manager, base_url=server.base_url) as client:
+            await DeviceSyncer(client, db_pool).sync()
+        print(server.stats.to_dict())
+
+Author: Performance Analysis
+"""
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from aiohttp import web
+
+from .api.resilience import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# Configuration
+# ============================================
+
+@dataclass
+class MockAPIConfig:
+    """Behaviour of the mock API server.
+
+    Attributes:
+        latency_ms: Added to every response
+        jitter_ms: Random extra latency in [0, jitter_ms)
+        page_sizes: Largest page served per collection (larger limits are
+            capped, as the real APIs do)
+        rate_limits: Requests per minute per endpoint class ("get", "patch",
+            "post", "async_status", "central"); missing classes are unlimited
+        rate_limit_burst: Requests an endpoint class may burst
+        error_429_rate: Fraction of requests answered with 429 regardless of
+            the rate limit
+        retry_after_seconds: Retry-After sent with injected 429s
+        operation_polls: Status polls before an async operation is COMPLETED
+        seed: Seed for jitter and injected errors
+    """
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    page_sizes: dict[str, int] = field(default_factory=lambda: {
+        "devices": 2000,
+        "subscriptions": 50,
+        "central": 100,
+    })
+    rate_limits: dict[str, float] = field(default_factory=dict)
+    rate_limit_burst: int = 10
+    error_429_rate: float = 0.0
+    retry_after_seconds: int = 1
+    operation_polls: int = 1
+    seed: int = 42
+
+
+@dataclass
+class MockAPIStats:
+    """Requests served by the mock server."""
+
+    requests: Counter = field(default_factory=Counter)
+    throttled: Counter = field(default_factory=Counter)
+    items_served: int = 0
+    operations_started: int = 0
+    devices_patched: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "total_requests": sum(self.requests.values()),
+            "throttled": dict(self.throttled),
+            "total_throttled": sum(self.throttled.values()),
+            "items_served": self.items_served,
+            "operations_started": self.operations_started,
+            "devices_patched": self.devices_patched,
+        }
+
+
+class _Bucket:
+    """Server-side token bucket for one endpoint class."""
+
+    def __init__(self, per_minute: float, burst: int):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; returns 0 on success or seconds until one is free."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+# ============================================
+# Server
+# ============================================
+
+class MockGreenLakeServer:
+    """aiohttp server serving GreenLake and Aruba Central inventory.
+
+    Args:
+        devices: GreenLake device records (API shape)
+        subscriptions: GreenLake subscription records (API shape)
+        central_devices: Aruba Central device-inventory records
+        clients: Aruba Central client records keyed by site id
+        config: Latency, page size and rate limit behaviour
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    DEVICE_OPERATIONS_PATH = "/devices/v2beta1/async-operations"
+
+    def __init__(
+        self,
+        devices: Optional[list[dict]] = None,
+        subscriptions: Optional[list[dict]] = None,
+        central_devices: Optional[list[dict]] = None,
+        clients: Optional[dict[str, list[dict]]] = None,
+        config: Optional[MockAPIConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.devices = list(devices or [])
+        self.subscriptions = list(subscriptions or [])
+        self.central_devices = list(central_devices or [])
+        self.clients = dict(clients or {})
+        self.config = config or MockAPIConfig()
+        self.host = host
+        self.port = port
+        self.stats = MockAPIStats()
+
+        self._devices_by_id = {d["id"]: d for d in self.devices}
+        self._operations: dict[str, dict[str, Any]] = {}
+        self._buckets = {
+            name: _Bucket(per_minute, self.config.rate_limit_burst)
+            for name, per_minute in self.config.rate_limits.items()
+        }
+        self._rng = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+
+    # ----------------------------------------
+    # Lifecycle
+    # ----------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        if self._runner is None:
+            raise RuntimeError("MockGreenLakeServer is not running")
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def token_url(self) -> str:
+        return f"{self.base_url}/oauth/token"
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/oauth/token", self._token)
+        app.router.add_get("/devices/v1/devices", self._list_devices)
+        app.router.add_get("/subscriptions/v1/subscriptions", self._list_subscriptions)
+        app.router.add_post("/devices/v2beta1/devices", self._add_device)
+        app.router.add_patch("/devices/v2beta1/devices", self._patch_devices)
+        app.router.add_get(f"{self.DEVICE_OPERATIONS_PATH}/{{operation_id}}", self._operation_status)
+        app.router.add_get("/network-monitoring/v1alpha1/device-inventory", self._central_devices)
+        app.router.add_get("/network-monitoring/v1alpha1/clients", self._central_clients)
+        return app
+
+    async def start(self) -> "MockGreenLakeServer":
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"Mock GreenLake/Aruba API listening on {self.base_url}")
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockGreenLakeServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    # ----------------------------------------
+    # Latency and Rate Limiting
+    # ----------------------------------------
+
+    @staticmethod
+    def endpoint_class(method: str, path: str) -> str:
+        """Rate limit class of a request (Central endpoints share one budget)."""
+        if path.startswith("/network-monitoring/"):
+            return "central"
+        return AdaptiveRateLimiter.classify(method, path)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        config = self.config
+        if request.path == "/oauth/token":
+            return await handler(request)
+
+        endpoint_class = self.endpoint_class(request.method, request.path)
+        self.stats.requests[endpoint_class] += 1
+
+        delay = config.latency_ms + (self._rng.random() * config.jitter_ms if config.jitter_ms else 0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        retry_after = 0.0
+        bucket = self._buckets.get(endpoint_class)
+        if bucket is not None:
+            retry_after = bucket.take()
+        if not retry_after and config.error_429_rate and self._rng.random() < config.error_429_rate:
+            retry_after = config.retry_after_seconds
+        if retry_after:
+            self.stats.throttled[endpoint_class] += 1
+            return self._too_many_requests(endpoint_class, max(1, math.ceil(retry_after)))
+
+        return await handler(request)
+
+    @staticmethod
+    def _too_many_requests(endpoint_class: str, retry_after: int) -> web.Response:
+        headers = {"Retry-After": str(retry_after)}
+        if endpoint_class == "central":
+            # ArubaCentralClient reads the wait from X-RateLimit-Reset
+            headers.update({
+                "X-RateLimit-Limit": "1",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(time.time() + retry_after + 1),
+            })
+        return web.json_response(
+            {"message": "Too many requests"}, status=429, headers=headers
+        )
+
+    # ----------------------------------------
+    # Auth
+    # ----------------------------------------
+
+    async def _token(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "access_token": f"mock-{uuid.uuid4().hex}",
+            "token_type": "Bearer",
+            "expires_in": 7200,
+        })
+
+    # ----------------------------------------
+    # GreenLake Collections (offset pagination)
+    # ----------------------------------------
+
+    def _offset_page(self, request: web.Request, items: list[dict], collection: str) -> web.Response:
+        offset = max(0, int(request.query.get("offset", 0)))
+        limit = int(request.query.get("limit", self.config.page_sizes[collection]))
+        limit = max(1, min(limit, self.config.page_sizes[collection]))
+        page = items[offset:offset + limit]
+        self.stats.items_served += len(page)
+        return web.json_response({
+            "items": page,
+            "count": len(page),
+            "offset": offset,
+            "total": len(items),
+        })
+
+    async def _list_devices(self, request: web.Request) -> web.Response:
+        return self._offset_page(request, self.devices, "devices")
+
+    async def _list_subscriptions(self, request: web.Request) -> web.Response:
+        return self._offset_page(request, self.subscriptions, "subscriptions")
+
+    # ----------------------------------------
+    # GreenLake Device Writes (async operations)
+    # ----------------------------------------
+
+    def _accepted(self, device_ids: list[str]) -> web.Response:
+        operation_id = str(uuid.uuid4())
+        self._operations[operation_id] = {"polls": 0, "device_ids": device_ids}
+        self.stats.operations_started += 1
+        location = f"{self.base_url}{self.DEVICE_OPERATIONS_PATH}/{operation_id}"
+        return web.json_response(
+            {"id": operation_id, "status": "IN_PROGRESS"},
+            status=202,
+            headers={"Location": location},
+        )
+
+    async def _add_device(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        device = {
+            "id": str(uuid.uuid4()),
+            "serialNumber": body.get("serialNumber"),
+            "macAddress": body.get("macAddress"),
+            "partNumber": body.get("partNumber"),
+            "deviceType": body.get("deviceType"),
+            "tags": body.get("tags") or {},
+            "archived": False,
+        }
+        self.devices.append(device)
+        self._devices_by_id[device["id"]] = device
+        return self._accepted([device["id"]])
+
+    async def _patch_devices(self, request: web.Request) -> web.Response:
+        device_ids = request.query.getall("id", [])
+        if not device_ids or len(device_ids) > 25:
+            return web.json_response(
+                {"message": "Between 1 and 25 device ids are required"}, status=400
+            )
+        body = await request.json()
+        for device_id in device_ids:
+            device = self._devices_by_id.get(device_id)
+            if device is None:
+                continue
+            if "application" in body:
+                device["application"] = body["application"]
+            if "region" in body:
+                device["region"] = body["region"]
+            if "subscription" in body:
+                device["subscription"] = body["subscription"]
+            if "tags" in body:
+                tags = dict(device.get("tags") or {})
+                for key, value in body["tags"].items():
+                    if value is None:
+                        tags.pop(key, None)
+                    else:
+                        tags[key] = value
+                device["tags"] = tags
+        self.stats.devices_patched += len(device_ids)
+        return self._accepted(device_ids)
+
+    async def _operation_status(self, request: web.Request) -> web.Response:
+        operation = self._operations.get(request.match_info["operation_id"])
+        if operation is None:
+            return web.json_response({"message": "Operation not found"}, status=404)
+        operation["polls"] += 1
+        if operation["polls"] < self.config.operation_polls:
+            progress = int(operation["polls"] / self.config.operation_polls * 100)
+            return web.json_response({"status": "IN_PROGRESS", "progress": progress})
+        return web.json_response({
+            "status": "COMPLETED",
+            "progress": 100,
+            "result": {"succeededDevices": operation["device_ids"]},
+        })
+
+    # ----------------------------------------
+    # Aruba Central (cursor pagination)
+    # ----------------------------------------
+
+    def _cursor_page(self, request: web.Request, items: list[dict]) -> web.Response:
+        offset = max(0, int(request.query.get("next", 0)))
+        limit = int(request.query.get("limit", self.config.page_sizes["central"]))
+        limit = max(1, min(limit, self.config.page_sizes["central"]))
+        page = items[offset:offset + limit]
+        self.stats.items_served += len(page)
+        next_offset = offset + len(page)
+        return web.json_response({
+            "items": page,
+            "count": len(page),
+            "total": len(items),
+            "next": str(next_offset) if next_offset < len(items) else None,
+        })
+
+    async def _central_devices(self, request: web.Request) -> web.Response:
+        return self._cursor_page(request, self.central_devices)
+
+    async def _central_clients(self, request: web.Request) -> web.Response:
+        return self._cursor_page(request, self.clients.get(request.query.get("site-id", ""), []))
@@ -11,10 +11,17 @@ Features:
 - Beautiful multi-sheet Excel workbooks with HPE branding
 - CSV exports for large datasets
 - Excel formula injection protection
-- Thread-safe async generation
+- Excel rendering in a bounded worker process pool
 """
 
 from .generator import BaseReportGenerator
+from .render_pool import ReportRenderPool, close_render_pool, get_render_pool
 from .styles import ExcelStyles
 
-__all__ = ["BaseReportGenerator", "ExcelStyles"]
+__all__ = [
+    "BaseReportGenerator",
+    "ExcelStyles",
+    "ReportRenderPool",
+    "close_render_pool",
+    "get_render_pool",
+]
@@ -17,7 +17,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 
-from ..assignment.api.dependencies import get_db_pool, verify_api_key
+from ..assignment.api.dependencies import get_export_pool, verify_api_key
 from .assignment_template import AssignmentTemplateGenerator
 from .clients_report import ClientsReportGenerator
 from .dashboard_report import DashboardReportGenerator
@@ -46,7 +46,7 @@ def get_filename(report_type: str, format: str) -> str:
 async def export_dashboard(
     format: str = Query("xlsx", regex="^(csv|xlsx)$", description="Export format"),
     expiring_days: int = Query(90, ge=1, le=365, description="Days for expiring items"),
-    pool=Depends(get_db_pool),
+    pool=Depends(get_export_pool),
     _auth: bool = Depends(verify_api_key),
 ):
     """Export dashboard data as Excel or CSV.
@@ -202,7 +202,7 @@ async def export_devices(
     assigned_state: Optional[str] = Query(None, description="Filter by assignment state"),
     search: Optional[str] = Query(None, description="Search term"),
     limit: int = Query(100000, ge=1, le=100000, description="Maximum records (default: all)"),
-    pool=Depends(get_db_pool),
+    pool=Depends(get_export_pool),
     _auth: bool = Depends(verify_api_key),
 ):
     """Export device inventory as Excel or CSV.
@@ -335,7 +335,7 @@ async def export_subscriptions(
     status: Optional[str] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search term"),
     limit: int = Query(100000, ge=1, le=100000, description="Maximum records (default: all)"),
-    pool=Depends(get_db_pool),
+    pool=Depends(get_export_pool),
     _auth: bool = Depends(verify_api_key),
 ):
     """Export subscription inventory as Excel or CSV.
@@ -444,7 +444,7 @@ async def export_clients(
     site_id: Optional[list[str]] = Query(None, description="Filter by site ID - multi-select"),
     tags: Optional[list[str]] = Query(None, description="Filter by tags in key:value format"),
     limit: int = Query(100000, ge=1, le=100000, description="Maximum records (default: all)"),
-    pool=Depends(get_db_pool),
+    pool=Depends(get_export_pool),
     _auth: bool = Depends(verify_api_key),
 ):
     """Export network clients as Excel or CSV.
@@ -9,18 +9,32 @@ Security:
 - Parameterized queries for all user inputs
 """
 
-import io
 import json
 import logging
 import time
 from datetime import datetime
+from typing import AsyncIterator
 
 import asyncpg
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
-
-from ..assignment.api.dependencies import get_db_pool, verify_api_key
-from .query_builder import QueryBuilder, QueryBuilderError, get_available_tables
+from starlette.background import BackgroundTask
+
+from ..assignment.api.dependencies import get_db_pool, get_export_pool, verify_api_key
+from .query_builder import QueryBuilderError, get_available_tables
+from .report_execution import (
+    ReportRowStream,
+    cache_batches,
+    csv_chunks,
+    file_chunks,
+    get_compiled_query_cache,
+    get_last_sync_id,
+    get_result_cache,
+    iter_cached,
+    json_chunks,
+    remove_file,
+    write_xlsx,
+)
 from .schemas import (
     CreateReportRequest,
     ExecuteReportResponse,
@@ -37,6 +51,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/reports/custom", tags=["custom-reports"])
 
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
 
 @router.get("/fields", response_model=FieldsResponse)
 async def get_fields(
@@ -516,7 +532,7 @@ async def execute_report(
     format: ExportFormat = Query(ExportFormat.JSON, description="Output format"),
     page: int = Query(1, ge=1, description="Page number for pagination"),
     page_size: int = Query(100, ge=1, le=1000, description="Rows per page"),
-    pool: asyncpg.Pool = Depends(get_db_pool),
+    pool: asyncpg.Pool = Depends(get_export_pool),
     _auth: bool = Depends(verify_api_key),
 ):
     """Execute a custom report and return the results.
@@ -530,8 +546,13 @@ async def execute_report(
     - CSV: Downloads results as CSV file
     - XLSX: Downloads results as Excel file
 
-    The endpoint also updates the report's execution statistics (last_executed_at
-    and execution_count).
+    Rows are streamed from a server-side cursor into the response, so memory
+    use doesn't grow with the result size. Compiled queries are cached per
+    report configuration, and small results are cached briefly until the
+    next sync (see report_execution).
+
+    Once the whole result has been sent, the endpoint also updates the report's
+    execution statistics (last_executed_at and execution_count).
 
     Args:
         id: Report ID (UUID)
@@ -542,8 +563,8 @@ async def execute_report(
         _auth: API key authentication
 
     Returns:
-        ExecuteReportResponse: For JSON format with results and metadata
-        StreamingResponse: For CSV/XLSX formats as file download
+        StreamingResponse: ExecuteReportResponse-shaped JSON, or a CSV/XLSX
+            file download
 
     Raises:
         HTTPException: 404 if report not found, 400 if query build fails,
@@ -563,6 +584,7 @@ async def execute_report(
                 """,
                 id,
             )
+            last_sync_id = await get_last_sync_id(conn) if row else None
 
         if not row:
             raise HTTPException(
@@ -584,11 +606,10 @@ async def execute_report(
                 detail=f"Invalid report configuration: {str(e)}",
             )
 
-        # Build the SQL query using QueryBuilder
+        # Compile (or reuse) the positional query for this config and page
         try:
-            builder = QueryBuilder()
             offset = (page - 1) * page_size
-            sql, params = builder.build_query(config, offset=offset)
+            compiled = get_compiled_query_cache().get(config, offset=offset)
         except QueryBuilderError as e:
             logger.error(f"Error building query for report {id}: {e}")
             raise HTTPException(
@@ -596,81 +617,109 @@ async def execute_report(
                 detail=f"Invalid report configuration: {str(e)}",
             )
 
-        # Execute the query and measure execution time
         start_time = time.perf_counter()
 
-        async with pool.acquire() as conn:
-            # Convert parameter dict to positional list for asyncpg
-            # asyncpg expects $1, $2, etc. but we need to map our param names
-            param_values = []
-            query_with_placeholders = sql
-
-            # Replace named parameters ($param_1, $param_2) with positional ones ($1, $2)
-            for i, (param_name, param_value) in enumerate(sorted(params.items()), start=1):
-                query_with_placeholders = query_with_placeholders.replace(f"${param_name}", f"${i}")
-                param_values.append(param_value)
-
-            # Execute the query
-            rows = await conn.fetch(query_with_placeholders, *param_values)
-
-        execution_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
-
-        # Update report execution statistics
-        async with pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE custom_reports
-                SET
-                    last_executed_at = $1,
-                    execution_count = execution_count + 1
-                WHERE id = $2
-                """,
-                datetime.now(),
-                id,
-            )
-
-        # Convert rows to list of dicts
-        data = [dict(row) for row in rows]
+        # Serve small, recent results from the cache; otherwise stream rows
+        # from a server-side cursor. The stream holds its connection until
+        # the response body has been written.
+        result_cache = get_result_cache()
+        cache_key = (id, compiled.config_hash, last_sync_id, offset)
+        cached = result_cache.get(cache_key) if last_sync_id is not None else None
+
+        stream = None
+        if cached is not None:
+            columns = cached.columns
+            batches = iter_cached(cached.rows)
+        else:
+            stream = ReportRowStream(pool, compiled)
+            await stream.__aenter__()
+            columns = stream.columns
+            batches = stream.batches()
+            if last_sync_id is not None:
+                batches = cache_batches(batches, result_cache, cache_key, columns, start_time)
+
+        path = None
+
+        async def close_stream() -> None:
+            if stream is not None:
+                await stream.__aexit__(None, None, None)
+
+        async def cleanup() -> None:
+            # Runs from the body, the response's background task and the
+            # error path below, so the XLSX file goes even if the body is
+            # never read
+            nonlocal path
+            await close_stream()
+            if path is not None:
+                remove_file(path)
+                path = None
+
+        async def record_execution() -> None:
+            try:
+                async with pool.acquire() as conn:
+                    await conn.execute(
+                        """
+                        UPDATE custom_reports
+                        SET
+                            last_executed_at = $1,
+                            execution_count = execution_count + 1
+                        WHERE id = $2
+                        """,
+                        datetime.now(),
+                        id,
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to update execution statistics for report {id}: {e}")
 
-        # Extract column names from first row (if any)
-        columns = list(data[0].keys()) if data else []
+        try:
+            if format == ExportFormat.XLSX:
+                path = await write_xlsx(columns, batches, sheet_title=row["name"])
+                await close_stream()
+                body = file_chunks(path)
+            elif format == ExportFormat.CSV:
+                body = csv_chunks(columns, batches)
+            else:
+                body = json_chunks(
+                    columns,
+                    batches,
+                    {"page": page, "page_size": page_size, "generated_sql": compiled.generated_sql},
+                    start_time,
+                )
+        except BaseException:
+            await cleanup()
+            raise
+
+        async def respond() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                await cleanup()
+            await record_execution()
 
-        # Handle different output formats
         if format == ExportFormat.JSON:
-            # Return JSON response with metadata
-            return ExecuteReportResponse(
-                success=True,
-                columns=columns,
-                data=data,
-                total_rows=len(data),
-                page=page,
-                page_size=page_size,
-                execution_time_ms=execution_time,
-                generated_sql=sql,
-                errors=[],
-            )
-        elif format == ExportFormat.CSV:
-            # Generate CSV and return as download
-            csv_content = _generate_csv(data, columns)
-            filename = f"{row['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-
             return StreamingResponse(
-                io.BytesIO(csv_content.encode("utf-8")),
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"',
-                    "Cache-Control": "no-store, no-cache, must-revalidate, private",
-                    "Pragma": "no-cache",
-                    "X-Content-Type-Options": "nosniff",
-                },
-            )
-        elif format == ExportFormat.XLSX:
-            # For now, XLSX is not implemented - return error
-            raise HTTPException(
-                status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                detail="XLSX export format is not yet implemented. Please use JSON or CSV.",
+                respond(),
+                media_type="application/json",
+                background=BackgroundTask(cleanup),
             )
 
+        extension = "xlsx" if format == ExportFormat.XLSX else "csv"
+        media_type = XLSX_MEDIA_TYPE if format == ExportFormat.XLSX else "text/csv"
+        filename = f"{row['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+        return StreamingResponse(
+            respond(),
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Cache-Control": "no-store, no-cache, must-revalidate, private",
+                "Pragma": "no-cache",
+                "X-Content-Type-Options": "nosniff",
+            },
+            background=BackgroundTask(cleanup),
+        )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -679,40 +728,3 @@ async def execute_report(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to execute report: {str(e)}",
         )
-
-
-def _generate_csv(data: list[dict], columns: list[str]) -> str:
-    """Generate CSV content from query results.
-
-    Args:
-        data: List of row dictionaries
-        columns: List of column names in order
-
-    Returns:
-        CSV content as string
-    """
-    import csv
-    from io import StringIO
-
-    output = StringIO()
-
-    if not data:
-        return ""
-
-    writer = csv.DictWriter(output, fieldnames=columns)
-    writer.writeheader()
-
-    for row in data:
-        # Convert any non-string values to strings for CSV
-        csv_row = {}
-        for col in columns:
-            value = row.get(col)
-            if value is None:
-                csv_row[col] = ""
-            elif isinstance(value, (datetime,)):
-                csv_row[col] = value.isoformat()
-            else:
-                csv_row[col] = str(value)
-        writer.writerow(csv_row)
-
-    return output.getvalue()
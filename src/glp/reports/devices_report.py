@@ -5,15 +5,20 @@ Generates comprehensive device inventory reports with:
 - Full device listing with all fields
 - Insights on unassigned and expiring devices
 - Aruba Central integration status
+
+Inventories of WRITE_ONLY_MIN_ROWS devices or more are built as a
+write-only workbook in a single pass over the devices (see
+generate_excel_write_only).
 """
 
 import json
 import logging
+from itertools import chain, islice
 from typing import Any
 
 from openpyxl.styles import Font
 
-from .generator import BaseReportGenerator
+from .generator import WIDTH_SAMPLE_ROWS, WRITE_ONLY_MIN_ROWS, BaseReportGenerator, SheetRow
 
 logger = logging.getLogger(__name__)
 
@@ -55,10 +60,12 @@ class DevicesReportGenerator(BaseReportGenerator):
         2. Device List - Full device inventory
         3. Insights - Devices needing attention
         """
-        wb = self.create_workbook()
-
         # Extract items
         items = data.get("items", [])
+        if len(items) >= WRITE_ONLY_MIN_ROWS:
+            return self.generate_excel_write_only(data, filters)
+
+        wb = self.create_workbook()
         total = data.get("total", len(items))
 
         # Sheet 1: Summary
@@ -198,21 +205,7 @@ class DevicesReportGenerator(BaseReportGenerator):
 
         # Data rows
         for item in items:
-            row_data = []
-            for field, _ in self.DEVICE_COLUMNS:
-                value = item.get(field, "")
-
-                # Handle special fields
-                if field == "tags" and isinstance(value, dict):
-                    # Format tags as key:value pairs
-                    value = "; ".join(f"{k}:{v}" for k, v in value.items()) if value else ""
-                elif field == "assigned_state":
-                    value = "Assigned" if value == "ASSIGNED_TO_SERVICE" else "Unassigned" if value == "UNASSIGNED" else value
-                elif field == "subscription_type" and value:
-                    value = value.replace("CENTRAL_", "")
-
-                row_data.append(value)
-
+            row_data = self._device_row(item)
             self.add_data_row(ws, row_data, row, alternate=(row % 2 == 0))
 
             # Color code assignment status
@@ -235,6 +228,24 @@ class DevicesReportGenerator(BaseReportGenerator):
         self.auto_fit_columns(ws, max_width=40)
         self.freeze_panes(ws, row=2)
 
+    def _device_row(self, item: dict) -> list[Any]:
+        """Device List values for one device."""
+        row_data = []
+        for field, _ in self.DEVICE_COLUMNS:
+            value = item.get(field, "")
+
+            # Handle special fields
+            if field == "tags" and isinstance(value, dict):
+                # Format tags as key:value pairs
+                value = "; ".join(f"{k}:{v}" for k, v in value.items()) if value else ""
+            elif field == "assigned_state":
+                value = "Assigned" if value == "ASSIGNED_TO_SERVICE" else "Unassigned" if value == "UNASSIGNED" else value
+            elif field == "subscription_type" and value:
+                value = value.replace("CENTRAL_", "")
+
+            row_data.append(value)
+        return row_data
+
     def _create_insights_sheet(self, ws, items: list[dict]) -> None:
         """Create insights sheet highlighting devices needing attention."""
         row = self.add_report_header(
@@ -358,3 +369,218 @@ class DevicesReportGenerator(BaseReportGenerator):
 
         self.auto_fit_columns(ws)
         self.freeze_panes(ws, row=6)
+
+    # ============================================
+    # Write-Only Mode
+    # ============================================
+
+    def generate_excel_write_only(
+        self,
+        data: dict[str, Any],
+        filters: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Generate the same report as a write-only workbook.
+
+        Rows stream to disk as they are appended, each cell style is a
+        named style set once per column, Device List widths come from the
+        first WIDTH_SAMPLE_ROWS devices, and the Summary and Insights
+        figures are collected while the Device List is written, so the
+        devices are walked once.
+        """
+        items = data.get("items", [])
+        total = data.get("total", len(items))
+
+        wb = self.create_write_only_workbook()
+        ws_summary = wb.create_sheet("Summary")
+        ws_devices = wb.create_sheet("Device List")
+        ws_insights = wb.create_sheet("Insights")
+
+        summary = self._write_device_list(ws_devices, items)
+        self.write_small_sheet(
+            ws_summary, self._summary_rows(summary, total, filters), freeze_row=8, merged_rows=2
+        )
+        self.write_small_sheet(
+            ws_insights, self._insights_rows(summary), freeze_row=6, merged_rows=2
+        )
+
+        return self._workbook_to_bytes(wb)
+
+    def _write_device_list(self, ws, items: list[dict]) -> dict[str, Any]:
+        """Stream the Device List sheet and summarize the devices.
+
+        Returns:
+            Counts and attention lists for the Summary and Insights sheets
+        """
+        summary: dict[str, Any] = {
+            "devices": 0,
+            "assigned": 0,
+            "in_central": 0,
+            "online": 0,
+            "with_subscription": 0,
+            "types": {},
+            "regions": {},
+            # [first 50 devices, total count]
+            "unassigned": [[], 0],
+            "no_subscription": [[], 0],
+            "offline": [[], 0],
+        }
+        types: dict[str, int] = summary["types"]
+        regions: dict[str, int] = summary["regions"]
+
+        def track(key: str, device: dict) -> None:
+            devices = summary[key]
+            if devices[1] < 50:
+                devices[0].append(device)
+            devices[1] += 1
+
+        headers = [label for _, label in self.DEVICE_COLUMNS]
+        devices = iter(items)
+        sample = [(item, self._device_row(item)) for item in islice(devices, WIDTH_SAMPLE_ROWS)]
+        self.set_column_widths(
+            ws, self.estimate_column_widths([headers, *(row for _, row in sample)], max_width=40)
+        )
+        ws.freeze_panes = "A2"
+
+        writer = self.write_only_rows(ws)
+        writer.append(headers, "report_header")
+
+        assigned_col = 6  # assigned_state column
+        central_col = 13  # central_status column
+        row = 2
+        for item, row_data in chain(sample, ((item, self._device_row(item)) for item in devices)):
+            assigned_state = item.get("assigned_state")
+            central_status = item.get("central_status")
+
+            styles = {}
+            if assigned_state == "ASSIGNED_TO_SERVICE":
+                styles[assigned_col] = "report_success"
+                summary["assigned"] += 1
+            elif assigned_state == "UNASSIGNED":
+                styles[assigned_col] = "report_warning"
+                track("unassigned", item)
+            status_style = self.styles.get_status_style_name(central_status)
+            if status_style:
+                styles[central_col] = status_style
+
+            writer.append(
+                row_data, "report_data_alt" if row % 2 == 0 else "report_data", styles
+            )
+            row += 1
+
+            summary["devices"] += 1
+            if item.get("in_central"):
+                summary["in_central"] += 1
+                if central_status == "OFFLINE":
+                    track("offline", item)
+            if central_status == "ONLINE":
+                summary["online"] += 1
+            if item.get("subscription_key"):
+                summary["with_subscription"] += 1
+            else:
+                track("no_subscription", item)
+            dtype = item.get("device_type", "Unknown") or "Unknown"
+            types[dtype] = types.get(dtype, 0) + 1
+            region = item.get("region", "Unknown") or "Unknown"
+            regions[region] = regions.get(region, 0) + 1
+
+        return summary
+
+    def _summary_rows(
+        self,
+        summary: dict[str, Any],
+        total: int,
+        filters: dict[str, Any] | None,
+    ) -> list[SheetRow]:
+        """Summary sheet rows, laid out as _create_summary_sheet() does."""
+        rows = self.report_header_rows("Device Inventory Report", f"{total:,} Devices", filters)
+        rows.append((["Quick Statistics"], "report_subtitle", None))
+        rows.append(([], None, None))
+
+        devices = summary["devices"]
+        assigned = summary["assigned"]
+        kpi_data = [
+            ("Total Devices", devices, None),
+            ("Assigned", assigned, f"{(assigned / max(devices, 1) * 100):.1f}%"),
+            ("In Aruba Central", summary["in_central"], f"{summary['online']} online"),
+            ("With Subscription", summary["with_subscription"], None),
+        ]
+        # KPI cards sit in every other column
+        for part, style in ((0, "report_kpi_label"), (1, "report_kpi_value"), (2, "report_kpi_note")):
+            values: list[Any] = []
+            for kpi in kpi_data:
+                values += [kpi[part], None]
+            rows.append((values[:-1], style, None))
+        rows.extend([([], None, None)] * 3)
+
+        for title, label, counts in (
+            ("Breakdown by Device Type", "Device Type", summary["types"]),
+            ("Breakdown by Region", "Region", summary["regions"]),
+        ):
+            rows.append(([title], "report_subtitle", None))
+            rows.append(([], None, None))
+            rows.append(([label, "Count", "Percentage"], "report_header", None))
+            for name, count in sorted(counts.items(), key=lambda x: -x[1]):
+                pct = f"{(count / max(devices, 1) * 100):.1f}%"
+                # Sheet rows are 1-based
+                alternate = (len(rows) + 1) % 2 == 0
+                rows.append(([name, count, pct], "report_data_alt" if alternate else "report_data", None))
+            rows.extend([([], None, None)] * 2)
+
+        return rows[:-2]
+
+    def _insights_rows(self, summary: dict[str, Any]) -> list[SheetRow]:
+        """Insights sheet rows, laid out as _create_insights_sheet() does."""
+        rows = self.report_header_rows("Device Insights", "Devices Requiring Attention")
+
+        def assignment(device: dict) -> str:
+            return "Assigned" if device.get("assigned_state") == "ASSIGNED_TO_SERVICE" else "Unassigned"
+
+        sections = (
+            (
+                "Unassigned Devices",
+                "unassigned",
+                ["Serial Number", "Device Type", "Model", "Region"],
+                lambda d: [d.get("serial_number"), d.get("device_type"), d.get("model"), d.get("region")],
+                "All devices are assigned.",
+            ),
+            (
+                "Devices Without Subscription",
+                "no_subscription",
+                ["Serial Number", "Device Type", "Model", "Assignment Status"],
+                lambda d: [d.get("serial_number"), d.get("device_type"), d.get("model"), assignment(d)],
+                "All devices have subscriptions.",
+            ),
+            (
+                "Offline Devices in Aruba Central",
+                "offline",
+                ["Serial Number", "Device Name", "Central Site", "Last Seen"],
+                lambda d: [
+                    d.get("serial_number"),
+                    d.get("central_device_name"),
+                    d.get("central_site_name"),
+                    d.get("central_last_seen_at"),
+                ],
+                "All Central devices are online.",
+            ),
+        )
+
+        for title, key, headers, values, all_clear in sections:
+            rows.append(([title], "report_subtitle", None))
+            rows.append(([], None, None))
+            devices, count = summary[key]
+            if count:
+                rows.append((headers, "report_header", None))
+                for device in devices:
+                    if key == "offline":
+                        # Highlight as error
+                        style = "report_error"
+                    else:
+                        style = "report_data_alt" if (len(rows) + 1) % 2 == 0 else "report_data"
+                    rows.append((values(device), style, None))
+                if count > 50:
+                    rows.append(([f"... and {count - 50} more"], "report_note", None))
+            else:
+                rows.append(([all_clear], "report_success", None))
+            rows.extend([([], None, None)] * 2)
+
+        return rows[:-2]
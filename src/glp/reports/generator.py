@@ -2,29 +2,89 @@
 
 This module provides the foundation for all report generators with:
 - Excel formula injection protection
-- Thread-safe async generation
+- Async generation (Excel rendered in a worker process pool)
 - Common styling and formatting
 - CSV and Excel output support
+- Write-only workbooks for large reports (WriteOnlyRows)
 """
 
 import csv
 import io
 import logging
+import os
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
 from datetime import datetime
 from typing import Any
 
 import anyio
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+from .render_pool import get_render_pool
 from .styles import ExcelStyles
 
 logger = logging.getLogger(__name__)
 
+# Reports with at least this many data rows are built as write-only workbooks
+WRITE_ONLY_MIN_ROWS = int(os.getenv("REPORT_WRITE_ONLY_MIN_ROWS", "5000"))
+
+# Data rows sampled to size the columns of a write-only sheet
+WIDTH_SAMPLE_ROWS = 1000
+
+# (values, named style for the row, per-column style overrides)
+SheetRow = tuple[Sequence[Any], str | None, dict[int, str] | None]
+
+
+class WriteOnlyRows:
+    """Appends styled rows to a write-only worksheet.
+
+    openpyxl serializes each appended row immediately, so one WriteOnlyCell
+    per (column, named style) is reused for every row instead of creating
+    and styling a cell object per value.
+
+    Column widths and freeze panes are written with the sheet header, so
+    set them before the first append().
+    """
+
+    def __init__(self, ws: Any, sanitize: Callable[[Any], Any]):
+        self.ws = ws
+        self._sanitize = sanitize
+        self._cells: dict[tuple[int, str | None], WriteOnlyCell] = {}
+
+    def _cell(self, col: int, style: str | None) -> WriteOnlyCell:
+        cell = self._cells.get((col, style))
+        if cell is None:
+            cell = WriteOnlyCell(self.ws)
+            if style:
+                cell.style = style
+            self._cells[(col, style)] = cell
+        return cell
+
+    def append(
+        self,
+        values: Sequence[Any],
+        style: str | None = None,
+        styles: dict[int, str] | None = None,
+    ) -> None:
+        """Append one row.
+
+        Args:
+            values: Cell values, sanitized against formula injection
+            style: Named style for every cell of the row
+            styles: Named style overrides by 0-based column index
+        """
+        row = []
+        for col, value in enumerate(values):
+            cell = self._cell(col, styles.get(col, style) if styles else style)
+            cell.value = self._sanitize(value)
+            row.append(cell)
+        self.ws.append(row)
+
 
 class BaseReportGenerator(ABC):
     """Abstract base class for report generators.
@@ -216,6 +276,114 @@ class BaseReportGenerator(ABC):
             adjusted_width = min(max(max_length + 2, min_width), max_width)
             ws.column_dimensions[column_letter].width = adjusted_width
 
+    @classmethod
+    def estimate_column_widths(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        min_width: int = 10,
+        max_width: int = 50,
+    ) -> list[int]:
+        """Column widths auto_fit_columns() would set for these rows.
+
+        Values are measured as sanitize_cell_value() writes them. Used for
+        write-only sheets, whose cells can't be read back; pass a sample of
+        the data rows for large sheets.
+
+        Args:
+            rows: Row values
+            min_width: Minimum column width
+            max_width: Maximum column width
+
+        Returns:
+            Width per column, first column first
+        """
+        lengths: list[int] = []
+        for row in rows:
+            if len(row) > len(lengths):
+                lengths.extend([0] * (len(row) - len(lengths)))
+            for col, value in enumerate(row):
+                value = cls.sanitize_cell_value(value)
+                if value:
+                    length = len(str(value))
+                    if length > lengths[col]:
+                        lengths[col] = length
+        return [min(max(length + 2, min_width), max_width) for length in lengths]
+
+    @staticmethod
+    def set_column_widths(ws: Any, widths: Sequence[int]) -> None:
+        """Set column widths, first column first."""
+        for col, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+
+    def create_write_only_workbook(self) -> Workbook:
+        """Create a write-only workbook with named styles registered.
+
+        Rows stream to a temporary file as they are appended, so memory
+        stays flat regardless of row count.
+        """
+        wb = Workbook(write_only=True)
+        for style in self.styles.create_named_styles():
+            wb.add_named_style(style)
+        return wb
+
+    def write_only_rows(self, ws: Any) -> WriteOnlyRows:
+        """Row appender for a write-only worksheet."""
+        return WriteOnlyRows(ws, self.sanitize_cell_value)
+
+    def report_header_rows(
+        self,
+        title: str,
+        subtitle: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> list[SheetRow]:
+        """The rows add_report_header() writes, for write-only sheets."""
+        rows: list[SheetRow] = [([title], "report_title", None)]
+        if subtitle:
+            rows.append(([subtitle], "report_subtitle", None))
+        rows.append(([], None, None))
+        rows.append((["Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")], None, None))
+        if filters:
+            active_filters = {k: v for k, v in filters.items() if v is not None}
+            if active_filters:
+                filter_str = ", ".join(f"{k}={v}" for k, v in active_filters.items())
+                rows.append((["Filters Applied:", filter_str], None, None))
+        rows.append(([], None, None))
+        return rows
+
+    def write_small_sheet(
+        self,
+        ws: Any,
+        rows: list[SheetRow],
+        freeze_row: int | None = None,
+        max_width: int = 50,
+        merged_rows: int = 0,
+    ) -> None:
+        """Write a short, fully built sheet to a write-only worksheet.
+
+        Column widths are fitted to every row, as auto_fit_columns() does.
+
+        Args:
+            ws: Write-only worksheet with nothing appended yet
+            rows: Rows to write
+            freeze_row: Freeze the rows above this one
+            max_width: Maximum column width
+            merged_rows: Leading rows to merge across columns A:F, as
+                add_report_header() does for the title and subtitle
+        """
+        widths = self.estimate_column_widths((values for values, _, _ in rows), max_width=max_width)
+        if merged_rows:
+            # Merged cells count as columns for auto_fit_columns()
+            widths += [10] * (6 - len(widths))
+            for row in range(1, merged_rows + 1):
+                ws.merged_cells.add(f"A{row}:F{row}")
+        self.set_column_widths(ws, widths)
+        if freeze_row:
+            ws.freeze_panes = f"A{freeze_row}"
+
+        writer = self.write_only_rows(ws)
+        for values, style, styles in rows:
+            writer.append(values, style, styles)
+
     def freeze_panes(self, ws: Worksheet, row: int = 2, column: int = 1) -> None:
         """Freeze panes at the specified position.
 
@@ -298,8 +466,9 @@ class BaseReportGenerator(ABC):
     ) -> bytes:
         """Generate Excel report asynchronously (non-blocking).
 
-        Uses anyio.to_thread to offload heavy workbook generation
-        from the async event loop.
+        Workbook generation holds the GIL for seconds on large exports, so
+        it runs in the shared report render process pool (see
+        render_pool), limited per report type and timed.
 
         Args:
             data: Report data
@@ -308,9 +477,7 @@ class BaseReportGenerator(ABC):
         Returns:
             Excel file as bytes
         """
-        return await anyio.to_thread.run_sync(
-            lambda: self.generate_excel(data, filters)
-        )
+        return await get_render_pool().render_excel(self, data, filters)
 
     async def generate_csv_async(
         self,
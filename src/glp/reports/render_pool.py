@@ -0,0 +1,344 @@
+"""Process-pool rendering for Excel reports.
+
+Building a styled openpyxl workbook (per-cell fonts, fills and borders,
+auto_fit_columns over every cell) holds the GIL for seconds on large
+exports. Run on a thread, that still stalls the event loop that serves
+every other request in the process. Excel rendering is therefore done in
+a small pool of worker processes:
+
+    - Bounded: REPORT_RENDER_WORKERS processes, started lazily with the
+      spawn method (forking a process that runs an event loop and asyncpg
+      pools is unsafe) and recycled every MAX_TASKS_PER_WORKER renders
+    - Per report type limit: at most REPORT_RENDER_PER_TYPE_LIMIT renders
+      of one generator class run at once, so a burst of device exports
+      cannot take every worker from the dashboard export
+    - Compact transfer: lists of uniform row dicts (asyncpg records) are
+      sent as ColumnarRows, one list per column, instead of one pickled
+      dict per row
+    - Metrics: per report type queue time (request to render start) and
+      render time histograms, served at /health/reports
+
+Set REPORT_RENDER_PROCESSES=false to render on threads instead (the
+previous behaviour); the same limits and metrics apply.
+
+Example:
+    content = await get_render_pool().render_excel(DevicesReportGenerator(), data, filters)
+    get_render_pool().snapshot()["report_types"]["DevicesReportGenerator"]
+"""
+
+import asyncio
+import bisect
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+REPORT_RENDER_PROCESSES = os.getenv("REPORT_RENDER_PROCESSES", "true").lower() == "true"
+
+# Leave a core for the event loop; a single-core host still gets one worker
+DEFAULT_WORKERS = int(
+    os.getenv("REPORT_RENDER_WORKERS", str(min(4, max(1, (os.cpu_count() or 2) - 1))))
+)
+DEFAULT_PER_TYPE_LIMIT = int(os.getenv("REPORT_RENDER_PER_TYPE_LIMIT", "2"))
+
+# Workers are replaced after this many renders to return openpyxl's memory
+MAX_TASKS_PER_WORKER = 50
+
+# Upper bounds (ms) of the queue/render time histogram buckets
+RENDER_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+# ============================================
+# Columnar Transfer
+# ============================================
+
+@dataclass(slots=True)
+class ColumnarRows:
+    """Rows sharing one set of keys, stored one list per column."""
+
+    columns: tuple[str, ...]
+    values: list[list[Any]]
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> Optional["ColumnarRows"]:
+        """Pack rows, or return None if they don't all have the same keys in order."""
+        if not rows or not all(isinstance(row, dict) for row in rows):
+            return None
+        columns = tuple(rows[0])
+        if any(tuple(row) != columns for row in rows):
+            return None
+        return cls(columns, [list(column) for column in zip(*(row.values() for row in rows))])
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Rebuild the row dicts, keys in their original order."""
+        if not self.columns:
+            return []
+        return [dict(zip(self.columns, row)) for row in zip(*self.values)]
+
+    def __len__(self) -> int:
+        return len(self.values[0]) if self.values else 0
+
+
+def pack_report_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Replace top-level lists of uniform row dicts with ColumnarRows."""
+    packed = {}
+    for key, value in data.items():
+        if isinstance(value, list):
+            value = ColumnarRows.from_rows(value) or value
+        packed[key] = value
+    return packed
+
+
+def unpack_report_data(packed: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of pack_report_data()."""
+    return {
+        key: value.to_rows() if isinstance(value, ColumnarRows) else value
+        for key, value in packed.items()
+    }
+
+
+def _render_excel(
+    generator_cls: type,
+    packed: dict[str, Any],
+    filters: Optional[dict[str, Any]],
+) -> tuple[bytes, float, float]:
+    """Worker entry point: render one workbook.
+
+    Returns:
+        (workbook bytes, wall-clock start, render seconds)
+    """
+    started_at = time.time()
+    start = time.perf_counter()
+    content = generator_cls().generate_excel(unpack_report_data(packed), filters)
+    return content, started_at, time.perf_counter() - start
+
+
+# ============================================
+# Metrics
+# ============================================
+
+@dataclass
+class TimingStats:
+    """Count, total, max and histogram of one timed phase."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(RENDER_BUCKETS_MS) + 1))
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.histogram[bisect.bisect_left(RENDER_BUCKETS_MS, seconds * 1000)] += 1
+
+    def percentile_ms(self, pct: float) -> float:
+        """Approximate percentile (bucket upper bound)."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return float(RENDER_BUCKETS_MS[i]) if i < len(RENDER_BUCKETS_MS) else self.max_seconds * 1000
+        return self.max_seconds * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"le_{b}ms" for b in RENDER_BUCKETS_MS] + [f"gt_{RENDER_BUCKETS_MS[-1]}ms"]
+        return {
+            "avg_ms": (self.total_seconds / self.count * 1000) if self.count else 0.0,
+            "p50_ms": self.percentile_ms(0.50),
+            "p95_ms": self.percentile_ms(0.95),
+            "max_ms": self.max_seconds * 1000,
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+@dataclass
+class ReportTypeStats:
+    """Render counters for one report generator class."""
+
+    renders: int = 0
+    failures: int = 0
+    waiting: int = 0
+    running: int = 0
+    bytes_out: int = 0
+    queue: TimingStats = field(default_factory=TimingStats)
+    render: TimingStats = field(default_factory=TimingStats)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "renders": self.renders,
+            "failures": self.failures,
+            "waiting": self.waiting,
+            "running": self.running,
+            "bytes_out": self.bytes_out,
+            "queue_time": self.queue.to_dict(),
+            "render_time": self.render.to_dict(),
+        }
+
+
+# ============================================
+# Render Pool
+# ============================================
+
+class ReportRenderPool:
+    """Bounded process pool that renders Excel reports off the event loop.
+
+    Args:
+        max_workers: Worker processes (default REPORT_RENDER_WORKERS)
+        per_type_limit: Concurrent renders per report type
+            (default REPORT_RENDER_PER_TYPE_LIMIT)
+        use_processes: Render in worker processes; False renders on
+            threads (default REPORT_RENDER_PROCESSES)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        per_type_limit: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+    ):
+        self.max_workers = max(1, max_workers or DEFAULT_WORKERS)
+        self.per_type_limit = max(1, per_type_limit or DEFAULT_PER_TYPE_LIMIT)
+        self.use_processes = REPORT_RENDER_PROCESSES if use_processes is None else use_processes
+        self.stats: dict[str, ReportTypeStats] = {}
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=MAX_TASKS_PER_WORKER,
+            )
+            logger.info(f"Started report render pool with {self.max_workers} workers")
+        return self._executor
+
+    async def _run(
+        self,
+        generator_cls: type,
+        packed: dict[str, Any],
+        filters: Optional[dict[str, Any]],
+    ) -> tuple[bytes, float, float]:
+        if not self.use_processes:
+            return await anyio.to_thread.run_sync(_render_excel, generator_cls, packed, filters)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), _render_excel, generator_cls, packed, filters
+            )
+        except BrokenProcessPool:
+            # A worker died (OOM kill, crash); start a fresh pool for the next render
+            logger.error("Report render pool broken; restarting it")
+            self._executor = None
+            raise
+
+    async def render_excel(
+        self,
+        generator: Any,
+        data: dict[str, Any],
+        filters: Optional[dict[str, Any]] = None,
+    ) -> bytes:
+        """Render generator.generate_excel(data, filters) in the pool.
+
+        The generator's class is instantiated in the worker, so it must be
+        importable at module level and need no constructor arguments.
+
+        Args:
+            generator: BaseReportGenerator instance
+            data: Report data
+            filters: Optional filters applied
+
+        Returns:
+            Excel file as bytes
+        """
+        generator_cls = type(generator)
+        report_type = generator_cls.__name__
+        stats = self.stats.setdefault(report_type, ReportTypeStats())
+        limit = self._limits.setdefault(report_type, asyncio.Semaphore(self.per_type_limit))
+
+        queued_at = time.time()
+        packed = pack_report_data(data)
+        stats.waiting += 1
+        acquired = False
+        try:
+            async with limit:
+                stats.waiting -= 1
+                acquired = True
+                stats.running += 1
+                try:
+                    content, started_at, render_seconds = await self._run(
+                        generator_cls, packed, filters
+                    )
+                finally:
+                    stats.running -= 1
+        except BaseException:
+            # Includes requests cancelled while queued (client went away)
+            if not acquired:
+                stats.waiting -= 1
+            stats.failures += 1
+            raise
+
+        stats.renders += 1
+        stats.bytes_out += len(content)
+        stats.queue.record(max(0.0, started_at - queued_at))
+        stats.render.record(render_seconds)
+        return content
+
+    def snapshot(self) -> dict[str, Any]:
+        """Pool settings and per report type render metrics."""
+        return {
+            "mode": "processes" if self.use_processes else "threads",
+            "max_workers": self.max_workers,
+            "per_type_limit": self.per_type_limit,
+            "report_types": {name: stats.to_dict() for name, stats in sorted(self.stats.items())},
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; in-flight renders are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_render_pool: Optional[ReportRenderPool] = None
+
+
+def get_render_pool() -> ReportRenderPool:
+    """The process-wide ReportRenderPool."""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ReportRenderPool()
+    return _render_pool
+
+
+def close_render_pool() -> None:
+    """Shut down the process-wide render pool, if one was started."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
+
+
+__all__ = [
+    "ColumnarRows",
+    "ReportRenderPool",
+    "ReportTypeStats",
+    "close_render_pool",
+    "get_render_pool",
+    "pack_report_data",
+    "unpack_report_data",
+]
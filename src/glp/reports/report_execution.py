@@ -0,0 +1,492 @@
+"""Custom report execution: compiled queries, result cache and streaming.
+
+Saved reports are executed in three steps:
+
+1. Compile: QueryBuilder output is converted to asyncpg positional SQL and
+   cached per (config hash, offset). Identical configs produce identical
+   SQL text, so asyncpg's per-connection statement cache also reuses the
+   server-side prepared statement (and Postgres its plan).
+2. Stream: rows are read from a server-side cursor in fixed-size batches
+   inside a read-only transaction and written straight into CSV, JSON or
+   XLSX output, so memory use is bounded by the batch size rather than
+   the row count.
+3. Cache (optional): small results are kept for a short TTL keyed by
+   (report id, config hash, last sync id, offset), so dashboards polling
+   a saved report don't re-run it until new data is synced.
+
+Example:
+    compiled = get_compiled_query_cache().get(config, offset=0)
+    async with ReportRowStream(pool, compiled) as stream:
+        async for chunk in csv_chunks(stream.columns, stream.batches()):
+            ...
+"""
+
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+from .query_builder import QueryBuilder
+from .schemas import ReportConfig
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the server-side cursor per round trip
+DEFAULT_BATCH_SIZE = 500
+
+# Flush streamed text output once this many characters are buffered
+CHUNK_SIZE = 64 * 1024
+
+
+# ============================================
+# Compiled Query Cache
+# ============================================
+
+_PARAM_PATTERN = re.compile(r"\$(param_\d+)\b")
+
+
+def config_hash(config: ReportConfig) -> str:
+    """Stable hash of a report configuration (field order independent)."""
+    canonical = json.dumps(config.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def to_positional(sql: str, params: dict[str, Any]) -> tuple[str, tuple]:
+    """Convert QueryBuilder's named placeholders ($param_N) to $1..$N.
+
+    Args:
+        sql: SQL with $param_N placeholders
+        params: Placeholder name -> value
+
+    Returns:
+        (SQL with positional placeholders, values in placeholder order)
+    """
+    order: dict[str, int] = {}
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in order:
+            order[name] = len(order) + 1
+        return f"${order[name]}"
+
+    positional_sql = _PARAM_PATTERN.sub(replace, sql)
+    values = tuple(params[name] for name in sorted(order, key=order.get))
+    return positional_sql, values
+
+
+@dataclass(frozen=True)
+class CompiledReportQuery:
+    """A report query ready for execution."""
+    config_hash: str
+    sql: str  # positional placeholders, sent to Postgres
+    params: tuple
+    generated_sql: str  # QueryBuilder output (returned for debugging)
+
+
+class CompiledQueryCache:
+    """LRU cache of compiled report queries keyed by (config hash, offset)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int], CompiledReportQuery] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, config: ReportConfig, offset: int = 0) -> CompiledReportQuery:
+        """Get (or build and cache) the compiled query for a config.
+
+        Raises:
+            QueryBuilderError: If the configuration is invalid
+        """
+        digest = config_hash(config)
+        key = (digest, offset)
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return compiled
+
+        self.misses += 1
+        sql, params = QueryBuilder().build_query(config, offset=offset)
+        positional_sql, values = to_positional(sql, params)
+        compiled = CompiledReportQuery(
+            config_hash=digest,
+            sql=positional_sql,
+            params=values,
+            generated_sql=sql,
+        )
+        self._entries[key] = compiled
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return compiled
+
+
+# ============================================
+# Result Cache
+# ============================================
+
+
+@dataclass
+class CachedReportResult:
+    """Rows of a small report result kept for repeat requests."""
+    columns: list[str]
+    rows: list[tuple]
+    execution_time_ms: float
+    cached_at: float
+
+
+class ReportResultCache:
+    """Short-lived cache of report results.
+
+    Keys include the last sync id, so results are recomputed as soon as new
+    data is synced through the API; the TTL bounds staleness for syncs that
+    don't record sync history (e.g. the scheduler). Results larger than
+    max_rows are never cached, which keeps memory bounded.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 64, max_rows: int = 2000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._entries: OrderedDict[tuple, CachedReportResult] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: tuple) -> Optional[CachedReportResult]:
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        if time.monotonic() - result.cached_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: tuple, columns: list[str], rows: list[tuple], execution_time_ms: float) -> None:
+        if not self.enabled or len(rows) > self.max_rows:
+            return
+        self._entries[key] = CachedReportResult(
+            columns=columns,
+            rows=rows,
+            execution_time_ms=execution_time_ms,
+            cached_at=time.monotonic(),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, report_id: Optional[str] = None) -> None:
+        """Drop cached results for one report, or all of them."""
+        if report_id is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == report_id]:
+            del self._entries[key]
+
+
+async def get_last_sync_id(conn) -> Optional[int]:
+    """Latest sync_history id (None if the table isn't available)."""
+    try:
+        return await conn.fetchval("SELECT COALESCE(MAX(id), 0) FROM sync_history")
+    except Exception as e:
+        logger.debug(f"Could not read last sync id: {e}")
+        return None
+
+
+# ============================================
+# Server-side Cursor Streaming
+# ============================================
+
+
+class ReportRowStream:
+    """Reads report rows from a server-side cursor in batches.
+
+    The first batch is fetched on entry so query errors surface before a
+    response is started, and so column names are known up front. The
+    connection is held (in a read-only transaction) until the context exits.
+    """
+
+    def __init__(self, pool, compiled: CompiledReportQuery, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.pool = pool
+        self.compiled = compiled
+        self.batch_size = batch_size
+        self.columns: list[str] = []
+        self.row_count = 0
+        self._conn = None
+        self._transaction = None
+        self._cursor = None
+        self._first_batch: list[tuple] = []
+
+    async def __aenter__(self) -> "ReportRowStream":
+        self._conn = await self.pool.acquire()
+        try:
+            self._transaction = self._conn.transaction(readonly=True)
+            await self._transaction.start()
+            # conn.cursor() goes through asyncpg's statement cache, so
+            # repeated executions of the same report reuse the prepared plan
+            self._cursor = await self._conn.cursor(self.compiled.sql, *self.compiled.params)
+            records = await self._cursor.fetch(self.batch_size)
+            if records:
+                self.columns = list(records[0].keys())
+            else:
+                statement = await self._conn.prepare(self.compiled.sql)
+                self.columns = [attr.name for attr in statement.get_attributes()]
+            self._first_batch = [tuple(r) for r in records]
+            self.row_count = len(self._first_batch)
+        except BaseException:
+            await self._close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._close()
+
+    async def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if self._transaction is not None:
+                await self._transaction.rollback()  # read-only; nothing to commit
+        except Exception as e:
+            logger.debug(f"Report cursor transaction close failed: {e}")
+        finally:
+            await self.pool.release(conn)
+
+    async def batches(self) -> AsyncIterator[list[tuple]]:
+        """Yield row batches (tuples in column order)."""
+        if self._first_batch:
+            yield self._first_batch
+        self._first_batch = []
+        if self.row_count < self.batch_size:
+            return
+        while True:
+            records = await self._cursor.fetch(self.batch_size)
+            if not records:
+                return
+            batch = [tuple(r) for r in records]
+            self.row_count += len(batch)
+            yield batch
+            if len(records) < self.batch_size:
+                return
+
+
+async def iter_cached(rows: list[tuple], batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[list[tuple]]:
+    """Yield cached rows in batches (same shape as ReportRowStream.batches)."""
+    for start in range(0, len(rows), batch_size):
+        yield rows[start:start + batch_size]
+
+
+async def cache_batches(
+    batches: AsyncIterator[list[tuple]],
+    cache: ReportResultCache,
+    key: tuple,
+    columns: list[str],
+    started_at: float,
+) -> AsyncIterator[list[tuple]]:
+    """Pass batches through, storing the result if it fits in the cache.
+
+    Collection stops as soon as the result exceeds cache.max_rows, so large
+    exports are still streamed without being buffered.
+    """
+    collected: Optional[list[tuple]] = [] if cache.enabled else None
+    async for batch in batches:
+        if collected is not None:
+            collected.extend(batch)
+            if len(collected) > cache.max_rows:
+                collected = None
+        yield batch
+    if collected is not None:
+        cache.put(key, columns, collected, (time.perf_counter() - started_at) * 1000)
+
+
+# ============================================
+# Output Writers
+# ============================================
+
+
+def _csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # Numbers, as jsonable_encoder sends them (SUM/AVG come back as numeric)
+        exponent = value.as_tuple().exponent
+        return int(value) if isinstance(exponent, int) and exponent >= 0 else float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    return str(value)
+
+
+async def csv_chunks(columns: list[str], batches: AsyncIterator[list[tuple]]) -> AsyncIterator[bytes]:
+    """Stream CSV (header + rows). Empty results produce an empty body."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_written = False
+
+    async for batch in batches:
+        if not header_written:
+            writer.writerow(columns)
+            header_written = True
+        for row in batch:
+            writer.writerow([_csv_value(v) for v in row])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def json_chunks(
+    columns: list[str],
+    batches: AsyncIterator[list[tuple]],
+    metadata: dict[str, Any],
+    started_at: float,
+) -> AsyncIterator[bytes]:
+    """Stream an ExecuteReportResponse-shaped JSON document.
+
+    Rows are written as they arrive; total_rows and execution_time_ms are
+    appended after the last row.
+    """
+    head = {"success": True, "columns": columns, **metadata}
+    yield (json.dumps(head, default=_json_default)[:-1] + ', "data": [').encode("utf-8")
+
+    parts: list[str] = []
+    size = 0
+    total = 0
+    async for batch in batches:
+        for row in batch:
+            text = json.dumps(dict(zip(columns, row)), default=_json_default)
+            parts.append(text if total == 0 else "," + text)
+            size += len(text)
+            total += 1
+        if size >= CHUNK_SIZE:
+            yield "".join(parts).encode("utf-8")
+            parts, size = [], 0
+
+    tail = {
+        "total_rows": total,
+        "execution_time_ms": (time.perf_counter() - started_at) * 1000,
+        "errors": [],
+    }
+    parts.append("], " + json.dumps(tail)[1:])
+    yield "".join(parts).encode("utf-8")
+
+
+def _xlsx_value(value: Any) -> Any:
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # Excel has no timezone support; write UTC wall time
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    if isinstance(value, (UUID,)):
+        return str(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+# Characters Excel does not allow in a sheet title
+_INVALID_SHEET_CHARS = re.compile(r"[\\/?*\[\]:]")
+
+
+def sheet_title_for(name: str) -> str:
+    """Make a report name usable as an Excel sheet title.
+
+    Drops the characters Excel rejects and cuts the title to 31
+    characters, falling back to "Report" when nothing is left.
+    """
+    title = _INVALID_SHEET_CHARS.sub("", name or "").strip()[:31].strip()
+    return title or "Report"
+
+
+async def write_xlsx(columns: list[str], batches: AsyncIterator[list[tuple]], sheet_title: str = "Report") -> str:
+    """Write rows to a temporary XLSX file using a write-only workbook.
+
+    Write-only worksheets spool rows to disk, so memory stays bounded.
+
+    Returns:
+        Path to the temporary file (caller deletes it)
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title_for(sheet_title))
+    sheet.append(columns)
+
+    def append_rows(rows: list[tuple]) -> None:
+        for row in rows:
+            sheet.append([_xlsx_value(v) for v in row])
+
+    async for batch in batches:
+        await asyncio.to_thread(append_rows, batch)
+
+    handle = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+    handle.close()
+    try:
+        await asyncio.to_thread(workbook.save, handle.name)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+    return handle.name
+
+
+async def file_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Stream a file. The caller deletes it (see remove_file)."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def remove_file(path: str) -> None:
+    """Delete a temporary file; a file that is already gone is fine."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+# ============================================
+# Process-wide Instances
+# ============================================
+
+_compiled_query_cache = CompiledQueryCache()
+_result_cache = ReportResultCache(
+    ttl_seconds=float(os.getenv("REPORT_RESULT_CACHE_TTL", "30")),
+)
+
+
+def get_compiled_query_cache() -> CompiledQueryCache:
+    """Get the process-wide compiled query cache."""
+    return _compiled_query_cache
+
+
+def get_result_cache() -> ReportResultCache:
+    """Get the process-wide report result cache."""
+    return _result_cache
@@ -245,4 +245,49 @@ class ExcelStyles:
         date_style.number_format = "YYYY-MM-DD"
         styles.append(date_style)
 
+        # Zebra-striped and status-colored data cells
+        for name, fill in (
+            ("report_data_alt", cls.get_alternate_row_fill()),
+            ("report_success", cls.get_success_fill()),
+            ("report_warning", cls.get_warning_fill()),
+            ("report_error", cls.get_error_fill()),
+            ("report_info", cls.get_info_fill()),
+        ):
+            style = NamedStyle(name=name)
+            style.font = Font(size=10)
+            style.alignment = cls.get_left_alignment()
+            style.border = cls.THIN_BORDER
+            style.fill = fill
+            styles.append(style)
+
+        # Text styles for write-only sheets, where cells can't be restyled
+        for name, font in (
+            ("report_title", cls.get_title_font()),
+            ("report_subtitle", cls.get_subtitle_font()),
+            ("report_kpi_label", cls.get_kpi_label_font()),
+            ("report_kpi_value", cls.get_kpi_value_font()),
+            ("report_kpi_note", Font(size=9, color=cls.DARK_GRAY)),
+            ("report_note", Font(italic=True)),
+        ):
+            style = NamedStyle(name=name)
+            style.font = font
+            styles.append(style)
+
         return styles
+
+    @classmethod
+    def get_status_style_name(cls, status: str | None) -> str | None:
+        """Named data style matching get_status_fill(), or None for no fill."""
+        if not status:
+            return None
+
+        status_lower = status.lower()
+        if status_lower in ("success", "completed", "active", "online", "started", "assigned", "good"):
+            return "report_success"
+        if status_lower in ("warning", "pending", "expiring", "partial", "fair"):
+            return "report_warning"
+        if status_lower in ("error", "failed", "offline", "ended", "cancelled", "poor"):
+            return "report_error"
+        if status_lower in ("info", "running", "syncing"):
+            return "report_info"
+        return None
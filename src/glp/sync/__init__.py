@@ -12,9 +12,12 @@ Architecture:
 
 from .domain.entities import (
     Device,
+    DeviceRecordBatch,
     DeviceSubscription,
     DeviceTag,
+    StageTiming,
     Subscription,
+    SubscriptionRecordBatch,
     SubscriptionTag,
     SyncResult,
     SyncStatistics,
@@ -33,10 +36,13 @@ __all__ = [
     "Device",
     "DeviceSubscription",
     "DeviceTag",
+    "DeviceRecordBatch",
     # Subscription Entities
     "Subscription",
     "SubscriptionTag",
+    "SubscriptionRecordBatch",
     # Result Entities
+    "StageTiming",
     "SyncResult",
     "SyncStatistics",
     # Device Ports
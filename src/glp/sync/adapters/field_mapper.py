@@ -5,13 +5,44 @@ logic that was previously embedded in DeviceSyncer._prepare_device_records().
 """
 
 import json
+import re
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from ..domain.entities import Device, DeviceSubscription, DeviceTag, Subscription, SubscriptionTag
+from ..domain.entities import (
+    Device,
+    DeviceRecordBatch,
+    DeviceSubscription,
+    DeviceTag,
+    Subscription,
+    SubscriptionRecordBatch,
+    SubscriptionTag,
+)
 from ..domain.ports import IFieldMapper, ISubscriptionFieldMapper
 
+# raw_data goes to JSONB, which drops insignificant whitespace anyway
+_JSON_SEPARATORS = (",", ":")
+# json.dumps() builds a new encoder per call when given separators. Rows
+# are sent as UTF-8 text, so non-ASCII needs no escaping, and API responses
+# parsed from JSON cannot be circular.
+_encode_json = json.JSONEncoder(
+    separators=_JSON_SEPARATORS, ensure_ascii=False, check_circular=False
+).encode
+
+_CANONICAL_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def _canonical_uuid(value: str) -> str:
+    """Return value in the form str(UUID(value)) gives, validating it.
+
+    The API already sends lower-case hyphenated ids, which a regex match
+    confirms far more cheaply than parsing them into a UUID.
+    """
+    if _CANONICAL_UUID.fullmatch(value):
+        return value
+    return str(UUID(value))
+
 
 class DeviceFieldMapper(IFieldMapper):
     """Maps GreenLake device API responses to domain entities and DB records.
@@ -22,6 +53,7 @@ class DeviceFieldMapper(IFieldMapper):
     - Timestamp parsing (ISO 8601 with Z suffix)
     - Type conversions (str -> UUID, etc.)
     - Subscription and tag extraction
+    - Direct API dict -> DB row mapping for record batches (map_to_records)
     """
 
     def map_to_entity(self, raw: dict[str, Any]) -> Device:
@@ -117,8 +149,73 @@ class DeviceFieldMapper(IFieldMapper):
             device.location_source,
             device.created_at,
             device.updated_at,
-            json.dumps(device.raw_data),  # JSONB requires JSON string
+            _encode_json(device.raw_data),  # JSONB requires JSON string
+        )
+
+    def map_to_records(self, raw: dict[str, Any], batch: DeviceRecordBatch) -> None:
+        """Append a device's rows to batch straight from the API dict.
+
+        Produces the same rows as map_to_record(), extract_subscriptions()
+        and extract_tags() without building Device, DeviceSubscription or
+        DeviceTag objects. raw_data is serialized here, so the batch holds
+        no reference to raw.
+
+        Args:
+            raw: Raw device dictionary from GreenLake API
+            batch: Batch to append the device, subscription and tag rows to
+        """
+        get = raw.get
+        device_id = _canonical_uuid(raw["id"])
+        application = get("application") or {}
+        location = get("location") or {}
+        dedicated = get("dedicatedPlatformWorkspace") or {}
+        parse = self._parse_timestamp
+
+        record = (
+            device_id,
+            get("macAddress"),
+            get("serialNumber"),
+            get("partNumber"),
+            get("deviceType"),
+            get("model"),
+            get("region"),
+            get("archived", False),
+            get("deviceName"),
+            get("secondaryName"),
+            get("assignedState"),
+            get("type"),
+            get("tenantWorkspaceId"),
+            application.get("id"),
+            application.get("resourceUri"),
+            dedicated.get("id"),
+            location.get("id"),
+            location.get("locationName"),
+            location.get("city"),
+            location.get("state"),
+            location.get("country"),
+            location.get("postalCode"),
+            location.get("streetAddress"),
+            location.get("latitude"),
+            location.get("longitude"),
+            location.get("locationSource"),
+            parse(get("createdAt")),
+            parse(get("updatedAt")),
+            _encode_json(raw),
         )
+        subscriptions = [
+            (device_id, _canonical_uuid(sub["id"]), sub.get("resourceUri"))
+            for sub in get("subscription") or []
+            if sub.get("id")
+        ]
+        tags = [
+            (device_id, key, str(value) if value is not None else "")
+            for key, value in (get("tags") or {}).items()
+        ]
+
+        batch.device_ids.append(device_id)
+        batch.devices.append(record)
+        batch.subscriptions.extend(subscriptions)
+        batch.tags.extend(tags)
 
     def extract_subscriptions(
         self,
@@ -210,6 +307,7 @@ class SubscriptionFieldMapper(ISubscriptionFieldMapper):
     - Timestamp parsing (ISO 8601 with Z suffix)
     - Type conversions (str -> UUID, str -> int, etc.)
     - Tag extraction
+    - Direct API dict -> DB row mapping for record batches (map_to_records)
     """
 
     def map_to_entity(self, raw: dict[str, Any]) -> Subscription:
@@ -284,8 +382,55 @@ class SubscriptionFieldMapper(ISubscriptionFieldMapper):
             subscription.reseller_po,
             subscription.created_at,
             subscription.updated_at,
-            json.dumps(subscription.raw_data),  # JSONB requires JSON string
+            _encode_json(subscription.raw_data),  # JSONB requires JSON string
+        )
+
+    def map_to_records(self, raw: dict[str, Any], batch: SubscriptionRecordBatch) -> None:
+        """Append a subscription's rows to batch straight from the API dict.
+
+        Produces the same rows as map_to_record() and extract_tags()
+        without building Subscription or SubscriptionTag objects.
+
+        Args:
+            raw: Raw subscription dictionary from GreenLake API
+            batch: Batch to append the subscription and tag rows to
+        """
+        get = raw.get
+        subscription_id = _canonical_uuid(raw["id"])
+        parse = self._parse_timestamp
+
+        record = (
+            subscription_id,
+            get("key"),
+            get("type"),
+            get("subscriptionType"),
+            get("subscriptionStatus"),
+            int(get("quantity", 0)) if get("quantity") else None,
+            int(get("availableQuantity", 0)) if get("availableQuantity") else None,
+            get("sku"),
+            get("skuDescription"),
+            parse(get("startTime")),
+            parse(get("endTime")),
+            get("tier"),
+            get("tierDescription"),
+            get("productType"),
+            get("isEval", False),
+            get("contract"),
+            get("quote"),
+            get("po"),
+            get("resellerPo"),
+            parse(get("createdAt")),
+            parse(get("updatedAt")),
+            _encode_json(raw),
         )
+        tags = [
+            (subscription_id, key, str(value) if value is not None else "")
+            for key, value in (get("tags") or {}).items()
+        ]
+
+        batch.subscription_ids.append(subscription_id)
+        batch.subscriptions.append(record)
+        batch.tags.extend(tags)
 
     def extract_tags(
         self,
@@ -11,7 +11,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from ..domain.entities import Device, DeviceSubscription, DeviceTag
+from ..domain.entities import Device, DeviceRecordBatch, DeviceSubscription, DeviceTag
 from ..domain.ports import IDeviceRepository
 
 if TYPE_CHECKING:
@@ -19,6 +19,54 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_DEVICES_SQL = """
+    INSERT INTO devices (
+        id, mac_address, serial_number, part_number,
+        device_type, model, region, archived,
+        device_name, secondary_name, assigned_state,
+        resource_type, tenant_workspace_id,
+        application_id, application_resource_uri,
+        dedicated_platform_id,
+        location_id, location_name, location_city, location_state,
+        location_country, location_postal_code, location_street_address,
+        location_latitude, location_longitude, location_source,
+        created_at, updated_at, raw_data, synced_at
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11,
+        $12, $13, $14, $15, $16, $17, $18, $19, $20,
+        $21, $22, $23, $24, $25, $26, $27, $28, $29::jsonb, NOW()
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        mac_address = EXCLUDED.mac_address,
+        serial_number = EXCLUDED.serial_number,
+        part_number = EXCLUDED.part_number,
+        device_type = EXCLUDED.device_type,
+        model = EXCLUDED.model,
+        region = EXCLUDED.region,
+        archived = EXCLUDED.archived,
+        device_name = EXCLUDED.device_name,
+        secondary_name = EXCLUDED.secondary_name,
+        assigned_state = EXCLUDED.assigned_state,
+        resource_type = EXCLUDED.resource_type,
+        tenant_workspace_id = EXCLUDED.tenant_workspace_id,
+        application_id = EXCLUDED.application_id,
+        application_resource_uri = EXCLUDED.application_resource_uri,
+        dedicated_platform_id = EXCLUDED.dedicated_platform_id,
+        location_id = EXCLUDED.location_id,
+        location_name = EXCLUDED.location_name,
+        location_city = EXCLUDED.location_city,
+        location_state = EXCLUDED.location_state,
+        location_country = EXCLUDED.location_country,
+        location_postal_code = EXCLUDED.location_postal_code,
+        location_street_address = EXCLUDED.location_street_address,
+        location_latitude = EXCLUDED.location_latitude,
+        location_longitude = EXCLUDED.location_longitude,
+        location_source = EXCLUDED.location_source,
+        updated_at = EXCLUDED.updated_at,
+        raw_data = EXCLUDED.raw_data,
+        synced_at = NOW()
+"""
+
 
 class PostgresDeviceRepository(IDeviceRepository):
     """PostgreSQL implementation of IDeviceRepository.
@@ -58,56 +106,7 @@ class PostgresDeviceRepository(IDeviceRepository):
         records = [self._device_to_record(d) for d in devices]
 
         async with self.pool.acquire() as conn:
-            await conn.executemany(
-                """
-                INSERT INTO devices (
-                    id, mac_address, serial_number, part_number,
-                    device_type, model, region, archived,
-                    device_name, secondary_name, assigned_state,
-                    resource_type, tenant_workspace_id,
-                    application_id, application_resource_uri,
-                    dedicated_platform_id,
-                    location_id, location_name, location_city, location_state,
-                    location_country, location_postal_code, location_street_address,
-                    location_latitude, location_longitude, location_source,
-                    created_at, updated_at, raw_data, synced_at
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11,
-                    $12, $13, $14, $15, $16, $17, $18, $19, $20,
-                    $21, $22, $23, $24, $25, $26, $27, $28, $29::jsonb, NOW()
-                )
-                ON CONFLICT (id) DO UPDATE SET
-                    mac_address = EXCLUDED.mac_address,
-                    serial_number = EXCLUDED.serial_number,
-                    part_number = EXCLUDED.part_number,
-                    device_type = EXCLUDED.device_type,
-                    model = EXCLUDED.model,
-                    region = EXCLUDED.region,
-                    archived = EXCLUDED.archived,
-                    device_name = EXCLUDED.device_name,
-                    secondary_name = EXCLUDED.secondary_name,
-                    assigned_state = EXCLUDED.assigned_state,
-                    resource_type = EXCLUDED.resource_type,
-                    tenant_workspace_id = EXCLUDED.tenant_workspace_id,
-                    application_id = EXCLUDED.application_id,
-                    application_resource_uri = EXCLUDED.application_resource_uri,
-                    dedicated_platform_id = EXCLUDED.dedicated_platform_id,
-                    location_id = EXCLUDED.location_id,
-                    location_name = EXCLUDED.location_name,
-                    location_city = EXCLUDED.location_city,
-                    location_state = EXCLUDED.location_state,
-                    location_country = EXCLUDED.location_country,
-                    location_postal_code = EXCLUDED.location_postal_code,
-                    location_street_address = EXCLUDED.location_street_address,
-                    location_latitude = EXCLUDED.location_latitude,
-                    location_longitude = EXCLUDED.location_longitude,
-                    location_source = EXCLUDED.location_source,
-                    updated_at = EXCLUDED.updated_at,
-                    raw_data = EXCLUDED.raw_data,
-                    synced_at = NOW()
-                """,
-                records,
-            )
+            await conn.executemany(_UPSERT_DEVICES_SQL, records)
 
         return len(records)
 
@@ -201,45 +200,72 @@ class PostgresDeviceRepository(IDeviceRepository):
         if not device_ids:
             return
 
+        await self._replace_related_rows(
+            [str(d) for d in device_ids],
+            [(str(s.device_id), str(s.subscription_id), s.resource_uri) for s in subscriptions],
+            [(str(t.device_id), t.tag_key, t.tag_value) for t in tags],
+        )
+
+    async def write_device_records(self, batch: DeviceRecordBatch) -> int:
+        """Upsert a batch of device rows and replace their subscriptions and tags.
+
+        Same statements as upsert_devices() + sync_all_related_data(), fed
+        with rows from DeviceFieldMapper.map_to_records().
+
+        Args:
+            batch: Device, subscription and tag rows for one page
+
+        Returns:
+            Number of devices upserted
+        """
+        if not batch.devices:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            await conn.executemany(_UPSERT_DEVICES_SQL, batch.devices)
+
+        await self._replace_related_rows(batch.device_ids, batch.subscriptions, batch.tags)
+        return len(batch.devices)
+
+    async def _replace_related_rows(
+        self,
+        device_ids: list[str],
+        subscription_rows: list[tuple[str, str, Any]],
+        tag_rows: list[tuple[str, str, str]],
+    ) -> None:
+        """Replace subscriptions and tags of device_ids in one transaction."""
         # Import here to avoid circular imports
         from ...api.database import database_transaction
 
         async with database_transaction(self.pool) as conn:
             # Delete all existing subscriptions and tags
-            device_id_strs = [str(d) for d in device_ids]
-
             await conn.execute(
                 "DELETE FROM device_subscriptions WHERE device_id = ANY($1)",
-                device_id_strs,
+                device_ids,
             )
             await conn.execute(
                 "DELETE FROM device_tags WHERE device_id = ANY($1)",
-                device_id_strs,
+                device_ids,
             )
 
             # Insert new subscriptions
-            if subscriptions:
-                sub_records = [
-                    (str(s.device_id), str(s.subscription_id), s.resource_uri)
-                    for s in subscriptions
-                ]
+            if subscription_rows:
                 await conn.executemany(
                     """
                     INSERT INTO device_subscriptions (device_id, subscription_id, resource_uri)
                     VALUES ($1, $2, $3)
                     """,
-                    sub_records,
+                    subscription_rows,
                 )
 
             # Insert new tags
-            if tags:
-                tag_records = [(str(t.device_id), t.tag_key, t.tag_value) for t in tags]
+            if tag_rows:
                 await conn.executemany(
                     """
                     INSERT INTO device_tags (device_id, tag_key, tag_value)
                     VALUES ($1, $2, $3)
                     """,
-                    tag_records,
+                    tag_rows,
                 )
 
     def _device_to_record(self, device: Device) -> tuple[Any, ...]:
@@ -12,7 +12,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from ..domain.entities import Subscription, SubscriptionTag
+from ..domain.entities import Subscription, SubscriptionRecordBatch, SubscriptionTag
 from ..domain.ports import ISubscriptionRepository
 
 if TYPE_CHECKING:
@@ -20,6 +20,42 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_SUBSCRIPTIONS_SQL = """
+    INSERT INTO subscriptions (
+        id, key, resource_type, subscription_type, subscription_status,
+        quantity, available_quantity, sku, sku_description,
+        start_time, end_time, tier, tier_description,
+        product_type, is_eval, contract, quote, po, reseller_po,
+        created_at, updated_at, raw_data, synced_at
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+        $11, $12, $13, $14, $15, $16, $17, $18, $19,
+        $20, $21, $22::jsonb, NOW()
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        key = EXCLUDED.key,
+        resource_type = EXCLUDED.resource_type,
+        subscription_type = EXCLUDED.subscription_type,
+        subscription_status = EXCLUDED.subscription_status,
+        quantity = EXCLUDED.quantity,
+        available_quantity = EXCLUDED.available_quantity,
+        sku = EXCLUDED.sku,
+        sku_description = EXCLUDED.sku_description,
+        start_time = EXCLUDED.start_time,
+        end_time = EXCLUDED.end_time,
+        tier = EXCLUDED.tier,
+        tier_description = EXCLUDED.tier_description,
+        product_type = EXCLUDED.product_type,
+        is_eval = EXCLUDED.is_eval,
+        contract = EXCLUDED.contract,
+        quote = EXCLUDED.quote,
+        po = EXCLUDED.po,
+        reseller_po = EXCLUDED.reseller_po,
+        updated_at = EXCLUDED.updated_at,
+        raw_data = EXCLUDED.raw_data,
+        synced_at = NOW()
+"""
+
 
 class PostgresSubscriptionRepository(ISubscriptionRepository):
     """PostgreSQL implementation of ISubscriptionRepository.
@@ -59,44 +95,7 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
         records = [self._subscription_to_record(s) for s in subscriptions]
 
         async with self.pool.acquire() as conn:
-            await conn.executemany(
-                """
-                INSERT INTO subscriptions (
-                    id, key, resource_type, subscription_type, subscription_status,
-                    quantity, available_quantity, sku, sku_description,
-                    start_time, end_time, tier, tier_description,
-                    product_type, is_eval, contract, quote, po, reseller_po,
-                    created_at, updated_at, raw_data, synced_at
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
-                    $11, $12, $13, $14, $15, $16, $17, $18, $19,
-                    $20, $21, $22::jsonb, NOW()
-                )
-                ON CONFLICT (id) DO UPDATE SET
-                    key = EXCLUDED.key,
-                    resource_type = EXCLUDED.resource_type,
-                    subscription_type = EXCLUDED.subscription_type,
-                    subscription_status = EXCLUDED.subscription_status,
-                    quantity = EXCLUDED.quantity,
-                    available_quantity = EXCLUDED.available_quantity,
-                    sku = EXCLUDED.sku,
-                    sku_description = EXCLUDED.sku_description,
-                    start_time = EXCLUDED.start_time,
-                    end_time = EXCLUDED.end_time,
-                    tier = EXCLUDED.tier,
-                    tier_description = EXCLUDED.tier_description,
-                    product_type = EXCLUDED.product_type,
-                    is_eval = EXCLUDED.is_eval,
-                    contract = EXCLUDED.contract,
-                    quote = EXCLUDED.quote,
-                    po = EXCLUDED.po,
-                    reseller_po = EXCLUDED.reseller_po,
-                    updated_at = EXCLUDED.updated_at,
-                    raw_data = EXCLUDED.raw_data,
-                    synced_at = NOW()
-                """,
-                records,
-            )
+            await conn.executemany(_UPSERT_SUBSCRIPTIONS_SQL, records)
 
         return len(records)
 
@@ -116,6 +115,38 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
         if not subscription_ids:
             return
 
+        await self._replace_tag_rows(
+            [str(s) for s in subscription_ids],
+            [(str(t.subscription_id), t.tag_key, t.tag_value) for t in tags],
+        )
+
+    async def write_subscription_records(self, batch: SubscriptionRecordBatch) -> int:
+        """Upsert a batch of subscription rows and replace their tags.
+
+        Same statements as upsert_subscriptions() + sync_tags(), fed with
+        rows from SubscriptionFieldMapper.map_to_records().
+
+        Args:
+            batch: Subscription and tag rows for one page
+
+        Returns:
+            Number of subscriptions upserted
+        """
+        if not batch.subscriptions:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            await conn.executemany(_UPSERT_SUBSCRIPTIONS_SQL, batch.subscriptions)
+
+        await self._replace_tag_rows(batch.subscription_ids, batch.tags)
+        return len(batch.subscriptions)
+
+    async def _replace_tag_rows(
+        self,
+        subscription_ids: list[str],
+        tag_rows: list[tuple[str, str, str]],
+    ) -> None:
+        """Replace tags of subscription_ids in one transaction."""
         # Import here to avoid circular imports
         from ...api.database import database_transaction
 
@@ -123,21 +154,17 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
             # Delete all existing tags for these subscriptions
             await conn.execute(
                 "DELETE FROM subscription_tags WHERE subscription_id = ANY($1)",
-                [str(s) for s in subscription_ids],
+                subscription_ids,
             )
 
             # Insert new tags
-            if tags:
-                records = [
-                    (str(t.subscription_id), t.tag_key, t.tag_value)
-                    for t in tags
-                ]
+            if tag_rows:
                 await conn.executemany(
                     """
                     INSERT INTO subscription_tags (subscription_id, tag_key, tag_value)
                     VALUES ($1, $2, $3)
                     """,
-                    records,
+                    tag_rows,
                 )
 
     def _subscription_to_record(self, subscription: Subscription) -> tuple[Any, ...]:
@@ -9,9 +9,12 @@ No infrastructure dependencies allowed in this layer.
 
 from .entities import (
     Device,
+    DeviceRecordBatch,
     DeviceSubscription,
     DeviceTag,
+    StageTiming,
     Subscription,
+    SubscriptionRecordBatch,
     SubscriptionTag,
     SyncResult,
     SyncStatistics,
@@ -30,10 +33,13 @@ __all__ = [
     "Device",
     "DeviceSubscription",
     "DeviceTag",
+    "DeviceRecordBatch",
     # Subscription Entities
     "Subscription",
     "SubscriptionTag",
+    "SubscriptionRecordBatch",
     # Result Entities
+    "StageTiming",
     "SyncResult",
     "SyncStatistics",
     # Device Ports
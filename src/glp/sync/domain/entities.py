@@ -2,6 +2,10 @@
 
 These are pure data structures with no infrastructure dependencies.
 They represent the core business objects used in sync operations.
+
+The per-record entities (Device, Subscription and their tags and
+subscription links) are slotted: a sync can hold 100k+ of them, and
+slots avoid a per-instance __dict__.
 """
 
 from dataclasses import dataclass, field
@@ -10,7 +14,7 @@ from typing import Any
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Domain entity representing a GreenLake device.
 
@@ -81,7 +85,7 @@ class Device:
         return self.location_id is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSubscription:
     """Represents a device-subscription relationship.
 
@@ -93,7 +97,7 @@ class DeviceSubscription:
     resource_uri: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTag:
     """Represents a device tag key-value pair.
 
@@ -105,11 +109,52 @@ class DeviceTag:
     tag_value: str
 
 
+@dataclass(slots=True)
+class DeviceRecordBatch:
+    """Database rows for a batch of devices, built without entities.
+
+    Produced by IFieldMapper.map_to_records() and written by
+    IDeviceRepository.write_device_records(). Rows are tuples in the
+    repository's column order; raw_data is already serialized to JSON, so
+    the API response dicts can be released as soon as a page is mapped.
+    """
+
+    device_ids: list[str] = field(default_factory=list)
+    devices: list[tuple[Any, ...]] = field(default_factory=list)
+    subscriptions: list[tuple[str, str, str | None]] = field(default_factory=list)
+    tags: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+
+@dataclass
+class StageTiming:
+    """Timing for one stage of a streaming sync pipeline.
+
+    busy_seconds is time spent doing the stage's work (awaiting the API,
+    mapping, writing); wait_seconds is time spent idle waiting for input
+    or blocked on a full downstream queue (backpressure).
+    """
+
+    pages: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "pages": self.pages,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
 @dataclass
 class SyncResult:
     """Result of a sync operation.
 
     Contains statistics about the sync operation and any errors encountered.
+    Streaming syncs also report per-stage timings (fetch, map, write).
     """
 
     success: bool
@@ -118,15 +163,21 @@ class SyncResult:
     errors: int
     synced_at: datetime
     error_details: list[str] = field(default_factory=list)
+    stage_timings: dict[str, StageTiming] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API responses and backward compatibility."""
-        return {
+        result = {
             "total": self.total,
             "upserted": self.upserted,
             "errors": self.errors,
             "synced_at": self.synced_at.isoformat(),
         }
+        if self.stage_timings:
+            result["stage_timings"] = {
+                name: timing.to_dict() for name, timing in self.stage_timings.items()
+            }
+        return result
 
 
 @dataclass
@@ -158,7 +209,7 @@ class SyncStatistics:
 # ============================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     """Domain entity representing a GreenLake subscription.
 
@@ -236,7 +287,7 @@ class Subscription:
         return (self.available_quantity or 0) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionTag:
     """Represents a subscription tag key-value pair.
 
@@ -246,3 +297,19 @@ class SubscriptionTag:
     subscription_id: UUID
     tag_key: str
     tag_value: str
+
+
+@dataclass(slots=True)
+class SubscriptionRecordBatch:
+    """Database rows for a batch of subscriptions, built without entities.
+
+    Produced by ISubscriptionFieldMapper.map_to_records() and written by
+    ISubscriptionRepository.write_subscription_records().
+    """
+
+    subscription_ids: list[str] = field(default_factory=list)
+    subscriptions: list[tuple[Any, ...]] = field(default_factory=list)
+    tags: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.subscriptions)
@@ -16,9 +16,11 @@ from uuid import UUID
 
 from .entities import (
     Device,
+    DeviceRecordBatch,
     DeviceSubscription,
     DeviceTag,
     Subscription,
+    SubscriptionRecordBatch,
     SubscriptionTag,
     SyncResult,
 )
@@ -90,6 +92,21 @@ class IDeviceRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def write_device_records(self, batch: DeviceRecordBatch) -> int:
+        """Upsert a batch of device rows and replace their subscriptions and tags.
+
+        Used instead of upsert_devices()/sync_all_related_data() when the
+        sync runs on record batches (see IFieldMapper.map_to_records).
+
+        Args:
+            batch: Rows produced by IFieldMapper.map_to_records()
+
+        Returns:
+            Number of devices upserted
+        """
+        ...
+
 
 class IDeviceAPI(ABC):
     """Port for device API operations.
@@ -183,6 +200,29 @@ class IFieldMapper(ABC):
         """
         ...
 
+    def map_to_records(self, raw: dict[str, Any], batch: DeviceRecordBatch) -> None:
+        """Append a device's database rows to batch without keeping entities.
+
+        The default builds them through map_to_entity(); implementations
+        can override it to go straight from the API dict to rows.
+
+        Args:
+            raw: Raw device dictionary from API
+            batch: Batch to append the device, subscription and tag rows to
+        """
+        device = self.map_to_entity(raw)
+        record = self.map_to_record(device)
+        subscriptions = [
+            (str(s.device_id), str(s.subscription_id), s.resource_uri)
+            for s in self.extract_subscriptions(device, raw)
+        ]
+        tags = [(str(t.device_id), t.tag_key, t.tag_value) for t in self.extract_tags(device, raw)]
+
+        batch.device_ids.append(str(device.id))
+        batch.devices.append(record)
+        batch.subscriptions.extend(subscriptions)
+        batch.tags.extend(tags)
+
 
 class ISyncService(ABC):
     """Port for high-level sync orchestration.
@@ -238,6 +278,18 @@ class ISubscriptionRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def write_subscription_records(self, batch: SubscriptionRecordBatch) -> int:
+        """Upsert a batch of subscription rows and replace their tags.
+
+        Args:
+            batch: Rows produced by ISubscriptionFieldMapper.map_to_records()
+
+        Returns:
+            Number of subscriptions upserted
+        """
+        ...
+
 
 class ISubscriptionAPI(ABC):
     """Port for subscription API operations.
@@ -337,3 +389,24 @@ class ISubscriptionFieldMapper(ABC):
             List of SubscriptionTag entities
         """
         ...
+
+    def map_to_records(self, raw: dict[str, Any], batch: SubscriptionRecordBatch) -> None:
+        """Append a subscription's database rows to batch without keeping entities.
+
+        The default builds them through map_to_entity(); implementations
+        can override it to go straight from the API dict to rows.
+
+        Args:
+            raw: Raw subscription dictionary from API
+            batch: Batch to append the subscription and tag rows to
+        """
+        subscription = self.map_to_entity(raw)
+        record = self.map_to_record(subscription)
+        tags = [
+            (str(t.subscription_id), t.tag_key, t.tag_value)
+            for t in self.extract_tags(subscription, raw)
+        ]
+
+        batch.subscription_ids.append(str(subscription.id))
+        batch.subscriptions.append(record)
+        batch.tags.extend(tags)
@@ -8,10 +8,13 @@ This layer contains use case classes that orchestrate the sync workflow:
 Use cases depend only on ports, not concrete implementations.
 """
 
+from .pipeline import PipelineOutcome, SyncPipeline
 from .sync_devices import SyncDevicesUseCase
 from .sync_subscriptions import SyncSubscriptionsUseCase
 
 __all__ = [
+    "PipelineOutcome",
+    "SyncPipeline",
     "SyncDevicesUseCase",
     "SyncSubscriptionsUseCase",
 ]
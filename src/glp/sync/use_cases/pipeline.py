@@ -0,0 +1,182 @@
+"""Staged fetch/map/write pipeline for streaming syncs.
+
+Streaming syncs used to handle one page at a time in series: fetch page N,
+map it, write it, then request page N+1. SyncPipeline runs the three steps
+as concurrent stages connected by bounded queues, so the API fetch of page
+N+1, the mapping of page N and the database write of page N-1 overlap:
+
+    fetch ──queue──> map ──queue──> write
+
+Bounded queues provide backpressure: when writes fall behind, the map
+stage blocks on a full queue, which in turn stops the fetch stage, so at
+most a few pages are held in memory. Writes stay strictly ordered (a single
+write stage), which preserves the per-page upsert semantics of the
+repositories.
+
+Example:
+    pipeline = SyncPipeline(queue_size=2)
+    outcome = await pipeline.run(api.fetch_paginated(), map_page, write_page)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from ..domain.entities import StageTiming
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# End-of-stream marker passed between stages
+_DONE = object()
+
+
+@dataclass
+class PipelineOutcome:
+    """Counters, errors and stage timings from a pipeline run."""
+
+    fetched: int = 0
+    written: int = 0
+    errors: list[str] = field(default_factory=list)
+    stage_timings: dict[str, StageTiming] = field(
+        default_factory=lambda: {name: StageTiming() for name in ("fetch", "map", "write")}
+    )
+
+
+class SyncPipeline:
+    """Runs fetch, map and write as overlapping stages with backpressure.
+
+    Args:
+        queue_size: Pages buffered between stages (>= 1)
+        map_in_thread: Map pages in a worker thread so the event loop keeps
+            servicing API and database I/O while a page is being mapped
+    """
+
+    def __init__(self, queue_size: int = 2, map_in_thread: bool = True):
+        self.queue_size = max(1, queue_size)
+        self.map_in_thread = map_in_thread
+
+    async def run(
+        self,
+        pages: AsyncIterator[list[dict[str, Any]]],
+        map_page: Callable[[list[dict[str, Any]]], T],
+        write_page: Callable[[T], Awaitable[int]],
+    ) -> PipelineOutcome:
+        """Run the pipeline until the page iterator is exhausted.
+
+        A fetch failure stops the pipeline after pages already fetched have
+        been written. Failures of map_page or write_page are recorded per
+        page and the pipeline continues.
+
+        Args:
+            pages: Async iterator of raw API pages
+            map_page: Maps a raw page to a write payload (sync; may record
+                per-item errors itself)
+            write_page: Persists a payload, returning the number of rows written
+
+        Returns:
+            PipelineOutcome with counts, error messages and stage timings
+        """
+        outcome: PipelineOutcome = PipelineOutcome()
+        raw_pages: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        mapped_pages: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self._fetch(pages, raw_pages, outcome)),
+            asyncio.create_task(self._map(map_page, raw_pages, mapped_pages, outcome)),
+            asyncio.create_task(self._write(write_page, mapped_pages, outcome)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return outcome
+
+    async def _fetch(
+        self,
+        pages: AsyncIterator[list[dict[str, Any]]],
+        out: asyncio.Queue,
+        outcome: PipelineOutcome,
+    ) -> None:
+        timing = outcome.stage_timings["fetch"]
+        try:
+            started = time.perf_counter()
+            async for page in pages:
+                fetched = time.perf_counter()
+                timing.busy_seconds += fetched - started
+                timing.pages += 1
+                outcome.fetched += len(page)
+
+                await out.put(page)
+                started = time.perf_counter()
+                timing.wait_seconds += started - fetched
+        except Exception as e:
+            error_msg = f"Streaming sync failed: {e}"
+            logger.error(error_msg)
+            outcome.errors.append(error_msg)
+        await out.put(_DONE)
+
+    async def _map(
+        self,
+        map_page: Callable[[list[dict[str, Any]]], T],
+        inp: asyncio.Queue,
+        out: asyncio.Queue,
+        outcome: PipelineOutcome,
+    ) -> None:
+        timing = outcome.stage_timings["map"]
+        while True:
+            waited = time.perf_counter()
+            page = await inp.get()
+            started = time.perf_counter()
+            timing.wait_seconds += started - waited
+            if page is _DONE:
+                await out.put(_DONE)
+                return
+
+            try:
+                if self.map_in_thread:
+                    payload = await asyncio.to_thread(map_page, page)
+                else:
+                    payload = map_page(page)
+            except Exception as e:
+                error_msg = f"Mapping failed for page: {e}"
+                logger.error(error_msg)
+                outcome.errors.append(error_msg)
+                continue
+            finally:
+                timing.busy_seconds += time.perf_counter() - started
+            timing.pages += 1
+
+            blocked = time.perf_counter()
+            await out.put(payload)
+            timing.wait_seconds += time.perf_counter() - blocked
+
+    async def _write(
+        self,
+        write_page: Callable[[T], Awaitable[int]],
+        inp: asyncio.Queue,
+        outcome: PipelineOutcome,
+    ) -> None:
+        timing = outcome.stage_timings["write"]
+        while True:
+            waited = time.perf_counter()
+            payload = await inp.get()
+            started = time.perf_counter()
+            timing.wait_seconds += started - waited
+            if payload is _DONE:
+                return
+
+            try:
+                outcome.written += await write_page(payload)
+            except Exception as e:
+                error_msg = f"Database operation failed for page: {e}"
+                logger.error(error_msg)
+                outcome.errors.append(error_msg)
+            finally:
+                timing.busy_seconds += time.perf_counter() - started
+            timing.pages += 1
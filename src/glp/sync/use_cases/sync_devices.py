@@ -16,14 +16,17 @@ Workflow:
 
 import logging
 from datetime import datetime, timezone
+from typing import Optional
 
 from ..domain.entities import (
     Device,
+    DeviceRecordBatch,
     DeviceSubscription,
     DeviceTag,
     SyncResult,
 )
 from ..domain.ports import IDeviceAPI, IDeviceRepository, IFieldMapper
+from .pipeline import SyncPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +53,8 @@ class SyncDevicesUseCase:
         device_api: IDeviceAPI,
         device_repo: IDeviceRepository,
         field_mapper: IFieldMapper,
+        pipeline: Optional[SyncPipeline] = None,
+        direct_records: bool = False,
     ):
         """Initialize the use case with its dependencies.
 
@@ -57,10 +62,29 @@ class SyncDevicesUseCase:
             device_api: Port for fetching devices from API
             device_repo: Port for persisting devices to database
             field_mapper: Port for transforming between formats
+            pipeline: Pipeline used by execute_streaming (default: SyncPipeline())
+            direct_records: Map API dicts straight to DeviceRecordBatch rows
+                (IFieldMapper.map_to_records) and write them with
+                IDeviceRepository.write_device_records, instead of building
+                Device entities that keep each raw dict alive
         """
         self.api = device_api
         self.repo = device_repo
         self.mapper = field_mapper
+        self.pipeline = pipeline or SyncPipeline()
+        self.direct_records = direct_records
+
+    def _map_records(self, raw_devices: list[dict], errors: list[str]) -> DeviceRecordBatch:
+        """Map API dicts to a record batch, collecting per-device errors."""
+        batch = DeviceRecordBatch()
+        for raw in raw_devices:
+            try:
+                self.mapper.map_to_records(raw, batch)
+            except Exception as e:
+                error_msg = f"Mapping error for device {raw.get('id', 'unknown')}: {e}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+        return batch
 
     async def execute(self) -> SyncResult:
         """Execute the device sync workflow.
@@ -105,6 +129,9 @@ class SyncDevicesUseCase:
                 synced_at=started_at,
             )
 
+        if self.direct_records:
+            return await self._execute_records(raw_devices, started_at, errors)
+
         # Step 2: Map to domain entities
         devices: list[Device] = []
         all_subscriptions: list[DeviceSubscription] = []
@@ -176,73 +203,117 @@ class SyncDevicesUseCase:
             error_details=errors,
         )
 
+    async def _execute_records(
+        self,
+        raw_devices: list[dict],
+        started_at: datetime,
+        errors: list[str],
+    ) -> SyncResult:
+        """Steps 2-5 of execute() on record batches instead of entities."""
+        total = len(raw_devices)
+        batch = self._map_records(raw_devices, errors)
+        # Rows carry serialized raw_data; release the API dicts before writing
+        raw_devices.clear()
+        logger.info(
+            f"Mapped {len(batch)} devices, "
+            f"{len(batch.subscriptions)} subscriptions, "
+            f"{len(batch.tags)} tags"
+        )
+
+        upserted = 0
+        try:
+            upserted = await self.repo.write_device_records(batch)
+            logger.info(f"Upserted {upserted} devices with subscriptions and tags")
+        except Exception as e:
+            error_msg = f"Database upsert failed: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+        duration = (datetime.now(timezone.utc) - started_at).total_seconds()
+        logger.info(
+            f"Device sync completed in {duration:.2f}s: "
+            f"{upserted} upserted, {len(errors)} errors"
+        )
+
+        return SyncResult(
+            success=len(errors) == 0,
+            total=total,
+            upserted=upserted,
+            errors=len(errors),
+            synced_at=started_at,
+            error_details=errors,
+        )
+
     async def execute_streaming(self) -> SyncResult:
         """Execute device sync with streaming to minimize memory usage.
 
         This method processes devices page by page instead of loading all
         records into memory at once. Ideal for large inventories (100K+ devices).
 
-        The streaming approach:
-        1. Fetches one page of devices at a time via fetch_paginated()
-        2. Maps and upserts each page immediately
-        3. Syncs related data (subscriptions, tags) per page
-        4. Keeps only current page in memory
+        The streaming approach runs a staged pipeline (see SyncPipeline):
+        1. Fetches pages via fetch_paginated()
+        2. Maps each page to devices, subscriptions and tags
+        3. Upserts each page and syncs its related data
+        The stages overlap (fetching page N+1 while page N is mapped and
+        page N-1 is written), and bounded queues keep only a few pages in
+        memory.
 
         Returns:
-            SyncResult with statistics about the sync operation
+            SyncResult with statistics and per-stage timings
         """
         started_at = datetime.now(timezone.utc)
         errors: list[str] = []
-        total_fetched = 0
-        total_upserted = 0
 
         logger.info(f"Starting streaming device sync at {started_at.isoformat()}")
 
-        try:
-            async for page in self.api.fetch_paginated():
-                page_size = len(page)
-                total_fetched += page_size
-
-                # Map page to entities
-                devices: list[Device] = []
-                subscriptions: list[DeviceSubscription] = []
-                tags: list[DeviceTag] = []
-
-                for raw in page:
-                    try:
-                        device = self.mapper.map_to_entity(raw)
-                        devices.append(device)
-                        subscriptions.extend(self.mapper.extract_subscriptions(device, raw))
-                        tags.extend(self.mapper.extract_tags(device, raw))
-                    except Exception as e:
-                        device_id = raw.get("id", "unknown")
-                        error_msg = f"Mapping error for device {device_id}: {e}"
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
-
-                # Upsert this page immediately
-                if devices:
-                    try:
-                        upserted = await self.repo.upsert_devices(devices)
-                        total_upserted += upserted
-
-                        # Sync related data for this page
-                        device_ids = [d.id for d in devices]
-                        await self.repo.sync_all_related_data(device_ids, subscriptions, tags)
-
-                    except Exception as e:
-                        error_msg = f"Database operation failed for page: {e}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
-
-                logger.debug(
-                    f"Processed page: {page_size} devices, {total_fetched} total so far"
-                )
+        def map_page(
+            page: list[dict],
+        ) -> tuple[list[Device], list[DeviceSubscription], list[DeviceTag]]:
+            devices: list[Device] = []
+            subscriptions: list[DeviceSubscription] = []
+            tags: list[DeviceTag] = []
+
+            for raw in page:
+                try:
+                    device = self.mapper.map_to_entity(raw)
+                    devices.append(device)
+                    subscriptions.extend(self.mapper.extract_subscriptions(device, raw))
+                    tags.extend(self.mapper.extract_tags(device, raw))
+                except Exception as e:
+                    device_id = raw.get("id", "unknown")
+                    error_msg = f"Mapping error for device {device_id}: {e}"
+                    logger.warning(error_msg)
+                    errors.append(error_msg)
+
+            return devices, subscriptions, tags
+
+        async def write_page(
+            mapped: tuple[list[Device], list[DeviceSubscription], list[DeviceTag]],
+        ) -> int:
+            devices, subscriptions, tags = mapped
+            if not devices:
+                return 0
 
-        except Exception as e:
-            error_msg = f"Streaming sync failed: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+            upserted = await self.repo.upsert_devices(devices)
+
+            # Sync related data for this page
+            device_ids = [d.id for d in devices]
+            await self.repo.sync_all_related_data(device_ids, subscriptions, tags)
+
+            logger.debug(f"Wrote page: {upserted} devices")
+            return upserted
+
+        if self.direct_records:
+            outcome = await self.pipeline.run(
+                self.api.fetch_paginated(),
+                lambda page: self._map_records(page, errors),
+                self.repo.write_device_records,
+            )
+        else:
+            outcome = await self.pipeline.run(self.api.fetch_paginated(), map_page, write_page)
+        errors.extend(outcome.errors)
+        total_fetched = outcome.fetched
+        total_upserted = outcome.written
 
         # Build result
         completed_at = datetime.now(timezone.utc)
@@ -250,7 +321,10 @@ class SyncDevicesUseCase:
 
         logger.info(
             f"Streaming device sync completed in {duration:.2f}s: "
-            f"{total_upserted} upserted, {len(errors)} errors"
+            f"{total_upserted} upserted, {len(errors)} errors "
+            f"(fetch {outcome.stage_timings['fetch'].busy_seconds:.2f}s, "
+            f"map {outcome.stage_timings['map'].busy_seconds:.2f}s, "
+            f"write {outcome.stage_timings['write'].busy_seconds:.2f}s)"
         )
 
         return SyncResult(
@@ -260,4 +334,5 @@ class SyncDevicesUseCase:
             errors=len(errors),
             synced_at=started_at,
             error_details=errors,
+            stage_timings=outcome.stage_timings,
         )
@@ -16,13 +16,16 @@ Workflow:
 
 import logging
 from datetime import datetime, timezone
+from typing import Optional
 
 from ..domain.entities import (
     Subscription,
+    SubscriptionRecordBatch,
     SubscriptionTag,
     SyncResult,
 )
 from ..domain.ports import ISubscriptionAPI, ISubscriptionFieldMapper, ISubscriptionRepository
+from .pipeline import SyncPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,8 @@ class SyncSubscriptionsUseCase:
         subscription_api: ISubscriptionAPI,
         subscription_repo: ISubscriptionRepository,
         field_mapper: ISubscriptionFieldMapper,
+        pipeline: Optional[SyncPipeline] = None,
+        direct_records: bool = False,
     ):
         """Initialize the use case with its dependencies.
 
@@ -56,10 +61,28 @@ class SyncSubscriptionsUseCase:
             subscription_api: Port for fetching subscriptions from API
             subscription_repo: Port for persisting subscriptions to database
             field_mapper: Port for transforming between formats
+            pipeline: Pipeline used by execute_streaming (default: SyncPipeline())
+            direct_records: Map API dicts straight to SubscriptionRecordBatch
+                rows (ISubscriptionFieldMapper.map_to_records) and write them
+                with ISubscriptionRepository.write_subscription_records
         """
         self.api = subscription_api
         self.repo = subscription_repo
         self.mapper = field_mapper
+        self.pipeline = pipeline or SyncPipeline()
+        self.direct_records = direct_records
+
+    def _map_records(self, raw_subscriptions: list[dict], errors: list[str]) -> SubscriptionRecordBatch:
+        """Map API dicts to a record batch, collecting per-subscription errors."""
+        batch = SubscriptionRecordBatch()
+        for raw in raw_subscriptions:
+            try:
+                self.mapper.map_to_records(raw, batch)
+            except Exception as e:
+                error_msg = f"Mapping error for subscription {raw.get('id', 'unknown')}: {e}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+        return batch
 
     async def execute(self) -> SyncResult:
         """Execute the subscription sync workflow.
@@ -104,6 +127,9 @@ class SyncSubscriptionsUseCase:
                 synced_at=started_at,
             )
 
+        if self.direct_records:
+            return await self._execute_records(raw_subscriptions, started_at, errors)
+
         # Step 2: Map to domain entities
         subscriptions: list[Subscription] = []
         all_tags: list[SubscriptionTag] = []
@@ -166,71 +192,105 @@ class SyncSubscriptionsUseCase:
             error_details=errors,
         )
 
+    async def _execute_records(
+        self,
+        raw_subscriptions: list[dict],
+        started_at: datetime,
+        errors: list[str],
+    ) -> SyncResult:
+        """Steps 2-5 of execute() on record batches instead of entities."""
+        total = len(raw_subscriptions)
+        batch = self._map_records(raw_subscriptions, errors)
+        # Rows carry serialized raw_data; release the API dicts before writing
+        raw_subscriptions.clear()
+        logger.info(f"Mapped {len(batch)} subscriptions, {len(batch.tags)} tags")
+
+        upserted = 0
+        try:
+            upserted = await self.repo.write_subscription_records(batch)
+            logger.info(f"Upserted {upserted} subscriptions with tags")
+        except Exception as e:
+            error_msg = f"Database upsert failed: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+        duration = (datetime.now(timezone.utc) - started_at).total_seconds()
+        logger.info(
+            f"Subscription sync completed in {duration:.2f}s: "
+            f"{upserted} upserted, {len(errors)} errors"
+        )
+
+        return SyncResult(
+            success=len(errors) == 0,
+            total=total,
+            upserted=upserted,
+            errors=len(errors),
+            synced_at=started_at,
+            error_details=errors,
+        )
+
     async def execute_streaming(self) -> SyncResult:
         """Execute subscription sync with streaming to minimize memory usage.
 
         This method processes subscriptions page by page instead of loading all
         records into memory at once. Ideal for large subscription counts.
 
-        The streaming approach:
-        1. Fetches one page of subscriptions at a time via fetch_paginated()
-        2. Maps and upserts each page immediately
-        3. Syncs related data (tags) per page
-        4. Keeps only current page in memory
+        The streaming approach runs a staged pipeline (see SyncPipeline):
+        1. Fetches pages via fetch_paginated()
+        2. Maps each page to subscriptions and tags
+        3. Upserts each page and syncs its tags
+        The stages overlap, and bounded queues keep only a few pages in memory.
 
         Returns:
-            SyncResult with statistics about the sync operation
+            SyncResult with statistics and per-stage timings
         """
         started_at = datetime.now(timezone.utc)
         errors: list[str] = []
-        total_fetched = 0
-        total_upserted = 0
 
         logger.info(f"Starting streaming subscription sync at {started_at.isoformat()}")
 
-        try:
-            async for page in self.api.fetch_paginated():
-                page_size = len(page)
-                total_fetched += page_size
-
-                # Map page to entities
-                subscriptions: list[Subscription] = []
-                tags: list[SubscriptionTag] = []
-
-                for raw in page:
-                    try:
-                        subscription = self.mapper.map_to_entity(raw)
-                        subscriptions.append(subscription)
-                        tags.extend(self.mapper.extract_tags(subscription, raw))
-                    except Exception as e:
-                        sub_id = raw.get("id", "unknown")
-                        error_msg = f"Mapping error for subscription {sub_id}: {e}"
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
-
-                # Upsert this page immediately
-                if subscriptions:
-                    try:
-                        upserted = await self.repo.upsert_subscriptions(subscriptions)
-                        total_upserted += upserted
-
-                        # Sync tags for this page
-                        subscription_ids = [s.id for s in subscriptions]
-                        await self.repo.sync_tags(subscription_ids, tags)
-
-                    except Exception as e:
-                        error_msg = f"Database operation failed for page: {e}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
-
-                logger.debug(
-                    f"Processed page: {page_size} subscriptions, {total_fetched} total so far"
-                )
+        def map_page(page: list[dict]) -> tuple[list[Subscription], list[SubscriptionTag]]:
+            subscriptions: list[Subscription] = []
+            tags: list[SubscriptionTag] = []
 
-        except Exception as e:
-            error_msg = f"Streaming sync failed: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+            for raw in page:
+                try:
+                    subscription = self.mapper.map_to_entity(raw)
+                    subscriptions.append(subscription)
+                    tags.extend(self.mapper.extract_tags(subscription, raw))
+                except Exception as e:
+                    sub_id = raw.get("id", "unknown")
+                    error_msg = f"Mapping error for subscription {sub_id}: {e}"
+                    logger.warning(error_msg)
+                    errors.append(error_msg)
+
+            return subscriptions, tags
+
+        async def write_page(mapped: tuple[list[Subscription], list[SubscriptionTag]]) -> int:
+            subscriptions, tags = mapped
+            if not subscriptions:
+                return 0
+
+            upserted = await self.repo.upsert_subscriptions(subscriptions)
+
+            # Sync tags for this page
+            subscription_ids = [s.id for s in subscriptions]
+            await self.repo.sync_tags(subscription_ids, tags)
+
+            logger.debug(f"Wrote page: {upserted} subscriptions")
+            return upserted
+
+        if self.direct_records:
+            outcome = await self.pipeline.run(
+                self.api.fetch_paginated(),
+                lambda page: self._map_records(page, errors),
+                self.repo.write_subscription_records,
+            )
+        else:
+            outcome = await self.pipeline.run(self.api.fetch_paginated(), map_page, write_page)
+        errors.extend(outcome.errors)
+        total_fetched = outcome.fetched
+        total_upserted = outcome.written
 
         # Build result
         completed_at = datetime.now(timezone.utc)
@@ -238,7 +298,10 @@ class SyncSubscriptionsUseCase:
 
         logger.info(
             f"Streaming subscription sync completed in {duration:.2f}s: "
-            f"{total_upserted} upserted, {len(errors)} errors"
+            f"{total_upserted} upserted, {len(errors)} errors "
+            f"(fetch {outcome.stage_timings['fetch'].busy_seconds:.2f}s, "
+            f"map {outcome.stage_timings['map'].busy_seconds:.2f}s, "
+            f"write {outcome.stage_timings['write'].busy_seconds:.2f}s)"
         )
 
         return SyncResult(
@@ -248,6 +311,7 @@ class SyncSubscriptionsUseCase:
             errors=len(errors),
             synced_at=started_at,
             error_details=errors,
+            stage_timings=outcome.stage_timings,
         )
 
     @staticmethod
@@ -0,0 +1,249 @@
+"""
+Tests for Anthropic prompt caching.
+
+Verifies that the stable parts of a request are cached, including:
+- PromptBuilder splits the prompt into a stable base and volatile context
+- Cache breakpoints on the last tool, the stable system block and the
+  latest tool result
+- System messages join the stable prefix
+- Caching can be disabled
+- Cache read/write token counts reach the DONE event and the orchestrator
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.glp.agent.domain.entities import (
+    ChatEventType,
+    Memory,
+    MemoryType,
+    Message,
+    MessageRole,
+    SystemPrompt,
+    ToolCall,
+    ToolDefinition,
+)
+from src.glp.agent.orchestrator.agent import AgentOrchestrator
+from src.glp.agent.orchestrator.prompt_builder import PromptBuilder
+from src.glp.agent.providers.anthropic import CACHE_CONTROL, AnthropicProvider
+from src.glp.agent.providers.base import LLMProviderConfig
+
+# ============================================
+# Fixtures
+# ============================================
+
+
+def make_config(**kwargs) -> LLMProviderConfig:
+    return LLMProviderConfig(api_key="test-key", model="claude-sonnet-4-20250514", **kwargs)
+
+
+def make_tools() -> list[ToolDefinition]:
+    return [
+        ToolDefinition(name=name, description=f"{name} tool", parameters={"type": "object"})
+        for name in ("search_devices", "run_query")
+    ]
+
+
+@pytest.fixture
+def tool_loop_history():
+    """A conversation whose latest message is a tool result."""
+    tool_call = ToolCall(id="tc_1", name="run_query", arguments={"sql": "SELECT 1"})
+    return [
+        Message(role=MessageRole.USER, content="How many devices?"),
+        Message(role=MessageRole.ASSISTANT, content="Checking.", tool_calls=[tool_call]),
+        Message(role=MessageRole.TOOL, content="[{'count': 42}]", tool_calls=[tool_call]),
+    ]
+
+
+def stream_client(mock_client_class, events):
+    """Wire a mocked AsyncAnthropic client to stream the given events."""
+    mock_stream = AsyncMock()
+    mock_stream.__aenter__ = AsyncMock(return_value=mock_stream)
+    mock_stream.__aexit__ = AsyncMock()
+
+    async def event_stream():
+        for event in events:
+            yield event
+
+    mock_stream.__aiter__ = lambda self: event_stream()
+    mock_messages = MagicMock()
+    mock_messages.stream = MagicMock(return_value=mock_stream)
+    mock_client_class.return_value = MagicMock(messages=mock_messages)
+    return mock_messages
+
+
+async def collect(provider, *args, **kwargs):
+    return [event async for event in provider.chat(*args, **kwargs)]
+
+
+# ============================================
+# Prompt Split Tests
+# ============================================
+
+
+class TestSystemPrompt:
+    """Tests for the stable/volatile prompt split."""
+
+    def test_prompt_builder_keeps_base_prompt_stable(self):
+        """Memories go into the volatile part; the full text is unchanged."""
+        memory = Memory(
+            tenant_id="t1",
+            user_id="u1",
+            memory_type=MemoryType.FACT,
+            content="Site HQ has 40 APs",
+        )
+
+        prompt = PromptBuilder().build(base_prompt="You are helpful.", memories=[memory])
+
+        assert isinstance(prompt, SystemPrompt)
+        assert prompt.stable == "You are helpful."
+        assert prompt.volatile.startswith("\n\nRelevant context")
+        assert prompt == "You are helpful.\n\nRelevant context from previous conversations:\n- [fact] Site HQ has 40 APs\n"
+
+    def test_prompt_without_context_is_all_stable(self):
+        prompt = PromptBuilder().build(base_prompt="You are helpful.")
+
+        assert prompt == prompt.stable == "You are helpful."
+        assert prompt.volatile == ""
+
+
+# ============================================
+# Cache Breakpoint Tests
+# ============================================
+
+
+class TestCacheBreakpoints:
+    """Tests for cache_control placement in API requests."""
+
+    @pytest.mark.asyncio
+    async def test_request_marks_stable_prefix(self, tool_loop_history):
+        """Tools, stable system block and latest tool result are cached."""
+        with patch("src.glp.agent.providers.anthropic.AsyncAnthropic") as mock_client_class:
+            mock_messages = stream_client(mock_client_class, [])
+            provider = AnthropicProvider(make_config())
+
+            await collect(
+                provider,
+                tool_loop_history,
+                tools=make_tools(),
+                system_prompt=SystemPrompt("You are helpful.", "\n\nContext: HQ"),
+            )
+
+            kwargs = mock_messages.stream.call_args[1]
+            assert kwargs["system"] == [
+                {"type": "text", "text": "You are helpful.", "cache_control": CACHE_CONTROL},
+                {"type": "text", "text": "\n\nContext: HQ"},
+            ]
+            assert "cache_control" not in kwargs["tools"][0]
+            assert kwargs["tools"][-1]["cache_control"] == CACHE_CONTROL
+            messages = kwargs["messages"]
+            assert messages[0]["content"] == "How many devices?"
+            assert "cache_control" not in messages[1]["content"][-1]
+            assert messages[2]["content"][-1]["type"] == "tool_result"
+            assert messages[2]["content"][-1]["cache_control"] == CACHE_CONTROL
+
+    def test_system_messages_join_stable_prefix(self):
+        with patch("src.glp.agent.providers.anthropic.AsyncAnthropic"):
+            provider = AnthropicProvider(make_config())
+
+        system, _ = provider._format_messages_for_api(
+            [Message(role=MessageRole.SYSTEM, content="Summary so far.")],
+            SystemPrompt("You are helpful.", "\n\nContext: HQ"),
+        )
+
+        assert system.stable == "Summary so far.\n\nYou are helpful."
+        assert system.volatile == "\n\nContext: HQ"
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, tool_loop_history):
+        """Without caching the request carries no cache_control at all."""
+        with patch("src.glp.agent.providers.anthropic.AsyncAnthropic") as mock_client_class:
+            mock_messages = stream_client(mock_client_class, [])
+            provider = AnthropicProvider(make_config(enable_prompt_cache=False))
+
+            await collect(
+                provider,
+                tool_loop_history,
+                tools=make_tools(),
+                system_prompt=SystemPrompt("You are helpful.", "\n\nContext: HQ"),
+            )
+
+            kwargs = mock_messages.stream.call_args[1]
+            assert kwargs["system"] == "You are helpful.\n\nContext: HQ"
+            assert "cache_control" not in str(kwargs["tools"])
+            assert "cache_control" not in str(kwargs["messages"])
+
+
+# ============================================
+# Usage Tests
+# ============================================
+
+
+class TestUsage:
+    """Tests for cache token accounting."""
+
+    @pytest.mark.asyncio
+    async def test_done_event_carries_usage(self):
+        events = [
+            SimpleNamespace(
+                type="message_start",
+                message=SimpleNamespace(
+                    usage=SimpleNamespace(
+                        input_tokens=12,
+                        cache_creation_input_tokens=0,
+                        cache_read_input_tokens=2048,
+                        output_tokens=1,
+                    )
+                ),
+            ),
+            SimpleNamespace(
+                type="content_block_start",
+                content_block=SimpleNamespace(type="text"),
+            ),
+            SimpleNamespace(
+                type="content_block_delta",
+                delta=SimpleNamespace(type="text_delta", text="42 devices"),
+            ),
+            SimpleNamespace(type="content_block_stop"),
+            SimpleNamespace(type="message_delta", usage=SimpleNamespace(output_tokens=5)),
+        ]
+        with patch("src.glp.agent.providers.anthropic.AsyncAnthropic") as mock_client_class:
+            stream_client(mock_client_class, events)
+            provider = AnthropicProvider(make_config())
+
+            result = await collect(provider, [Message(role=MessageRole.USER, content="Count?")])
+
+        done = result[-1]
+        assert done.type == ChatEventType.DONE
+        usage = done.metadata["usage"]
+        assert usage["input_tokens"] == 12
+        assert usage["cache_read_input_tokens"] == 2048
+        assert usage["cache_creation_input_tokens"] == 0
+        assert usage["output_tokens"] == 5
+        assert usage["time_to_first_token_ms"] >= 0
+
+    def test_orchestrator_sums_usage_per_turn(self):
+        totals = {}
+
+        first = AgentOrchestrator._record_usage(
+            1,
+            {"input_tokens": 10, "cache_creation_input_tokens": 3000, "output_tokens": 50},
+            totals,
+        )
+        second = AgentOrchestrator._record_usage(
+            2,
+            {"input_tokens": 20, "cache_read_input_tokens": 3050, "output_tokens": 30,
+             "time_to_first_token_ms": 180},
+            totals,
+        )
+
+        assert (first, second) == (3060, 3100)
+        assert totals == {
+            "input_tokens": 30,
+            "cache_creation_input_tokens": 3000,
+            "cache_read_input_tokens": 3050,
+            "output_tokens": 80,
+        }
+        assert AgentOrchestrator._record_usage(3, {}, totals) is None
@@ -0,0 +1,315 @@
+"""
+Tests for fair chat scheduling.
+
+Verifies ChatScheduler admission, including:
+- Chats under the limits start immediately and keep their sequence numbers
+- Global and per tenant concurrency limits queue further chats
+- Waiting chats get queue position events and shifted sequence numbers
+- A newly active tenant goes ahead of a backlogged one, and weights
+  split slots between backlogged tenants
+- Full queues, queue timeouts and cancelled waiters
+- Idle tenants are dropped, with their counts kept in the totals
+- /health/chats requires the API key
+- Queue events pass through the resumable stream buffer
+- Small tenant latency under load from one heavy tenant, with and
+  without the scheduler
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.glp.agent.api.chat_scheduler import ChatScheduler, parse_tenant_weights
+from src.glp.agent.api.stream_replay import ChatStreamManager, InMemoryReplayBuffer
+from src.glp.agent.domain.entities import ChatEvent, ChatEventType, ErrorType, UserContext
+
+
+def user(tenant_id: str) -> UserContext:
+    return UserContext(tenant_id=tenant_id, user_id=f"{tenant_id}-user", session_id="s-1")
+
+
+async def fake_chat(seconds: float = 0.0, release: asyncio.Event = None, started: list = None, name: str = ""):
+    """Mock orchestrator.chat(): two deltas and DONE."""
+    if started is not None:
+        started.append(name)
+    if release is not None:
+        await release.wait()
+    await asyncio.sleep(seconds)
+    yield ChatEvent(type=ChatEventType.TEXT_DELTA, sequence=1, content="Hello")
+    yield ChatEvent(type=ChatEventType.TEXT_DELTA, sequence=2, content=" there")
+    yield ChatEvent.done(sequence=3)
+
+
+async def collect(events) -> list[ChatEvent]:
+    return [event async for event in events]
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ============================================
+# Admission Tests
+# ============================================
+
+
+class TestAdmission:
+    """Tests for limits, queue events and sequence numbers."""
+
+    @pytest.mark.asyncio
+    async def test_under_limit_runs_immediately(self):
+        scheduler = ChatScheduler(max_concurrent=2, per_tenant_limit=2)
+
+        events = await collect(scheduler.schedule(fake_chat(), user("acme")))
+
+        assert [(e.type, e.sequence) for e in events] == [
+            (ChatEventType.TEXT_DELTA, 1),
+            (ChatEventType.TEXT_DELTA, 2),
+            (ChatEventType.DONE, 3),
+        ]
+        assert scheduler.running == 0
+        assert scheduler.snapshot()["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_per_tenant_limit_queues_with_position(self):
+        scheduler = ChatScheduler(max_concurrent=4, per_tenant_limit=1)
+        release = asyncio.Event()
+
+        first = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("acme"))))
+        await settle()
+        second = asyncio.create_task(collect(scheduler.schedule(fake_chat(), user("acme"))))
+        # Another tenant is not held back by acme's limit
+        other = await collect(scheduler.schedule(fake_chat(), user("globex")))
+        await settle()
+
+        assert other[0].type == ChatEventType.TEXT_DELTA
+        assert scheduler.snapshot()["tenants"]["acme"]["queued"] == 1
+
+        release.set()
+        await first
+        events = await second
+
+        assert events[0].type == ChatEventType.QUEUED
+        assert events[0].metadata == {"position": 1}
+        assert [e.sequence for e in events] == [1, 2, 3, 4]
+        assert events[-1].type == ChatEventType.DONE
+
+    @pytest.mark.asyncio
+    async def test_new_tenant_goes_before_backlog(self):
+        scheduler = ChatScheduler(max_concurrent=1, per_tenant_limit=4)
+        release = asyncio.Event()
+        started: list[str] = []
+
+        tasks = [asyncio.create_task(collect(scheduler.schedule(
+            fake_chat(release=release, started=started, name=f"acme-{i}"), user("acme")
+        ))) for i in range(3)]
+        await settle()
+        tasks.append(asyncio.create_task(collect(scheduler.schedule(
+            fake_chat(release=release, started=started, name="globex-0"), user("globex")
+        ))))
+        await settle()
+
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert started == ["acme-0", "globex-0", "acme-1", "acme-2"]
+        # globex was told it is next, behind nobody
+        assert results[3][0].metadata == {"position": 1}
+
+    @pytest.mark.asyncio
+    async def test_weights_split_slots(self):
+        scheduler = ChatScheduler(
+            max_concurrent=1, per_tenant_limit=1, tenant_weights={"acme": 2.0}
+        )
+        release = asyncio.Event()
+        started: list[str] = []
+
+        blocker = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("other"))))
+        await settle()
+        tasks = []
+        for i in range(6):
+            for tenant in ("acme", "globex"):
+                tasks.append(asyncio.create_task(collect(scheduler.schedule(
+                    fake_chat(started=started, name=tenant), user(tenant)
+                ))))
+        await settle()
+
+        release.set()
+        await asyncio.gather(blocker, *tasks)
+
+        assert started[:6].count("acme") == 4
+        assert started[:6].count("globex") == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects(self):
+        scheduler = ChatScheduler(max_concurrent=1, per_tenant_limit=1, max_queued_per_tenant=1)
+        release = asyncio.Event()
+
+        running = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("acme"))))
+        await settle()
+        waiting = asyncio.create_task(collect(scheduler.schedule(fake_chat(), user("acme"))))
+        await settle()
+        rejected = await collect(scheduler.schedule(fake_chat(), user("acme")))
+
+        assert [(e.type, e.error_type) for e in rejected] == [(ChatEventType.ERROR, ErrorType.RATE_LIMIT)]
+        assert scheduler.snapshot()["tenants"]["acme"]["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(running, waiting)
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        scheduler = ChatScheduler(max_concurrent=1, queue_timeout_seconds=0.05)
+        release = asyncio.Event()
+
+        running = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("acme"))))
+        await settle()
+        events = await collect(scheduler.schedule(fake_chat(), user("globex")))
+
+        assert [e.type for e in events] == [ChatEventType.QUEUED, ChatEventType.ERROR]
+        assert events[-1].error_type == ErrorType.TIMEOUT
+        assert events[-1].sequence == 2
+        assert scheduler.snapshot()["queued"] == 0
+        assert scheduler.snapshot()["timed_out"] == 1
+
+        release.set()
+        await running
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = ChatScheduler(max_concurrent=1)
+        release = asyncio.Event()
+
+        running = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("a"))))
+        await settle()
+        cancelled = asyncio.create_task(collect(scheduler.schedule(fake_chat(), user("b"))))
+        await settle()
+        last = scheduler.schedule(fake_chat(), user("c"))
+        first_event = await last.__anext__()
+        assert first_event.metadata == {"position": 2}
+
+        cancelled.cancel()
+        await settle()
+        second_event = await last.__anext__()
+
+        assert second_event.metadata == {"position": 1}
+        release.set()
+        await running
+        assert [e.type for e in await collect(last)][-1] == ChatEventType.DONE
+        assert scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_tenants_are_dropped():
+    scheduler = ChatScheduler(max_concurrent=2, per_tenant_limit=1, max_queued_per_tenant=0)
+    release = asyncio.Event()
+
+    running = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("acme"))))
+    await settle()
+    rejected = await collect(scheduler.schedule(fake_chat(), user("acme")))
+    for i in range(50):
+        await collect(scheduler.schedule(fake_chat(), user(f"tenant-{i}")))
+
+    snapshot = scheduler.snapshot()
+    assert rejected[0].error_type == ErrorType.RATE_LIMIT
+    assert list(snapshot["tenants"]) == ["acme"]
+    assert snapshot["tenants"]["acme"]["rejected"] == 1
+
+    release.set()
+    await running
+    snapshot = scheduler.snapshot()
+    assert snapshot["tenants"] == {}
+    assert (snapshot["admitted"], snapshot["rejected"]) == (51, 1)
+    assert snapshot["queue_wait"]["histogram"]["le_10ms"] == 51
+
+
+def test_parse_tenant_weights():
+    assert parse_tenant_weights("acme=2, globex=0.5,bad,neg=-1,x=y") == {"acme": 2.0, "globex": 0.5}
+    assert parse_tenant_weights("") == {}
+
+
+@pytest.mark.asyncio
+async def test_queue_events_are_resumable():
+    scheduler = ChatScheduler(max_concurrent=1)
+    manager = ChatStreamManager(InMemoryReplayBuffer())
+    release = asyncio.Event()
+    context = user("acme")
+
+    running = asyncio.create_task(collect(scheduler.schedule(fake_chat(release=release), user("globex"))))
+    await settle()
+    stream_id = await manager.start(scheduler.schedule(fake_chat(), context), context)
+    await settle()
+    release.set()
+    await running
+
+    # A client that saw the queue event resumes after it
+    events = await collect(manager.subscribe(stream_id, context, after_sequence=1))
+
+    assert [(e.type, e.sequence) for e in events] == [
+        (ChatEventType.TEXT_DELTA, 2),
+        (ChatEventType.TEXT_DELTA, 3),
+        (ChatEventType.DONE, 4),
+    ]
+
+
+# ============================================
+# Load Test
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_small_tenant_latency_under_load():
+    """One tenant submits 40 long chats at once; 8 small tenants each send
+    one short chat shortly after. 8 slots, chats take 50ms (heavy) or
+    10ms (small)."""
+
+    async def run(schedule):
+        latencies: list[float] = []
+
+        async def small_chat(tenant_id):
+            started = time.perf_counter()
+            await collect(schedule(fake_chat(0.01), user(tenant_id)))
+            latencies.append(time.perf_counter() - started)
+
+        heavy = [
+            asyncio.create_task(collect(schedule(fake_chat(0.05), user("heavy"))))
+            for _ in range(40)
+        ]
+        await asyncio.sleep(0.005)
+        small = [asyncio.create_task(small_chat(f"small-{i}")) for i in range(8)]
+        await asyncio.gather(*heavy, *small)
+        latencies.sort()
+        return latencies[int(len(latencies) * 0.95) - 1], latencies[-1]
+
+    # Previous behaviour plus a plain global limit: first come, first served
+    semaphore = asyncio.Semaphore(8)
+
+    async def fifo(events, context):
+        async with semaphore:
+            async for event in events:
+                yield event
+
+    scheduler = ChatScheduler(max_concurrent=8, per_tenant_limit=4, max_queued_per_tenant=50)
+
+    fifo_p95, fifo_max = await run(fifo)
+    fair_p95, fair_max = await run(scheduler.schedule)
+
+    print(
+        f"\nsmall tenant latency: fifo p95 {fifo_p95 * 1000:.0f}ms max {fifo_max * 1000:.0f}ms, "
+        f"fair p95 {fair_p95 * 1000:.0f}ms max {fair_max * 1000:.0f}ms"
+    )
+    snapshot = scheduler.snapshot()
+    print(f"queue wait p95 {snapshot['queue_wait']['p95_ms']:.0f}ms")
+    assert fair_max * 3 < fifo_max
+    assert snapshot["running"] == 0 and snapshot["queued"] == 0
+    assert snapshot["tenants"] == {}
+
+
+def test_health_endpoint_requires_api_key():
+    from src.glp.assignment.api.dependencies import verify_api_key
+    from src.glp.assignment.app import app
+
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/health/chats")
+    assert verify_api_key in [d.call for d in route.dependant.dependencies]
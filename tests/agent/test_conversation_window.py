@@ -0,0 +1,303 @@
+"""
+Tests for windowed conversation loading.
+
+Verifies that chat turns no longer read whole conversations, including:
+- ConversationStore.get() loads a message window starting at a user turn
+- get_messages() keyset pages cover every message exactly once
+- ConversationManager reuses the session's cached conversation and
+  reloads it when another session added messages
+- The summary of earlier messages reaches the system prompt
+- Per-turn DB time for a 500-message conversation, before and after
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.glp.agent.domain.entities import Conversation, Message, MessageRole, UserContext
+from src.glp.agent.memory.conversation import ConversationStore
+from src.glp.agent.orchestrator.conversation_manager import ConversationManager
+from src.glp.agent.orchestrator.prompt_builder import PromptBuilder
+
+CONTEXT = UserContext(tenant_id="tenant-1", user_id="user-1", session_id="s-1")
+
+# One user turn: question, tool call, tool result, answer
+TURN_ROLES = ["user", "assistant", "tool", "assistant"]
+
+
+# ============================================
+# Fakes
+# ============================================
+
+
+class FakeConversationDB:
+    """agent_conversations and agent_messages for one conversation.
+
+    Each round trip costs ``latency`` seconds plus ``row_cost`` per row
+    returned, and rows returned are counted.
+    """
+
+    def __init__(self, message_count=0, latency=0.0, row_cost=0.0):
+        self.latency = latency
+        self.row_cost = row_cost
+        self.round_trips = 0
+        self.rows_read = 0
+        self.conversation = {
+            "id": uuid4(), "tenant_id": "tenant-1", "user_id": "user-1",
+            "title": "Inventory", "summary": "Earlier: counted switches per site.",
+            "message_count": 0, "metadata": {},
+            "created_at": datetime(2026, 1, 1), "updated_at": datetime(2026, 1, 1),
+        }
+        self.messages = []
+        start = datetime(2026, 1, 1)
+        for i in range(message_count):
+            # Pairs of messages share a timestamp to exercise the id tie-break
+            self._insert(TURN_ROLES[i % 4], f"message {i}", start + timedelta(seconds=i // 2))
+
+    def _insert(self, role, content, created_at):
+        row = {
+            "id": UUID(int=len(self.messages) + 1), "role": role, "content": content, "thinking_summary": None,
+            "tool_calls": None, "model_used": None, "tokens_used": None,
+            "latency_ms": None, "created_at": created_at,
+        }
+        self.messages.append(row)
+        self.conversation["message_count"] += 1
+        return row
+
+    @staticmethod
+    def _key(row):
+        return row["created_at"], row["id"]
+
+    async def _round_trip(self, rows=0):
+        self.round_trips += 1
+        self.rows_read += rows
+        await asyncio.sleep(self.latency + self.row_cost * rows)
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        await self.db._round_trip()
+
+    async def fetchval(self, query, *args):
+        await self.db._round_trip()
+        return 1
+
+    async def fetchrow(self, query, *args):
+        if query.strip().startswith("INSERT INTO agent_messages"):
+            await self.db._round_trip()
+            last = self.db.messages[-1]["created_at"] if self.db.messages else datetime(2026, 1, 1)
+            row = self.db._insert(args[3], args[4], last + timedelta(seconds=1))
+            row["id"] = args[0]
+            return row
+        await self.db._round_trip(1)
+        return dict(self.db.conversation)
+
+    async def fetch(self, query, *args):
+        rows = sorted(self.db.messages, key=self.db._key)
+        if "(created_at, id) <" in query:
+            cursor = next(r for r in rows if r["id"] == args[1])
+            rows = [r for r in rows if self.db._key(r) < self.db._key(cursor)]
+        if "DESC" in query:
+            rows = list(reversed(rows))[:args[-1]]
+        await self.db._round_trip(len(rows))
+        return rows
+
+
+class FakePool:
+    def __init__(self, db):
+        self.db = db
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self.db)
+
+
+# ============================================
+# ConversationStore Tests
+# ============================================
+
+
+class TestConversationStore:
+    """Tests for windowed loads and keyset paging."""
+
+    @pytest.mark.asyncio
+    async def test_window_starts_at_user_message(self):
+        db = FakeConversationDB(message_count=500)
+        store = ConversationStore(FakePool(db))
+
+        conversation = await store.get(db.conversation["id"], CONTEXT, message_limit=10)
+
+        # Last 10 are ..., tool, assistant | user, assistant, tool, assistant x2
+        assert [m.content for m in conversation.messages] == [
+            f"message {i}" for i in range(492, 500)
+        ]
+        assert conversation.messages[0].role == MessageRole.USER
+        assert conversation.message_count == 500
+        assert db.rows_read == 1 + 10
+
+    @pytest.mark.asyncio
+    async def test_header_only_and_full_loads(self):
+        db = FakeConversationDB(message_count=12)
+        store = ConversationStore(FakePool(db))
+
+        header = await store.get(db.conversation["id"], CONTEXT, message_limit=0)
+        full = await store.get(db.conversation["id"], CONTEXT)
+
+        assert header.messages == [] and header.message_count == 12
+        assert [m.content for m in full.messages] == [f"message {i}" for i in range(12)]
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_every_message_once(self):
+        db = FakeConversationDB(message_count=95)
+        store = ConversationStore(FakePool(db))
+        conversation_id = db.conversation["id"]
+
+        pages = []
+        before = None
+        while True:
+            page = await store.get_messages(conversation_id, CONTEXT, limit=20, before=before)
+            if not page:
+                break
+            pages.append(page)
+            before = page[0].id
+
+        seen = [m.content for page in reversed(pages) for m in page]
+        assert seen == [f"message {i}" for i in range(95)]
+        assert [len(page) for page in pages] == [20, 20, 20, 20, 15]
+
+
+def test_keep_recent_messages_drops_leading_tool_results():
+    conversation = Conversation(tenant_id="t", user_id="u")
+    conversation.messages = [
+        Message(role=MessageRole(role), content=str(i))
+        for i, role in enumerate(TURN_ROLES * 3)
+    ]
+
+    conversation.keep_recent_messages(6)
+    assert [m.content for m in conversation.messages] == ["8", "9", "10", "11"]
+
+    conversation.keep_recent_messages(3)
+    assert conversation.messages == []
+
+
+# ============================================
+# ConversationManager Tests
+# ============================================
+
+
+class TestConversationCache:
+    """Tests for the per-session conversation cache."""
+
+    @pytest.mark.asyncio
+    async def test_next_turn_reuses_cached_conversation(self):
+        db = FakeConversationDB(message_count=100)
+        manager = ConversationManager(ConversationStore(FakePool(db)), history_window=20)
+        conversation_id = db.conversation["id"]
+
+        conversation = await manager.get_or_create(conversation_id, CONTEXT)
+        for role in ("user", "assistant"):
+            message = Message(role=MessageRole(role), content=f"new {role}")
+            await manager.add_message(conversation_id, message, CONTEXT)
+            conversation.messages.append(message)
+
+        db.rows_read = 0
+        again = await manager.get_or_create(conversation_id, CONTEXT)
+
+        assert again is conversation
+        assert db.rows_read == 1  # Conversation row only
+        assert [m.content for m in again.messages[-2:]] == ["new user", "new assistant"]
+        assert again.messages[0].role == MessageRole.USER
+        assert len(again.messages) <= 20
+        assert again.message_count == 102
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_another_session_writes(self):
+        db = FakeConversationDB(message_count=8)
+        store = ConversationStore(FakePool(db))
+        manager = ConversationManager(store, history_window=20)
+        conversation_id = db.conversation["id"]
+
+        first = await manager.get_or_create(conversation_id, CONTEXT)
+        other_tab = UserContext(tenant_id="tenant-1", user_id="user-1", session_id="s-2")
+        await ConversationManager(store).add_message(
+            conversation_id, Message(role=MessageRole.USER, content="from s-2"), other_tab
+        )
+
+        again = await manager.get_or_create(conversation_id, CONTEXT)
+
+        assert again is not first
+        assert again.messages[-1].content == "from s-2"
+
+    @pytest.mark.asyncio
+    async def test_history_page(self):
+        db = FakeConversationDB(message_count=30)
+        manager = ConversationManager(ConversationStore(FakePool(db)))
+
+        conversation = await manager.get_history(db.conversation["id"], CONTEXT, limit=10)
+
+        assert [m.content for m in conversation.messages] == [f"message {i}" for i in range(20, 30)]
+
+
+def test_earlier_summary_in_volatile_prompt():
+    prompt = PromptBuilder().build("BASE", conversation_summary="Counted switches per site.")
+
+    assert prompt.stable == "BASE"
+    assert "Counted switches per site." in prompt.volatile
+
+
+# ============================================
+# Benchmark
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_per_turn_db_time_for_long_conversation():
+    """500-message conversation, 0.5ms per round trip + 20us per row."""
+    turns = 10
+
+    async def run(load):
+        db = FakeConversationDB(message_count=500, latency=0.0005, row_cost=0.00002)
+        started = time.perf_counter()
+        await load(db)
+        return (time.perf_counter() - started) / turns, db.rows_read / turns
+
+    async def full_reload(db):
+        # Previous behaviour: every turn reads the whole conversation
+        store = ConversationStore(FakePool(db))
+        for _ in range(turns):
+            conversation = await store.get(db.conversation["id"], CONTEXT)
+            for role in ("user", "assistant"):
+                await store.add_message(
+                    conversation.id, Message(role=MessageRole(role), content=role), CONTEXT
+                )
+
+    async def windowed(db):
+        manager = ConversationManager(ConversationStore(FakePool(db)), history_window=40)
+        for _ in range(turns):
+            conversation = await manager.get_or_create(db.conversation["id"], CONTEXT)
+            for role in ("user", "assistant"):
+                message = Message(role=MessageRole(role), content=role)
+                await manager.add_message(conversation.id, message, CONTEXT)
+                conversation.messages.append(message)
+
+    before_seconds, before_rows = await run(full_reload)
+    after_seconds, after_rows = await run(windowed)
+
+    print(
+        f"\nper turn: full load {before_seconds * 1000:.1f}ms / {before_rows:.0f} rows, "
+        f"windowed + cache {after_seconds * 1000:.1f}ms / {after_rows:.0f} rows"
+    )
+    assert before_rows > 500
+    assert after_rows < 10
+    assert after_seconds * 2 < before_seconds
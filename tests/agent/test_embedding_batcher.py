@@ -0,0 +1,173 @@
+"""
+Tests for the micro-batching embedding adapter.
+
+Verifies that MicroBatchEmbedder coalesces concurrent embed() calls,
+including:
+- Concurrent calls share one embed_batch() request
+- Full batches flush without waiting for the linger window
+- Provider errors reach every caller in the batch
+- A cancelled caller does not affect the rest of its batch
+- Other attributes are forwarded to the wrapped provider
+- App startup wraps the embedding provider unless EMBEDDING_MICRO_BATCH=false
+- Throughput against one request per text with a mock provider
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.glp.agent.providers.batching import MicroBatchEmbedder
+
+
+class MockLocalProvider:
+    """Embedding provider that serves one request at a time, like a local model.
+
+    Each request costs ``latency`` seconds whatever its size.
+    """
+
+    embedding_model = "mock-embed"
+
+    def __init__(self, latency: float = 0.0, fail: bool = False):
+        self.latency = latency
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self._lock = asyncio.Lock()
+
+    async def embed(self, text):
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts):
+        async with self._lock:
+            self.batches.append(list(texts))
+            await asyncio.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError("model not loaded")
+        return [([float(len(text))], self.embedding_model, 1) for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_batch():
+    provider = MockLocalProvider()
+    embedder = MicroBatchEmbedder(provider, linger_seconds=0.01)
+
+    results = await asyncio.gather(*(embedder.embed("x" * n) for n in range(1, 6)))
+
+    assert [embedding[0] for embedding, _, _ in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert provider.batches == [["x", "xx", "xxx", "xxxx", "xxxxx"]]
+    assert embedder.stats.batches == 1
+    assert embedder.stats.mean_batch_size == 5
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_immediately():
+    provider = MockLocalProvider()
+    embedder = MicroBatchEmbedder(provider, max_batch_size=3, linger_seconds=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(embedder.embed(str(n)) for n in range(6))), timeout=1
+    )
+
+    assert len(results) == 6
+    assert [len(batch) for batch in provider.batches] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    embedder = MicroBatchEmbedder(MockLocalProvider(fail=True), linger_seconds=0.001)
+
+    results = await asyncio.gather(
+        embedder.embed("a"), embedder.embed("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert embedder.stats.failed_batches == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_batch():
+    provider = MockLocalProvider(latency=0.02)
+    embedder = MicroBatchEmbedder(provider, linger_seconds=0.001)
+
+    cancelled = asyncio.create_task(embedder.embed("gone"))
+    kept = asyncio.create_task(embedder.embed("kept"))
+    await asyncio.sleep(0.005)
+    cancelled.cancel()
+
+    embedding, model, _ = await kept
+    assert embedding == [4.0] and model == "mock-embed"
+    await embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_forwards_other_attributes():
+    provider = MockLocalProvider()
+    embedder = MicroBatchEmbedder(provider)
+
+    assert embedder.embedding_model == "mock-embed"
+    assert await embedder.embed_batch(["ab"]) == [([2.0], "mock-embed", 1)]
+
+
+def test_rejects_empty_batches():
+    with pytest.raises(ValueError):
+        MicroBatchEmbedder(MockLocalProvider(), max_batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_throughput_against_single_requests():
+    """200 concurrent callers against a provider with 5ms per request."""
+    texts = [f"device {n} is online" for n in range(200)]
+
+    single = MockLocalProvider(latency=0.005)
+    started = time.perf_counter()
+    await asyncio.gather(*(single.embed(text) for text in texts))
+    single_seconds = time.perf_counter() - started
+
+    batched = MockLocalProvider(latency=0.005)
+    embedder = MicroBatchEmbedder(batched, max_batch_size=64, linger_seconds=0.002)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(embedder.embed(text) for text in texts))
+    batched_seconds = time.perf_counter() - started
+
+    print(
+        f"\nsingle: {len(texts) / single_seconds:.0f} embeddings/s, "
+        f"batched: {len(texts) / batched_seconds:.0f} embeddings/s "
+        f"({embedder.stats.batches} batches)"
+    )
+    assert [r[0][0] for r in results] == [float(len(t)) for t in texts]
+    assert len(single.batches) == 200
+    assert embedder.stats.batches == 4
+    assert batched_seconds * 10 < single_seconds
+
+
+# ============================================
+# App Wiring
+# ============================================
+
+
+class FakeOpenAIProvider(MockLocalProvider):
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+
+
+@pytest.mark.parametrize("flag, wrapped", [("true", True), ("false", False)])
+def test_app_wraps_embedding_provider(monkeypatch, flag, wrapped):
+    from src.glp.assignment import app
+
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "openai")
+    monkeypatch.setenv("EMBEDDING_MICRO_BATCH", flag)
+    monkeypatch.setattr(app, "OpenAIProvider", FakeOpenAIProvider)
+    monkeypatch.setattr(app, "MCPClient", None)
+    monkeypatch.setattr(app, "get_agent_pool", lambda: object())
+    monkeypatch.setattr(app, "create_agent_dependencies", lambda *args: None)
+    monkeypatch.setattr(app, "_batch_embedder", None)
+    monkeypatch.setattr(app, "_chatbot_enabled", False)
+
+    orchestrator = app._init_agent_orchestrator()
+
+    embedder = orchestrator.memory.embedding_provider
+    assert isinstance(embedder, MicroBatchEmbedder) is wrapped
+    assert (app._batch_embedder is embedder) is wrapped
@@ -0,0 +1,160 @@
+"""
+Tests for the chat event WebSocket transport.
+
+Verifies ChatEventSender, including:
+- Consecutive deltas of one type merge into one frame
+- Other events are sent in order and end a merged delta
+- Frame size and coalescing window limits
+- Backpressure from a slow client and the send timeout
+- Encoding negotiation and per-stream transport stats
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.glp.agent.api import event_stream
+from src.glp.agent.api.event_stream import ChatEventSender, resolve_encoding
+from src.glp.agent.domain.entities import ChatEvent, ChatEventType
+
+
+class RecordingWebSocket:
+    """Collects frames; each write takes ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames: list[dict] = []
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(text))
+
+    async def send_bytes(self, data: bytes) -> None:
+        await asyncio.sleep(self.delay)
+        self.frames.append(event_stream.msgpack.unpackb(data))
+
+
+def delta(text, sequence, event_type=ChatEventType.TEXT_DELTA):
+    return ChatEvent(type=event_type, sequence=sequence, content=text)
+
+
+async def stream(websocket, events, **kwargs):
+    async with ChatEventSender(websocket, **kwargs) as sender:
+        for event in events:
+            await sender.send(event)
+    return sender
+
+
+@pytest.mark.asyncio
+async def test_deltas_merge_into_one_frame():
+    ws = RecordingWebSocket()
+    events = [
+        delta("Let me ", 1, ChatEventType.THINKING_DELTA),
+        delta("check.", 2, ChatEventType.THINKING_DELTA),
+        delta("There ", 3),
+        delta("are ", 4),
+        delta("42 devices.", 5),
+        ChatEvent(type=ChatEventType.TOOL_CALL_START, sequence=6, tool_call_id="tc_1", tool_name="run_query"),
+        delta("Done", 7),
+        ChatEvent(type=ChatEventType.DONE, sequence=8, metadata={"conversation_id": "c-1"}),
+    ]
+
+    sender = await stream(ws, events)
+
+    assert [(f["type"], f.get("content"), f["sequence"]) for f in ws.frames] == [
+        ("thinking_delta", "Let me check.", 2),
+        ("text_delta", "There are 42 devices.", 5),
+        ("tool_call_start", None, 6),
+        ("text_delta", "Done", 7),
+        ("done", None, 8),
+    ]
+    assert ws.frames[1]["event_id"] == events[2].event_id
+    assert sender.stats.events == 8
+    assert sender.stats.frames == 5
+    assert sender.stats.conversation_id == "c-1"
+    assert sender.stats.bytes_sent == sum(
+        len(json.dumps(f, separators=(",", ":")).encode()) for f in ws.frames
+    )
+
+
+@pytest.mark.asyncio
+async def test_frame_size_limit():
+    ws = RecordingWebSocket()
+
+    await stream(ws, [delta("abcd", n) for n in range(5)], max_frame_chars=8)
+
+    assert [f["content"] for f in ws.frames] == ["abcdabcd", "abcdabcd", "abcd"]
+
+
+@pytest.mark.asyncio
+async def test_slow_producer_flushes_after_window():
+    ws = RecordingWebSocket()
+
+    async with ChatEventSender(ws, coalesce_seconds=0.01) as sender:
+        await sender.send(delta("first", 1))
+        await asyncio.sleep(0.05)
+        # Flushed by the window without waiting for the next event
+        assert [f["content"] for f in ws.frames] == ["first"]
+        await sender.send(delta("second", 2))
+
+    assert [f["content"] for f in ws.frames] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_slow_client_applies_backpressure():
+    ws = RecordingWebSocket(delay=0.02)
+    events = [ChatEvent(type=ChatEventType.TOOL_RESULT, sequence=n, content="x") for n in range(6)]
+
+    sender = await stream(ws, events, max_pending_events=2)
+
+    assert len(ws.frames) == 6
+    assert sender.stats.backpressure_waits > 0
+    assert sender.stats.max_send_seconds >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_stops_stream():
+    ws = RecordingWebSocket(delay=1)
+
+    async with ChatEventSender(ws, send_timeout_seconds=0.01) as sender:
+        await sender.send(ChatEvent(type=ChatEventType.TOOL_RESULT, sequence=1))
+        await asyncio.sleep(0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await sender.send(ChatEvent(type=ChatEventType.TOOL_RESULT, sequence=2))
+
+    assert ws.frames == []
+
+
+@pytest.mark.asyncio
+async def test_token_stream_frame_reduction():
+    """A 300-token answer streamed 1ms per token."""
+    ws = RecordingWebSocket()
+
+    async with ChatEventSender(ws, coalesce_seconds=0.02) as sender:
+        for n in range(300):
+            await sender.send(delta(f"tok{n} ", n))
+            await asyncio.sleep(0.001)
+
+    print(f"\n300 deltas -> {sender.stats.frames} frames, {sender.stats.bytes_sent} bytes")
+    assert "".join(f["content"] for f in ws.frames) == "".join(f"tok{n} " for n in range(300))
+    assert sender.stats.frames * 5 < 300
+
+
+def test_resolve_encoding(monkeypatch):
+    monkeypatch.setattr(event_stream, "MSGPACK_AVAILABLE", False)
+
+    assert resolve_encoding("msgpack") == "json"
+    assert resolve_encoding("json") == "json"
+    assert resolve_encoding(object()) == "json"
+
+
+@pytest.mark.skipif(not event_stream.MSGPACK_AVAILABLE, reason="msgpack not installed")
+@pytest.mark.asyncio
+async def test_msgpack_frames():
+    ws = RecordingWebSocket()
+
+    sender = await stream(ws, [delta("a", 1), delta("b", 2)], encoding="msgpack")
+
+    assert ws.frames[0]["content"] == "ab"
+    assert sender.stats.encoding == "msgpack"
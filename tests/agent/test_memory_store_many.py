@@ -0,0 +1,253 @@
+"""
+Tests for batched memory writes.
+
+Verifies the store_many() write path used by fact extraction, including:
+- One embed_batch call and one multi-row upsert per tenant transaction
+- Duplicates within a batch collapse into one row
+- Embedding failures still store the memories
+- MemoryManager stores all extracted facts in one batch
+- Throughput against the one-at-a-time store() path with a mock provider
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.glp.agent.domain.entities import Memory, MemoryType, UserContext
+from src.glp.agent.memory.long_term import ExtractedFact
+from src.glp.agent.memory.semantic import MEMORY_INSERT_COLUMNS, SemanticMemoryStore
+from src.glp.agent.orchestrator.memory_manager import MemoryManager
+
+# ============================================
+# Fakes
+# ============================================
+
+
+class MockEmbeddingProvider:
+    """Embedding provider with a fixed per-request latency."""
+
+    def __init__(self, latency: float = 0.0, fail: bool = False):
+        self.latency = latency
+        self.fail = fail
+        self.embed_calls = 0
+        self.batch_sizes: list[int] = []
+
+    async def embed(self, text):
+        self.embed_calls += 1
+        await asyncio.sleep(self.latency)
+        return [float(len(text))], "mock-embed", 1
+
+    async def embed_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError("embedding service down")
+        return [([float(len(text))], "mock-embed", 1) for text in texts]
+
+
+class FakeConnection:
+    """Emulates the agent_memory upsert with a per-round-trip latency."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.rows: dict[tuple, dict] = {}
+        self.tenant_id = None
+        self.transactions = 0
+        self.statements = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def execute(self, query, *args):
+        await asyncio.sleep(self.latency)
+        if query.startswith("SELECT set_config('app.tenant_id'"):
+            self.tenant_id = args[0]
+
+    def _upsert(self, values):
+        record = dict(zip(MEMORY_INSERT_COLUMNS, values))
+        assert record["tenant_id"] == self.tenant_id
+        key = (record["tenant_id"], record["user_id"], record["content_hash"])
+        if key in self.rows:
+            existing = self.rows[key]
+            existing["confidence"] = max(existing["confidence"], record["confidence"])
+        else:
+            self.rows[key] = {**record, "created_at": datetime.utcnow(), "updated_at": datetime.utcnow()}
+        return self.rows[key]
+
+    async def fetchrow(self, query, *args):
+        self.statements += 1
+        await asyncio.sleep(self.latency)
+        return self._upsert(args)
+
+    async def fetch(self, query, *args):
+        self.statements += 1
+        await asyncio.sleep(self.latency)
+        width = len(MEMORY_INSERT_COLUMNS)
+        return [self._upsert(args[i:i + width]) for i in range(0, len(args), width)]
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def make_memories(count, tenant_id="tenant-1"):
+    return [
+        Memory(
+            tenant_id=tenant_id,
+            user_id="user-1",
+            memory_type=MemoryType.FACT,
+            content=f"Site {i} has {i * 3} access points",
+            confidence=0.8,
+        )
+        for i in range(count)
+    ]
+
+
+# ============================================
+# store_many Tests
+# ============================================
+
+
+class TestStoreMany:
+    """Tests for SemanticMemoryStore.store_many."""
+
+    @pytest.mark.asyncio
+    async def test_one_embedding_call_and_one_upsert(self):
+        conn = FakeConnection()
+        provider = MockEmbeddingProvider()
+        store = SemanticMemoryStore(FakePool(conn), provider)
+
+        memories = await store.store_many(make_memories(20))
+
+        assert provider.batch_sizes == [20]
+        assert provider.embed_calls == 0
+        assert conn.statements == 1
+        assert conn.transactions == 1
+        assert len(conn.rows) == 20
+        assert all(m.embedding_model == "mock-embed" and m.created_at for m in memories)
+        assert len({m.id for m in memories}) == 20
+
+    @pytest.mark.asyncio
+    async def test_one_transaction_per_tenant(self):
+        conn = FakeConnection()
+        store = SemanticMemoryStore(FakePool(conn), MockEmbeddingProvider())
+
+        await store.store_many(make_memories(3, "tenant-a") + make_memories(2, "tenant-b"))
+
+        assert conn.transactions == 2
+        assert conn.statements == 2
+        assert {key[0] for key in conn.rows} == {"tenant-a", "tenant-b"}
+
+    @pytest.mark.asyncio
+    async def test_duplicates_collapse_to_highest_confidence(self):
+        conn = FakeConnection()
+        store = SemanticMemoryStore(FakePool(conn), MockEmbeddingProvider())
+        low, high = make_memories(1) + make_memories(1)
+        high.confidence = 0.95
+
+        stored = await store.store_many([low, high])
+
+        assert len(conn.rows) == 1
+        assert stored[0].id == stored[1].id == high.id
+        assert next(iter(conn.rows.values()))["confidence"] == 0.95
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_still_stores(self):
+        conn = FakeConnection()
+        store = SemanticMemoryStore(FakePool(conn), MockEmbeddingProvider(fail=True))
+
+        stored = await store.store_many(make_memories(3))
+
+        assert len(conn.rows) == 3
+        assert all(m.embedding is None for m in stored)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        conn = FakeConnection()
+        store = SemanticMemoryStore(FakePool(conn), MockEmbeddingProvider())
+
+        assert await store.store_many([]) == []
+        assert conn.transactions == 0
+
+    @pytest.mark.asyncio
+    async def test_throughput_against_single_stores(self):
+        """With 5ms per embedding request and 1ms per DB round trip."""
+        count = 50
+
+        single_conn = FakeConnection(latency=0.001)
+        single = SemanticMemoryStore(FakePool(single_conn), MockEmbeddingProvider(latency=0.005))
+        started = time.perf_counter()
+        for memory in make_memories(count):
+            await single.store(memory)
+        single_seconds = time.perf_counter() - started
+
+        batch_conn = FakeConnection(latency=0.001)
+        batch = SemanticMemoryStore(FakePool(batch_conn), MockEmbeddingProvider(latency=0.005))
+        started = time.perf_counter()
+        await batch.store_many(make_memories(count))
+        batch_seconds = time.perf_counter() - started
+
+        print(
+            f"\nstore(): {count / single_seconds:.0f} memories/s, "
+            f"store_many(): {count / batch_seconds:.0f} memories/s"
+        )
+        assert batch_conn.rows.keys() == single_conn.rows.keys()
+        assert batch_seconds * 10 < single_seconds
+
+
+# ============================================
+# MemoryManager Tests
+# ============================================
+
+
+class TestExtractAndStoreFacts:
+    """Tests for MemoryManager.extract_and_store_facts."""
+
+    @pytest.mark.asyncio
+    async def test_facts_stored_in_one_batch(self):
+        extractor = MagicMock()
+        extractor.extract = AsyncMock(return_value=[
+            ExtractedFact(content="User prefers us-west", memory_type=MemoryType.PREFERENCE, confidence=0.9),
+            ExtractedFact(content="HQ has 40 APs", memory_type=MemoryType.FACT, confidence=0.8),
+        ])
+        memory_store = MagicMock()
+        memory_store.store_many = AsyncMock(side_effect=lambda memories: memories)
+        manager = MemoryManager(memory_store=memory_store, fact_extractor=extractor)
+        context = UserContext(tenant_id="tenant-1", user_id="user-1")
+        message_id = uuid4()
+
+        stored = await manager.extract_and_store_facts("...", uuid4(), message_id, context)
+
+        assert stored == 2
+        memory_store.store_many.assert_awaited_once()
+        memories = memory_store.store_many.await_args.args[0]
+        assert [m.content for m in memories] == ["User prefers us-west", "HQ has 40 APs"]
+        assert all(m.tenant_id == "tenant-1" and m.source_message_id == message_id for m in memories)
+        memory_store.store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_facts_skips_store(self):
+        extractor = MagicMock()
+        extractor.extract = AsyncMock(return_value=[])
+        memory_store = MagicMock()
+        memory_store.store_many = AsyncMock()
+        manager = MemoryManager(memory_store=memory_store, fact_extractor=extractor)
+
+        stored = await manager.extract_and_store_facts(
+            "...", uuid4(), uuid4(), UserContext(tenant_id="t", user_id="u")
+        )
+
+        assert stored == 0
+        memory_store.store_many.assert_not_called()
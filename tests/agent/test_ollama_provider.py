@@ -390,6 +390,55 @@ class TestOllamaEmbeddings:
         with pytest.raises(LLMProviderError, match="No embedding returned"):
             await provider.embed("test")
 
+    @pytest.mark.asyncio
+    async def test_embed_batch_uses_batch_endpoint(self, ollama_config):
+        """Batch embedding sends chunks of texts to /api/embed."""
+        provider = OllamaProvider(ollama_config)
+        provider.EMBED_BATCH_SIZE = 2
+
+        async def post(path, json):
+            response = MagicMock()
+            response.raise_for_status = MagicMock()
+            response.json.return_value = {
+                "embeddings": [[float(len(text))] * 768 for text in json["input"]]
+            }
+            return response
+
+        provider.client = MagicMock()
+        provider.client.post = AsyncMock(side_effect=post)
+
+        results = await provider.embed_batch(["a", "bb", "ccc"])
+
+        assert [embedding[0] for embedding, _, _ in results] == [1.0, 2.0, 3.0]
+        assert all(model == "nomic-embed-text" and dim == 768 for _, model, dim in results)
+        calls = provider.client.post.call_args_list
+        assert [call.args[0] for call in calls] == ["/api/embed", "/api/embed"]
+        assert [call.kwargs["json"]["input"] for call in calls] == [["a", "bb"], ["ccc"]]
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_count_mismatch(self, ollama_config):
+        """A short batch response raises instead of misaligning results."""
+        from src.glp.agent.providers.base import LLMProviderError
+
+        provider = OllamaProvider(ollama_config)
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {"embeddings": [[0.1] * 768]}
+        provider.client = MagicMock()
+        provider.client.post = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(LLMProviderError, match="1 embeddings for 2 texts"):
+            await provider.embed_batch(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_empty(self, ollama_config):
+        provider = OllamaProvider(ollama_config)
+        provider.client = MagicMock()
+        provider.client.post = AsyncMock()
+
+        assert await provider.embed_batch([]) == []
+        provider.client.post.assert_not_called()
+
 
 class TestOllamaContextManager:
     """Tests for async context manager functionality."""
@@ -0,0 +1,369 @@
+"""
+Tests for resumable chat streams.
+
+Verifies ChatStreamManager and the replay buffers, including:
+- A generation keeps running after its subscriber leaves
+- Resuming from a sequence number replays only the missing events
+- Streams of other users and evicted events cannot be resumed
+- A generation with no subscriber past the grace period is stopped
+- Cancellation and generation errors end the stream with an event
+- The Redis buffer against a minimal Redis streams fake
+- The WebSocket resume flow across two connections
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from src.glp.agent.api.router import create_agent_dependencies, websocket_endpoint
+from src.glp.agent.api.stream_replay import (
+    ChatStreamManager,
+    InMemoryReplayBuffer,
+    RedisReplayBuffer,
+    ResumeUnavailableError,
+)
+from src.glp.agent.domain.entities import ChatEvent, ChatEventType, ErrorType, UserContext
+from src.glp.agent.security.ticket_auth import WebSocketTicketAuth
+
+CONTEXT = UserContext(tenant_id="tenant-1", user_id="user-1", session_id="s-1")
+
+
+async def generation(count, delay=0.0, fail_at=None, produced=None):
+    """Orchestrator-like event stream: ``count`` deltas then DONE."""
+    for sequence in range(1, count + 1):
+        await asyncio.sleep(delay)
+        if sequence == fail_at:
+            raise RuntimeError("model overloaded")
+        if produced is not None:
+            produced.append(sequence)
+        yield ChatEvent.text_delta(f"t{sequence} ", sequence)
+    yield ChatEvent(type=ChatEventType.DONE, sequence=count + 1)
+
+
+async def collect(manager, stream_id, after_sequence=0, limit=None, context=CONTEXT):
+    events = []
+    async for event in manager.subscribe(stream_id, context, after_sequence):
+        events.append(event)
+        if limit and len(events) == limit:
+            break
+    return events
+
+
+def make_manager(**buffer_kwargs):
+    return ChatStreamManager(
+        InMemoryReplayBuffer(**buffer_kwargs),
+        read_timeout_seconds=0.05,
+        liveness_check_seconds=0.01,
+    )
+
+
+# ============================================
+# Fakes
+# ============================================
+
+
+class FakeRedisStreams:
+    """The Redis commands RedisReplayBuffer uses, with decoded responses."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.streams: dict[str, list[tuple[str, dict]]] = {}
+        self._auto_id = 0
+
+    @staticmethod
+    def _id(entry_id):
+        ms, seq = entry_id.split("-")
+        return int(ms), int(seq)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    async def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, str(value))
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    async def getdel(self, key):
+        return self.values.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.values or key in self.hashes or key in self.streams)
+
+    async def xadd(self, key, fields, id="*", maxlen=None, approximate=True):
+        entries = self.streams.setdefault(key, [])
+        if id == "*":
+            self._auto_id += 1
+            id = f"{10**12 + self._auto_id}-0"
+        if entries and self._id(id) <= self._id(entries[-1][0]):
+            raise ValueError("ID must be greater than the last entry")
+        entries.append((id, dict(fields)))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return id
+
+    async def xrange(self, key, min="-", max="+", count=None):
+        entries = self.streams.get(key, [])
+        if min.startswith("("):
+            entries = [e for e in entries if self._id(e[0]) > self._id(min[1:])]
+        return entries[:count] if count else list(entries)
+
+    async def xread(self, streams, block=None):
+        (key, after), = streams.items()
+        deadline = asyncio.get_running_loop().time() + (block or 0) / 1000
+        while True:
+            entries = await self.xrange(key, min=f"({after}")
+            if entries:
+                return [[key, entries]]
+            if asyncio.get_running_loop().time() >= deadline:
+                return []
+            await asyncio.sleep(0.005)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append(getattr(self.redis, name)(*args, **kwargs))
+        return queue
+
+    async def execute(self):
+        return [await call for call in self.calls]
+
+
+class ResumingWebSocket:
+    """WebSocket fed from a queue; raises WebSocketDisconnect on None."""
+
+    def __init__(self, messages):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        for message in messages:
+            self.incoming.put_nowait(message)
+        self.sent: list[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise WebSocketDisconnect()
+        return json.dumps(message)
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+# ============================================
+# ChatStreamManager Tests
+# ============================================
+
+
+class TestChatStreamManager:
+    """Tests for ChatStreamManager with the in-process buffer."""
+
+    @pytest.mark.asyncio
+    async def test_generation_survives_detach_and_resumes(self):
+        manager = make_manager()
+        produced = []
+        stream_id = await manager.start(generation(20, delay=0.002, produced=produced), CONTEXT)
+
+        first = await collect(manager, stream_id, limit=5)
+        # Subscriber gone; the generation keeps going
+        await asyncio.sleep(0.1)
+        assert len(produced) == 20
+
+        rest = await collect(manager, stream_id, after_sequence=first[-1].sequence)
+
+        assert [e.sequence for e in first + rest] == list(range(1, 22))
+        assert rest[-1].type == ChatEventType.DONE
+
+    @pytest.mark.asyncio
+    async def test_finished_stream_replays_from_sequence(self):
+        manager = make_manager()
+        stream_id = await manager.start(generation(5), CONTEXT)
+        await asyncio.sleep(0.02)
+
+        events = await collect(manager, stream_id, after_sequence=3)
+
+        assert [(e.sequence, e.content) for e in events] == [(4, "t4 "), (5, "t5 "), (6, None)]
+
+    @pytest.mark.asyncio
+    async def test_other_user_cannot_resume(self):
+        manager = make_manager()
+        stream_id = await manager.start(generation(2), CONTEXT)
+        intruder = UserContext(tenant_id="tenant-2", user_id="user-1")
+
+        with pytest.raises(ResumeUnavailableError):
+            await collect(manager, stream_id, context=intruder)
+        with pytest.raises(ResumeUnavailableError):
+            await collect(manager, "no-such-stream")
+
+    @pytest.mark.asyncio
+    async def test_evicted_events_cannot_resume(self):
+        manager = make_manager(max_events=10)
+        stream_id = await manager.start(generation(30), CONTEXT)
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(ResumeUnavailableError):
+            await collect(manager, stream_id, after_sequence=5)
+        # Still in the buffer
+        assert len(await collect(manager, stream_id, after_sequence=25)) == 6
+
+    @pytest.mark.asyncio
+    async def test_unattended_generation_stops_after_grace(self):
+        manager = make_manager(grace_seconds=0.05)
+        produced = []
+        stream_id = await manager.start(generation(1000, delay=0.001, produced=produced), CONTEXT)
+
+        await asyncio.sleep(0.5)
+
+        assert 10 < len(produced) < 1000
+        events = await collect(manager, stream_id, after_sequence=len(produced))
+        assert [e.type for e in events] == [ChatEventType.CANCEL]
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_generation(self):
+        manager = make_manager()
+        produced = []
+        stream_id = await manager.start(generation(1000, delay=0.001, produced=produced), CONTEXT)
+        await asyncio.sleep(0.02)
+
+        await manager.cancel(stream_id)
+        await asyncio.sleep(0.01)
+        stopped_at = len(produced)
+        await asyncio.sleep(0.02)
+
+        assert len(produced) == stopped_at < 1000
+        events = await collect(manager, stream_id)
+        assert events[-1].type == ChatEventType.CANCEL
+        assert events[-1].sequence == stopped_at + 1
+
+    @pytest.mark.asyncio
+    async def test_generation_error_becomes_error_event(self):
+        manager = make_manager()
+        stream_id = await manager.start(generation(5, fail_at=3), CONTEXT)
+
+        events = await collect(manager, stream_id)
+
+        assert [e.type for e in events] == [
+            ChatEventType.TEXT_DELTA, ChatEventType.TEXT_DELTA, ChatEventType.ERROR
+        ]
+        assert events[-1].sequence == 3
+        assert events[-1].error_type == ErrorType.FATAL
+
+
+# ============================================
+# RedisReplayBuffer Tests
+# ============================================
+
+
+class TestRedisReplayBuffer:
+    """Tests for the Redis Streams buffer."""
+
+    @pytest.mark.asyncio
+    async def test_resume_through_redis(self):
+        redis = FakeRedisStreams()
+        manager = ChatStreamManager(
+            RedisReplayBuffer(redis), read_timeout_seconds=0.05, liveness_check_seconds=0.01
+        )
+        stream_id = await manager.start(generation(8, delay=0.002), CONTEXT)
+
+        first = await collect(manager, stream_id, limit=3)
+        rest = await collect(manager, stream_id, after_sequence=3)
+
+        assert [e.sequence for e in first + rest] == list(range(1, 10))
+        assert rest[-1].type == ChatEventType.DONE
+        assert [entry_id for entry_id, _ in redis.streams[f"chat_stream:{stream_id}"][:2]] == [
+            "0-1", "0-2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_evicted_and_unknown_streams(self):
+        redis = FakeRedisStreams()
+        buffer = RedisReplayBuffer(redis, max_events=5)
+        manager = ChatStreamManager(buffer, read_timeout_seconds=0.05)
+        stream_id = await manager.start(generation(20), CONTEXT)
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(ResumeUnavailableError):
+            await collect(manager, stream_id, after_sequence=2)
+        with pytest.raises(ResumeUnavailableError):
+            await buffer.read("no-such-stream", 0, 0.01)
+
+    @pytest.mark.asyncio
+    async def test_attachment(self):
+        buffer = RedisReplayBuffer(FakeRedisStreams())
+        await buffer.create("s", "tenant-1:user-1")
+
+        assert await buffer.attached("s")
+        await buffer.release("s")
+        assert not await buffer.attached("s")
+        assert await buffer.owner("s") == "tenant-1:user-1"
+
+
+# ============================================
+# WebSocket Tests
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_websocket_resume_after_reconnect():
+    redis = FakeRedisStreams()
+    ticket_auth = WebSocketTicketAuth(redis)
+    orchestrator = type("Orchestrator", (), {"_pending_confirmations": {}})()
+    orchestrator.chat = lambda message, context, conversation_id: generation(200, delay=0.002)
+    create_agent_dependencies(orchestrator, ticket_auth, make_manager())
+
+    first_ws = ResumingWebSocket([{"type": "chat", "message": "How many APs?"}])
+    ticket = await ticket_auth.create_ticket(user_id="user-1", tenant_id="tenant-1", session_id="s")
+    connection = asyncio.create_task(websocket_endpoint(first_ws, ticket))
+    await asyncio.sleep(0.1)
+    first_ws.incoming.put_nowait(None)  # Connection drops mid-answer
+    await connection
+
+    stream_id = first_ws.sent[0]["stream_id"]
+    received = [f for f in first_ws.sent[1:] if "sequence" in f]
+    assert received and received[-1]["type"] == "text_delta"
+
+    second_ws = ResumingWebSocket([
+        {"type": "resume", "stream_id": stream_id, "after_sequence": received[-1]["sequence"]},
+    ])
+    ticket = await ticket_auth.create_ticket(user_id="user-1", tenant_id="tenant-1", session_id="s")
+    connection = asyncio.create_task(websocket_endpoint(second_ws, ticket))
+    for _ in range(200):
+        if second_ws.sent and second_ws.sent[-1]["type"] == "done":
+            break
+        await asyncio.sleep(0.01)
+    second_ws.incoming.put_nowait(None)
+    await connection
+
+    text = "".join(f.get("content", "") for f in received + second_ws.sent)
+    assert text == "".join(f"t{n} " for n in range(1, 201))
+    assert second_ws.sent[-1]["type"] == "done"
@@ -3,6 +3,8 @@ Tests for tenant-based rate limiting with Redis failure scenarios.
 
 Tests cover:
     - InMemoryRateLimiter: basic operations, concurrency, cleanup
+    - Sliding window accuracy at window boundaries and Retry-After
+    - Contention-free checks at 10k tenants (micro-benchmark)
     - TenantRateLimiter: Redis success, fail-closed, fail-open behaviors
     - Fail-closed behavior: Falls back to in-memory when Redis unavailable
     - Fail-open behavior: Allows requests when Redis unavailable (legacy mode)
@@ -23,6 +25,17 @@ from src.glp.agent.security.tenant_rate_limiter import (
     TenantRateLimiter,
 )
 
+
+class FakeClock:
+    """Settable time source for InMemoryRateLimiter."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
 # ============================================
 # InMemoryRateLimiter Tests
 # ============================================
@@ -171,19 +184,21 @@ class TestInMemoryRateLimiter:
             window_seconds=1,  # 1 second window
             enabled=True,
         )
-        limiter = InMemoryRateLimiter(config=config)
-        limiter._cleanup_interval = 0  # Force cleanup on every check
+        clock = FakeClock(100.0)
+        limiter = InMemoryRateLimiter(config=config, shards=1, clock=clock)
 
         tenant_id = "tenant-cleanup"
 
         # Make a request
         await limiter.check_rate_limit(tenant_id)
-        assert tenant_id in limiter._counters
+        assert limiter.active_tenants == 1
 
-        # Wait for window to expire
-        await asyncio.sleep(1.1)
+        # Wait until the request has left the sliding window
+        clock.now += 2.1
 
-        # Next request triggers cleanup and creates new bucket
+        # Next check expires the old counters and starts new ones
+        await limiter.check_rate_limit("tenant-other")
+        assert limiter.active_tenants == 1
         await limiter.check_rate_limit(tenant_id)
 
         # Should have new bucket with count=1
@@ -221,10 +236,15 @@ class MockRedisClient:
         key = keys_and_args[0]
         window = int(keys_and_args[1])
         limit = int(keys_and_args[2])
+        cost = int(keys_and_args[4]) if len(keys_and_args) > 4 else 1
 
         # Simple counter logic
         current = self.counters.get(key, 0)
 
+        if cost == 0:
+            # Read-only call from get_rate_limit_info
+            return [int(current < limit), current, 0]
+
         if current >= limit:
             # Return: [allowed, current, ttl]
             return [0, current, window]
@@ -685,3 +705,182 @@ class TestEdgeCases:
 
         # No exception raised
         assert redis.call_count == 0  # Redis not even called
+
+
+# ============================================
+# Sliding Window Tests
+# ============================================
+
+
+class TestSlidingWindow:
+    """Test sliding window accuracy and Retry-After."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock(6000.0)  # Start of a 60s bucket
+
+    @pytest.fixture
+    def limiter(self, clock):
+        config = RateLimitConfig(requests_per_window=10, window_seconds=60, enabled=True)
+        return InMemoryRateLimiter(config=config, clock=clock)
+
+    @pytest.mark.asyncio
+    async def test_no_double_burst_at_window_boundary(self, limiter, clock):
+        """A full burst just before the boundary still counts just after it."""
+        clock.now += 59
+        for _ in range(10):
+            await limiter.check_rate_limit("tenant-edge")
+
+        clock.now += 2  # Next bucket; a fixed window would allow 10 more
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await limiter.check_rate_limit("tenant-edge")
+
+        # 10 * (1 - 1/60) ~ 9.8 in window; one slot frees after ~5s
+        assert exc_info.value.headers["Retry-After"] == "5"
+        clock.now += 5
+        await limiter.check_rate_limit("tenant-edge")
+
+    @pytest.mark.asyncio
+    async def test_retry_after_when_current_bucket_full(self, limiter, clock):
+        """Retry-After covers the rest of the bucket and part of the next."""
+        for _ in range(10):
+            await limiter.check_rate_limit("tenant-full")
+
+        clock.now += 30
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await limiter.check_rate_limit("tenant-full")
+
+        assert exc_info.value.headers["Retry-After"] == "36"
+        clock.now += 35
+        with pytest.raises(RateLimitExceededError):
+            await limiter.check_rate_limit("tenant-full")
+        clock.now += 1
+        await limiter.check_rate_limit("tenant-full")
+
+    @pytest.mark.asyncio
+    async def test_steady_rate_is_allowed(self, limiter, clock):
+        """A steady 90% of the limit never hits it, across many buckets."""
+        for _ in range(50):
+            await limiter.check_rate_limit("tenant-steady")
+            clock.now += 60 / 9
+
+    @pytest.mark.asyncio
+    async def test_expiry_is_incremental(self, limiter, clock):
+        """Idle tenants are removed a few per check, not in one sweep."""
+        for i in range(100):
+            await limiter.check_rate_limit(f"tenant-{i}")
+        clock.now += 180
+
+        await limiter.check_rate_limit("tenant-new")
+
+        assert 100 + 1 - limiter.active_tenants <= limiter.EXPIRE_PER_CHECK
+        # Checks on one tenant drain every shard
+        for _ in range(400):
+            await limiter.get_rate_limit_info("tenant-new")
+        assert limiter.active_tenants == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_script_call(self):
+        """One key per tenant; info reads with cost 0."""
+        redis = MockRedisClient()
+        config = RateLimitConfig(requests_per_window=5, window_seconds=60, enabled=True)
+        limiter = TenantRateLimiter(redis=redis, config=config)
+        calls = []
+        original_eval = redis.eval
+
+        async def recording_eval(script, numkeys, *keys_and_args):
+            calls.append(keys_and_args)
+            return await original_eval(script, numkeys, *keys_and_args)
+
+        redis.eval = recording_eval
+        await limiter.check_rate_limit("tenant-lua")
+        await limiter.get_rate_limit_info("tenant-lua")
+
+        assert [(c[0], c[1], c[2], c[4]) for c in calls] == [
+            ("rate_limit:tenant:tenant-lua", 60, 5, 1),
+            ("rate_limit:tenant:tenant-lua", 60, 5, 0),
+        ]
+
+
+# ============================================
+# Benchmark
+# ============================================
+
+
+class GlobalLockFixedWindowLimiter:
+    """Previous InMemoryRateLimiter: one lock, fixed windows, full sweeps."""
+
+    def __init__(self, config, clock):
+        self.config = config
+        self.clock = clock
+        self._counters = {}
+        self._lock = asyncio.Lock()
+        self._last_cleanup = clock()
+
+    async def check_rate_limit(self, tenant_id):
+        now = self.clock()
+        if now - self._last_cleanup >= 300:
+            async with self._lock:
+                for tid in list(self._counters):
+                    buckets = self._counters[tid]
+                    for bucket in [b for b, (_, expires) in buckets.items() if expires < now]:
+                        del buckets[bucket]
+                    if not buckets:
+                        del self._counters[tid]
+                self._last_cleanup = now
+
+        bucket = int(now // self.config.window_seconds)
+        async with self._lock:
+            buckets = self._counters.setdefault(tenant_id, {})
+            count, expires = buckets.get(bucket, (0, now + self.config.window_seconds))
+            if count >= self.config.requests_per_window:
+                raise RateLimitExceededError(tenant_id, self.config.requests_per_window, 60, 1)
+            buckets[bucket] = (count + 1, expires)
+
+
+@pytest.mark.asyncio
+async def test_check_cost_at_10k_tenants():
+    """100 concurrent clients, 200k checks over 10k tenants, fake time
+    advancing 10ms per check (2000s, several windows and sweeps).
+    GC is paused so its pauses do not mask the sweeps."""
+    import gc
+    import time
+
+    config = RateLimitConfig(requests_per_window=1000, window_seconds=60, enabled=True)
+    tenants = [f"tenant-{i}" for i in range(10_000)]
+    clients, checks_per_client = 100, 2_000
+
+    async def run(limiter, clock):
+        worst = 0.0
+
+        async def client(n):
+            nonlocal worst
+            for i in range(checks_per_client):
+                clock.now += 0.01
+                started = time.perf_counter()
+                await limiter.check_rate_limit(tenants[(n * 7919 + i * 104729) % len(tenants)])
+                worst = max(worst, time.perf_counter() - started)
+                if i % 50 == 0:
+                    await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(n) for n in range(clients)))
+        total = time.perf_counter() - started
+        return total / (clients * checks_per_client), worst
+
+    old_clock, new_clock = FakeClock(0.0), FakeClock(0.0)
+    new_limiter = InMemoryRateLimiter(config=config, clock=new_clock)
+    gc.disable()
+    try:
+        old_mean, old_worst = await run(GlobalLockFixedWindowLimiter(config, old_clock), old_clock)
+        new_mean, new_worst = await run(new_limiter, new_clock)
+    finally:
+        gc.enable()
+
+    print(
+        f"\nper check: global lock + sweeps {old_mean * 1e6:.1f}us (worst {old_worst * 1000:.2f}ms), "
+        f"sharded sliding window {new_mean * 1e6:.1f}us (worst {new_worst * 1000:.2f}ms), "
+        f"{new_limiter.active_tenants} tenants tracked"
+    )
+    assert new_worst < old_worst
+    assert new_limiter.active_tenants <= len(tenants)
@@ -0,0 +1,213 @@
+"""
+Tests for tool catalogue warm-up and versioned refresh.
+
+Verifies that tools are loaded once and refreshed only when they change, including:
+- MCPClient revalidates its cached tools by ETag and keeps the same list
+  while the server answers 304
+- A changed catalogue is picked up after the cache TTL
+- A failed refresh keeps the cached tools and backs off
+- ToolRegistry rebuilds its combined list only when a source changes,
+  keeps the last MCP tools on failure and retries after a failed start
+- Providers format the tool payload once per catalogue
+- AgentOrchestrator.warm_up() loads tools and prepares the payload
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.glp.agent.domain.entities import ToolDefinition
+from src.glp.agent.orchestrator.agent import AgentOrchestrator
+from src.glp.agent.providers.anthropic import AnthropicProvider
+from src.glp.agent.providers.base import LLMProviderConfig
+from src.glp.agent.providers.openai import OpenAIProvider
+from src.glp.agent.tools.mcp_client import MCPClient, MCPClientConfig, MCPToolError
+from src.glp.agent.tools.registry import ToolRegistry
+
+# ============================================
+# Fixtures
+# ============================================
+
+
+class FakeMCPServer:
+    """tools/list endpoint with the same ETag handling as server.py."""
+
+    def __init__(self):
+        self.tool_names = ["search_devices", "run_query"]
+        self.version = 1
+        self.requests: list[str] = []
+        self.fail = False
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    async def list_tools(self, request: web.Request) -> web.Response:
+        if self.fail:
+            return web.Response(status=503, text="unavailable")
+        if request.headers.get("If-None-Match") == self.etag:
+            self.requests.append("304")
+            return web.Response(status=304, headers={"ETag": self.etag})
+        self.requests.append("200")
+        tools = [{"name": name, "description": name, "inputSchema": {}} for name in self.tool_names]
+        return web.json_response({"tools": tools, "version": self.etag}, headers={"ETag": self.etag})
+
+
+@pytest.fixture
+async def mcp_server():
+    fake = FakeMCPServer()
+    app = web.Application()
+    app.router.add_post("/mcp/v1/tools/list", fake.list_tools)
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    yield fake
+    await server.close()
+
+
+@pytest.fixture
+async def client(mcp_server):
+    client = MCPClient(MCPClientConfig(base_url=mcp_server.url))
+    yield client
+    await client.close()
+
+
+def expire(client: MCPClient) -> None:
+    client._tools_cache_time -= client.TOOL_CACHE_TTL_SECONDS
+
+
+def make_tools(*names) -> list[ToolDefinition]:
+    return [ToolDefinition(name=name, description=name, parameters={"type": "object"}) for name in names]
+
+
+# ============================================
+# MCPClient Tests
+# ============================================
+
+
+class TestMCPClientRefresh:
+    """Tests for ETag revalidation of the cached tool list."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_catalogue_keeps_same_list(self, mcp_server, client):
+        first = await client.list_tools()
+        assert await client.list_tools() is first  # Within TTL, no request
+
+        expire(client)
+        again = await client.list_tools()
+
+        assert again is first
+        assert mcp_server.requests == ["200", "304"]
+        assert client.tools_version == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_changed_catalogue_is_reloaded(self, mcp_server, client):
+        first = await client.list_tools()
+        mcp_server.tool_names.append("get_device")
+        mcp_server.version = 2
+
+        assert await client.list_tools() is first
+        expire(client)
+        changed = await client.list_tools()
+
+        assert [t.name for t in changed] == ["search_devices", "run_query", "get_device"]
+        assert client.tools_version == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_cached_tools(self, mcp_server, client):
+        first = await client.list_tools()
+        mcp_server.fail = True
+        expire(client)
+
+        assert await client.list_tools() is first
+        # Backed off: the next call does not hit the server again
+        mcp_server.fail = False
+        assert await client.list_tools() is first
+        assert mcp_server.requests == ["200"]
+
+    @pytest.mark.asyncio
+    async def test_failure_without_cache_raises(self, mcp_server, client):
+        mcp_server.fail = True
+
+        with pytest.raises(MCPToolError):
+            await client.list_tools()
+
+
+# ============================================
+# ToolRegistry Tests
+# ============================================
+
+
+class TestToolRegistry:
+    """Tests for rebuilding the combined tool list."""
+
+    @pytest.mark.asyncio
+    async def test_combined_list_follows_mcp_versions(self):
+        mcp_client = MagicMock()
+        v1, v2 = make_tools("search_devices"), make_tools("search_devices", "run_query")
+        mcp_client.list_tools = AsyncMock(side_effect=[v1, v1, v2])
+        write_executor = MagicMock()
+        write_executor.get_tool_definitions.return_value = make_tools("add_device")
+        registry = ToolRegistry(mcp_client, write_executor)
+
+        first = await registry.get_all_tools()
+        second = await registry.get_all_tools()
+        third = await registry.get_all_tools()
+
+        assert second is first
+        assert [t.name for t in third] == ["search_devices", "run_query", "add_device"]
+        assert mcp_client.list_tools.await_count == 3
+        write_executor.get_tool_definitions.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_keeps_last_mcp_tools_on_failure(self):
+        mcp_client = MagicMock()
+        mcp_client.list_tools = AsyncMock(side_effect=[make_tools("search_devices"), MCPToolError("down", "list_tools")])
+        registry = ToolRegistry(mcp_client)
+
+        first = await registry.get_all_tools()
+
+        assert await registry.get_all_tools() is first
+
+    @pytest.mark.asyncio
+    async def test_retries_after_failed_warm_up(self):
+        mcp_client = MagicMock()
+        mcp_client.list_tools = AsyncMock(side_effect=[MCPToolError("down", "list_tools"), make_tools("search_devices")])
+        registry = ToolRegistry(mcp_client)
+
+        assert await registry.warm_up() == []
+        assert [t.name for t in await registry.get_all_tools()] == ["search_devices"]
+
+
+# ============================================
+# Provider and Orchestrator Tests
+# ============================================
+
+
+@pytest.mark.parametrize("provider_class", [AnthropicProvider, OpenAIProvider])
+def test_tool_payload_formatted_once_per_catalogue(provider_class):
+    provider = provider_class(LLMProviderConfig(api_key="test-key", model="test-model"))
+    tools = make_tools("search_devices", "run_query")
+
+    payload = provider.prepare_tools(tools)
+
+    assert provider.prepare_tools(tools) is payload
+    assert payload == provider._format_tools_for_api(tools)
+    assert provider.prepare_tools(make_tools("search_devices")) is not payload
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_warm_up_prepares_payload():
+    mcp_client = MagicMock()
+    mcp_client.list_tools = AsyncMock(return_value=make_tools("search_devices"))
+    registry = ToolRegistry(mcp_client)
+    provider = AnthropicProvider(LLMProviderConfig(api_key="test-key", model="test-model"))
+    orchestrator = AgentOrchestrator(llm_provider=provider, tool_registry=registry)
+
+    await orchestrator.warm_up()
+
+    tools = await registry.get_all_tools()
+    assert provider._prepared_tools[0] is tools
+    assert provider.prepare_tools(tools) is provider._prepared_tools[1]
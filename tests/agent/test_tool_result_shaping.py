@@ -0,0 +1,315 @@
+"""
+Tests for tool result shaping.
+
+Verifies that large tool results are kept out of the LLM context, including:
+- Results under the token budget pass through unchanged
+- Large row sets become a summary with value counts, sample rows and a
+  handle, and dict results keep their other keys
+- Pages read back every row exactly once and stay within the budget
+- Handles are tenant scoped, expire and are evicted least recently used
+- Results without rows are cut to the budget
+- The paging tool is registered with and routed by ToolRegistry
+- The orchestrator streams rows to the client and keeps only the summary
+  in the conversation
+- Prompt size over a multi-turn conversation, before and after
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.glp.agent.domain.entities import (
+    ChatEvent,
+    ChatEventType,
+    Conversation,
+    MessageRole,
+    ToolCall,
+    UserContext,
+)
+from src.glp.agent.orchestrator.agent import AgentConfig, AgentOrchestrator
+from src.glp.agent.orchestrator.tool_executor import ToolExecutor
+from src.glp.agent.tools.registry import ToolRegistry
+from src.glp.agent.tools.result_shaper import (
+    PAGE_TOOL_NAME,
+    ResultShaper,
+    ToolResultStore,
+    estimate_tokens,
+    serialize_result,
+)
+
+CONTEXT = UserContext(tenant_id="tenant-1", user_id="user-1", session_id="s-1")
+
+
+def make_devices(count: int) -> list[dict]:
+    """Rows shaped like list_devices output."""
+    updated = datetime(2026, 1, 1)
+    return [
+        {
+            "serial_number": f"SN{i:06d}",
+            "mac_address": f"00:11:22:{i // 65536 % 256:02x}:{i // 256 % 256:02x}:{i % 256:02x}",
+            "device_type": ["SWITCH", "AP", "GATEWAY"][i % 3],
+            "model": f"model-{i % 7}",
+            "region": ["us-west", "us-east", "eu-central", "ap-south"][i % 4],
+            "device_name": f"device-{i}",
+            "assigned_state": "ASSIGNED" if i % 5 else "UNASSIGNED",
+            "updated_at": updated - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ============================================
+# ResultShaper Tests
+# ============================================
+
+
+class TestShape:
+    """Tests for fitting results into the budget."""
+
+    def test_small_result_passes_through(self):
+        shaper = ResultShaper(token_budget=500)
+        rows = make_devices(3)
+
+        shaped = shaper.shape("list_devices", rows, CONTEXT)
+
+        assert shaped.result is rows
+        assert not shaped.truncated and shaped.handle is None
+        assert shaped.content == serialize_result(rows)
+        assert len(shaper.store) == 0
+
+    def test_large_row_set_becomes_summary(self):
+        shaper = ResultShaper(token_budget=1000)
+        rows = make_devices(2000)
+
+        shaped = shaper.shape("list_devices", rows, CONTEXT)
+
+        assert shaped.truncated
+        assert estimate_tokens(shaped.content) <= 1000
+        assert shaped.total_rows == 2000 and shaped.rows is rows
+        summary = shaped.result
+        assert summary["handle"] == shaped.handle
+        assert summary["total_rows"] == 2000
+        assert summary["columns"][:3] == ["serial_number", "mac_address", "device_type"]
+        assert summary["value_counts"]["device_type"] == {"SWITCH": 667, "AP": 667, "GATEWAY": 666}
+        assert summary["value_counts"]["assigned_state"] == {"ASSIGNED": 1600, "UNASSIGNED": 400}
+        # Unique columns carry no counts
+        assert "serial_number" not in summary["value_counts"]
+        assert 0 < len(summary["sample_rows"]) <= 5
+        assert f"{len(summary['sample_rows'])} of 2000 rows" in summary["note"]
+
+    def test_dict_result_keeps_other_keys(self):
+        shaper = ResultShaper(token_budget=1000)
+        result = {
+            "devices": make_devices(500),
+            "summary": [{"device_type": "SWITCH", "region": "us-west", "count": 125}],
+        }
+
+        shaped = shaper.shape("get_unassigned_devices", result, CONTEXT)
+
+        assert shaped.result["summary"] == result["summary"]
+        assert shaped.result["devices"]["total_rows"] == 500
+        assert shaped.rows is result["devices"]
+
+    def test_samples_shrink_to_fit(self):
+        shaper = ResultShaper(token_budget=300, sample_rows=5)
+
+        shaped = shaper.shape("list_devices", make_devices(400), CONTEXT)
+
+        assert estimate_tokens(shaped.content) <= 300
+        assert len(shaped.result["sample_rows"]) < 5
+
+    def test_text_is_truncated(self):
+        shaper = ResultShaper(token_budget=100)
+
+        shaped = shaper.shape("get_report", "x" * 10_000, CONTEXT)
+
+        assert shaped.truncated and shaped.handle is None
+        assert estimate_tokens(shaped.content) <= 100
+        assert shaped.content.endswith("[truncated, 10000 characters in full result]")
+
+
+class TestPaging:
+    """Tests for reading stored rows back."""
+
+    def test_pages_cover_every_row_once(self):
+        shaper = ResultShaper(token_budget=1500, page_size=50)
+        rows = make_devices(1234)
+        handle = shaper.shape("list_devices", rows, CONTEXT).handle
+
+        seen = []
+        offset = 0
+        while offset is not None:
+            page = shaper.page({"handle": handle, "offset": offset, "limit": 500}, CONTEXT)
+            assert estimate_tokens(serialize_result(page)) <= 1500
+            assert len(page["rows"]) <= 50
+            seen.extend(page["rows"])
+            offset = page["next_offset"]
+
+        assert seen == rows
+
+    def test_handle_scoped_to_tenant(self):
+        shaper = ResultShaper(token_budget=200)
+        handle = shaper.shape("list_devices", make_devices(100), CONTEXT).handle
+        other = UserContext(tenant_id="tenant-2", user_id="user-1", session_id="s-1")
+
+        assert "error" in shaper.page({"handle": handle}, other)
+        assert shaper.page({"handle": handle}, CONTEXT)["total_rows"] == 100
+
+    def test_bad_arguments(self):
+        shaper = ResultShaper(token_budget=200)
+        handle = shaper.shape("list_devices", make_devices(100), CONTEXT).handle
+
+        assert shaper.page({"handle": "res_missing"}, CONTEXT)["recoverable"] is True
+        assert "error" in shaper.page({"handle": handle, "offset": "ten"}, CONTEXT)
+
+
+def test_store_expiry_and_eviction():
+    clock = FakeClock()
+    store = ToolResultStore(max_entries=2, ttl_seconds=60, clock=clock)
+    first = store.put("list_devices", [1], CONTEXT)
+    second = store.put("list_devices", [2], CONTEXT)
+
+    assert store.get(first, CONTEXT).rows == [1]  # Now most recently used
+    store.put("list_devices", [3], CONTEXT)
+    assert store.get(second, CONTEXT) is None
+    assert store.get(first, CONTEXT) is not None
+
+    clock.now += 61
+    assert store.get(first, CONTEXT) is None
+    assert len(store) == 1
+
+
+# ============================================
+# Registry and Orchestrator Tests
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_paging_tool_routed_by_registry():
+    mcp_client = MagicMock()
+    mcp_client.list_tools = AsyncMock(return_value=[])
+    registry = ToolRegistry(mcp_client)
+    shaper = ResultShaper(token_budget=1000)
+    executor = ToolExecutor(registry, result_shaper=shaper)
+
+    tools = await registry.get_all_tools()
+    assert [t.name for t in tools] == [PAGE_TOOL_NAME]
+    assert await registry.get_all_tools() is tools
+
+    handle = shaper.shape("list_devices", make_devices(200), CONTEXT).handle
+    call = ToolCall(name=PAGE_TOOL_NAME, arguments={"handle": handle, "offset": 190})
+    result = await executor.execute_tool_call(call, CONTEXT, conversation_id=None)
+
+    assert [r["serial_number"] for r in result.result["rows"]] == [f"SN{i:06d}" for i in range(190, 200)]
+    assert result.result["next_offset"] is None
+    mcp_client.execute_tool_call.assert_not_called()
+
+
+class ScriptedLLM:
+    """LLM that calls list_devices when asked to list devices, and
+    otherwise answers.
+
+    Records the size of the messages it is sent on each call.
+    """
+
+    def __init__(self):
+        self.prompt_tokens: list[int] = []
+
+    async def chat(self, messages, tools=None, **kwargs):
+        self.prompt_tokens.append(sum(estimate_tokens(m.content or "") for m in messages))
+        if messages[-1].role == MessageRole.USER and messages[-1].content == "List all devices":
+            yield ChatEvent(type=ChatEventType.TOOL_CALL_START, tool_call_id="tc_1", tool_name="list_devices", sequence=1)
+            yield ChatEvent(type=ChatEventType.TOOL_CALL_END, tool_call_id="tc_1", tool_arguments={"limit": 2000}, sequence=2)
+        else:
+            yield ChatEvent(type=ChatEventType.TEXT_DELTA, content="There are 2000 devices.", sequence=1)
+        yield ChatEvent.done(sequence=3)
+
+
+def make_orchestrator(rows, **config):
+    """Orchestrator whose MCP tools return ``rows``, with one conversation."""
+    mcp_client = MagicMock()
+    mcp_client.list_tools = AsyncMock(return_value=[])
+
+    async def execute_tool_call(tool_call, context):
+        tool_call.result = rows
+        return tool_call
+
+    mcp_client.execute_tool_call = execute_tool_call
+    llm = ScriptedLLM()
+    orchestrator = AgentOrchestrator(
+        llm_provider=llm,
+        tool_registry=ToolRegistry(mcp_client),
+        config=AgentConfig(
+            enable_fact_extraction=False, enable_pattern_learning=False, **config
+        ),
+    )
+    conversation = Conversation(tenant_id=CONTEXT.tenant_id, user_id=CONTEXT.user_id)
+    orchestrator.conversation_manager.get_or_create = AsyncMock(return_value=conversation)
+    return orchestrator, llm, conversation
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_rows_and_keeps_summary():
+    rows = make_devices(2000)
+    orchestrator, llm, conversation = make_orchestrator(
+        rows, tool_result_token_budget=1000, tool_result_stream_rows=120
+    )
+
+    events = [e async for e in orchestrator.chat("List all devices", CONTEXT)]
+
+    results = [e for e in events if e.type == ChatEventType.TOOL_RESULT]
+    partial, final = results[:-1], results[-1]
+    assert [e.metadata["offset"] for e in partial] == [0, 50, 100]
+    streamed = [row for e in partial for row in e.metadata["rows"]]
+    assert [r["serial_number"] for r in streamed] == [f"SN{i:06d}" for i in range(120)]
+    assert streamed[0]["updated_at"] == "2026-01-01 00:00:00"
+    assert final.metadata["truncated"] is True
+    assert final.metadata["total_rows"] == 2000
+    assert [e.sequence for e in events] == list(range(1, len(events) + 1))
+
+    # The conversation keeps only the summary
+    tool_msg = next(m for m in conversation.messages if m.role == MessageRole.TOOL)
+    assert estimate_tokens(tool_msg.content) <= 1000
+    assert tool_msg.tool_calls[0].result["handle"] == final.metadata["handle"]
+    assert llm.prompt_tokens[1] < 1100
+
+
+# ============================================
+# Benchmark
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_prompt_size_with_and_without_shaping():
+    """2000-row list_devices result, then a follow-up question each
+    turn for four more turns in the same conversation."""
+    rows = make_devices(2000)
+
+    async def run(**config):
+        orchestrator, llm, _ = make_orchestrator(rows, **config)
+        async for _ in orchestrator.chat("List all devices", CONTEXT):
+            pass
+        for _ in range(4):
+            async for _ in orchestrator.chat("And how many are switches?", CONTEXT):
+                pass
+        return llm.prompt_tokens
+
+    before = await run(tool_result_token_budget=0)
+    after = await run(tool_result_token_budget=2000)
+
+    print(
+        f"\nprompt tokens per LLM call: unshaped {before[1:]} "
+        f"shaped {after[1:]}"
+    )
+    assert len(before) == len(after) == 6
+    assert all(b > 100_000 for b in before[1:])
+    assert all(a < 1000 for a in after[1:])
@@ -9,6 +9,7 @@ from src.glp.assignment.domain.entities import (
     AssignmentStatus,
     DeviceAssignment,
     ExcelRow,
+    SubscriptionCompatibilityIndex,
     SubscriptionOption,
     ValidationResult,
     ValidationError,
@@ -197,3 +198,45 @@ class TestValidationResult:
         )
         assert result.is_valid is False
         assert len(result.errors) == 1
+
+
+class TestSubscriptionCompatibilityIndex:
+    """Tests for SubscriptionCompatibilityIndex."""
+
+    @pytest.fixture
+    def subscriptions(self):
+        def sub(key, sub_type, tier):
+            return SubscriptionOption(
+                id=uuid4(), key=key, subscription_type=sub_type, tier=tier,
+                available_quantity=5,
+            )
+
+        return [
+            sub("AP", "CENTRAL_AP", "FOUNDATION_AP"),
+            sub("SW6200", "CENTRAL_SWITCH", "FOUNDATION_SWITCH_6200"),
+            sub("SW6300", "CENTRAL_SWITCH", "ADVANCED_SWITCH_6300"),
+            sub("COMPUTE", "CENTRAL_COMPUTE", "STANDARD"),
+        ]
+
+    def test_matches_entity_compatibility_rules(self, subscriptions):
+        index = SubscriptionCompatibilityIndex(subscriptions)
+        for device_type in (None, "NETWORK", "COMPUTE", "STORAGE"):
+            for model in (None, "6200F-24G-4SFP+", "6300M-48G", "AP-635-RW", "unknown"):
+                expected = [
+                    s for s in subscriptions
+                    if (device_type is None or s.is_compatible_with(device_type))
+                    and (model is None or s.is_compatible_with_model(model))
+                ]
+                assert index.get(device_type=device_type, model=model) == expected
+
+    def test_preserves_order_and_returns_copies(self, subscriptions):
+        index = SubscriptionCompatibilityIndex(subscriptions, generation=1)
+        network = index.get(device_type="NETWORK")
+        assert [s.key for s in network] == ["AP", "SW6200", "SW6300"]
+        network.clear()
+        assert len(index.get(device_type="NETWORK")) == 3
+        assert index.generation == 1
+
+    def test_unknown_series_gets_generic_only(self, subscriptions):
+        index = SubscriptionCompatibilityIndex(subscriptions)
+        assert [s.key for s in index.get("NETWORK", "8360-48XT4C")] == ["AP"]
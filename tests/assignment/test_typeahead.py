@@ -0,0 +1,325 @@
+"""Tests for the in-memory typeahead index and search history cache.
+
+Also covers the search-suggestions endpoint's use of the cache and its
+fallback to the aggregate query.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.glp.assignment.api import dashboard_router
+from src.glp.assignment.api.typeahead import (
+    InventoryTypeahead,
+    PrefixIndex,
+    SearchHistoryCache,
+    TypeaheadEntry,
+)
+
+
+def _device(i: int, **kwargs) -> TypeaheadEntry:
+    defaults = dict(
+        id=f"dev-{i}",
+        kind="device",
+        label=f"SN{i:05d}",
+        name=f"Switch {i}",
+        mac_address=f"AA:BB:CC:00:00:{i:02X}",
+        sub_type="SWITCH",
+    )
+    defaults.update(kwargs)
+    return TypeaheadEntry(**defaults)
+
+
+class TestPrefixIndex:
+    """Tests for PrefixIndex."""
+
+    def test_prefix_lookup(self):
+        index = PrefixIndex()
+        index.build([("a", ["apple", "avocado"]), ("b", ["banana"]), ("c", ["apricot"])])
+        assert index.search("ap", limit=10) == ["a", "c"]
+        assert index.search("b", limit=10) == ["b"]
+        assert index.search("z", limit=10) == []
+
+    def test_deduplicates_and_limits(self):
+        index = PrefixIndex()
+        index.build([("a", ["aa", "ab"]), ("b", ["ac"]), ("c", ["ad"])])
+        assert index.search("a", limit=2) == ["a", "b"]
+
+    def test_update_replaces_keys(self):
+        index = PrefixIndex()
+        index.build([(str(i), [f"key{i:03d}"]) for i in range(100)])
+        index.update([("5", ["renamed"])])
+        assert index.search("key005", limit=10) == []
+        assert index.search("ren", limit=10) == ["5"]
+        assert len(index) == 100
+
+    def test_large_update_rebuilds(self):
+        index = PrefixIndex()
+        index.build([("a", ["one"])])
+        index.update([(str(i), [f"k{i}"]) for i in range(10)])
+        assert index.search("one", limit=10) == ["a"]
+        assert len(index.search("k", limit=20)) == 10
+
+
+class TestInventoryTypeahead:
+    """Tests for InventoryTypeahead."""
+
+    @pytest.fixture
+    def index(self):
+        index = InventoryTypeahead()
+        index.load([_device(i) for i in range(20)] + [
+            TypeaheadEntry(id="sub-1", kind="subscription", label="KEY-ABC"),
+            _device(99, label="SN99999", archived=True),
+        ])
+        return index
+
+    def test_matches_serial_case_insensitive(self, index):
+        results = index.search("sn0001", limit=5)
+        assert [r.label for r in results] == [f"SN0001{i}" for i in range(5)]
+
+    def test_matches_mac_with_or_without_separators(self, index):
+        assert index.search("aa:bb:cc:00:00:0a")[0].id == "dev-10"
+        assert index.search("aabbcc00000a")[0].id == "dev-10"
+
+    def test_filters_by_kind(self, index):
+        assert [r.id for r in index.search("key", kind="subscription")] == ["sub-1"]
+        assert index.search("key", kind="device") == []
+
+    def test_excludes_archived_by_default(self, index):
+        assert index.search("SN999") == []
+        assert index.search("SN999", include_archived=True)[0].id == "dev-99"
+
+    def test_apply_updates_entry(self, index):
+        index.apply([_device(3, name="Core Router")])
+        assert index.search("core")[0].id == "dev-3"
+        assert all(r.id != "dev-3" for r in index.search("switch 3"))
+
+
+class _FakeConn:
+    def __init__(self, devices, subscriptions):
+        self.devices = devices
+        self.subscriptions = subscriptions
+        self.cursors = []
+        self.fetched = []
+
+    async def fetch(self, sql, cursor):
+        self.cursors.append(cursor)
+        rows = self.devices if "FROM devices" in sql else self.subscriptions
+        rows = [r for r in rows if cursor is None or r["updated_at"] >= cursor]
+        self.fetched.append(len(rows))
+        return rows
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *args):
+                return False
+
+        return _Ctx()
+
+
+def _device_row(i, updated_at, **kwargs):
+    row = {"id": f"d{i}", "serial_number": f"SN{i}", "mac_address": None,
+           "device_name": None, "device_type": "AP", "archived": False,
+           "updated_at": updated_at}
+    row.update(kwargs)
+    return row
+
+
+class TestInventoryRefresh:
+    """Tests for the incremental database refresh."""
+
+    T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    async def test_refresh_only_applies_changed_rows(self):
+        devices = [_device_row(i, self.T0) for i in range(3)]
+        subs = [{"id": "s1", "key": "KEY1", "subscription_type": "CENTRAL_AP", "updated_at": self.T0}]
+        conn = _FakeConn(devices, subs)
+        index = InventoryTypeahead()
+
+        assert await index.refresh(_FakePool(conn)) == 4
+        assert conn.cursors == [None, None]
+
+        devices.append(_device_row(9, self.T0 + timedelta(minutes=5), serial_number="SNNEW"))
+        assert await index.refresh(_FakePool(conn)) == 1
+        assert conn.cursors[2:] == [self.T0, self.T0]
+        assert index.search("snnew")[0].id == "d9"
+        assert len(index) == 5
+
+        # The cursor moved to the newest updated_at seen
+        assert await index.refresh(_FakePool(conn)) == 0
+        assert conn.cursors[4] == self.T0 + timedelta(minutes=5)
+        assert conn.fetched[4:] == [1, 1]
+
+    async def test_resync_without_api_changes_refetches_nothing(self):
+        devices = [_device_row(i, self.T0 - timedelta(days=i)) for i in range(50)]
+        conn = _FakeConn(devices, [])
+        index = InventoryTypeahead()
+        await index.refresh(_FakePool(conn))
+
+        # A full sync rewrites synced_at on every row but not updated_at
+        for row in devices:
+            row["synced_at"] = self.T0 + timedelta(hours=1)
+
+        assert await index.refresh(_FakePool(conn)) == 0
+        assert await index.refresh(_FakePool(conn)) == 0
+        assert conn.fetched[2::2] == [1, 1]
+
+    async def test_late_commit_behind_cursor_is_loaded_by_full_refresh(self):
+        devices = [_device_row(1, self.T0), _device_row(2, self.T0 + timedelta(minutes=5))]
+        conn = _FakeConn(devices, [])
+        index = InventoryTypeahead()
+        await index.refresh(_FakePool(conn))
+
+        # A row with an older updated_at commits after the cursor passed it
+        devices.append(_device_row(3, self.T0 + timedelta(minutes=1), serial_number="SNLATE"))
+        assert await index.refresh(_FakePool(conn)) == 0
+        assert index.search("snlate") == []
+
+        await index.refresh(_FakePool(conn), full=True)
+        assert index.search("snlate")[0].id == "d3"
+
+    async def test_full_refresh_drops_deleted_rows(self):
+        devices = [_device_row(i, self.T0) for i in range(3)]
+        conn = _FakeConn(devices, [])
+        index = InventoryTypeahead(full_refresh_seconds=0)
+        await index.refresh(_FakePool(conn))
+
+        del devices[1]
+        # Older than the cursor: only a full rebuild would see it
+        devices.append(_device_row(7, self.T0 - timedelta(days=1), serial_number="SNOLD"))
+        await index.refresh(_FakePool(conn))
+
+        assert conn.cursors[-1] is None
+        assert index.search("sn1") == []
+        assert index.search("snold")[0].id == "d7"
+        assert len(index) == 3
+
+
+class TestSearchHistoryCache:
+    """Tests for SearchHistoryCache."""
+
+    def test_suggest_prefix_recent_first_unique(self):
+        items = [("router-2", "device"), ("Router-1", "device"),
+                 ("router-2", "device"), ("sub", "subscription")]
+        assert SearchHistoryCache.suggest(items, "rout") == ["router-2", "Router-1"]
+        assert SearchHistoryCache.suggest(items, "s", search_type="subscription") == ["sub"]
+
+    def test_record_only_updates_cached_users(self):
+        cache = SearchHistoryCache()
+        cache.record("t", "u", "x", "device")
+        assert cache.get("t", "u") is None
+
+        cache.put("t", "u", [("old", "device")])
+        cache.record("t", "u", "new", "device")
+        assert cache.get("t", "u") == [("new", "device"), ("old", "device")]
+
+    def test_record_moves_repeated_query_to_front(self):
+        cache = SearchHistoryCache(max_items_per_user=2)
+        cache.put("t", "u", [("a", "device"), ("b", "device")], complete=True)
+        cache.record("t", "u", "b", "device")
+        assert cache.get("t", "u") == [("b", "device"), ("a", "device")]
+        assert cache.is_complete("t", "u")
+
+        # A new query pushes the oldest out, so the cache is no longer whole
+        cache.record("t", "u", "c", "device")
+        assert cache.get("t", "u") == [("c", "device"), ("b", "device")]
+        assert not cache.is_complete("t", "u")
+
+    def test_put_marks_truncated_history_incomplete(self):
+        cache = SearchHistoryCache(max_items_per_user=2)
+        cache.put("t", "u", [("a", "device")])
+        assert cache.is_complete("t", "u")
+
+        cache.put("t", "u", [("a", "device"), ("b", "device"), ("c", "device")])
+        assert cache.get("t", "u") == [("a", "device"), ("b", "device")]
+        assert not cache.is_complete("t", "u")
+
+    def test_invalidate_and_ttl(self):
+        cache = SearchHistoryCache(ttl_seconds=-1)
+        cache.put("t", "u", [("q", "device")])
+        assert cache.get("t", "u") is None
+
+        cache = SearchHistoryCache()
+        cache.put("t", "u", [("q", "device")])
+        cache.invalidate("t", "u")
+        assert cache.get("t", "u") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = SearchHistoryCache(max_users=2)
+        cache.put("t", "a", [])
+        cache.put("t", "b", [])
+        cache.get("t", "a")
+        cache.put("t", "c", [])
+        assert cache.get("t", "b") is None
+        assert cache.get("t", "a") == []
+
+
+class _HistoryConn:
+    """Answers the search-suggestion queries from a list of history rows."""
+
+    def __init__(self, history):
+        self.history = history  # (query, search_type), oldest first
+        self.queries = []
+
+    async def fetchval(self, sql, *args):
+        return True
+
+    async def fetch(self, sql, *args):
+        self.queries.append(sql)
+        last_used = {}
+        for position, item in enumerate(self.history):
+            last_used[item] = position
+        pairs = sorted(last_used, key=last_used.get, reverse=True)
+        if "ILIKE" in sql:
+            prefix = args[2].rstrip("%").lower()
+            queries = []
+            for query, _ in pairs:
+                if query.lower().startswith(prefix) and query not in queries:
+                    queries.append(query)
+            return [{"query": q} for q in queries[: args[-1]]]
+        return [{"query": q, "search_type": t} for q, t in pairs[: args[-1]]]
+
+
+class TestSearchSuggestions:
+    """Tests for get_search_suggestions."""
+
+    async def _suggest(self, conn, cache, prefix, limit=5):
+        with patch.object(dashboard_router, "get_search_history_cache", return_value=cache):
+            response = await dashboard_router.get_search_suggestions(
+                tenant_id="t", user_id="u", prefix=prefix, search_type=None,
+                limit=limit, include_inventory=False, pool=_FakePool(conn), _auth=True,
+            )
+        return response.suggestions
+
+    async def test_repeated_searches_do_not_crowd_out_older_queries(self):
+        history = [("old-frequent", "device")] * 5 + [("recent", "device")] * 10
+        conn = _HistoryConn(history)
+        cache = SearchHistoryCache(max_items_per_user=5)
+
+        assert await self._suggest(conn, cache, "old") == ["old-frequent"]
+        assert await self._suggest(conn, cache, "rec") == ["recent"]
+        # Both were served from one aggregated load
+        assert len(conn.queries) == 1
+        assert cache.is_complete("t", "u")
+
+    async def test_truncated_cache_falls_back_to_aggregate_query(self):
+        history = [(f"q{i}", "device") for i in range(4)]
+        conn = _HistoryConn(history)
+        cache = SearchHistoryCache(max_items_per_user=2)
+
+        assert await self._suggest(conn, cache, "q3", limit=1) == ["q3"]
+        assert len(conn.queries) == 1
+        # q0 was cut from the cache, so the database answers
+        assert await self._suggest(conn, cache, "q0") == ["q0"]
+        assert "ILIKE" in conn.queries[-1]
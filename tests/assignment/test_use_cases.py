@@ -164,7 +164,7 @@ class TestGetOptionsUseCase:
         await use_case.execute(device_type="NETWORK")
 
         mock_subscription_repo.get_available_subscriptions.assert_called_once_with(
-            device_type="NETWORK"
+            device_type="NETWORK", model=None
         )
 
 
@@ -1,12 +1,19 @@
 """Tests for the DeviceFieldMapper adapter."""
 
+import json
 from datetime import datetime, timezone
 from uuid import UUID
 
 import pytest
 
 from src.glp.sync.adapters.field_mapper import DeviceFieldMapper, SubscriptionFieldMapper
-from src.glp.sync.domain.entities import Device, Subscription
+from src.glp.sync.domain.entities import (
+    Device,
+    DeviceRecordBatch,
+    Subscription,
+    SubscriptionRecordBatch,
+)
+from src.glp.sync.domain.ports import IFieldMapper
 
 
 class TestDeviceFieldMapper:
@@ -154,6 +161,42 @@ class TestDeviceFieldMapper:
         assert record[1] == "AA:BB:CC:DD:EE:FF"  # mac_address
         assert record[2] == "SN12345"  # serial_number
 
+    def test_map_to_records_matches_entity_path(self, mapper, raw_device_full):
+        """Test direct row mapping produces the same rows as the entity path."""
+        batch = DeviceRecordBatch()
+        mapper.map_to_records(raw_device_full, batch)
+
+        entity_batch = DeviceRecordBatch()
+        IFieldMapper.map_to_records(mapper, raw_device_full, entity_batch)
+
+        assert batch == entity_batch
+        assert batch.device_ids == ["12345678-1234-1234-1234-123456789012"]
+        assert len(batch) == 1
+        assert batch.subscriptions[0] == (
+            "12345678-1234-1234-1234-123456789012",
+            "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa",
+            "/subscriptions/sub-001",
+        )
+        assert ("12345678-1234-1234-1234-123456789012", "team", "networking") in batch.tags
+
+    def test_map_to_records_leaves_batch_unchanged_on_error(self, mapper, raw_device_full):
+        """Test a device with an invalid subscription id adds no rows."""
+        raw_device_full["subscription"] = [{"id": "not-a-uuid"}]
+        batch = DeviceRecordBatch()
+
+        with pytest.raises(ValueError):
+            mapper.map_to_records(raw_device_full, batch)
+
+        assert batch == DeviceRecordBatch()
+
+    def test_entities_are_slotted(self, mapper, raw_device_full):
+        """Test device entities carry no per-instance __dict__."""
+        device = mapper.map_to_entity(raw_device_full)
+        subscription = mapper.extract_subscriptions(device, raw_device_full)[0]
+
+        assert not hasattr(device, "__dict__")
+        assert not hasattr(subscription, "__dict__")
+
     def test_extract_subscriptions(self, mapper, raw_device_full):
         """Test extracting subscriptions from device data."""
         device = mapper.map_to_entity(raw_device_full)
@@ -355,6 +398,19 @@ class TestSubscriptionFieldMapper:
         assert record[1] == "SUB-001"  # key
         assert record[3] == "CENTRAL_SWITCH"  # subscription_type
 
+    def test_map_to_records_matches_entity_path(self, mapper, raw_subscription_full):
+        """Test direct row mapping produces the same rows as the entity path."""
+        batch = SubscriptionRecordBatch()
+        mapper.map_to_records(raw_subscription_full, batch)
+
+        sub = mapper.map_to_entity(raw_subscription_full)
+        assert batch.subscriptions == [mapper.map_to_record(sub)]
+        assert batch.subscription_ids == ["12345678-1234-1234-1234-123456789012"]
+        assert sorted(batch.tags) == [
+            ("12345678-1234-1234-1234-123456789012", "environment", "production"),
+            ("12345678-1234-1234-1234-123456789012", "team", "networking"),
+        ]
+
     def test_extract_tags(self, mapper, raw_subscription_full):
         """Test extracting tags from subscription data."""
         sub = mapper.map_to_entity(raw_subscription_full)
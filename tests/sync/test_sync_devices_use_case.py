@@ -12,6 +12,7 @@ import pytest
 
 from src.glp.sync.domain.entities import (
     Device,
+    DeviceRecordBatch,
     DeviceSubscription,
     DeviceTag,
     SyncResult,
@@ -45,6 +46,7 @@ class MockDeviceRepository(IDeviceRepository):
         self.upserted_devices: list[Device] = []
         self.synced_subscriptions: list[DeviceSubscription] = []
         self.synced_tags: list[DeviceTag] = []
+        self.written_batches: list[DeviceRecordBatch] = []
         self.raise_error = raise_error
 
     async def upsert_devices(self, devices: list[Device]) -> int:
@@ -78,6 +80,12 @@ class MockDeviceRepository(IDeviceRepository):
         self.synced_subscriptions.extend(subscriptions)
         self.synced_tags.extend(tags)
 
+    async def write_device_records(self, batch: DeviceRecordBatch) -> int:
+        if self.raise_error:
+            raise self.raise_error
+        self.written_batches.append(batch)
+        return len(batch)
+
 
 class MockFieldMapper(IFieldMapper):
     """Mock implementation of IFieldMapper for testing."""
@@ -291,3 +299,49 @@ class TestSyncDevicesUseCase:
         tag_keys = {t.tag_key for t in repo.synced_tags}
         assert "env" in tag_keys
         assert "team" in tag_keys
+
+    async def test_sync_direct_records(self, sample_devices):
+        """Test direct_records writes row batches and releases the API dicts."""
+        api = MockDeviceAPI(devices=sample_devices)
+        repo = MockDeviceRepository()
+        mapper = MockFieldMapper()
+
+        use_case = SyncDevicesUseCase(api, repo, mapper, direct_records=True)
+        result = await use_case.execute()
+
+        assert result.success is True
+        assert result.total == 2
+        assert result.upserted == 2
+        assert repo.upserted_devices == []
+        [batch] = repo.written_batches
+        assert batch.device_ids == [
+            "11111111-1111-1111-1111-111111111111",
+            "22222222-2222-2222-2222-222222222222",
+        ]
+        assert len(batch.subscriptions) == 1
+        assert len(batch.tags) == 3
+        assert api.devices == []
+
+    async def test_direct_records_isolates_bad_device(self, sample_devices):
+        """Test a device that fails to map is dropped on its own."""
+        sample_devices.append({"id": "not-a-uuid"})
+        api = MockDeviceAPI(devices=sample_devices)
+        repo = MockDeviceRepository()
+
+        use_case = SyncDevicesUseCase(api, repo, MockFieldMapper(), direct_records=True)
+        result = await use_case.execute()
+
+        assert result.upserted == 2
+        assert result.errors == 1
+        assert "not-a-uuid" in result.error_details[0]
+
+    async def test_streaming_direct_records(self, sample_devices):
+        """Test streaming with direct_records writes one batch per page."""
+        api = MockDeviceAPI(devices=sample_devices)
+        repo = MockDeviceRepository()
+
+        use_case = SyncDevicesUseCase(api, repo, MockFieldMapper(), direct_records=True)
+        result = await use_case.execute_streaming()
+
+        assert result.upserted == 2
+        assert [len(batch) for batch in repo.written_batches] == [2]
@@ -0,0 +1,165 @@
+"""Tests for the staged streaming sync pipeline.
+
+Covers stage overlap, backpressure, error handling and the streaming
+paths of SyncDevicesUseCase and SyncSubscriptionsUseCase.
+"""
+
+import asyncio
+
+from src.glp.sync.use_cases.pipeline import SyncPipeline
+from src.glp.sync.use_cases.sync_devices import SyncDevicesUseCase
+from src.glp.sync.use_cases.sync_subscriptions import SyncSubscriptionsUseCase
+
+from .test_sync_devices_use_case import MockDeviceRepository, MockFieldMapper
+from .test_sync_subscriptions_use_case import (
+    MockSubscriptionFieldMapper,
+    MockSubscriptionRepository,
+)
+
+
+async def pages_of(pages, delay: float = 0.0, fail_after: int | None = None):
+    for i, page in enumerate(pages):
+        if fail_after is not None and i == fail_after:
+            raise RuntimeError("API down")
+        if delay:
+            await asyncio.sleep(delay)
+        yield page
+
+
+class TestSyncPipeline:
+    async def test_stages_overlap(self):
+        """Fetch and write latency overlap instead of adding up."""
+        pages = [[{"n": i}] for i in range(5)]
+
+        async def write(payload):
+            await asyncio.sleep(0.05)
+            return len(payload)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        outcome = await SyncPipeline().run(pages_of(pages, delay=0.05), lambda p: p, write)
+        elapsed = loop.time() - started
+
+        assert outcome.fetched == 5
+        assert outcome.written == 5
+        assert elapsed < 0.45  # serial would take ~0.5s
+        assert outcome.stage_timings["fetch"].pages == 5
+        assert outcome.stage_timings["write"].busy_seconds >= 0.25
+
+    async def test_backpressure_bounds_buffered_pages(self):
+        fetched = 0
+        max_ahead = 0
+        written = 0
+
+        async def pages():
+            nonlocal fetched
+            for i in range(20):
+                fetched += 1
+                yield [i]
+
+        async def write(payload):
+            nonlocal written, max_ahead
+            await asyncio.sleep(0.001)
+            written += 1
+            max_ahead = max(max_ahead, fetched - written)
+            return 1
+
+        outcome = await SyncPipeline(queue_size=1).run(pages(), lambda p: p, write)
+        assert outcome.written == 20
+        # queues (1 + 1) plus one page in each stage
+        assert max_ahead <= 4
+        assert outcome.stage_timings["fetch"].wait_seconds > 0
+
+    async def test_fetch_failure_writes_fetched_pages(self):
+        outcome = await SyncPipeline().run(
+            pages_of([[1], [2], [3]], fail_after=2),
+            lambda p: p,
+            lambda p: asyncio.sleep(0, result=len(p)),
+        )
+        assert outcome.written == 2
+        assert outcome.errors == ["Streaming sync failed: API down"]
+
+    async def test_map_and_write_failures_are_per_page(self):
+        def map_page(page):
+            if page == ["bad-map"]:
+                raise ValueError("boom")
+            return page
+
+        async def write(payload):
+            if payload == ["bad-write"]:
+                raise RuntimeError("db")
+            return 1
+
+        outcome = await SyncPipeline(map_in_thread=False).run(
+            pages_of([["ok"], ["bad-map"], ["bad-write"], ["ok"]]), map_page, write
+        )
+        assert outcome.written == 2
+        assert outcome.errors == [
+            "Mapping failed for page: boom",
+            "Database operation failed for page: db",
+        ]
+
+
+class PagedDeviceAPI:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def fetch_all(self):
+        return [d for page in self.pages for d in page]
+
+    async def fetch_paginated(self):
+        for page in self.pages:
+            yield page
+
+
+def make_device(i: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{i:012d}",
+        "serialNumber": f"SN{i}",
+        "tags": {"env": "prod"},
+    }
+
+
+class TestStreamingUseCases:
+    async def test_device_streaming_sync(self):
+        pages = [[make_device(1), make_device(2)], [make_device(3)]]
+        repo = MockDeviceRepository()
+        use_case = SyncDevicesUseCase(PagedDeviceAPI(pages), repo, MockFieldMapper())
+
+        result = await use_case.execute_streaming()
+
+        assert result.success
+        assert result.total == 3
+        assert result.upserted == 3
+        assert [d.serial_number for d in repo.upserted_devices] == ["SN1", "SN2", "SN3"]
+        assert len(repo.synced_tags) == 3
+        assert set(result.stage_timings) == {"fetch", "map", "write"}
+        assert "stage_timings" in result.to_dict()
+
+    async def test_device_streaming_mapping_errors(self):
+        use_case = SyncDevicesUseCase(
+            PagedDeviceAPI([[make_device(1)]]),
+            MockDeviceRepository(),
+            MockFieldMapper(raise_mapping_error=True),
+        )
+        result = await use_case.execute_streaming()
+        assert not result.success
+        assert result.upserted == 0
+        assert result.error_details[0].startswith("Mapping error for device")
+
+    async def test_subscription_streaming_sync(self):
+        pages = [
+            [{"id": "11111111-1111-1111-1111-111111111111", "key": "K1"}],
+            [{"id": "22222222-2222-2222-2222-222222222222", "key": "K2"}],
+        ]
+        repo = MockSubscriptionRepository()
+        use_case = SyncSubscriptionsUseCase(
+            PagedDeviceAPI(pages), repo, MockSubscriptionFieldMapper()
+        )
+
+        result = await use_case.execute_streaming()
+
+        assert result.success
+        assert result.total == 2
+        assert result.upserted == 2
+        assert result.stage_timings["write"].pages == 2
@@ -12,6 +12,7 @@ import pytest
 
 from src.glp.sync.domain.entities import (
     Subscription,
+    SubscriptionRecordBatch,
     SubscriptionTag,
     SyncResult,
 )
@@ -53,6 +54,7 @@ class MockSubscriptionRepository(ISubscriptionRepository):
     def __init__(self, raise_error: Exception | None = None):
         self.upserted_subscriptions: list[Subscription] = []
         self.synced_tags: list[SubscriptionTag] = []
+        self.written_batches: list[SubscriptionRecordBatch] = []
         self.raise_error = raise_error
 
     async def upsert_subscriptions(self, subscriptions: list[Subscription]) -> int:
@@ -70,6 +72,12 @@ class MockSubscriptionRepository(ISubscriptionRepository):
             raise self.raise_error
         self.synced_tags.extend(tags)
 
+    async def write_subscription_records(self, batch: SubscriptionRecordBatch) -> int:
+        if self.raise_error:
+            raise self.raise_error
+        self.written_batches.append(batch)
+        return len(batch)
+
 
 class MockSubscriptionFieldMapper(ISubscriptionFieldMapper):
     """Mock implementation of ISubscriptionFieldMapper for testing."""
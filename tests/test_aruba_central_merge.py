@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Unit tests for the set-based Aruba Central device merge.
+
+Tests cover:
+    - Pages COPY'd into the staging table in STAGING_COLUMNS order
+    - Merge UPDATE restricted to changed devices (run against SQLite, so an
+      unchanged device is checked to produce no write)
+    - Volatile columns left to the hourly touch
+    - Removal detection via staging anti-join
+    - Throughput and WAL stats returned by the streaming sync
+
+These tests use a fake connection and need no database.
+"""
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.glp.api.aruba_devices import (
+    CENTRAL_COLUMNS,
+    MERGE_CHANGED_SQL,
+    STAGING_COLUMNS,
+    STAGING_TABLE,
+    TOUCH_UNCHANGED_SQL,
+    ArubaCentralSyncer,
+)
+
+SEEN_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeConnection:
+    def __init__(self, update_status: str = "UPDATE 1"):
+        self.update_status = update_status
+        self.executed: list[tuple[str, tuple]] = []
+        self.copies: list[tuple[str, list, list]] = []
+
+    async def execute(self, query, *args):
+        self.executed.append((query, args))
+        return self.update_status if query.lstrip().startswith("UPDATE") else "OK"
+
+    async def fetchval(self, query, *args):
+        if "pg_current_wal_lsn()::text" in query:
+            return "0/1000"
+        if "pg_wal_lsn_diff" in query:
+            return 8192
+        if "COUNT(DISTINCT serial_number)" in query:
+            return 2
+        return None
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        self.copies.append((table, records, columns))
+
+    def transaction(self, **kwargs):
+        class _Tx:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def start(self):
+                pass
+
+            async def commit(self):
+                pass
+
+            async def rollback(self):
+                pass
+
+        return _Tx()
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def acquire(self):
+        return self.conn
+
+    async def release(self, conn):
+        pass
+
+
+class FakeClient:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def paginate(self, endpoint, config=None):
+        for page in self.pages:
+            yield page
+
+
+async def test_upsert_page_copies_and_merges_changed_only():
+    syncer = ArubaCentralSyncer(client=None)
+    conn = FakeConnection("UPDATE 1")
+
+    staged, skipped, changed = await syncer._upsert_page(
+        conn, [{"serialNumber": "sn1"}, {"serialNumber": "sn2"}, {}], 3, SEEN_AT
+    )
+
+    assert (staged, skipped, changed) == (2, 1, 1)
+    table, records, columns = conn.copies[0]
+    assert table == STAGING_TABLE
+    assert columns == list(STAGING_COLUMNS)
+    assert all(len(r) == len(STAGING_COLUMNS) for r in records)
+    assert [r[:2] for r in records] == [(3, "SN1"), (3, "SN2")]
+
+    query, args = conn.executed[-1]
+    assert "IS DISTINCT FROM" in query
+    assert args == (3, SEEN_AT)
+
+
+async def test_mark_removed_uses_staging_anti_join():
+    conn = FakeConnection("UPDATE 4")
+    assert await ArubaCentralSyncer(client=None)._mark_removed_devices(conn, 10) == 4
+    query, args = conn.executed[-1]
+    assert "NOT EXISTS" in query and STAGING_TABLE in query
+    assert "ALL(" not in query
+    assert args == ()
+
+
+async def test_mark_removed_skipped_when_nothing_seen():
+    conn = FakeConnection()
+    assert await ArubaCentralSyncer(client=None)._mark_removed_devices(conn, 0) == 0
+    assert conn.executed == []
+
+
+async def test_streaming_sync_reports_throughput_and_wal():
+    conn = FakeConnection("UPDATE 1")
+    pages = [[{"serialNumber": "a"}, {"serialNumber": "b"}]]
+    syncer = ArubaCentralSyncer(client=FakeClient(pages), db_pool=FakePool(conn))
+
+    stats = await syncer.sync_to_postgres_streaming()
+
+    assert stats["total_upserted"] == 2
+    assert stats["total_changed"] == 1
+    assert stats["total_unchanged"] == 1
+    assert stats["unique_serials"] == 2
+    assert stats["wal_bytes"] == 8192
+    assert stats["devices_per_second"] > 0
+    assert any(f"CREATE TEMP TABLE {STAGING_TABLE}" in q for q, _ in conn.executed)
+
+
+# ============================================
+# Merge and touch statements against SQLite
+# ============================================
+
+class MergeDatabase:
+    """The merge statements run on an in-memory SQLite database.
+
+    SQLite accepts the UPDATE ... FROM and row-value IS DISTINCT FROM used
+    here; only the $n placeholders and NOW() need adapting.
+    """
+
+    def __init__(self):
+        self.db = sqlite3.connect(":memory:")
+        self.db.create_function("NOW", 0, lambda: "now")
+        central = ", ".join(CENTRAL_COLUMNS)
+        self.db.execute(
+            f"CREATE TABLE devices (serial_number, mac_address, {central}, "
+            "central_raw_data, in_central, last_seen_central, synced_at)"
+        )
+        self.db.execute(f"CREATE TABLE {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)})")
+
+    def insert_device(self, serial, last_seen, **central):
+        values = [central.get(c, f"{c}-v1") for c in CENTRAL_COLUMNS]
+        self.db.execute(
+            f"INSERT INTO devices VALUES (?, 'mac', {', '.join('?' * len(values))}, "
+            "'raw', 1, ?, 'synced')",
+            (serial, *values, last_seen),
+        )
+
+    def stage(self, serial, **central):
+        values = [central.get(c, f"{c}-v1") for c in CENTRAL_COLUMNS]
+        self.db.execute(
+            f"INSERT INTO {STAGING_TABLE} VALUES (0, ?, 'mac', "
+            f"{', '.join('?' * len(values))}, 'raw')",
+            (serial, *values),
+        )
+
+    def execute(self, sql, *args) -> int:
+        return self.db.execute(re.sub(r"\$(\d)", r"?\1", sql), args).rowcount
+
+    def device(self, serial) -> dict:
+        cursor = self.db.execute("SELECT * FROM devices WHERE serial_number = ?", (serial,))
+        return dict(zip([d[0] for d in cursor.description], cursor.fetchone()))
+
+
+def test_merge_skips_device_whose_volatile_columns_changed():
+    db = MergeDatabase()
+    db.insert_device("SN1", "2026-01-01T00:00")
+    db.stage("SN1", central_uptime_millis=999, central_last_seen_at="2026-01-01T00:05")
+
+    assert db.execute(MERGE_CHANGED_SQL, 0, "2026-01-01T00:05") == 0
+    assert db.device("SN1")["synced_at"] == "synced"
+
+
+def test_merge_rewrites_device_with_changed_column():
+    db = MergeDatabase()
+    db.insert_device("SN1", "2026-01-01T00:00")
+    db.stage("SN1", central_status="OFFLINE", central_uptime_millis=999)
+
+    assert db.execute(MERGE_CHANGED_SQL, 0, "2026-01-01T00:05") == 1
+    device = db.device("SN1")
+    assert device["central_status"] == "OFFLINE"
+    assert device["central_uptime_millis"] == 999
+    assert device["synced_at"] == "now"
+
+
+def test_touch_refreshes_volatile_columns_once_stale():
+    db = MergeDatabase()
+    db.insert_device("FRESH", "2026-01-01T00:30")
+    db.insert_device("STALE", "2025-12-31T22:00")
+    for serial in ("FRESH", "STALE"):
+        db.stage(serial, central_uptime_millis=999)
+
+    assert db.execute(TOUCH_UNCHANGED_SQL, "2026-01-01T01:00", "2026-01-01T00:00") == 1
+    assert db.device("FRESH")["central_uptime_millis"] == "central_uptime_millis-v1"
+    stale = db.device("STALE")
+    assert stale["central_uptime_millis"] == 999
+    assert stale["last_seen_central"] == "2026-01-01T01:00"
+    assert stale["synced_at"] == "synced"
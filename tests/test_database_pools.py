@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Unit tests for named, instrumented connection pools.
+
+Tests cover:
+    - PoolConfig environment overrides
+    - InstrumentedPool acquire latency, wait queue and timeout metrics
+    - Both `await pool.acquire()` and `async with pool.acquire()` usage
+    - PoolRegistry fallback to the default pool
+    - bulk_sync sized for every scheduler job and its advisory lock
+
+These tests use a fake asyncpg pool and need no database.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.glp.api.database import (
+    DEFAULT_POOL_CONFIGS,
+    InstrumentedPool,
+    PoolConfig,
+    PoolRegistry,
+    database_transaction,
+)
+from src.glp.api.exceptions import ConnectionPoolError
+
+# ============================================
+# Fakes
+# ============================================
+
+class FakeConnection:
+    async def fetchval(self, query, *args, column=0, timeout=None):
+        return 1
+
+    def transaction(self, **kwargs):
+        class _Tx:
+            async def start(self):
+                pass
+
+            async def commit(self):
+                pass
+
+            async def rollback(self):
+                pass
+
+        return _Tx()
+
+
+class FakePool:
+    """Minimal asyncpg.Pool stand-in with a fixed number of connections."""
+
+    def __init__(self, size: int = 1):
+        self._free = asyncio.Queue()
+        for _ in range(size):
+            self._free.put_nowait(FakeConnection())
+        self._size = size
+
+    async def acquire(self, timeout=None):
+        return await asyncio.wait_for(self._free.get(), timeout=timeout)
+
+    async def release(self, conn, timeout=None):
+        self._free.put_nowait(conn)
+
+    def get_size(self):
+        return self._size
+
+    def get_idle_size(self):
+        return self._free.qsize()
+
+
+def make_pool(size: int = 1, **config) -> InstrumentedPool:
+    return InstrumentedPool(FakePool(size), PoolConfig(name="test", **config))
+
+
+# ============================================
+# PoolConfig
+# ============================================
+
+class TestPoolConfig:
+    def test_defaults_cover_all_workloads(self):
+        assert set(DEFAULT_POOL_CONFIGS) == {"interactive", "bulk_sync", "export", "agent"}
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_BULK_SYNC_MAX", "8")
+        monkeypatch.setenv("DB_POOL_BULK_SYNC_STATEMENT_CACHE_SIZE", "0")
+        config = DEFAULT_POOL_CONFIGS["bulk_sync"].with_env_overrides()
+        assert config.max_size == 8
+        assert config.statement_cache_size == 0
+        assert config.min_size == DEFAULT_POOL_CONFIGS["bulk_sync"].min_size
+
+    def test_bulk_sync_fits_every_scheduler_job_and_lock(self):
+        from scheduler import SchedulerConfig, build_sync_jobs
+
+        config = SchedulerConfig()
+        for flag in ("sync_subscriptions", "sync_devices", "sync_central",
+                     "sync_clients", "sync_firmware"):
+            setattr(config, flag, True)
+        jobs = build_sync_jobs(config, object(), object(), object())
+
+        assert len(jobs) == 5
+        assert DEFAULT_POOL_CONFIGS["bulk_sync"].max_size >= 2 * len(jobs)
+
+    def test_invalid_env_value_ignored(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_EXPORT_MAX", "lots")
+        config = DEFAULT_POOL_CONFIGS["export"].with_env_overrides()
+        assert config.max_size == DEFAULT_POOL_CONFIGS["export"].max_size
+
+
+# ============================================
+# InstrumentedPool
+# ============================================
+
+class TestInstrumentedPool:
+    async def test_context_manager_records_acquire(self):
+        pool = make_pool()
+        async with pool.acquire() as conn:
+            assert isinstance(conn, FakeConnection)
+            assert pool.metrics.in_use == 1
+        assert pool.metrics.in_use == 0
+        assert pool.metrics.acquires == 1
+        assert pool.get_metrics()["idle"] == 1
+
+    async def test_await_acquire_and_release(self):
+        pool = make_pool()
+        conn = await pool.acquire()
+        assert pool.metrics.in_use == 1
+        await pool.release(conn)
+        assert pool.metrics.in_use == 0
+
+    async def test_wait_queue_and_latency(self):
+        pool = make_pool(size=1)
+
+        async def hold():
+            async with pool.acquire():
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(hold(), hold(), hold())
+        metrics = pool.get_metrics()
+        assert metrics["acquires"] == 3
+        assert metrics["peak_waiting"] == 3
+        assert metrics["waiting"] == 0
+        assert metrics["max_wait_ms"] >= 50
+        assert sum(metrics["wait_histogram"].values()) == 3
+
+    async def test_timeout_counted(self):
+        pool = make_pool(size=1, acquire_timeout=0.01)
+        held = await pool.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire()
+        assert pool.metrics.timeouts == 1
+        assert pool.metrics.waiting == 0
+        await pool.release(held)
+
+    async def test_fetchval_shortcut_uses_instrumented_acquire(self):
+        pool = make_pool()
+        assert await pool.fetchval("SELECT 1") == 1
+        assert pool.metrics.acquires == 1
+
+    async def test_works_with_database_transaction(self):
+        pool = make_pool()
+        async with database_transaction(pool) as conn:
+            assert isinstance(conn, FakeConnection)
+        assert pool.metrics.acquires == 1
+        assert pool.metrics.in_use == 0
+
+
+# ============================================
+# PoolRegistry
+# ============================================
+
+class TestPoolRegistry:
+    def test_falls_back_to_default_pool(self):
+        registry = PoolRegistry("postgresql://unused")
+        interactive = make_pool()
+        registry._pools["interactive"] = interactive
+        assert registry.get("export") is interactive
+        assert registry.get() is interactive
+
+    def test_raises_when_not_started(self):
+        registry = PoolRegistry("postgresql://unused")
+        with pytest.raises(ConnectionPoolError):
+            registry.get("interactive")
+
+    def test_metrics_keyed_by_name(self):
+        registry = PoolRegistry("postgresql://unused")
+        registry._pools["interactive"] = make_pool()
+        assert set(registry.get_metrics()) == {"interactive"}
+
+
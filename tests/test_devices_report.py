@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for the device inventory report's write-only mode.
+
+Tests cover:
+    - Write-only workbook matches the regular workbook cell for cell
+    - Column widths, freeze panes, merged header cells and fills
+    - Large inventories switch to write-only mode
+    - Column width estimation
+
+These tests need no database.
+"""
+import io
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openpyxl import load_workbook
+
+from src.glp.reports import devices_report
+from src.glp.reports.devices_report import DevicesReportGenerator
+from src.glp.reports.generator import BaseReportGenerator
+
+
+def make_devices(count: int) -> list[dict]:
+    return [
+        {
+            "serial_number": f"SN{i:05d}",
+            "mac_address": f"AA:BB:CC:00:{i // 256:02X}:{i % 256:02X}",
+            "device_type": ("AP", "SWITCH", "GATEWAY")[i % 3],
+            "model": "AP-635",
+            "region": ("us-west", "eu-central")[i % 2],
+            "assigned_state": "UNASSIGNED" if i % 4 == 0 else "ASSIGNED_TO_SERVICE",
+            "subscription_key": None if i % 5 == 0 else f"KEY{i}",
+            "subscription_type": "CENTRAL_AP",
+            "tags": {"site": f"site-{i % 7}"},
+            "in_central": i % 3 != 2,
+            "central_status": ("ONLINE", "OFFLINE", None)[i % 3],
+            "central_site_name": "=HYPERLINK(\"x\")" if i == 1 else "HQ",
+            "updated_at": datetime(2026, 1, 1 + i % 28),
+        }
+        for i in range(count)
+    ]
+
+
+def load(content: bytes):
+    return load_workbook(io.BytesIO(content))
+
+
+def sheet_values(ws) -> list[list]:
+    rows = [[cell.value for cell in row] for row in ws.iter_rows()]
+    # Generated timestamps differ between the two renders
+    return [row for row in rows if row[:1] != ["Generated:"]]
+
+
+def test_write_only_matches_regular_workbook():
+    data = {"items": make_devices(240), "total": 240}
+    generator = DevicesReportGenerator()
+
+    regular = load(generator.generate_excel(data, {"region": "us-west", "model": None}))
+    write_only = load(generator.generate_excel_write_only(data, {"region": "us-west", "model": None}))
+
+    assert write_only.sheetnames == regular.sheetnames == ["Summary", "Device List", "Insights"]
+    for name in regular.sheetnames:
+        expected, actual = regular[name], write_only[name]
+        assert sheet_values(actual) == sheet_values(expected)
+        assert actual.freeze_panes == expected.freeze_panes
+        assert {k: d.width for k, d in actual.column_dimensions.items()} == {
+            k: d.width for k, d in expected.column_dimensions.items()
+        }
+        assert set(map(str, actual.merged_cells.ranges)) == set(map(str, expected.merged_cells.ranges))
+        for row in range(1, 60):
+            for col in range(1, 19):
+                assert (
+                    actual.cell(row, col).fill.fgColor.rgb == expected.cell(row, col).fill.fgColor.rgb
+                ), (name, row, col)
+
+
+def test_large_inventory_uses_write_only(monkeypatch):
+    monkeypatch.setattr(devices_report, "WRITE_ONLY_MIN_ROWS", 10)
+    calls = []
+    generator = DevicesReportGenerator()
+    monkeypatch.setattr(
+        generator,
+        "generate_excel_write_only",
+        lambda data, filters=None: calls.append(len(data["items"])) or b"",
+    )
+
+    generator.generate_excel({"items": make_devices(9)})
+    generator.generate_excel({"items": make_devices(10)})
+
+    assert calls == [10]
+
+
+def test_device_list_widths_from_sample(monkeypatch):
+    monkeypatch.setattr(devices_report, "WIDTH_SAMPLE_ROWS", 5)
+    items = make_devices(20)
+    items[10]["model"] = "M" * 60
+
+    workbook = load(DevicesReportGenerator().generate_excel_write_only({"items": items}))
+
+    ws = workbook["Device List"]
+    # The long model is past the sample; the value is still written in full
+    assert ws.column_dimensions["D"].width == 10
+    assert ws["D12"].value == "M" * 60
+
+
+def test_estimate_column_widths():
+    widths = BaseReportGenerator.estimate_column_widths(
+        [["Serial Number", None, 5], ["x" * 80, "", 123456789012]], max_width=40
+    )
+
+    assert widths == [40, 10, 14]
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Tests for the independent sync job scheduler.
+
+Tests cover:
+    - Jobs run on their own intervals
+    - Dependencies: a job waits for a running or failed dependency
+    - Single flight: a job whose advisory lock is held elsewhere is skipped
+    - Advisory lock acquire/release, including a held dependency lock
+    - Retry backoff capped at the interval
+    - Per-job health and scheduler job wiring
+
+These tests need no database.
+"""
+import asyncio
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+from scheduler import HealthState, SchedulerConfig, build_sync_jobs
+from src.glp.api.job_scheduler import AdvisoryLocks, JobScheduler, SyncJob
+
+
+class FakeLocks:
+    """In-memory stand-in for AdvisoryLocks."""
+
+    def __init__(self, held_elsewhere=()):
+        self.held_elsewhere = set(held_elsewhere)
+        self.acquired = []
+        self.released = []
+
+    async def try_acquire(self, name, shared=()):
+        if name in self.held_elsewhere:
+            return False
+        self.acquired.append((name, shared))
+        return True
+
+    async def release(self, name, shared=()):
+        self.released.append((name, shared))
+
+    async def close(self):
+        pass
+
+
+class FakeConnection:
+    """Answers pg_try_advisory_lock* from a set of keys held elsewhere."""
+
+    def __init__(self, held_elsewhere=()):
+        self.held_elsewhere = set(held_elsewhere)
+        self.statements = []
+
+    def is_closed(self):
+        return False
+
+    async def fetchval(self, query, key):
+        self.statements.append((query, key))
+        return key not in self.held_elsewhere
+
+    async def execute(self, query, key):
+        self.statements.append((query, key))
+
+
+async def run_for(scheduler: JobScheduler, seconds: float) -> None:
+    shutdown = asyncio.Event()
+    task = asyncio.create_task(scheduler.run(shutdown))
+    await asyncio.sleep(seconds)
+    shutdown.set()
+    await asyncio.wait_for(task, timeout=2)
+
+
+def job(name, run, interval=60.0, **kwargs) -> SyncJob:
+    return SyncJob(name, run, interval_seconds=interval, jitter=0, **kwargs)
+
+
+async def test_jobs_run_on_their_own_intervals():
+    counts = {"fast": 0, "slow": 0}
+
+    def counter(name):
+        async def run():
+            counts[name] += 1
+        return run
+
+    scheduler = JobScheduler(
+        [job("fast", counter("fast"), 0.05), job("slow", counter("slow"), 10)],
+        max_concurrent=2,
+    )
+    await run_for(scheduler, 0.3)
+
+    assert counts["slow"] == 1
+    assert counts["fast"] >= 4
+    assert scheduler.states["fast"].last_outcome == "success"
+
+
+async def test_dependent_waits_for_running_dependency():
+    order = []
+
+    async def subscriptions():
+        order.append("subscriptions started")
+        await asyncio.sleep(0.1)
+        order.append("subscriptions done")
+
+    async def devices():
+        order.append("devices")
+
+    locks = FakeLocks()
+    scheduler = JobScheduler(
+        [
+            job("devices", devices, depends_on=("subscriptions",)),
+            job("subscriptions", subscriptions),
+        ],
+        locks=locks,
+        max_concurrent=2,
+    )
+    await run_for(scheduler, 0.3)
+
+    assert order == ["subscriptions started", "subscriptions done", "devices"]
+    # The dependent holds a shared lock on its dependency while it runs
+    assert ("devices", ("subscriptions",)) in locks.acquired
+    assert sorted(locks.acquired) == sorted(locks.released)
+
+
+async def test_failed_dependency_blocks_dependent():
+    ran = []
+
+    async def subscriptions():
+        raise RuntimeError("API down")
+
+    async def devices():
+        ran.append("devices")
+
+    scheduler = JobScheduler(
+        [
+            job("subscriptions", subscriptions, retry_delay_seconds=60),
+            job("devices", devices, depends_on=("subscriptions",)),
+        ],
+        dependency_poll_seconds=0.05,
+    )
+    await run_for(scheduler, 0.2)
+
+    assert ran == []
+    subscriptions_state = scheduler.states["subscriptions"]
+    assert subscriptions_state.last_outcome == "failed"
+    assert subscriptions_state.last_error == "RuntimeError: API down"
+    assert scheduler.states["devices"].waiting_on == "subscriptions"
+    assert not scheduler.healthy
+
+
+async def test_missing_dependency_is_ignored():
+    ran = []
+
+    async def devices():
+        ran.append("devices")
+
+    scheduler = JobScheduler([job("devices", devices, depends_on=("subscriptions",))])
+    await run_for(scheduler, 0.1)
+
+    assert ran == ["devices"]
+
+
+async def test_job_locked_elsewhere_is_skipped():
+    run = MagicMock()
+
+    async def central():
+        run()
+
+    locks = FakeLocks(held_elsewhere={"central"})
+    scheduler = JobScheduler([job("central", central)], locks=locks)
+
+    state = await scheduler.run_job(scheduler.jobs["central"])
+
+    run.assert_not_called()
+    assert state.last_outcome == "locked"
+    assert state.skipped_locked == 1
+    assert state.runs == 0
+    assert locks.released == []
+    # Another replica is syncing it, so dependents may proceed
+    assert state.satisfies_dependents
+
+
+async def test_advisory_locks_release_exclusive_when_dependency_held():
+    pool = MagicMock()
+    locks = AdvisoryLocks(pool)
+    conn = FakeConnection(held_elsewhere={locks.key("subscriptions")})
+
+    async def acquire():
+        return conn
+
+    pool.acquire = acquire
+
+    assert not await locks.try_acquire("devices", ("subscriptions",))
+    assert [query.split("(")[0] for query, _ in conn.statements] == [
+        "SELECT pg_try_advisory_lock",
+        "SELECT pg_try_advisory_lock_shared",
+        "SELECT pg_advisory_unlock",
+    ]
+
+    conn.held_elsewhere.clear()
+    conn.statements.clear()
+    assert await locks.try_acquire("devices", ("subscriptions",))
+    await locks.release("devices", ("subscriptions",))
+    assert [key for _, key in conn.statements] == [
+        locks.key("devices"),
+        locks.key("subscriptions"),
+        locks.key("subscriptions"),
+        locks.key("devices"),
+    ]
+    assert locks.key("devices") != locks.key("subscriptions")
+    assert locks.key("devices") == AdvisoryLocks(pool).key("devices")
+
+
+def test_retry_backoff_capped_at_interval():
+    sync_job = job("devices", None, interval=3600, retry_delay_seconds=300)
+    scheduler = JobScheduler([sync_job])
+    state = scheduler.states["devices"]
+
+    state.last_outcome = "failed"
+    delays = []
+    for failures in (1, 2, 3, 5):
+        state.consecutive_failures = failures
+        delays.append(scheduler._delay(sync_job, state))
+    state.last_outcome = "success"
+
+    assert delays == [300, 600, 1200, 3600]
+    assert scheduler._delay(sync_job, state) == 3600
+
+
+async def test_health_state_counts_job_runs():
+    async def ok():
+        return {"synced": 1}
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    health = HealthState()
+    scheduler = JobScheduler(
+        [job("central", ok), job("firmware", broken)],
+        locks=FakeLocks(held_elsewhere={"clients"}),
+        on_finished=health.record_job,
+    )
+    health.job_scheduler = scheduler
+
+    await scheduler.run_job(scheduler.jobs["central"])
+    assert health.healthy
+    await scheduler.run_job(scheduler.jobs["firmware"])
+
+    assert health.total_syncs == 2
+    assert health.failed_syncs == 1
+    assert not health.healthy
+    snapshot = scheduler.snapshot()
+    assert snapshot["central"]["last_outcome"] == "success"
+    assert snapshot["firmware"]["consecutive_failures"] == 1
+
+
+@pytest.mark.parametrize("db_pool", [MagicMock(), None])
+def test_build_sync_jobs(monkeypatch, db_pool):
+    for name, value in {
+        "SYNC_SUBSCRIPTIONS_INTERVAL_MINUTES": "360",
+        "SYNC_CENTRAL_INTERVAL_MINUTES": "10",
+        "SYNC_DEVICES": "true",
+        "SYNC_SUBSCRIPTIONS": "true",
+        "SYNC_CENTRAL": "true",
+        "SYNC_CLIENTS": "true",
+        "SYNC_FIRMWARE": "false",
+    }.items():
+        monkeypatch.setenv(name, value)
+    config = SchedulerConfig()
+
+    jobs = {j.name: j for j in build_sync_jobs(config, MagicMock(), db_pool, MagicMock())}
+
+    if db_pool:
+        assert set(jobs) == {"subscriptions", "devices", "central", "clients"}
+        assert jobs["devices"].depends_on == ("subscriptions",)
+        assert jobs["clients"].depends_on == ("central",)
+    else:
+        # Fetch-only: no FK to respect, and clients need sites from the database
+        assert set(jobs) == {"subscriptions", "devices", "central"}
+        assert jobs["devices"].depends_on == ()
+    assert jobs["subscriptions"].interval_seconds == 360 * 60
+    assert jobs["central"].interval_seconds == 10 * 60
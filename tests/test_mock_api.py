@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for the local mock GreenLake/Aruba Central API server.
+
+Tests cover:
+    - Offset pagination through GLPClient with capped page sizes
+    - Cursor pagination through ArubaCentralClient, per site
+    - Injected 429s retried after Retry-After
+    - PATCH async operations polled to completion by DeviceManager
+
+These tests run the server on a local port and need no database.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.glp.api.aruba_auth import ArubaTokenManager
+from src.glp.api.aruba_client import ArubaCentralClient, ArubaPaginationConfig
+from src.glp.api.auth import TokenManager
+from src.glp.api.client import GLPClient, PaginationConfig
+from src.glp.api.device_manager import DeviceManager
+from src.glp.api.exceptions import ValidationError
+from src.glp.api.resilience import AdaptiveRateLimiter
+from src.glp.mock_api import MockAPIConfig, MockGreenLakeServer
+
+UNTHROTTLED = {name: (1_000_000.0, 1000, 1_000_000.0) for name in AdaptiveRateLimiter.DEFAULT_LIMITS}
+
+
+def make_devices(count: int) -> list[dict]:
+    return [
+        {"id": f"00000000-0000-0000-0000-{i:012d}", "serialNumber": f"SN{i:04d}", "tags": {"a": "1"}}
+        for i in range(count)
+    ]
+
+
+def glp_client(server: MockGreenLakeServer) -> GLPClient:
+    return GLPClient(
+        TokenManager("id", "secret", server.token_url),
+        base_url=server.base_url,
+        rate_limiter=AdaptiveRateLimiter(limits=UNTHROTTLED, name="test"),
+    )
+
+
+async def test_offset_pagination_caps_page_size():
+    config = MockAPIConfig(page_sizes={"devices": 40, "subscriptions": 50, "central": 100})
+    async with MockGreenLakeServer(devices=make_devices(95), config=config) as server:
+        async with glp_client(server) as client:
+            pages = [
+                page async for page in client.paginate(
+                    "/devices/v1/devices", PaginationConfig(page_size=40, delay_between_pages=0)
+                )
+            ]
+
+    assert [len(page) for page in pages] == [40, 40, 15]
+    assert server.stats.requests["get"] == 3
+    assert server.stats.items_served == 95
+
+
+async def test_cursor_pagination_per_site():
+    clients = {"site-1": [{"mac": f"02:00:00:00:00:{i:02x}"} for i in range(25)]}
+    config = MockAPIConfig(page_sizes={"devices": 2000, "subscriptions": 50, "central": 10})
+    async with MockGreenLakeServer(clients=clients, config=config) as server:
+        async with ArubaCentralClient(
+            ArubaTokenManager("id", "secret", server.token_url),
+            base_url=server.base_url,
+            rate_limiter=AdaptiveRateLimiter(limits=UNTHROTTLED, name="test"),
+        ) as central:
+            items = [
+                item
+                async for page in central.paginate(
+                    "/network-monitoring/v1alpha1/clients",
+                    ArubaPaginationConfig(page_size=100, delay_between_pages=0),
+                    params={"site-id": "site-1"},
+                )
+                for item in page
+            ]
+
+    assert len(items) == 25
+    assert server.stats.requests["central"] == 3
+
+
+async def test_injected_429_is_retried(monkeypatch):
+    sleeps = []
+
+    async def fast_sleep(seconds):
+        sleeps.append(seconds)
+
+    # With seed 1 the first request is throttled and the second served
+    config = MockAPIConfig(error_429_rate=0.5, retry_after_seconds=2, seed=1)
+    async with MockGreenLakeServer(devices=make_devices(3), config=config) as server:
+        async with glp_client(server) as client:
+            monkeypatch.setattr("src.glp.api.client.asyncio.sleep", fast_sleep)
+            data = await client.get("/devices/v1/devices")
+
+    assert len(data["items"]) == 3
+    assert server.stats.throttled["get"] == 1
+    assert max(sleeps) == pytest.approx(2, abs=0.1)
+
+
+async def test_patch_operation_completes_after_polls():
+    config = MockAPIConfig(operation_polls=2)
+    devices = make_devices(3)
+    async with MockGreenLakeServer(devices=devices, config=config) as server:
+        async with glp_client(server) as client:
+            manager = DeviceManager(client)
+            operation = await manager.update_tags(
+                [d["id"] for d in devices[:2]], {"a": None, "b": "2"}
+            )
+            status = await manager.wait_for_completion(operation.operation_url, poll_interval=0)
+
+            with pytest.raises(ValidationError):
+                await client.patch_merge(
+                    "/devices/v2beta1/devices",
+                    json_body={"tags": {}},
+                    params={"id": [f"id-{i}" for i in range(26)]},
+                )
+
+    assert status.is_success
+    assert server.stats.requests["async_status"] == 2
+    assert devices[0]["tags"] == {"b": "2"}
+    assert devices[2]["tags"] == {"a": "1"}
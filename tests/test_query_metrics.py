@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Unit tests for always-on query instrumentation.
+
+Tests cover:
+    - Statement normalization
+    - Per-statement histograms, row counts and the statement cap
+    - Scopes, pool wait attribution and N+1 detection
+    - Route-named scopes from the ASGI middleware
+    - create_pool installing the instrumented connection class
+    - Access to the /health/queries and /health/pools endpoints
+
+These tests need no database.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.glp.api import database
+from src.glp.api.query_metrics import (
+    OVERFLOW_KEY,
+    InstrumentedConnection,
+    QueryMetrics,
+    QueryMetricsMiddleware,
+    current_scope,
+    get_query_metrics,
+    normalize_statement,
+)
+
+
+def test_normalize_statement_replaces_literals():
+    assert normalize_statement(
+        "SELECT *  FROM devices\n WHERE id = 5 AND name = 'it''s' AND serial = $1"
+    ) == "SELECT * FROM devices WHERE id = ? AND name = ? AND serial = $1"
+    assert normalize_statement("SELECT * FROM t1 WHERE x IN (1, 2, 3)") == (
+        "SELECT * FROM t1 WHERE x IN (?)"
+    )
+
+
+def test_record_builds_histogram_and_rows():
+    metrics = QueryMetrics()
+    metrics.record("SELECT 1", 0.0004, 1)
+    metrics.record("SELECT 2", 0.030, 1)
+    metrics.record("SELECT 3", 7.0, 0, error=True)
+
+    [row] = metrics.top_statements()
+    assert row["statement"] == "SELECT ?"
+    assert row["calls"] == 3
+    assert row["errors"] == 1
+    assert row["rows"] == 2
+    assert row["latency_histogram"]["le_1ms"] == 1
+    assert row["latency_histogram"]["le_50ms"] == 1
+    assert row["latency_histogram"]["gt_5000ms"] == 1
+    assert row["p50_ms"] == 50.0
+    assert row["max_ms"] == 7000.0
+
+
+def test_statement_cap_folds_into_overflow():
+    metrics = QueryMetrics(max_statements=2)
+    for table in ("a", "b", "c", "d"):
+        metrics.record(f"SELECT * FROM {table}", 0.001)
+    assert set(metrics.statements) == {"SELECT * FROM a", "SELECT * FROM b", OVERFLOW_KEY}
+    assert metrics.statements[OVERFLOW_KEY].calls == 2
+
+
+async def test_scope_detects_n_plus_one_across_tasks():
+    metrics = QueryMetrics(n_plus_one_threshold=3)
+
+    async def lookup(i):
+        metrics.record(f"SELECT * FROM devices WHERE id = {i}", 0.001, 1)
+
+    with metrics.scope("GET /api/devices") as scope:
+        metrics.record("SELECT count(*) FROM devices", 0.002, 1)
+        metrics.record_pool_wait(0.01)
+        await asyncio.gather(*(lookup(i) for i in range(4)))
+
+    assert scope.queries == 5
+    stats = metrics.snapshot()["scopes"]["GET /api/devices"]
+    assert stats["runs"] == 1
+    assert stats["n_plus_one"] == 1
+    assert stats["pool_wait_ms"] == pytest.approx(10.0)
+    [event] = metrics.snapshot()["n_plus_one"]
+    assert event["statement"] == "SELECT * FROM devices WHERE id = ?"
+    assert event["count"] == 4
+
+
+def test_nested_scopes_merge_into_outer():
+    metrics = QueryMetrics()
+    with metrics.scope("outer") as outer:
+        with metrics.scope("inner") as inner:
+            metrics.record("SELECT 1", 0.001)
+    assert inner is outer
+    assert list(metrics.scopes) == ["outer"]
+    assert current_scope() is None
+
+
+async def test_middleware_names_scope_after_route():
+    metrics = get_query_metrics()
+    metrics.reset()
+
+    class Route:
+        path = "/api/devices/{device_id}"
+
+    async def app(scope, receive, send):
+        scope["route"] = Route()
+        metrics.record("SELECT * FROM devices WHERE id = $1", 0.001, 1)
+
+    await QueryMetricsMiddleware(app)({"type": "http", "method": "GET"}, None, None)
+
+    assert metrics.scopes["GET /api/devices/{device_id}"].queries == 1
+    metrics.reset()
+
+
+async def test_create_pool_uses_instrumented_connection(monkeypatch):
+    import asyncpg
+
+    captured = {}
+
+    async def fake_create_pool(dsn, **kwargs):
+        captured.update(kwargs)
+        return object()
+
+    monkeypatch.setattr(asyncpg, "create_pool", fake_create_pool)
+
+    await database.create_pool("postgresql://localhost/test")
+    assert captured["connection_class"] is InstrumentedConnection
+
+    await database.create_pool("postgresql://localhost/test", connection_class=asyncpg.Connection)
+    assert captured["connection_class"] is asyncpg.Connection
+
+
+async def test_mcp_query_health_is_gated(monkeypatch):
+    from starlette.requests import Request
+
+    import server
+
+    def request(query: str = "", key: str = "") -> Request:
+        headers = [(b"x-api-key", key.encode())] if key else []
+        return Request({"type": "http", "method": "GET", "query_string": query.encode(), "headers": headers})
+
+    monkeypatch.delenv("DIAGNOSTICS_ENABLED", raising=False)
+    monkeypatch.setenv("API_KEY", "secret")
+    assert (await server.query_health(request(key="secret"))).status_code == 404
+
+    monkeypatch.setenv("DIAGNOSTICS_ENABLED", "true")
+    assert (await server.pool_health(request())).status_code == 401
+    assert (await server.query_health(request("limit=abc", key="secret"))).status_code == 400
+    assert (await server.query_health(request("limit=0", key="secret"))).status_code == 400
+    assert (await server.query_health(request("limit=5", key="secret"))).status_code == 200
+
+
+def test_app_diagnostics_require_api_key():
+    from src.glp.assignment.api.dependencies import verify_api_key
+    from src.glp.assignment.app import app
+
+    for path in ("/health/pools", "/health/queries"):
+        route = next(r for r in app.routes if getattr(r, "path", None) == path)
+        assert verify_api_key in [d.call for d in route.dependant.dependencies]
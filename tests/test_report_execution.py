@@ -0,0 +1,249 @@
+"""Tests for custom report execution (compiled queries, caching, streaming)."""
+
+import json
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.glp.reports.report_execution import (
+    CompiledQueryCache,
+    ReportResultCache,
+    ReportRowStream,
+    cache_batches,
+    config_hash,
+    csv_chunks,
+    file_chunks,
+    iter_cached,
+    json_chunks,
+    remove_file,
+    sheet_title_for,
+    to_positional,
+    write_xlsx,
+)
+from src.glp.reports.schemas import (
+    ExecuteReportResponse,
+    FieldConfig,
+    FilterConfig,
+    FilterOperator,
+    ReportConfig,
+)
+
+
+def make_config(device_name: str = "sw-1") -> ReportConfig:
+    return ReportConfig(
+        fields=[
+            FieldConfig(table="devices", field="serial_number"),
+            FieldConfig(table="devices", field="device_name"),
+        ],
+        filters=[
+            FilterConfig(
+                table="devices",
+                field="device_name",
+                operator=FilterOperator.EQUALS,
+                value=device_name,
+            ),
+        ],
+        grouping=[],
+        sorting=[],
+    )
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+# ============================================
+# Compilation
+# ============================================
+
+def test_to_positional_handles_ten_or_more_params():
+    params = {f"param_{i}": i for i in range(1, 12)}
+    sql = " AND ".join(f"c{i} = $param_{i}" for i in range(1, 12))
+    positional, values = to_positional(sql, params)
+    assert "c10 = $10" in positional
+    assert "c1 = $1 " in positional
+    assert values == tuple(range(1, 12))
+
+
+def test_config_hash_is_stable_and_value_sensitive():
+    assert config_hash(make_config()) == config_hash(make_config())
+    assert config_hash(make_config()) != config_hash(make_config("sw-2"))
+
+
+def test_compiled_query_cache_reuses_entries():
+    cache = CompiledQueryCache(max_entries=2)
+    first = cache.get(make_config(), offset=0)
+    assert cache.get(make_config(), offset=0) is first
+    assert cache.hits == 1
+    assert "$param_" not in first.sql
+    assert first.params == ("sw-1",)
+
+    cache.get(make_config(), offset=100)
+    cache.get(make_config("sw-2"), offset=0)
+    assert len(cache._entries) == 2
+
+
+# ============================================
+# Result cache
+# ============================================
+
+async def test_cache_batches_stores_small_results():
+    cache = ReportResultCache(ttl_seconds=60, max_rows=10)
+    rows = [(i,) for i in range(5)]
+    passed = [b async for b in cache_batches(iter_cached(rows, 2), cache, ("r", "h", 1, 0), ["n"], 0.0)]
+    assert sum(passed, []) == rows
+    assert cache.get(("r", "h", 1, 0)).rows == rows
+    assert cache.get(("r", "h", 2, 0)) is None
+
+
+async def test_cache_batches_skips_large_results():
+    cache = ReportResultCache(ttl_seconds=60, max_rows=3)
+    rows = [(i,) for i in range(5)]
+    async for _ in cache_batches(iter_cached(rows, 2), cache, ("r",), ["n"], 0.0):
+        pass
+    assert cache.get(("r",)) is None
+
+
+def test_result_cache_ttl_and_invalidate():
+    cache = ReportResultCache(ttl_seconds=-1)
+    assert not cache.enabled
+    cache = ReportResultCache(ttl_seconds=60)
+    cache.put(("a", "h"), ["n"], [(1,)], 1.0)
+    cache.put(("b", "h"), ["n"], [(1,)], 1.0)
+    cache.invalidate("a")
+    assert cache.get(("a", "h")) is None
+    assert cache.get(("b", "h")) is not None
+
+
+# ============================================
+# Streaming
+# ============================================
+
+class FakeRecord(dict):
+    def __iter__(self):
+        return iter(self.values())
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def fetch(self, n):
+        batch, self._rows = self._rows[:n], self._rows[n:]
+        return batch
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.rolled_back = False
+
+    def transaction(self, readonly=False):
+        conn = self
+
+        class _Tx:
+            async def start(self):
+                pass
+
+            async def rollback(self):
+                conn.rolled_back = True
+
+        return _Tx()
+
+    async def cursor(self, sql, *args):
+        return FakeCursor(list(self.rows))
+
+
+class FakePool:
+    def __init__(self, rows):
+        self.conn = FakeConnection(rows)
+        self.released = False
+
+    async def acquire(self):
+        return self.conn
+
+    async def release(self, conn):
+        self.released = True
+
+
+async def test_row_stream_batches_and_releases():
+    rows = [FakeRecord(id=i, name=f"d{i}") for i in range(5)]
+    pool = FakePool(rows)
+    compiled = CompiledQueryCache().get(make_config())
+    async with ReportRowStream(pool, compiled, batch_size=2) as stream:
+        assert stream.columns == ["id", "name"]
+        batches = [b async for b in stream.batches()]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert stream.row_count == 5
+    assert pool.released and pool.conn.rolled_back
+
+
+async def test_csv_and_json_writers():
+    stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = [(1, None, stamp), (2, "x", stamp)]
+    columns = ["id", "name", "at"]
+
+    text = (await collect(csv_chunks(columns, iter_cached(rows)))).decode()
+    assert text.splitlines() == ["id,name,at", f"1,,{stamp.isoformat()}", f"2,x,{stamp.isoformat()}"]
+    assert await collect(csv_chunks(columns, iter_cached([]))) == b""
+
+    body = json.loads(await collect(json_chunks(columns, iter_cached(rows), {"page": 1}, 0.0)))
+    assert body["success"] and body["page"] == 1
+    assert body["total_rows"] == 2
+    assert body["data"][1] == {"id": 2, "name": "x", "at": stamp.isoformat()}
+
+
+async def test_json_aggregates_are_numbers():
+    """SUM/AVG columns (numeric -> Decimal) are sent as numbers, like jsonable_encoder."""
+    columns = ["region", "total", "average"]
+    rows = [("us-west", Decimal("42"), Decimal("3.25"))]
+    metadata = {"page": 1, "page_size": 100, "generated_sql": "SELECT 1"}
+
+    body = json.loads(await collect(json_chunks(columns, iter_cached(rows), metadata, 0.0)))
+
+    assert body["data"] == [{"region": "us-west", "total": 42, "average": 3.25}]
+    assert isinstance(body["data"][0]["total"], int)
+    assert set(body) == set(ExecuteReportResponse.model_fields)
+    assert ExecuteReportResponse.model_validate(body).data == body["data"]
+
+
+async def test_write_xlsx():
+    from openpyxl import load_workbook
+
+    rows = [(1, datetime(2026, 1, 1, tzinfo=timezone.utc))]
+    path = await write_xlsx(["id", "at"], iter_cached(rows))
+    try:
+        sheet = load_workbook(path).active
+        assert [c.value for c in sheet[1]] == ["id", "at"]
+        assert sheet["A2"].value == 1
+    finally:
+        os.unlink(path)
+
+
+def test_sheet_title_for():
+    assert sheet_title_for("Q1 / Q2 [draft]: sites?*") == "Q1  Q2 draft sites"
+    assert sheet_title_for("x" * 40) == "x" * 31
+    assert sheet_title_for("/\\?*[]:") == "Report"
+    assert sheet_title_for("") == "Report"
+
+
+async def test_write_xlsx_with_invalid_sheet_title():
+    from openpyxl import load_workbook
+
+    path = await write_xlsx(["id"], iter_cached([(1,)]), sheet_title="Sites: east/west")
+    try:
+        assert load_workbook(path).active.title == "Sites eastwest"
+    finally:
+        os.unlink(path)
+
+
+async def test_file_chunks_leaves_cleanup_to_caller(tmp_path):
+    path = tmp_path / "report.xlsx"
+    path.write_bytes(b"x" * 10)
+
+    assert await collect(file_chunks(str(path), chunk_size=4)) == b"x" * 10
+    assert path.exists()
+
+    remove_file(str(path))
+    remove_file(str(path))  # Already gone
+    assert not path.exists()
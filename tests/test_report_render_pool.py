@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for the Excel report render pool.
+
+Tests cover:
+    - Columnar packing of report data
+    - Rendering a real report in a worker process
+    - Per report type concurrency limit and queue/render metrics
+    - Failure accounting
+
+These tests need no database.
+"""
+import asyncio
+import io
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openpyxl import load_workbook
+
+from src.glp.reports.devices_report import DevicesReportGenerator
+from src.glp.reports.generator import BaseReportGenerator
+from src.glp.reports.render_pool import (
+    ColumnarRows,
+    ReportRenderPool,
+    pack_report_data,
+    unpack_report_data,
+)
+
+
+class SlowReport(BaseReportGenerator):
+    """Records how many renders overlap."""
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def generate_excel(self, data, filters=None):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.running -= 1
+        return b"report"
+
+    def generate_csv(self, data, filters=None):
+        return ""
+
+
+class FailingReport(SlowReport):
+    def generate_excel(self, data, filters=None):
+        raise ValueError("bad data")
+
+
+def test_pack_report_data_columnar_round_trip():
+    rows = [{"id": "a", "count": 1, "seen": datetime(2026, 1, 1)}, {"id": "b", "count": 2, "seen": None}]
+    mixed = [{"id": "a"}, {"name": "b"}]
+    data = {"items": rows, "mixed": mixed, "empty": [], "total": 2, "stats": {"total": 2}}
+
+    packed = pack_report_data(data)
+
+    assert isinstance(packed["items"], ColumnarRows)
+    assert packed["items"].columns == ("id", "count", "seen")
+    assert packed["items"].values[1] == [1, 2]
+    assert len(packed["items"]) == 2
+    assert packed["mixed"] is mixed
+    assert packed["empty"] == []
+    assert unpack_report_data(packed) == data
+
+
+async def test_render_excel_in_worker_process():
+    pool = ReportRenderPool(max_workers=1, use_processes=True)
+    data = {
+        "items": [
+            {"serial_number": f"SN{i}", "device_type": "AP", "assigned_state": "UNASSIGNED"}
+            for i in range(3)
+        ],
+        "total": 3,
+    }
+    try:
+        content = await pool.render_excel(DevicesReportGenerator(), data, {"region": None})
+    finally:
+        pool.shutdown()
+
+    workbook = load_workbook(io.BytesIO(content))
+    assert workbook.sheetnames == ["Summary", "Device List", "Insights"]
+    stats = pool.snapshot()["report_types"]["DevicesReportGenerator"]
+    assert stats["renders"] == 1
+    assert stats["bytes_out"] == len(content)
+    assert pool.snapshot()["mode"] == "processes"
+
+
+async def test_per_type_limit_queues_renders():
+    pool = ReportRenderPool(per_type_limit=1, use_processes=False)
+
+    results = await asyncio.gather(*(pool.render_excel(SlowReport(), {}) for _ in range(3)))
+
+    assert results == [b"report"] * 3
+    assert SlowReport.max_running == 1
+    stats = pool.stats["SlowReport"]
+    assert stats.renders == 3
+    assert stats.waiting == 0 and stats.running == 0
+    # The last render waited for the two before it
+    assert stats.queue.max_seconds >= 0.09
+    assert stats.render.count == 3
+
+
+async def test_render_failure_is_counted():
+    pool = ReportRenderPool(use_processes=False)
+
+    with pytest.raises(ValueError):
+        await pool.render_excel(FailingReport(), {})
+
+    stats = pool.snapshot()["report_types"]["FailingReport"]
+    assert stats["failures"] == 1
+    assert stats["renders"] == 0
+    assert stats["running"] == 0
@@ -19,6 +19,7 @@ import pytest
 
 sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
 from src.glp.api.resilience import (
+    AdaptiveRateLimiter,
     CircuitBreaker,
     CircuitState,
     ConcurrentBatcher,
@@ -29,6 +30,7 @@ from src.glp.api.resilience import (
     retry,
     retry_async,
     run_concurrent_tasks,
+    SequentialRateLimiter,
     try_or_default,
     with_fallback,
     with_timeout,
@@ -805,6 +807,108 @@ class TestResilienceIntegration:
         assert all(r % 2 == 0 for r in valid_results)
 
 
+# ============================================
+# Adaptive Rate Limiter Tests
+# ============================================
+
+class TestAdaptiveRateLimiter:
+    """Test token-bucket pacing and learning from API feedback."""
+
+    def test_classify_endpoint_classes(self):
+        """Methods and async-operation polls map to their own classes."""
+        assert AdaptiveRateLimiter.classify("GET", "/devices/v1/devices") == "get"
+        assert AdaptiveRateLimiter.classify(
+            "GET", "/devices/v2beta1/async-operations/abc"
+        ) == "async_status"
+        assert AdaptiveRateLimiter.classify("POST", "/devices/v2beta1/devices") == "post"
+        assert AdaptiveRateLimiter.classify("PATCH", "/devices/v2beta1/devices") == "patch"
+        assert AdaptiveRateLimiter.classify("DELETE", "/devices/v2beta1/devices") == "patch"
+
+    def test_burst_then_paced(self):
+        """Requests within the burst are free, then paced at the rate."""
+        limiter = AdaptiveRateLimiter(limits={"patch": (60.0, 3, 60.0)})
+
+        waits = [limiter.reserve("patch") for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1.0, abs=0.05)
+        assert waits[4] == pytest.approx(2.0, abs=0.05)
+
+    def test_rate_limited_halves_rate_and_blocks(self):
+        """A 429 halves the rate, lowers the ceiling and blocks for Retry-After."""
+        limiter = AdaptiveRateLimiter(limits={"patch": (20.0, 3, 20.0)})
+
+        limiter.record_rate_limited("patch", retry_after=5)
+
+        metrics = limiter.get_metrics()["classes"]["patch"]
+        assert metrics["rate_per_minute"] == pytest.approx(10.0)
+        assert metrics["ceiling_per_minute"] == pytest.approx(19.0)
+        assert metrics["rate_limited_responses"] == 1
+        assert limiter.reserve("patch") == pytest.approx(5.0, abs=0.05)
+
+    def test_successes_increase_rate_up_to_ceiling(self):
+        """Sustained success creeps the rate back up, never past the ceiling."""
+        limiter = AdaptiveRateLimiter(limits={"get": (30.0, 5, 60.0)})
+
+        for _ in range(limiter.INCREASE_AFTER_SUCCESSES * 100):
+            limiter.record_success("get")
+
+        metrics = limiter.get_metrics()["classes"]["get"]
+        assert metrics["rate_per_minute"] == pytest.approx(60.0)
+
+    def test_rate_limit_headers_spread_remaining_budget(self):
+        """Headers set the rate to remaining/reset and block when exhausted."""
+        limiter = AdaptiveRateLimiter(limits={"get": (300.0, 5, 420.0)})
+
+        limiter.record_rate_limit_headers("get", remaining=60, reset_in_seconds=600)
+        assert limiter.get_metrics()["classes"]["get"]["rate_per_minute"] == pytest.approx(6.0)
+
+        limiter.record_rate_limit_headers("get", remaining=0, reset_in_seconds=30)
+        assert limiter.reserve("get") == pytest.approx(30.0, abs=0.05)
+
+    def test_hourly_window_headers_keep_configured_rate(self):
+        """A large budget left in an hourly window doesn't slow the rate."""
+        limiter = AdaptiveRateLimiter(limits={"get": (300.0, 7, 420.0)})
+
+        limiter.record_rate_limit_headers("get", remaining=4000, reset_in_seconds=3000)
+        assert limiter.get_metrics()["classes"]["get"]["rate_per_minute"] == pytest.approx(300.0)
+
+        # Near the end of the budget, pacing never exceeds the configured rate
+        limiter.record_rate_limit_headers("get", remaining=200, reset_in_seconds=10)
+        assert limiter.get_metrics()["classes"]["get"]["rate_per_minute"] == pytest.approx(300.0)
+
+        limiter.record_rate_limit_headers("get", remaining=100, reset_in_seconds=1200)
+        assert limiter.get_metrics()["classes"]["get"]["rate_per_minute"] == pytest.approx(5.0)
+
+    async def test_acquire_records_throttled_time(self):
+        """Time spent waiting is reported in metrics."""
+        limiter = AdaptiveRateLimiter(limits={"post": (600.0, 1, 600.0)})
+
+        await limiter.acquire("post")
+        waited = await limiter.acquire("post")
+
+        metrics = limiter.get_metrics()
+        assert waited == pytest.approx(0.1, abs=0.02)
+        assert metrics["requests"] == 2
+        assert metrics["throttled_seconds"] == pytest.approx(0.1, abs=0.02)
+        assert metrics["classes"]["post"]["effective_rate_per_minute"] > 0
+
+    async def test_sequential_limiter_uses_adaptive_budget(self):
+        """SequentialRateLimiter waits for shared budget instead of fixed intervals."""
+        limiter = AdaptiveRateLimiter(limits={"patch": (17.0, 3, 20.0)})
+        sequential = SequentialRateLimiter("patch", limiter=limiter)
+
+        start = time.monotonic()
+        for i in range(3):
+            await sequential.wait_before_call(i)
+
+        # Burst budget available: no 3.5s sleeps, and no tokens consumed
+        assert time.monotonic() - start < 0.5
+        assert sequential.call_count == 3
+        assert limiter.get_metrics()["requests"] == 0
+
+
+
 # ============================================
 # Run tests
 # ============================================
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Unit tests for sync-generation removal detection.
+
+Tests cover:
+    - Row-count parsing
+    - Aruba Central firmware syncer clearing devices not stamped with the
+      current generation, without shipping arrays of seen serials
+
+These tests use a fake connection and need no database.
+"""
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.glp.api.aruba_firmware import ArubaFirmwareSyncer
+from src.glp.api.database import affected_rows
+
+
+class FakeConnection:
+    def __init__(self, status: str = "UPDATE 3"):
+        self.status = status
+        self.executed: list[tuple[str, tuple]] = []
+
+    async def fetchval(self, query, *args):
+        self.executed.append((query, args))
+        return 42
+
+    async def execute(self, query, *args):
+        self.executed.append((query, args))
+        return self.status
+
+
+def test_affected_rows():
+    assert affected_rows("UPDATE 17") == 17
+    assert affected_rows("") == 0
+    assert affected_rows(None) == 0
+
+
+async def test_firmware_clear_stale_uses_generation():
+    syncer = ArubaFirmwareSyncer(client=None)
+    conn = FakeConnection("UPDATE 4")
+    synced = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert await syncer._clear_stale_firmware(conn, 11, 10, synced) == 4
+    query, args = conn.executed[-1]
+    assert "firmware_sync_generation IS DISTINCT FROM $1" in query
+    assert "firmware_synced_at = $2" in query
+    assert "ALL(" not in query
+    assert args == (11, synced)